@@ -4,13 +4,14 @@ from fastapi import APIRouter, HTTPException, status, Depends
 import logging
 from app.models.bonus import (
     ApplyPromocodeRequest,
+    BalanceResponse,
     PromocodeResponse,
     SpendBonusesRequest,
     SpendBonusesResponse
 )
 from app.services.bonus_service import BonusService
 from app.repositories.local_bonus_repo import bonus_repository
-from app.auth import get_current_user_id
+from detailing_auth import get_current_user_id
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +63,19 @@ async def apply_promocode(
         )
 
 
+@router.get("/balance", response_model=BalanceResponse, status_code=status.HTTP_200_OK)
+async def get_balance(
+    user_id: UUID = Depends(get_current_user_id)
+):
+    """
+    Get bonus balance of the current user
+    
+    Returns user identifier and balance
+    """
+    balance = await bonus_service.get_balance(user_id)
+    return BalanceResponse(user_id=user_id, balance=balance)
+
+
 @router.post("/spend", response_model=SpendBonusesResponse, status_code=status.HTTP_200_OK)
 async def spend_bonuses(
     request: SpendBonusesRequest,
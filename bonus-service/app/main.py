@@ -4,6 +4,9 @@ import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+from detailing_observability import setup_load_shedding, setup_metrics, setup_profiling
+from detailing_persistence import setup_persistence
 from app.config import settings
 from app.endpoints import bonuses
 from app.models.bonus import HealthResponse
@@ -59,7 +62,8 @@ app = FastAPI(
     title="Bonus Service API",
     description="Microservice for managing bonuses and promocodes",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if settings.FAST_JSON_RESPONSES else JSONResponse
 )
 
 # Configure CORS
@@ -71,6 +75,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Shed load (503) on event-loop lag or too many requests in flight
+setup_load_shedding(app)
+
+# Request metrics and /metrics endpoint
+setup_metrics(app)
+
+# Sampling profiler at /debug/profile (only with PROFILING_ENABLED=true)
+setup_profiling(app)
+
+# Snapshot + write-ahead log of bonus balances (only with PERSISTENCE_DIR set)
+setup_persistence(app, "bonuses", bonus_repository)
+
 # Include routers
 app.include_router(bonuses.router)
 
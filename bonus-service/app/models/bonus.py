@@ -38,6 +38,12 @@ class SpendBonusesResponse(BaseModel):
     new_balance: float = Field(..., description="New bonus balance")
 
 
+class BalanceResponse(BaseModel):
+    """Response model for bonus balance"""
+    user_id: UUID = Field(..., description="User identifier")
+    balance: float = Field(..., description="Current bonus balance")
+
+
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str
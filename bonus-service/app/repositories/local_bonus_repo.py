@@ -1,8 +1,10 @@
 """In-memory repository for bonus and promocode data"""
 from uuid import UUID
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 import logging
 
+from detailing_persistence import DurableStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,12 +17,18 @@ class Promocode:
 
 
 class LocalBonusRepository:
-    """In-memory storage for bonuses and promocodes"""
+    """
+    In-memory storage for bonuses and promocodes
+
+    When ``journal`` is set, every new balance is appended to it. Promocodes
+    are predefined and not journaled.
+    """
     
     def __init__(self):
         """Initialize repository with empty balances and predefined promocodes"""
         self.user_balances: Dict[UUID, float] = {}
         self.promocodes: List[Promocode] = self._initialize_promocodes()
+        self.journal: Optional[DurableStore] = None
         logger.info(f"Initialized LocalBonusRepository with {len(self.promocodes)} promocodes")
     
     def _initialize_promocodes(self) -> List[Promocode]:
@@ -30,6 +38,12 @@ class LocalBonusRepository:
             Promocode(code="WELCOME10", discount_amount=1000.00, active=True),
         ]
     
+    def _set_balance(self, user_id: UUID, balance: float) -> None:
+        """Store a balance and journal it"""
+        self.user_balances[user_id] = balance
+        if self.journal is not None:
+            self.journal.append({"type": "balance", "user_id": user_id, "balance": balance})
+    
     async def get_user_balance(self, user_id: UUID) -> float:
         """Get user bonus balance"""
         balance = self.user_balances.get(user_id, 0.0)
@@ -40,7 +54,7 @@ class LocalBonusRepository:
         """Add bonuses to user balance"""
         current_balance = self.user_balances.get(user_id, 0.0)
         new_balance = current_balance + amount
-        self.user_balances[user_id] = new_balance
+        self._set_balance(user_id, new_balance)
         logger.info(f"Added {amount} bonuses to user {user_id}. New balance: {new_balance}")
         return new_balance
     
@@ -53,7 +67,7 @@ class LocalBonusRepository:
             raise ValueError(f"Insufficient bonuses. Current balance: {current_balance}, requested: {amount}")
         
         new_balance = current_balance - amount
-        self.user_balances[user_id] = new_balance
+        self._set_balance(user_id, new_balance)
         logger.info(f"Spent {amount} bonuses for user {user_id}. New balance: {new_balance}")
         return new_balance
     
@@ -66,6 +80,20 @@ class LocalBonusRepository:
         logger.warning(f"Promocode not found or inactive: {code}")
         return None
 
+    def apply_record(self, record: Dict[str, Any]) -> None:
+        """Apply a journal record during recovery"""
+        if record["type"] != "balance":
+            raise ValueError(f"Unknown record type: {record['type']!r}")
+        self.user_balances[UUID(record["user_id"])] = record["balance"]
+    
+    def snapshot_records(self) -> Iterable[Dict[str, Any]]:
+        """Records rebuilding all balances"""
+        balances = list(self.user_balances.items())
+        return (
+            {"type": "balance", "user_id": user_id, "balance": balance}
+            for user_id, balance in balances
+        )
+
 
 # Global repository instance
 bonus_repository = LocalBonusRepository()
@@ -38,6 +38,18 @@ class BonusService:
         logger.info(f"Successfully applied promocode '{promocode}' to order {order_id}. Discount: {promo.discount_amount}")
         return "applied", promo.discount_amount
     
+    async def get_balance(self, user_id: UUID) -> float:
+        """
+        Get user bonus balance
+        
+        Args:
+            user_id: User identifier
+            
+        Returns:
+            Current balance (0 for users without bonuses)
+        """
+        return await self.repository.get_user_balance(user_id)
+    
     async def spend_bonuses(self, user_id: UUID, order_id: UUID, amount: int) -> Tuple[int, float]:
         """
         Spend bonuses from user account
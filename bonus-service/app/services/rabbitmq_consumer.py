@@ -1,6 +1,8 @@
 """RabbitMQ consumer for payment_succeeded events"""
+import asyncio
 import json
 import logging
+from typing import Dict, Optional
 from uuid import UUID
 import aio_pika
 from aio_pika import IncomingMessage
@@ -11,12 +13,32 @@ logger = logging.getLogger(__name__)
 
 
 class RabbitMQConsumer:
-    """RabbitMQ consumer for payment success events"""
+    """
+    RabbitMQ consumer for payment success events
+
+    The broker delivers up to prefetch_count unacked messages and aio_pika
+    runs on_message for each of them concurrently. At most `concurrency`
+    accruals run at the same time, and accruals for the same user are
+    serialized in delivery order by a per-user lock. A message is acked
+    only after its accrual has finished.
+    """
     
-    def __init__(self, bonus_service: BonusService):
+    def __init__(
+        self,
+        bonus_service: BonusService,
+        prefetch_count: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ):
         self.bonus_service = bonus_service
+        self.prefetch_count = prefetch_count or settings.RABBITMQ_PREFETCH_COUNT
+        self.concurrency = concurrency or settings.CONSUMER_CONCURRENCY
         self.connection = None
         self.channel = None
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        # user_id -> [lock, number of messages holding or waiting for it]
+        self._user_locks: Dict[UUID, list] = {}
+        self.in_flight = 0
+        self.processed = 0
     
     async def start(self):
         """Start consuming messages from RabbitMQ"""
@@ -25,8 +47,8 @@ class RabbitMQConsumer:
             self.connection = await aio_pika.connect_robust(settings.AMQP_URL)
             self.channel = await self.connection.channel()
             
-            # Set QoS to process one message at a time
-            await self.channel.set_qos(prefetch_count=1)
+            # Let the broker push several messages ahead so handlers can overlap
+            await self.channel.set_qos(prefetch_count=self.prefetch_count)
             
             # Declare queue (idempotent operation)
             queue = await self.channel.declare_queue(
@@ -34,7 +56,10 @@ class RabbitMQConsumer:
                 durable=True
             )
             
-            logger.info(f"Successfully connected to RabbitMQ. Listening on queue: {settings.PAYMENT_QUEUE}")
+            logger.info(
+                f"Successfully connected to RabbitMQ. Listening on queue: {settings.PAYMENT_QUEUE} "
+                f"(prefetch={self.prefetch_count}, concurrency={self.concurrency})"
+            )
             
             # Start consuming messages
             await queue.consume(self.on_message)
@@ -65,15 +90,9 @@ class RabbitMQConsumer:
                 user_id = UUID(body["user_id"])
                 amount = float(body["amount"])
                 
-                # Accrue bonuses (1% of payment amount)
-                bonuses = await self.bonus_service.accrue_bonuses(
-                    user_id=user_id,
-                    order_id=order_id,
-                    payment_amount=amount,
-                    rate=settings.BONUS_ACCRUAL_RATE
-                )
-                
-                logger.info(f"Successfully accrued {bonuses} bonuses to user {user_id} for order {order_id}")
+                # No await happens between delivery and queuing on the user
+                # lock, so accruals for one user keep the delivery order
+                await self._accrue(user_id, order_id, amount)
                 
             except KeyError as e:
                 logger.error(f"Missing required field in message: {e}", exc_info=True)
@@ -82,6 +101,34 @@ class RabbitMQConsumer:
             except Exception as e:
                 logger.error(f"Error processing message: {e}", exc_info=True)
     
+    async def _accrue(self, user_id: UUID, order_id: UUID, amount: float) -> None:
+        """Accrue bonuses holding the user's lock and a concurrency slot"""
+        entry = self._user_locks.get(user_id)
+        if entry is None:
+            entry = self._user_locks[user_id] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                async with self._semaphore:
+                    self.in_flight += 1
+                    try:
+                        # Accrue bonuses (1% of payment amount)
+                        bonuses = await self.bonus_service.accrue_bonuses(
+                            user_id=user_id,
+                            order_id=order_id,
+                            payment_amount=amount,
+                            rate=settings.BONUS_ACCRUAL_RATE
+                        )
+                        self.processed += 1
+                    finally:
+                        self.in_flight -= 1
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._user_locks[user_id]
+        
+        logger.info(f"Successfully accrued {bonuses} bonuses to user {user_id} for order {order_id}")
+    
     async def stop(self):
         """Stop consuming and close connections"""
         try:
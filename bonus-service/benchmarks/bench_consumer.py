@@ -0,0 +1,118 @@
+"""
+Benchmark of payment_succeeded consumption throughput.
+
+Drives RabbitMQConsumer.on_message through an in-process fake broker that
+behaves like RabbitMQ with basic.qos: it keeps at most ``prefetch`` unacked
+messages delivered, starts one on_message task per delivery (as aio_pika
+does) and delivers the next message once an ack arrives. Each ack costs a
+simulated broker round trip and each accrual a simulated storage call, so
+the benchmark shows how prefetch and handler concurrency overlap them.
+
+Usage (from the bonus-service directory):
+    python -m benchmarks.bench_consumer
+    python -m benchmarks.bench_consumer --messages 5000 --users 50 --rtt-ms 2
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+from app.repositories.local_bonus_repo import LocalBonusRepository
+from app.services.bonus_service import BonusService
+from app.services.rabbitmq_consumer import RabbitMQConsumer
+
+
+class SlowRepository(LocalBonusRepository):
+    """Repository whose writes take ``latency`` seconds"""
+
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+
+    async def add_bonuses(self, user_id, amount):
+        await asyncio.sleep(self.latency)
+        return await super().add_bonuses(user_id, amount)
+
+
+class FakeMessage:
+    """IncomingMessage stand-in whose ack releases a prefetch slot"""
+
+    def __init__(self, body: bytes, broker: "FakeBroker"):
+        self.body = body
+        self._broker = broker
+
+    @asynccontextmanager
+    async def process(self):
+        yield
+        await asyncio.sleep(self._broker.rtt)
+        self._broker.slots.release()
+
+
+class FakeBroker:
+    """Queue that pushes messages to a consumer respecting prefetch"""
+
+    def __init__(self, prefetch: int, rtt: float):
+        self.slots = asyncio.Semaphore(prefetch)
+        self.rtt = rtt
+
+    async def deliver(self, bodies, callback) -> None:
+        tasks = []
+        for body in bodies:
+            await self.slots.acquire()
+            tasks.append(asyncio.create_task(callback(FakeMessage(body, self))))
+        await asyncio.gather(*tasks)
+
+
+def _bodies(messages: int, users: int) -> list:
+    user_ids = [str(uuid4()) for _ in range(users)]
+    return [
+        json.dumps({
+            "order_id": str(uuid4()),
+            "user_id": user_ids[i % users],
+            "amount": 1000.0
+        }).encode()
+        for i in range(messages)
+    ]
+
+
+async def run(prefetch: int, concurrency: int, bodies: list, rtt: float, latency: float) -> float:
+    """Consume all messages and return throughput in messages per second"""
+    consumer = RabbitMQConsumer(
+        bonus_service=BonusService(repository=SlowRepository(latency)),
+        prefetch_count=prefetch,
+        concurrency=concurrency
+    )
+    broker = FakeBroker(prefetch, rtt)
+
+    start = time.perf_counter()
+    await broker.deliver(bodies, consumer.on_message)
+    elapsed = time.perf_counter() - start
+    assert consumer.processed == len(bodies)
+    return len(bodies) / elapsed
+
+
+async def main(messages: int, users: int, rtt: float, latency: float) -> None:
+    bodies = _bodies(messages, users)
+    print(f"messages={messages} users={users} rtt={rtt * 1000:.1f}ms accrual={latency * 1000:.1f}ms")
+    print(f"{'prefetch':>9} {'concurrency':>12} {'msg/s':>10}")
+    baseline = None
+    for prefetch, concurrency in [(1, 1), (16, 8), (64, 16), (256, 64)]:
+        throughput = await run(prefetch, concurrency, bodies, rtt, latency)
+        baseline = baseline or throughput
+        print(f"{prefetch:>9} {concurrency:>12} {throughput:>10.0f}  ({throughput / baseline:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--rtt-ms", type=float, default=1.0)
+    parser.add_argument("--accrual-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    asyncio.run(main(args.messages, args.users, args.rtt_ms / 1000, args.accrual_ms / 1000))
@@ -55,7 +55,7 @@ async def component_test_client(component_repository: LocalBonusRepository):
     Async test client with REAL service and repository for component testing.
     Mocks only external dependencies (JWT auth).
     """
-    from app.auth import get_current_user_id
+    from detailing_auth import get_current_user_id
 
     # Create test app without lifespan (to avoid RabbitMQ connection)
     test_app = FastAPI(title="Test Bonus Service - Component")
@@ -377,7 +377,7 @@ async def test_insufficient_balance_error_propagation(
     }
 
     # Temporarily override auth to return user2_id
-    from app.auth import get_current_user_id
+    from detailing_auth import get_current_user_id
 
     def mock_user2() -> UUID:
         return user2_id
@@ -144,7 +144,7 @@ def test_client() -> TestClient:
     from app.endpoints import bonuses
     from app.models.bonus import HealthResponse
     from app.config import settings
-    from app.auth import get_current_user_id
+    from detailing_auth import get_current_user_id
 
     test_app = FastAPI(title="Test Bonus Service")
     
@@ -171,7 +171,7 @@ async def async_test_client() -> AsyncGenerator[AsyncClient, None]:
     from app.endpoints import bonuses
     from app.models.bonus import HealthResponse
     from app.config import settings
-    from app.auth import get_current_user_id
+    from detailing_auth import get_current_user_id
 
     test_app = FastAPI(title="Test Bonus Service")
     
@@ -234,6 +234,34 @@ class TestApplyPromocodeEndpoint:
 
 
 @pytest.mark.integration
+class TestBalanceEndpoint:
+    """Test GET /api/bonuses/balance endpoint"""
+
+    def test_get_balance(self, test_client: TestClient, test_user_id: UUID):
+        """Test the current user's balance is returned"""
+        # Arrange
+        bonus_repository.user_balances[test_user_id] = 250.0
+
+        # Act
+        response = test_client.get("/api/bonuses/balance")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {"user_id": str(test_user_id), "balance": 250.0}
+
+        # Cleanup
+        bonus_repository.user_balances.clear()
+
+    def test_get_balance_without_bonuses(self, test_client: TestClient):
+        """Test users without bonuses have a zero balance"""
+        # Act
+        response = test_client.get("/api/bonuses/balance")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["balance"] == 0.0
+
+
 class TestSpendBonusesEndpoint:
     """Test POST /api/bonuses/spend endpoint"""
 
@@ -1,8 +1,9 @@
 """Unit tests for RabbitMQ consumer"""
+import asyncio
 import pytest
 import json
 from unittest.mock import AsyncMock, Mock, patch, MagicMock
-from uuid import UUID
+from uuid import UUID, uuid4
 from contextlib import asynccontextmanager
 
 from app.services.rabbitmq_consumer import RabbitMQConsumer
@@ -23,6 +24,8 @@ class TestRabbitMQConsumerInitialization:
         assert consumer.bonus_service == mock_bonus_service
         assert consumer.connection is None
         assert consumer.channel is None
+        assert consumer.prefetch_count == settings.RABBITMQ_PREFETCH_COUNT
+        assert consumer.concurrency == settings.CONSUMER_CONCURRENCY
 
     def test_consumer_requires_bonus_service(self):
         """Test consumer requires bonus service parameter"""
@@ -81,7 +84,7 @@ class TestConsumerStart:
         mock_bonus_service: AsyncMock,
         mock_rabbitmq_connection: AsyncMock
     ):
-        """Test start method sets QoS to process one message at a time"""
+        """Test start method sets QoS to the configured prefetch count"""
         # Arrange
         mock_connect.return_value = mock_rabbitmq_connection
         mock_channel = await mock_rabbitmq_connection.channel()
@@ -91,7 +94,9 @@ class TestConsumerStart:
         await consumer.start()
 
         # Assert
-        mock_channel.set_qos.assert_called_once_with(prefetch_count=1)
+        mock_channel.set_qos.assert_called_once_with(
+            prefetch_count=settings.RABBITMQ_PREFETCH_COUNT
+        )
 
     @patch('app.services.rabbitmq_consumer.aio_pika.connect_robust')
     async def test_start_declares_queue(
@@ -548,3 +553,102 @@ class TestConsumerIntegration:
 
         # Assert
         assert mock_bonus_service.accrue_bonuses.call_count == len(amounts)
+
+
+def _make_message(user_id: str, amount: float, events: list) -> Mock:
+    """Build a message mock that records when it is acked"""
+    mock_message = Mock()
+    mock_message.body = json.dumps({
+        "order_id": "123e4567-e89b-12d3-a456-426614174000",
+        "user_id": user_id,
+        "amount": amount
+    }).encode()
+
+    @asynccontextmanager
+    async def mock_process():
+        yield
+        events.append(("ack", amount))
+
+    mock_message.process = mock_process
+    return mock_message
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestConcurrentConsumption:
+    """Test concurrent message handling"""
+
+    async def test_concurrency_is_bounded(self, mock_bonus_service: AsyncMock):
+        """Test no more than `concurrency` accruals run at once"""
+        # Arrange
+        consumer = RabbitMQConsumer(bonus_service=mock_bonus_service, concurrency=3)
+        release = asyncio.Event()
+        active = 0
+        max_active = 0
+
+        async def slow_accrue(**kwargs):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await release.wait()
+            active -= 1
+            return 1.0
+
+        mock_bonus_service.accrue_bonuses.side_effect = slow_accrue
+        messages = [_make_message(str(uuid4()), 100.0 + i, []) for i in range(10)]
+
+        # Act
+        tasks = [asyncio.create_task(consumer.on_message(m)) for m in messages]
+        for _ in range(5):
+            await asyncio.sleep(0)
+        in_flight = consumer.in_flight
+        release.set()
+        await asyncio.gather(*tasks)
+
+        # Assert
+        assert in_flight == 3
+        assert max_active == 3
+        assert consumer.processed == 10
+        assert mock_bonus_service.accrue_bonuses.await_count == 10
+
+    async def test_same_user_accruals_keep_delivery_order(self, mock_bonus_service: AsyncMock):
+        """Test accruals for one user run sequentially in delivery order"""
+        # Arrange
+        consumer = RabbitMQConsumer(bonus_service=mock_bonus_service, concurrency=8)
+        user_id = str(uuid4())
+        order = []
+
+        async def accrue(**kwargs):
+            # Later messages finish faster, so only the lock keeps the order
+            await asyncio.sleep(0.01 / kwargs["payment_amount"])
+            order.append(kwargs["payment_amount"])
+            return 1.0
+
+        mock_bonus_service.accrue_bonuses.side_effect = accrue
+        messages = [_make_message(user_id, float(i), []) for i in range(1, 6)]
+
+        # Act
+        await asyncio.gather(*(consumer.on_message(m) for m in messages))
+
+        # Assert
+        assert order == [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert consumer._user_locks == {}
+
+    async def test_ack_happens_after_accrual(self, mock_bonus_service: AsyncMock):
+        """Test message is acked only after bonuses are accrued"""
+        # Arrange
+        consumer = RabbitMQConsumer(bonus_service=mock_bonus_service)
+        events = []
+
+        async def accrue(**kwargs):
+            await asyncio.sleep(0)
+            events.append(("accrue", kwargs["payment_amount"]))
+            return 1.0
+
+        mock_bonus_service.accrue_bonuses.side_effect = accrue
+
+        # Act
+        await consumer.on_message(_make_message(str(uuid4()), 42.0, events))
+
+        # Assert
+        assert events == [("accrue", 42.0), ("ack", 42.0)]
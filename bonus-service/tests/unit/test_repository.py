@@ -2,6 +2,8 @@
 import pytest
 from uuid import UUID
 
+from detailing_persistence import DurableStore
+
 from app.repositories.local_bonus_repo import LocalBonusRepository, Promocode
 
 
@@ -444,3 +446,29 @@ class TestRepositoryIntegration:
         # Assert - balance unchanged
         final_balance = await fresh_repository.get_user_balance(test_user_id)
         assert final_balance == initial_balance
+
+    async def test_journaled_balances_are_recovered(
+        self,
+        fresh_repository: LocalBonusRepository,
+        test_user_id: UUID,
+        different_user_id: UUID,
+        tmp_path
+    ):
+        """Test that balances survive a restart through a DurableStore"""
+        # Arrange
+        store = DurableStore(str(tmp_path), "bonuses")
+        store.recover(fresh_repository.apply_record)
+        fresh_repository.journal = store
+        await fresh_repository.add_bonuses(test_user_id, 500.0)
+        store.compact(fresh_repository.snapshot_records)
+        await fresh_repository.spend_bonuses(test_user_id, 100)
+        await fresh_repository.add_bonuses(different_user_id, 50.0)
+        store.close()
+
+        # Act
+        recovered = LocalBonusRepository()
+        DurableStore(str(tmp_path), "bonuses").recover(recovered.apply_record)
+
+        # Assert
+        assert await recovered.get_user_balance(test_user_id) == 400.0
+        assert await recovered.get_user_balance(different_user_id) == 50.0
@@ -14,6 +14,16 @@ class Settings(BaseSettings):
     min_car_year: int = 1900
     max_car_year: int = 2025
 
+    # Document listing pagination
+    documents_page_size: int = 50
+    max_documents_page_size: int = 200
+
+    # Maximum number of car IDs in one batch lookup
+    max_batch_size: int = 500
+
+    # Serialize responses with orjson instead of json.dumps (opt-in)
+    fast_json_responses: bool = False
+
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -1,18 +1,22 @@
 """API endpoints for car-service."""
 
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 import logging
 
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Query
 
+from app.config import settings
 from app.models.car import (
     AddCarRequest,
     CarResponse,
+    CarBatchRequest,
+    CarBatchResponse,
     AddDocumentRequest,
-    DocumentResponse
+    DocumentResponse,
+    DocumentPage
 )
-from app.services.car_service import CarService
+from app.services.car_service import CarService, InvalidCursorError
 from app.repositories.local_car_repo import get_repository, LocalCarRepository
 
 logger = logging.getLogger(__name__)
@@ -77,6 +81,44 @@ def add_car(
         )
 
 
+@router.post(
+    "/batch",
+    response_model=CarBatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get several cars",
+    description="Retrieve up to max_batch_size cars by ID in one request; unknown IDs are listed in missing_ids"
+)
+def get_cars_batch(
+    request: CarBatchRequest,
+    car_service: CarService = Depends(get_car_service)
+) -> CarBatchResponse:
+    """
+    Get information about several cars at once.
+
+    Intended for inter-service callers (order-service, dashboards) that
+    would otherwise issue one GET /api/cars/{car_id} per car.
+
+    Args:
+        request: CarBatchRequest with car IDs
+        car_service: CarService instance (injected)
+
+    Returns:
+        CarBatchResponse with found cars and missing IDs
+
+    Raises:
+        HTTPException 422: If the ID list is empty, too long or malformed
+    """
+    try:
+        logger.info(f"POST /api/cars/batch - Retrieving {len(request.car_ids)} cars")
+        return car_service.get_cars(request.car_ids)
+    except Exception as e:
+        logger.error(f"Unexpected error when retrieving cars in batch: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
+
+
 @router.get(
     "/{car_id}",
     response_model=CarResponse,
@@ -166,3 +208,60 @@ def add_car_document(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
         )
+
+
+@router.get(
+    "/{car_id}/documents",
+    response_model=DocumentPage,
+    status_code=status.HTTP_200_OK,
+    summary="List car documents",
+    description="Retrieve documents of a specific car page by page using an opaque cursor"
+)
+def list_car_documents(
+    car_id: UUID,
+    limit: int = Query(
+        settings.documents_page_size,
+        ge=1,
+        le=settings.max_documents_page_size,
+        description="Maximum number of documents to return"
+    ),
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
+    car_service: CarService = Depends(get_car_service)
+) -> DocumentPage:
+    """
+    List documents of a car with cursor pagination.
+
+    Args:
+        car_id: UUID of the car
+        limit: Maximum number of documents on the page
+        cursor: Opaque cursor of the page to fetch
+        car_service: CarService instance (injected)
+
+    Returns:
+        DocumentPage with documents and next_cursor
+
+    Raises:
+        HTTPException 400: If cursor is malformed
+        HTTPException 404: If car not found
+    """
+    try:
+        logger.info(f"GET /api/cars/{car_id}/documents - Listing documents (limit={limit})")
+        return car_service.list_car_documents(car_id, limit, cursor)
+    except InvalidCursorError as e:
+        logger.warning(f"Invalid cursor when listing documents: car_id={car_id}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except ValueError as e:
+        logger.warning(f"Car not found when listing documents: car_id={car_id}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error when listing documents: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
@@ -4,10 +4,13 @@ import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+from detailing_observability import setup_load_shedding, setup_metrics, setup_profiling
+from detailing_persistence import setup_persistence
 
 from app.config import settings
 from app.endpoints import cars
+from app.repositories.local_car_repo import get_repository
 
 # Configure logging
 logging.basicConfig(
@@ -38,9 +41,22 @@ app = FastAPI(
     title="Car Service API",
     description="Microservice for managing car information and documents",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if settings.fast_json_responses else JSONResponse
 )
 
+# Shed load (503) on event-loop lag or too many requests in flight
+setup_load_shedding(app)
+
+# Request metrics and /metrics endpoint
+setup_metrics(app)
+
+# Sampling profiler at /debug/profile (only with PROFILING_ENABLED=true)
+setup_profiling(app)
+
+# Snapshot + write-ahead log of cars and documents (only with PERSISTENCE_DIR set)
+setup_persistence(app, "cars", get_repository())
+
 # Include routers
 app.include_router(cars.router, prefix=settings.api_prefix)
 
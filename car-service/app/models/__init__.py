@@ -1,13 +1,19 @@
 from .car import (
     AddCarRequest,
     CarResponse,
+    CarBatchRequest,
+    CarBatchResponse,
     AddDocumentRequest,
     DocumentResponse,
+    DocumentPage,
 )
 
 __all__ = [
     "AddCarRequest",
     "CarResponse",
+    "CarBatchRequest",
+    "CarBatchResponse",
     "AddDocumentRequest",
     "DocumentResponse",
+    "DocumentPage",
 ]
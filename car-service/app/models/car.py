@@ -1,7 +1,7 @@
 """Pydantic models for car-service API."""
 
 from uuid import UUID
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field, field_validator
 from app.config import settings
 
@@ -42,6 +42,24 @@ class CarResponse(BaseModel):
     year: int = Field(..., description="Manufacturing year")
 
 
+class CarBatchRequest(BaseModel):
+    """Request model for looking up several cars at once."""
+
+    car_ids: List[UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.max_batch_size,
+        description="IDs of the cars to retrieve"
+    )
+
+
+class CarBatchResponse(BaseModel):
+    """Response model for a batch car lookup."""
+
+    cars: List[CarResponse] = Field(..., description="Cars that were found, in request order")
+    missing_ids: List[UUID] = Field(..., description="Requested IDs that do not exist")
+
+
 class AddDocumentRequest(BaseModel):
     """Request model for adding a document to a car."""
 
@@ -56,3 +74,10 @@ class DocumentResponse(BaseModel):
     document_id: UUID = Field(..., description="Unique document identifier")
     document_type: str = Field(..., description="Type of document")
     status: str = Field(..., description="Document status (e.g., 'pending', 'approved')")
+
+
+class DocumentPage(BaseModel):
+    """Response model for one page of car documents."""
+
+    items: List[DocumentResponse] = Field(..., description="Documents on this page, oldest first")
+    next_cursor: Optional[str] = Field(None, description="Opaque cursor for the next page, null on the last page")
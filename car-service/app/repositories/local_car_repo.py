@@ -1,21 +1,59 @@
 """In-memory repository for car data storage."""
 
 from uuid import UUID, uuid4
-from typing import List, Optional, Dict
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 import logging
+import threading
+
+from detailing_persistence import DurableStore
 
 logger = logging.getLogger(__name__)
 
 
 class LocalCarRepository:
-    """In-memory storage for cars and documents."""
+    """
+    In-memory storage for cars and documents.
+
+    Cars are kept in insertion order in ``self.cars`` and additionally
+    indexed by ``car_id``, VIN and license plate, so duplicate checks and
+    lookups by ID are O(1). VIN and plate are indexed exactly as stored;
+    normalization (upper-casing, trimming) happens in AddCarRequest.
+    Documents are also grouped per car in insertion order, so listing the
+    documents of one car never scans the documents of other cars.
+
+    Writes are serialized by a lock (handlers run on the threadpool). When
+    ``journal`` is set, every added car and document is appended to it; a
+    document record carries its position in the car's list, so replaying
+    it over a snapshot that already contains it is a no-op.
+    """
 
     def __init__(self):
-        """Initialize empty storage lists."""
+        """Initialize empty storage lists and indexes."""
         self.cars: List[Dict] = []
         self.documents: List[Dict] = []
+        self._cars_by_id: Dict[UUID, Dict] = {}
+        self._cars_by_vin: Dict[str, Dict] = {}
+        self._cars_by_plate: Dict[str, Dict] = {}
+        self._documents_by_car: Dict[UUID, List[Dict]] = {}
+        self._write_lock = threading.Lock()
+        self.journal: Optional[DurableStore] = None
         logger.info("LocalCarRepository initialized with in-memory storage")
 
+    def _insert_car(self, car: Dict) -> None:
+        """Store a car and index it (write lock held)."""
+        self.cars.append(car)
+        self._cars_by_id[car['car_id']] = car
+        self._cars_by_vin[car['vin']] = car
+        self._cars_by_plate[car['license_plate']] = car
+        self._documents_by_car[car['car_id']] = []
+
+    def _insert_document(self, document: Dict) -> int:
+        """Store a document of an existing car; returns its position among the car's documents."""
+        car_documents = self._documents_by_car[document['car_id']]
+        self.documents.append(document)
+        car_documents.append(document)
+        return len(car_documents) - 1
+
     def add_car(self, car_data: Dict) -> Dict:
         """
         Add a new car to storage.
@@ -29,29 +67,35 @@ class LocalCarRepository:
         Raises:
             ValueError: If VIN or license_plate already exists
         """
-        # Check for duplicate VIN
-        if any(car['vin'] == car_data['vin'] for car in self.cars):
-            logger.warning(f"Attempt to add car with duplicate VIN: {car_data['vin']}")
-            raise ValueError(f"Car with VIN {car_data['vin']} already exists")
-
-        # Check for duplicate license plate
-        if any(car['license_plate'] == car_data['license_plate'] for car in self.cars):
-            logger.warning(f"Attempt to add car with duplicate license plate: {car_data['license_plate']}")
-            raise ValueError(f"Car with license plate {car_data['license_plate']} already exists")
-
-        # Generate new car ID
-        car_id = uuid4()
-        car = {
-            'car_id': car_id,
-            'owner_id': car_data['owner_id'],
-            'license_plate': car_data['license_plate'],
-            'vin': car_data['vin'],
-            'make': car_data['make'],
-            'model': car_data['model'],
-            'year': car_data['year']
-        }
-
-        self.cars.append(car)
+        vin_key = car_data['vin']
+        plate_key = car_data['license_plate']
+
+        with self._write_lock:
+            # Check for duplicate VIN
+            if vin_key in self._cars_by_vin:
+                logger.warning(f"Attempt to add car with duplicate VIN: {car_data['vin']}")
+                raise ValueError(f"Car with VIN {car_data['vin']} already exists")
+
+            # Check for duplicate license plate
+            if plate_key in self._cars_by_plate:
+                logger.warning(f"Attempt to add car with duplicate license plate: {car_data['license_plate']}")
+                raise ValueError(f"Car with license plate {car_data['license_plate']} already exists")
+
+            # Generate new car ID
+            car_id = uuid4()
+            car = {
+                'car_id': car_id,
+                'owner_id': car_data['owner_id'],
+                'license_plate': car_data['license_plate'],
+                'vin': car_data['vin'],
+                'make': car_data['make'],
+                'model': car_data['model'],
+                'year': car_data['year']
+            }
+
+            self._insert_car(car)
+            if self.journal is not None:
+                self.journal.append({'type': 'car', 'car': car})
         logger.info(f"Car added successfully: car_id={car_id}, VIN={car_data['vin']}")
         return car
 
@@ -65,10 +109,10 @@ class LocalCarRepository:
         Returns:
             Car dictionary if found, None otherwise
         """
-        for car in self.cars:
-            if car['car_id'] == car_id:
-                logger.debug(f"Car found: car_id={car_id}")
-                return car
+        car = self._cars_by_id.get(car_id)
+        if car is not None:
+            logger.debug(f"Car found: car_id={car_id}")
+            return car
 
         logger.debug(f"Car not found: car_id={car_id}")
         return None
@@ -87,23 +131,25 @@ class LocalCarRepository:
         Raises:
             ValueError: If car_id does not exist
         """
-        # Verify car exists
-        car = self.get_car_by_id(car_id)
-        if car is None:
-            logger.warning(f"Attempt to add document for non-existent car: car_id={car_id}")
-            raise ValueError(f"Car with ID {car_id} not found")
-
-        # Generate new document ID
-        document_id = uuid4()
-        document = {
-            'document_id': document_id,
-            'car_id': car_id,
-            'document_type': document_data['document_type'],
-            'file': document_data.get('file'),
-            'status': 'pending'  # Default status for new documents
-        }
-
-        self.documents.append(document)
+        with self._write_lock:
+            # Verify car exists
+            if car_id not in self._documents_by_car:
+                logger.warning(f"Attempt to add document for non-existent car: car_id={car_id}")
+                raise ValueError(f"Car with ID {car_id} not found")
+
+            # Generate new document ID
+            document_id = uuid4()
+            document = {
+                'document_id': document_id,
+                'car_id': car_id,
+                'document_type': document_data['document_type'],
+                'file': document_data.get('file'),
+                'status': 'pending'  # Default status for new documents
+            }
+
+            index = self._insert_document(document)
+            if self.journal is not None:
+                self.journal.append({'type': 'document', 'index': index, 'document': document})
         logger.info(f"Document added successfully: document_id={document_id}, car_id={car_id}, type={document_data['document_type']}")
         return document
 
@@ -117,10 +163,28 @@ class LocalCarRepository:
         Returns:
             List of document dictionaries
         """
-        docs = [doc for doc in self.documents if doc['car_id'] == car_id]
+        docs = list(self._documents_by_car.get(car_id, ()))
         logger.debug(f"Found {len(docs)} documents for car_id={car_id}")
         return docs
 
+    def get_documents_page(self, car_id: UUID, offset: int, limit: int) -> Optional[List[Dict]]:
+        """
+        Retrieve a slice of the documents of a car in insertion order.
+
+        Args:
+            car_id: UUID of the car
+            offset: Number of documents to skip
+            limit: Maximum number of documents to return
+
+        Returns:
+            List of document dictionaries, or None if the car does not exist
+        """
+        car_documents = self._documents_by_car.get(car_id)
+        if car_documents is None:
+            logger.debug(f"Car not found when paging documents: car_id={car_id}")
+            return None
+        return car_documents[offset:offset + limit]
+
     def get_all_cars(self) -> List[Dict]:
         """
         Retrieve all cars from storage.
@@ -131,10 +195,63 @@ class LocalCarRepository:
         logger.debug(f"Retrieving all cars: total={len(self.cars)}")
         return self.cars.copy()
 
+    def apply_record(self, record: Dict[str, Any]) -> None:
+        """
+        Apply a journal record during recovery.
+
+        Records already reflected in storage (a car with a known ID, a
+        document at an occupied position) are skipped.
+
+        Args:
+            record: Record written by add_car, add_document or snapshot_records
+
+        Raises:
+            ValueError: If the record type is unknown or a document refers to a missing car
+        """
+        if record['type'] == 'car':
+            data = record['car']
+            car_id = UUID(data['car_id'])
+            if car_id not in self._cars_by_id:
+                self._insert_car({**data, 'car_id': car_id, 'owner_id': UUID(data['owner_id'])})
+        elif record['type'] == 'document':
+            data = record['document']
+            car_id = UUID(data['car_id'])
+            car_documents = self._documents_by_car.get(car_id)
+            if car_documents is None:
+                raise ValueError(f"Document {data['document_id']} refers to unknown car {car_id}")
+            if record['index'] >= len(car_documents):
+                self._insert_document({**data, 'document_id': UUID(data['document_id']), 'car_id': car_id})
+        else:
+            raise ValueError(f"Unknown record type: {record['type']!r}")
+
+    def snapshot_records(self) -> Iterable[Dict[str, Any]]:
+        """
+        Records rebuilding the current storage: all cars, then their documents.
+
+        The lists are copied under the write lock; records are built lazily,
+        so the result can be consumed on another thread.
+        """
+        with self._write_lock:
+            cars = list(self.cars)
+            documents = [list(docs) for docs in self._documents_by_car.values()]
+
+        def records() -> Iterator[Dict[str, Any]]:
+            for car in cars:
+                yield {'type': 'car', 'car': car}
+            for car_documents in documents:
+                for index, document in enumerate(car_documents):
+                    yield {'type': 'document', 'index': index, 'document': document}
+
+        return records()
+
     def clear(self):
-        """Clear all data from storage (useful for testing)."""
+        """Clear all data from storage (useful for testing; not journaled)."""
         self.cars.clear()
         self.documents.clear()
+        self._cars_by_id.clear()
+        self._cars_by_vin.clear()
+        self._cars_by_plate.clear()
+        self._documents_by_car.clear()
         logger.info("Repository cleared")
 
 
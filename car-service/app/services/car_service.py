@@ -1,20 +1,51 @@
 """Business logic layer for car-service."""
 
 from uuid import UUID
-from typing import List
+from typing import List, Optional
+import base64
+import binascii
 import logging
 
 from app.models.car import (
     AddCarRequest,
     CarResponse,
+    CarBatchResponse,
     AddDocumentRequest,
-    DocumentResponse
+    DocumentResponse,
+    DocumentPage
 )
 from app.repositories.local_car_repo import LocalCarRepository
 
 logger = logging.getLogger(__name__)
 
 
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def _encode_cursor(offset: int) -> str:
+    """Encode a document offset as an opaque URL-safe cursor."""
+    return base64.urlsafe_b64encode(f"o:{offset}".encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> int:
+    """
+    Decode a cursor produced by _encode_cursor.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        prefix, _, value = base64.urlsafe_b64decode(padded).decode().partition(":")
+        offset = int(value)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursorError("Invalid pagination cursor")
+    if prefix != "o" or offset < 0:
+        raise InvalidCursorError("Invalid pagination cursor")
+    return offset
+
+
 class CarService:
     """Service layer for car business logic."""
 
@@ -93,6 +124,43 @@ class CarService:
             year=car['year']
         )
 
+    def get_cars(self, car_ids: List[UUID]) -> CarBatchResponse:
+        """
+        Retrieve several cars in one call.
+
+        Duplicate IDs are looked up once; the order of the first occurrence
+        is preserved in both the found and the missing lists.
+
+        Args:
+            car_ids: UUIDs of the cars
+
+        Returns:
+            CarBatchResponse with found cars and missing IDs
+        """
+        unique_ids = list(dict.fromkeys(car_ids))
+        logger.info(f"Retrieving cars in batch: requested={len(unique_ids)}")
+
+        cars: List[CarResponse] = []
+        missing_ids: List[UUID] = []
+        for car_id in unique_ids:
+            car = self.repository.get_car_by_id(car_id)
+            if car is None:
+                missing_ids.append(car_id)
+                continue
+            cars.append(CarResponse(
+                car_id=car['car_id'],
+                license_plate=car['license_plate'],
+                vin=car['vin'],
+                make=car['make'],
+                model=car['model'],
+                year=car['year']
+            ))
+
+        if missing_ids:
+            logger.warning(f"Batch lookup: {len(missing_ids)} of {len(unique_ids)} cars not found")
+
+        return CarBatchResponse(cars=cars, missing_ids=missing_ids)
+
     def add_document(self, car_id: UUID, request: AddDocumentRequest) -> DocumentResponse:
         """
         Add a document to a car.
@@ -156,3 +224,48 @@ class CarService:
             )
             for doc in documents
         ]
+
+    def list_car_documents(
+        self,
+        car_id: UUID,
+        limit: int,
+        cursor: Optional[str] = None
+    ) -> DocumentPage:
+        """
+        Retrieve one page of documents for a car.
+
+        Args:
+            car_id: UUID of the car
+            limit: Maximum number of documents on the page
+            cursor: Opaque cursor from a previous page, None for the first page
+
+        Returns:
+            DocumentPage with documents and the cursor of the next page
+
+        Raises:
+            InvalidCursorError: If cursor is malformed
+            ValueError: If car not found
+        """
+        offset = _decode_cursor(cursor) if cursor else 0
+        logger.info(f"Listing documents for car: car_id={car_id}, offset={offset}, limit={limit}")
+
+        # Fetch one extra document to know whether another page exists
+        documents = self.repository.get_documents_page(car_id, offset, limit + 1)
+        if documents is None:
+            logger.warning(f"Car not found when listing documents: car_id={car_id}")
+            raise ValueError(f"Car with ID {car_id} not found")
+
+        next_cursor = _encode_cursor(offset + limit) if len(documents) > limit else None
+
+        return DocumentPage(
+            items=[
+                DocumentResponse(
+                    car_id=doc['car_id'],
+                    document_id=doc['document_id'],
+                    document_type=doc['document_type'],
+                    status=doc['status']
+                )
+                for doc in documents[:limit]
+            ],
+            next_cursor=next_cursor
+        )
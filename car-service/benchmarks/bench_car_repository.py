@@ -0,0 +1,75 @@
+"""
+Benchmark for LocalCarRepository insert and lookup cost.
+
+Fills the repository with N cars and measures the mean cost of one more
+insert (including the VIN/license plate duplicate checks) and of
+``get_car_by_id`` for random existing IDs. With the hash indexes both
+numbers should stay flat as N grows from 1k to 1M.
+
+Usage (from the car-service directory):
+    python -m benchmarks.bench_car_repository
+    python -m benchmarks.bench_car_repository --sizes 1000 10000
+"""
+
+import argparse
+import logging
+import random
+import time
+from uuid import uuid4
+
+from app.repositories.local_car_repo import LocalCarRepository
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+SAMPLE_OPS = 10_000
+
+
+def _car_data(index: int) -> dict:
+    """Build a unique car payload for the given index."""
+    return {
+        'owner_id': uuid4(),
+        'license_plate': f"P{index:09d}",
+        'vin': f"V{index:016d}",
+        'make': "Lada",
+        'model': "Vesta",
+        'year': 2021
+    }
+
+
+def run(size: int) -> tuple[float, float]:
+    """
+    Fill a repository with ``size`` cars and time inserts and lookups.
+
+    Returns:
+        Tuple of (insert_us, lookup_us) mean cost per operation in microseconds
+    """
+    repo = LocalCarRepository()
+    car_ids = [repo.add_car(_car_data(i))['car_id'] for i in range(size)]
+
+    start = time.perf_counter()
+    for i in range(size, size + SAMPLE_OPS):
+        repo.add_car(_car_data(i))
+    insert_us = (time.perf_counter() - start) / SAMPLE_OPS * 1e6
+
+    probes = random.choices(car_ids, k=SAMPLE_OPS)
+    start = time.perf_counter()
+    for car_id in probes:
+        repo.get_car_by_id(car_id)
+    lookup_us = (time.perf_counter() - start) / SAMPLE_OPS * 1e6
+
+    return insert_us, lookup_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    print(f"{'cars':>10} {'insert, us':>12} {'lookup, us':>12}")
+    for size in args.sizes:
+        insert_us, lookup_us = run(size)
+        print(f"{size:>10} {insert_us:>12.2f} {lookup_us:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,9 @@ Integration tests for FastAPI endpoints in app.endpoints.cars.
 Tests cover:
 - POST /api/cars (create car) - success and error scenarios
 - GET /api/cars/{car_id} (get car) - success and not found
+- POST /api/cars/batch (batch lookup) - found, missing and limits
 - POST /api/cars/{car_id}/documents (add document) - success and errors
+- GET /api/cars/{car_id}/documents (list documents) - pagination and errors
 - HTTP status codes validation
 - Response format validation
 - End-to-end API flows
@@ -505,6 +507,47 @@ class TestGetCarEndpoint:
         assert data["make"] == "Make2"
 
 
+@pytest.mark.integration
+class TestGetCarsBatchEndpoint:
+    """Test suite for POST /api/cars/batch endpoint."""
+
+    def test_batch_returns_found_and_missing(self, test_client_with_car: tuple[TestClient, Dict]):
+        """Test that one request returns existing cars and unknown IDs."""
+        # Arrange
+        client, car = test_client_with_car
+        missing_id = str(uuid4())
+
+        # Act
+        response = client.post("/api/cars/batch", json={"car_ids": [car["car_id"], missing_id]})
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["cars"] == [car]
+        assert data["missing_ids"] == [missing_id]
+
+    def test_batch_empty_list_returns_422(self, test_client: TestClient):
+        """Test that an empty ID list is rejected."""
+        response = test_client.post("/api/cars/batch", json={"car_ids": []})
+
+        assert response.status_code == 422
+
+    def test_batch_too_many_ids_returns_422(self, test_client: TestClient):
+        """Test that lists above max_batch_size are rejected."""
+        from app.config import settings
+
+        car_ids = [str(uuid4()) for _ in range(settings.max_batch_size + 1)]
+        response = test_client.post("/api/cars/batch", json={"car_ids": car_ids})
+
+        assert response.status_code == 422
+
+    def test_batch_invalid_uuid_returns_422(self, test_client: TestClient):
+        """Test that malformed IDs are rejected."""
+        response = test_client.post("/api/cars/batch", json={"car_ids": ["not-a-uuid"]})
+
+        assert response.status_code == 422
+
+
 @pytest.mark.integration
 class TestAddDocumentEndpoint:
     """Test suite for POST /api/cars/{car_id}/documents endpoint."""
@@ -683,6 +726,73 @@ class TestAddDocumentEndpoint:
         assert data["status"] == "pending"
 
 
+@pytest.mark.integration
+class TestListDocumentsEndpoint:
+    """Test suite for GET /api/cars/{car_id}/documents endpoint."""
+
+    def test_list_documents_paginates_with_cursor(
+        self,
+        test_client_with_car: tuple[TestClient, Dict]
+    ):
+        """Test that documents are returned page by page via next_cursor."""
+        # Arrange
+        client, car = test_client_with_car
+        car_id = car["car_id"]
+        for i in range(5):
+            client.post(f"/api/cars/{car_id}/documents", json={"document_type": f"Scan{i}"})
+
+        # Act
+        first = client.get(f"/api/cars/{car_id}/documents", params={"limit": 3})
+        second = client.get(
+            f"/api/cars/{car_id}/documents",
+            params={"limit": 3, "cursor": first.json()["next_cursor"]}
+        )
+
+        # Assert
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert [d["document_type"] for d in first.json()["items"]] == ["Scan0", "Scan1", "Scan2"]
+        assert [d["document_type"] for d in second.json()["items"]] == ["Scan3", "Scan4"]
+        assert first.json()["next_cursor"] is not None
+        assert second.json()["next_cursor"] is None
+
+    def test_list_documents_empty(self, test_client_with_car: tuple[TestClient, Dict]):
+        """Test listing documents of a car without documents."""
+        client, car = test_client_with_car
+
+        response = client.get(f"/api/cars/{car['car_id']}/documents")
+
+        assert response.status_code == 200
+        assert response.json() == {"items": [], "next_cursor": None}
+
+    def test_list_documents_car_not_found(self, test_client: TestClient):
+        """Test that listing documents of a non-existent car returns 404."""
+        response = test_client.get(f"/api/cars/{uuid4()}/documents")
+
+        assert response.status_code == 404
+
+    def test_list_documents_invalid_cursor(self, test_client_with_car: tuple[TestClient, Dict]):
+        """Test that a malformed cursor returns 400."""
+        client, car = test_client_with_car
+
+        response = client.get(f"/api/cars/{car['car_id']}/documents", params={"cursor": "garbage"})
+
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("limit", [0, -1, 10_000])
+    def test_list_documents_invalid_limit(
+        self,
+        test_client_with_car: tuple[TestClient, Dict],
+        limit: int
+    ):
+        """Test that out-of-range limits are rejected with 422."""
+        client, car = test_client_with_car
+
+        response = client.get(f"/api/cars/{car['car_id']}/documents", params={"limit": limit})
+
+        assert response.status_code == 422
+
+
 @pytest.mark.integration
 class TestEndToEndFlows:
     """Test suite for complete end-to-end API flows."""
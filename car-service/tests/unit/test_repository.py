@@ -7,6 +7,7 @@ Tests cover:
 - Adding documents to cars
 - Retrieving documents by car ID
 - Repository clearing
+- Journal records and recovery
 - Edge cases and error scenarios
 """
 
@@ -14,6 +15,8 @@ import pytest
 from uuid import UUID, uuid4
 from typing import Dict
 
+from detailing_persistence import DurableStore
+
 from app.repositories.local_car_repo import LocalCarRepository, get_repository
 
 
@@ -435,6 +438,42 @@ class TestLocalCarRepositoryDocuments:
         assert car2_docs[0]["document_type"] == "Car2Doc1"
 
 
+@pytest.mark.unit
+class TestLocalCarRepositoryDocumentPages:
+    """Test suite for paged document access."""
+
+    def test_get_documents_page_slices_in_insertion_order(
+        self,
+        repository_with_car: tuple[LocalCarRepository, Dict]
+    ):
+        """Test that pages follow insertion order and respect offset/limit."""
+        # Arrange
+        repo, car = repository_with_car
+        docs = [repo.add_document(car["car_id"], {"document_type": f"Doc{i}"}) for i in range(5)]
+
+        # Act
+        first = repo.get_documents_page(car["car_id"], 0, 2)
+        last = repo.get_documents_page(car["car_id"], 4, 2)
+        beyond = repo.get_documents_page(car["car_id"], 10, 2)
+
+        # Assert
+        assert first == docs[:2]
+        assert last == docs[4:]
+        assert beyond == []
+
+    def test_get_documents_page_unknown_car_returns_none(self, clean_repository: LocalCarRepository):
+        """Test that paging documents of a non-existent car returns None."""
+        assert clean_repository.get_documents_page(uuid4(), 0, 10) is None
+
+    def test_get_documents_page_empty_car(
+        self,
+        repository_with_car: tuple[LocalCarRepository, Dict]
+    ):
+        """Test that an existing car without documents yields an empty page."""
+        repo, car = repository_with_car
+        assert repo.get_documents_page(car["car_id"], 0, 10) == []
+
+
 @pytest.mark.unit
 class TestLocalCarRepositoryUtilityMethods:
     """Test suite for utility methods in the repository."""
@@ -554,6 +593,140 @@ class TestLocalCarRepositoryUtilityMethods:
         assert len(repo.documents) == 0
 
 
+@pytest.mark.unit
+class TestLocalCarRepositoryIndexes:
+    """Test suite for the car_id, VIN and license plate indexes."""
+
+    def test_get_car_by_id_uses_index(
+        self,
+        clean_repository: LocalCarRepository,
+        valid_car_data: Dict
+    ):
+        """Test that every added car is reachable by ID among many cars."""
+        # Arrange
+        repo = clean_repository
+        cars = [
+            repo.add_car({
+                **valid_car_data,
+                "vin": f"V{i:016d}",
+                "license_plate": f"P{i:06d}"
+            })
+            for i in range(50)
+        ]
+
+        # Act & Assert
+        for car in cars:
+            assert repo.get_car_by_id(car["car_id"]) is car
+
+    def test_failed_insert_leaves_indexes_untouched(
+        self,
+        repository_with_car: tuple[LocalCarRepository, Dict],
+        valid_car_data: Dict
+    ):
+        """Test that a rejected duplicate does not register its plate or VIN."""
+        # Arrange
+        repo, car = repository_with_car
+        duplicate_vin = {**valid_car_data, "license_plate": "NEWPLATE1"}
+
+        # Act
+        with pytest.raises(ValueError):
+            repo.add_car(duplicate_vin)
+
+        # Assert - the plate of the rejected car is still free
+        other = repo.add_car({**valid_car_data, "vin": "ZZZZZZZZZZZZZZZZZ", "license_plate": "NEWPLATE1"})
+        assert repo.get_car_by_id(other["car_id"]) is other
+        assert len(repo.cars) == 2
+
+    def test_clear_resets_indexes(
+        self,
+        repository_with_car: tuple[LocalCarRepository, Dict],
+        valid_car_data: Dict
+    ):
+        """Test that clear() empties the indexes so the same car can be re-added."""
+        # Arrange
+        repo, car = repository_with_car
+
+        # Act
+        repo.clear()
+
+        # Assert
+        assert repo.get_car_by_id(car["car_id"]) is None
+        readded = repo.add_car(valid_car_data)
+        assert repo.get_car_by_id(readded["car_id"]) is readded
+
+
+@pytest.mark.unit
+class TestLocalCarRepositoryPersistence:
+    """Test suite for journaling and recovery through a DurableStore."""
+
+    @staticmethod
+    def _recover(directory: str) -> LocalCarRepository:
+        repo = LocalCarRepository()
+        store = DurableStore(directory, "cars")
+        store.recover(repo.apply_record)
+        store.close()
+        return repo
+
+    def test_journaled_cars_and_documents_are_recovered(
+        self,
+        clean_repository: LocalCarRepository,
+        valid_car_data: Dict,
+        tmp_path
+    ):
+        """Test that a restarted repository gets the same cars and documents with typed IDs."""
+        # Arrange
+        repo = clean_repository
+        store = DurableStore(str(tmp_path), "cars")
+        store.recover(repo.apply_record)
+        repo.journal = store
+        car = repo.add_car(valid_car_data)
+        repo.add_document(car["car_id"], {"document_type": "СТС", "file": "sts.pdf"})
+        repo.add_document(car["car_id"], {"document_type": "ПТС"})
+        repo.journal = None
+        store.close()
+
+        # Act
+        recovered = self._recover(str(tmp_path))
+
+        # Assert
+        assert recovered.get_car_by_id(car["car_id"]) == car
+        assert recovered.get_car_by_id(car["car_id"])["owner_id"] == valid_car_data["owner_id"]
+        assert recovered.get_documents_by_car_id(car["car_id"]) == repo.get_documents_by_car_id(car["car_id"])
+        with pytest.raises(ValueError):
+            recovered.add_car(valid_car_data)
+
+    def test_log_overlapping_snapshot_does_not_duplicate(
+        self,
+        clean_repository: LocalCarRepository,
+        valid_car_data: Dict,
+        tmp_path
+    ):
+        """Test that records both in the snapshot and in the log are applied once."""
+        # Arrange
+        repo = clean_repository
+        store = DurableStore(str(tmp_path), "cars")
+        store.recover(repo.apply_record)
+        repo.journal = store
+        car = repo.add_car(valid_car_data)
+
+        def snapshot_with_concurrent_write():
+            # Logged after the log rotation, but already part of the snapshot
+            repo.add_document(car["car_id"], {"document_type": "ОСАГО"})
+            return repo.snapshot_records()
+
+        store.compact(snapshot_with_concurrent_write)
+        repo.add_document(car["car_id"], {"document_type": "СТС"})
+        repo.journal = None
+        store.close()
+
+        # Act
+        recovered = self._recover(str(tmp_path))
+
+        # Assert
+        assert [d["document_type"] for d in recovered.get_documents_by_car_id(car["car_id"])] == ["ОСАГО", "СТС"]
+        assert len(recovered.get_all_cars()) == 1
+
+
 @pytest.mark.unit
 class TestRepositorySingleton:
     """Test suite for the singleton pattern implementation."""
@@ -16,12 +16,14 @@ from uuid import UUID, uuid4
 from unittest.mock import Mock, call
 from typing import Dict
 
-from app.services.car_service import CarService
+from app.services.car_service import CarService, InvalidCursorError
 from app.models.car import (
     AddCarRequest,
     CarResponse,
+    CarBatchResponse,
     AddDocumentRequest,
-    DocumentResponse
+    DocumentResponse,
+    DocumentPage
 )
 from app.repositories.local_car_repo import LocalCarRepository
 
@@ -282,6 +284,46 @@ class TestCarServiceGetCar:
         assert result.make == "Make2"
 
 
+@pytest.mark.unit
+class TestCarServiceGetCars:
+    """Test suite for batch car retrieval via CarService."""
+
+    def test_get_cars_returns_found_and_missing(
+        self,
+        car_service: CarService,
+        valid_car_request: AddCarRequest,
+        another_valid_car_request: AddCarRequest
+    ):
+        """Test that found cars and missing IDs are split in request order."""
+        # Arrange
+        car1 = car_service.create_car(valid_car_request)
+        car2 = car_service.create_car(another_valid_car_request)
+        missing = uuid4()
+
+        # Act
+        result = car_service.get_cars([car2.car_id, missing, car1.car_id])
+
+        # Assert
+        assert isinstance(result, CarBatchResponse)
+        assert [car.car_id for car in result.cars] == [car2.car_id, car1.car_id]
+        assert result.missing_ids == [missing]
+
+    def test_get_cars_deduplicates_ids(self, mock_repository: Mock):
+        """Test that duplicate IDs are looked up and returned once."""
+        # Arrange
+        service = CarService(mock_repository)
+        car_id = uuid4()
+        mock_repository.get_car_by_id.return_value = None
+
+        # Act
+        result = service.get_cars([car_id, car_id, car_id])
+
+        # Assert
+        mock_repository.get_car_by_id.assert_called_once_with(car_id)
+        assert result.cars == []
+        assert result.missing_ids == [car_id]
+
+
 @pytest.mark.unit
 class TestCarServiceAddDocument:
     """Test suite for adding documents via CarService."""
@@ -556,6 +598,94 @@ class TestCarServiceGetCarDocuments:
         assert all(doc.car_id == car2.car_id for doc in car2_docs)
 
 
+@pytest.mark.unit
+class TestCarServiceListCarDocuments:
+    """Test suite for cursor-paginated document listing via CarService."""
+
+    def test_list_car_documents_walks_all_pages(
+        self,
+        car_service_with_car: tuple[CarService, Dict]
+    ):
+        """Test that following next_cursor returns every document exactly once."""
+        # Arrange
+        service, car = car_service_with_car
+        car_id = car["car_id"]
+        created = [
+            service.add_document(car_id, AddDocumentRequest(document_type=f"Scan{i}"))
+            for i in range(7)
+        ]
+
+        # Act
+        seen = []
+        pages = 0
+        cursor = None
+        while True:
+            page = service.list_car_documents(car_id, limit=3, cursor=cursor)
+            assert isinstance(page, DocumentPage)
+            seen.extend(page.items)
+            pages += 1
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        # Assert
+        assert pages == 3
+        assert [doc.document_id for doc in seen] == [doc.document_id for doc in created]
+
+    def test_list_car_documents_exact_page_has_no_next_cursor(
+        self,
+        car_service_with_car: tuple[CarService, Dict]
+    ):
+        """Test that a page ending exactly at the last document has no cursor."""
+        # Arrange
+        service, car = car_service_with_car
+        for i in range(3):
+            service.add_document(car["car_id"], AddDocumentRequest(document_type=f"Doc{i}"))
+
+        # Act
+        page = service.list_car_documents(car["car_id"], limit=3)
+
+        # Assert
+        assert len(page.items) == 3
+        assert page.next_cursor is None
+
+    def test_list_car_documents_car_not_found(self, car_service: CarService):
+        """Test that listing documents of a non-existent car raises ValueError."""
+        with pytest.raises(ValueError) as exc_info:
+            car_service.list_car_documents(uuid4(), limit=10)
+
+        assert not isinstance(exc_info.value, InvalidCursorError)
+        assert "not found" in str(exc_info.value).lower()
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "eDox", "bzotMQ", "!!!"])
+    def test_list_car_documents_invalid_cursor(
+        self,
+        car_service_with_car: tuple[CarService, Dict],
+        cursor: str
+    ):
+        """Test that malformed cursors raise InvalidCursorError."""
+        service, car = car_service_with_car
+
+        with pytest.raises(InvalidCursorError):
+            service.list_car_documents(car["car_id"], limit=10, cursor=cursor)
+
+    def test_list_car_documents_uses_single_repository_call(self, mock_repository: Mock):
+        """Test that listing does not look the car up separately."""
+        # Arrange
+        service = CarService(mock_repository)
+        car_id = uuid4()
+        mock_repository.get_documents_page.return_value = []
+
+        # Act
+        page = service.list_car_documents(car_id, limit=5)
+
+        # Assert
+        mock_repository.get_documents_page.assert_called_once_with(car_id, 0, 6)
+        mock_repository.get_car_by_id.assert_not_called()
+        assert page.items == []
+        assert page.next_cursor is None
+
+
 @pytest.mark.unit
 class TestCarServiceInitialization:
     """Test suite for CarService initialization."""
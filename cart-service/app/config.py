@@ -1,6 +1,7 @@
 """
 Configuration module for Cart Service
 """
+import os
 from uuid import UUID
 
 # Mock user ID for testing purposes
@@ -9,3 +10,28 @@ MOCK_USER_ID = UUID("12345678-1234-5678-1234-567812345678")
 # Service configuration
 SERVICE_NAME = "cart-service"
 SERVICE_PORT = 8004
+
+# Abandoned carts: carts idle longer than the TTL are evicted (0 disables),
+# at most CART_MAX_CARTS carts are kept with LRU eviction (0 means unlimited)
+CART_TTL_SECONDS = float(os.getenv("CART_TTL_SECONDS", 7 * 24 * 3600))
+CART_MAX_CARTS = int(os.getenv("CART_MAX_CARTS", 0))
+CART_SWEEP_INTERVAL_SECONDS = float(os.getenv("CART_SWEEP_INTERVAL_SECONDS", 60))
+
+# Cart storage is split into this many lock shards (per-user locking)
+CART_LOCK_SHARDS = int(os.getenv("CART_LOCK_SHARDS", 64))
+
+# Serialize responses with orjson instead of json.dumps (opt-in)
+FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "false").lower() in ("1", "true", "yes")
+
+# Catalog: optional JSON file loaded at startup; PUT /api/cart/catalog
+# requires this token in X-Catalog-Token (updates are disabled when empty)
+CATALOG_FILE = os.getenv("CATALOG_FILE", "")
+CATALOG_ADMIN_TOKEN = os.getenv("CATALOG_ADMIN_TOKEN", "")
+
+# Downstream services used by checkout (one pooled HTTP client per service)
+ORDER_SERVICE_URL = os.getenv("ORDER_SERVICE_URL", "http://order-service:8003")
+BONUS_SERVICE_URL = os.getenv("BONUS_SERVICE_URL", "http://bonus-service:8006")
+PAYMENT_SERVICE_URL = os.getenv("PAYMENT_SERVICE_URL", "http://payment-service:8005")
+DOWNSTREAM_TIMEOUT_SECONDS = float(os.getenv("DOWNSTREAM_TIMEOUT_SECONDS", 5.0))
+DOWNSTREAM_MAX_CONNECTIONS = int(os.getenv("DOWNSTREAM_MAX_CONNECTIONS", 100))
+DOWNSTREAM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("DOWNSTREAM_MAX_KEEPALIVE_CONNECTIONS", 20))
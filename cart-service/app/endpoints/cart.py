@@ -1,21 +1,66 @@
 """
 Cart API endpoints
 """
-from fastapi import APIRouter, Depends, status, Response
+import hmac
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status, Response
 from uuid import UUID
 
-from app.models.cart import CartResponse, AddItemRequest
-from app.services.cart_service import CartService
+from app.models.cart import (
+    AddItemRequest,
+    BatchCartRequest,
+    CartResponse,
+    CatalogUpdateRequest,
+    CatalogUpdateResponse,
+    CheckoutRequest,
+    CheckoutResponse
+)
+from app.services.cart_service import CATALOG, CartService
+from app.services.catalog_store import CatalogStore
+from app.services.checkout_service import CheckoutService
+from app.services.downstream_client import DownstreamClient
 from app.repositories.local_cart_repo import LocalCartRepo
-from app.auth import get_current_user_id
+from app.config import (
+    BONUS_SERVICE_URL,
+    CART_LOCK_SHARDS,
+    CART_MAX_CARTS,
+    CART_TTL_SECONDS,
+    CATALOG_ADMIN_TOKEN,
+    DOWNSTREAM_MAX_CONNECTIONS,
+    DOWNSTREAM_MAX_KEEPALIVE_CONNECTIONS,
+    DOWNSTREAM_TIMEOUT_SECONDS,
+    ORDER_SERVICE_URL,
+    PAYMENT_SERVICE_URL
+)
+from detailing_auth import get_current_user_id
 
 
 # Create router
 router = APIRouter(prefix="/api/cart", tags=["cart"])
 
 # Initialize repository and service (singleton pattern)
-cart_repo = LocalCartRepo()
-cart_service = CartService(cart_repo)
+cart_repo = LocalCartRepo(ttl_seconds=CART_TTL_SECONDS, max_carts=CART_MAX_CARTS, shards=CART_LOCK_SHARDS)
+catalog_store = CatalogStore(CATALOG)
+cart_service = CartService(cart_repo, catalog_store)
+
+
+def _downstream(name: str, base_url: str) -> DownstreamClient:
+    return DownstreamClient(
+        name=name,
+        base_url=base_url,
+        timeout=DOWNSTREAM_TIMEOUT_SECONDS,
+        max_connections=DOWNSTREAM_MAX_CONNECTIONS,
+        max_keepalive_connections=DOWNSTREAM_MAX_KEEPALIVE_CONNECTIONS
+    )
+
+
+checkout_service = CheckoutService(
+    cart_service,
+    orders=_downstream("order-service", ORDER_SERVICE_URL),
+    bonuses=_downstream("bonus-service", BONUS_SERVICE_URL),
+    payments=_downstream("payment-service", PAYMENT_SERVICE_URL)
+)
 
 
 def get_cart_service() -> CartService:
@@ -25,6 +70,13 @@ def get_cart_service() -> CartService:
     return cart_service
 
 
+def get_checkout_service() -> CheckoutService:
+    """
+    Dependency injection for checkout service
+    """
+    return checkout_service
+
+
 @router.get(
     "",
     response_model=CartResponse,
@@ -73,6 +125,64 @@ def add_item(
     return service.add_item(user_id, request)
 
 
+@router.post(
+    "/items/batch",
+    response_model=CartResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Update several cart items at once",
+    description="Apply add, remove and set_quantity operations atomically and return the final cart"
+)
+def apply_batch(
+    request: BatchCartRequest,
+    user_id: UUID = Depends(get_current_user_id),
+    service: CartService = Depends(get_cart_service)
+) -> CartResponse:
+    """
+    Apply a batch of cart operations
+
+    Args:
+        request: BatchCartRequest with up to 100 operations
+
+    Returns:
+        Final CartResponse
+
+    Raises:
+        HTTPException 404: If an item is not in the catalog, or a removed item is not in the cart
+        HTTPException 400: If an item type mismatches
+    """
+    return service.apply_batch(user_id, request)
+
+
+@router.post(
+    "/checkout",
+    response_model=CheckoutResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Check out the cart",
+    description="Create an order from the cart, apply promocode and bonuses, start the payment and clear the cart"
+)
+async def checkout(
+    request: CheckoutRequest,
+    authorization: str = Header(...),
+    user_id: UUID = Depends(get_current_user_id),
+    service: CheckoutService = Depends(get_checkout_service)
+) -> CheckoutResponse:
+    """
+    Check out the cart
+
+    Args:
+        request: CheckoutRequest with car, appointment time, promocode, bonuses and payment method
+
+    Returns:
+        CheckoutResponse with the created order and payment
+
+    Raises:
+        HTTPException 400: If the cart is empty or bonuses are insufficient
+        HTTPException 409: If a checkout of the user is already running
+        HTTPException 503: If a downstream service is unavailable
+    """
+    return await service.checkout(user_id, authorization, request)
+
+
 @router.delete(
     "/items/{item_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -98,3 +208,68 @@ def remove_item(
     """
     service.remove_item(user_id, item_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)"""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+@router.get(
+    "/catalog",
+    summary="Get catalog",
+    description="Return the current catalog version and items; supports If-None-Match",
+    responses={304: {"description": "Catalog has not changed since the given ETag"}}
+)
+def get_catalog(if_none_match: Optional[str] = Header(None)) -> Response:
+    """
+    Get the product and service catalog
+
+    The body is rendered once per catalog version. Clients send the ETag
+    back in If-None-Match and get 304 Not Modified until the catalog changes.
+
+    Returns:
+        {"version": int, "items": {item_id: {"type", "name", "price"}}}
+    """
+    snapshot = catalog_store.current
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
+    if if_none_match is not None and _etag_matches(if_none_match, snapshot.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
+
+
+@router.put(
+    "/catalog",
+    response_model=CatalogUpdateResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Replace catalog",
+    description="Publish a new catalog version (requires X-Catalog-Token)"
+)
+def update_catalog(
+    request: CatalogUpdateRequest,
+    x_catalog_token: Optional[str] = Header(None)
+) -> CatalogUpdateResponse:
+    """
+    Replace the catalog with a new version
+
+    Carts are repriced against the new version on their next access.
+
+    Args:
+        request: CatalogUpdateRequest with all catalog entries
+
+    Returns:
+        Version, ETag and size of the published catalog
+
+    Raises:
+        HTTPException 403: If updates are disabled or the token is wrong
+    """
+    if not CATALOG_ADMIN_TOKEN:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Catalog updates are disabled")
+    if x_catalog_token is None or not hmac.compare_digest(CATALOG_ADMIN_TOKEN, x_catalog_token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid catalog token")
+
+    snapshot = catalog_store.load({item_id: item.model_dump() for item_id, item in request.items.items()})
+    return CatalogUpdateResponse(version=snapshot.version, etag=snapshot.etag, item_count=len(snapshot.items))
@@ -2,12 +2,15 @@
 Main FastAPI application for Cart Service
 """
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.security import HTTPBearer
+from detailing_observability import setup_load_shedding, setup_metrics, setup_profiling
+from detailing_persistence import setup_persistence
 import logging
 
 from app.endpoints import cart
-from app.config import SERVICE_NAME, SERVICE_PORT
+from app.config import CART_SWEEP_INTERVAL_SECONDS, CATALOG_FILE, FAST_JSON_RESPONSES, SERVICE_NAME, SERVICE_PORT
+from app.services.cart_sweeper import CartSweeper
 
 
 # Configure logging
@@ -29,13 +32,29 @@ app = FastAPI(
     redoc_url="/redoc",
     swagger_ui_parameters={
         "persistAuthorization": True  # Сохраняет токен между обновлениями страницы
-    }
+    },
+    default_response_class=ORJSONResponse if FAST_JSON_RESPONSES else JSONResponse
 )
 
 
+# Shed load (503) on event-loop lag or too many requests in flight
+setup_load_shedding(app)
+
+# Request metrics and /metrics endpoint
+setup_metrics(app)
+
+# Sampling profiler at /debug/profile (only with PROFILING_ENABLED=true)
+setup_profiling(app)
+
+# Snapshot + write-ahead log of carts (only with PERSISTENCE_DIR set)
+setup_persistence(app, "carts", cart.cart_repo)
+
 # Include routers
 app.include_router(cart.router)
 
+# Evicts abandoned carts in the background
+cart_sweeper = CartSweeper(cart.cart_repo, CART_SWEEP_INTERVAL_SECONDS)
+
 
 @app.on_event("startup")
 async def startup_event():
@@ -44,6 +63,9 @@ async def startup_event():
     """
     logger.info(f"{SERVICE_NAME} starting on port {SERVICE_PORT}")
     logger.info("In-memory cart storage initialized")
+    if CATALOG_FILE:
+        cart.catalog_store.load_file(CATALOG_FILE)
+    cart_sweeper.start()
 
 
 @app.on_event("shutdown")
@@ -51,6 +73,8 @@ async def shutdown_event():
     """
     Application shutdown event handler
     """
+    await cart_sweeper.stop()
+    await cart.checkout_service.close()
     logger.info(f"{SERVICE_NAME} shutting down")
 
 
@@ -67,7 +91,9 @@ async def health_check():
         content={
             "status": "healthy",
             "service": SERVICE_NAME,
-            "version": "1.0.0"
+            "version": "1.0.0",
+            "storage": cart.cart_repo.stats(),
+            "catalog": cart.catalog_store.stats()
         }
     )
 
@@ -87,7 +113,9 @@ async def root():
         "endpoints": {
             "health": "/health",
             "docs": "/docs",
-            "cart": "/api/cart"
+            "cart": "/api/cart",
+            "catalog": "/api/cart/catalog",
+            "checkout": "/api/cart/checkout"
         }
     }
 
@@ -1,9 +1,13 @@
 """
 Pydantic models for Cart Service
 """
-from typing import List
+from datetime import datetime
+from typing import Dict, List, Literal, Optional
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+# Upper bound on operations in one batch request
+MAX_BATCH_OPERATIONS = 100
 
 
 class CartItem(BaseModel):
@@ -35,6 +39,7 @@ class CartResponse(BaseModel):
     user_id: UUID = Field(..., description="User identifier")
     items: List[CartItem] = Field(default_factory=list, description="List of items in cart")
     total_price: float = Field(..., ge=0, description="Total price of all items")
+    item_count: int = Field(0, ge=0, description="Total quantity of all items")
 
     class Config:
         json_schema_extra = {
@@ -49,7 +54,8 @@ class CartResponse(BaseModel):
                         "price": 2500.00
                     }
                 ],
-                "total_price": 2500.00
+                "total_price": 2500.00,
+                "item_count": 1
             }
         }
 
@@ -70,3 +76,130 @@ class AddItemRequest(BaseModel):
                 "quantity": 1
             }
         }
+
+
+class CartOperation(BaseModel):
+    """
+    One operation of a batch cart update
+    """
+    op: Literal["add", "remove", "set_quantity"] = Field(..., description="Operation to apply")
+    item_id: str = Field(..., description="Catalog item identifier")
+    type: Optional[str] = Field(None, description="Type of item; checked against the catalog if given")
+    quantity: Optional[int] = Field(
+        None, ge=0, description="Quantity to add (add) or new quantity, 0 removes the item (set_quantity)"
+    )
+
+    @model_validator(mode="after")
+    def check_quantity(self) -> "CartOperation":
+        """Require the quantity the operation needs"""
+        if self.op == "add" and not self.quantity:
+            raise ValueError("add requires a quantity greater than 0")
+        if self.op == "set_quantity" and self.quantity is None:
+            raise ValueError("set_quantity requires a quantity")
+        return self
+
+
+class BatchCartRequest(BaseModel):
+    """
+    Request model for applying several cart operations at once
+    """
+    operations: List[CartOperation] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_OPERATIONS, description="Operations applied in order"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "operations": [
+                    {"op": "add", "item_id": "svc_oil_change", "type": "service", "quantity": 1},
+                    {"op": "set_quantity", "item_id": "prod_oil_filter", "quantity": 2},
+                    {"op": "remove", "item_id": "svc_diagnostics"}
+                ]
+            }
+        }
+
+
+class CatalogItem(BaseModel):
+    """
+    Catalog entry of a product or service
+    """
+    type: str = Field(..., pattern="^(product|service)$", description="Type of item: 'product' or 'service'")
+    name: str = Field(..., min_length=1, description="Display name of the item")
+    price: float = Field(..., gt=0, description="Price per unit")
+
+
+class CatalogUpdateRequest(BaseModel):
+    """
+    Request model for replacing the catalog
+    """
+    items: Dict[str, CatalogItem] = Field(..., description="Catalog entries keyed by item_id")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "items": {
+                    "svc_oil_change": {
+                        "type": "service",
+                        "name": "Замена масла",
+                        "price": 2500.00
+                    }
+                }
+            }
+        }
+
+
+class CatalogUpdateResponse(BaseModel):
+    """
+    Response model for a catalog update
+    """
+    version: int = Field(..., description="Version of the published catalog")
+    etag: str = Field(..., description="ETag served for the published catalog")
+    item_count: int = Field(..., ge=0, description="Number of catalog entries")
+
+
+class CheckoutRequest(BaseModel):
+    """
+    Request model for checking out the cart
+    """
+    car_id: UUID = Field(..., description="UUID of the car to be serviced")
+    desired_time: datetime = Field(..., description="Desired appointment time")
+    description: Optional[str] = Field(
+        None, min_length=1, max_length=500, description="Order description (defaults to the cart content)"
+    )
+    promocode: Optional[str] = Field(None, min_length=1, description="Promocode to apply")
+    bonuses: int = Field(0, ge=0, description="Bonuses to spend on the order")
+    payment_method: Optional[str] = Field(None, description="Payment method (card, sbp); no payment if omitted")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "car_id": "123e4567-e89b-12d3-a456-426614174000",
+                "desired_time": "2025-11-20T10:00:00",
+                "promocode": "SUMMER24",
+                "bonuses": 100,
+                "payment_method": "card"
+            }
+        }
+
+
+class CheckoutPayment(BaseModel):
+    """
+    Payment created during checkout
+    """
+    payment_id: str = Field(..., description="Payment identifier")
+    status: str = Field(..., description="Payment status")
+    confirmation_url: str = Field(..., description="URL to confirm the payment")
+
+
+class CheckoutResponse(BaseModel):
+    """
+    Response model for a completed checkout
+    """
+    order_id: UUID = Field(..., description="Created order identifier")
+    order_status: str = Field(..., description="Status of the created order")
+    items: List[CartItem] = Field(..., description="Items that were checked out")
+    total_price: float = Field(..., ge=0, description="Cart total before discounts")
+    discount_amount: float = Field(0, ge=0, description="Promocode discount")
+    bonuses_spent: int = Field(0, ge=0, description="Bonuses spent on the order")
+    amount_due: float = Field(..., ge=0, description="Total after discount and bonuses")
+    payment: Optional[CheckoutPayment] = Field(None, description="Created payment, if requested")
@@ -1,20 +1,260 @@
 """
 Local in-memory repository for cart data
 """
-from typing import Dict, List, Optional
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 from uuid import UUID
 from app.models.cart import CartItem
+from detailing_observability import REGISTRY, MetricsRegistry
+from detailing_persistence import DurableStore
+
+logger = logging.getLogger(__name__)
+
+CENTS = Decimal("0.01")
+
+# Rough fixed cost of one resident cart: storage key, Cart object, item dict
+CART_OVERHEAD_BYTES = sys.getsizeof(UUID(int=0)) + 64 + sys.getsizeof({})
+
+
+# Model instance, its field dict and the numeric fields of one cart line
+ITEM_OVERHEAD_BYTES = (
+    sys.getsizeof(CartItem(item_id="", type="", name="", quantity=1, price=1.0))
+    + sys.getsizeof({"item_id": 0, "type": 0, "name": 0, "quantity": 0, "price": 0})
+    + sys.getsizeof(0) + sys.getsizeof(0.0)
+)
+
+
+def _item_bytes(item: CartItem) -> int:
+    """Approximate memory held by one cart line (stable while quantity changes)"""
+    return ITEM_OVERHEAD_BYTES + sys.getsizeof(item.item_id) + sys.getsizeof(item.type) + sys.getsizeof(item.name)
+
+
+class Cart:
+    """
+    Items of one cart keyed by item_id, with running totals
+
+    total and item_count are updated on every mutation, so reading them
+    never walks the items. The total is kept as an exact Decimal sum of
+    line totals to avoid float drift from repeated adds and removes.
+    catalog_version is the catalog version the lines were priced against.
+    """
+
+    __slots__ = ("items", "total", "item_count", "bytes", "touched_at", "catalog_version")
+
+    def __init__(self, touched_at: float = 0.0, catalog_version: int = 0):
+        self.items: Dict[str, CartItem] = {}
+        self.total = Decimal(0)
+        self.item_count = 0
+        self.bytes = CART_OVERHEAD_BYTES
+        self.touched_at = touched_at
+        self.catalog_version = catalog_version
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @staticmethod
+    def _line_total(price: float, quantity: int) -> Decimal:
+        return Decimal(repr(price)) * quantity
+
+    @property
+    def total_price(self) -> float:
+        """Total price rounded to 2 decimal places"""
+        return float(self.total.quantize(CENTS))
+
+    def add(self, item: CartItem) -> None:
+        """
+        Add an item or increase the quantity of an existing one
+
+        Stored items are never mutated: an existing line is replaced by a
+        copy with the new quantity, so item lists handed out earlier keep
+        showing the state they were read in.
+        """
+        existing_item = self.items.get(item.item_id)
+        if existing_item is not None:
+            self.items[item.item_id] = existing_item.model_copy(
+                update={"quantity": existing_item.quantity + item.quantity}
+            )
+        else:
+            self.items[item.item_id] = item
+            self.bytes += _item_bytes(item)
+        self.total += self._line_total(item.price, item.quantity)
+        self.item_count += item.quantity
+
+    def remove(self, item_id: str) -> bool:
+        """Remove an item; returns False if it is not in the cart"""
+        item = self.items.pop(item_id, None)
+        if item is None:
+            return False
+        self.total -= self._line_total(item.price, item.quantity)
+        self.item_count -= item.quantity
+        self.bytes -= _item_bytes(item)
+        return True
+
+    def reprice(self, catalog: Mapping[str, Mapping[str, Any]], version: int) -> int:
+        """
+        Update names, types and prices of all lines from a catalog
+
+        Lines whose item is no longer in the catalog are removed. Changed
+        lines are replaced by copies, like in add().
+
+        Returns:
+            Number of lines that were changed or removed
+        """
+        changed = 0
+        for item_id, item in list(self.items.items()):
+            entry = catalog.get(item_id)
+            if entry is None:
+                self.remove(item_id)
+                changed += 1
+                continue
+            if entry["price"] == item.price and entry["name"] == item.name and entry["type"] == item.type:
+                continue
+            repriced = item.model_copy(update={"type": entry["type"], "name": entry["name"], "price": entry["price"]})
+            self.items[item_id] = repriced
+            self.total += self._line_total(repriced.price, item.quantity) - self._line_total(item.price, item.quantity)
+            self.bytes += _item_bytes(repriced) - _item_bytes(item)
+            changed += 1
+        self.catalog_version = version
+        return changed
+
+    def list_items(self) -> List[CartItem]:
+        """Items in insertion order"""
+        return list(self.items.values())
+
+
+class _Shard:
+    """Carts of the users hashed to one lock, in least-recently-touched order"""
+
+    __slots__ = ("lock", "carts", "bytes")
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.carts: "OrderedDict[UUID, Cart]" = OrderedDict()
+        self.bytes = 0
 
 
 class LocalCartRepo:
     """
     In-memory storage for shopping carts
     Key: user_id (UUID)
-    Value: List of CartItem objects
+    Value: Cart with items keyed by item_id and running totals
+
+    Cart endpoints are sync handlers running on the threadpool, so the
+    storage is split into shards, each with its own re-entrant lock and its
+    own touch-ordered dict. Every method locks only the shard of the user it
+    works on: mutations of one cart are linearizable while different users
+    proceed in parallel. Callers that combine several calls into one
+    operation (read-modify-read) hold lock(user_id) around them.
+
+    Every read or write touches the cart; a cart idle for longer than
+    ttl_seconds is treated as abandoned and dropped, either lazily on access
+    or by evict_expired(). When max_carts is set, adding a cart beyond the
+    limit evicts the least recently touched cart across all shards.
+    Evictions take one shard lock at a time, never while holding another.
+    Empty carts are not kept. A ttl_seconds or max_carts of 0 disables that
+    bound.
+
+    When ``journal`` is set, the full content of a cart is appended to it
+    after every change, under the shard lock (an empty list when the cart
+    is cleared, emptied or evicted). Recovered carts are repriced on their
+    next access like carts of an older catalog version.
+
+    Metrics:
+        cart_resident_carts, cart_resident_bytes (approximate)
+        cart_evictions_total{reason}
     """
 
-    def __init__(self):
-        self._storage: Dict[UUID, List[CartItem]] = {}
+    def __init__(
+        self,
+        ttl_seconds: float = 0,
+        max_carts: int = 0,
+        shards: int = 64,
+        clock: Callable[[], float] = time.monotonic,
+        registry: MetricsRegistry = REGISTRY
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_carts = max_carts
+        self._clock = clock
+        self._shards = [_Shard() for _ in range(max(1, shards))]
+        self._evictions_lock = threading.Lock()
+        self.evictions = {"ttl": 0, "lru": 0}
+        self._resident_carts = registry.gauge("cart_resident_carts", "Carts currently held in memory")
+        self._resident_bytes = registry.gauge("cart_resident_bytes", "Approximate memory held by resident carts")
+        self._evictions_total = registry.counter(
+            "cart_evictions_total", "Carts dropped from memory by reason", ("reason",)
+        )
+        self.journal: Optional[DurableStore] = None
+
+    def _shard(self, user_id: UUID) -> _Shard:
+        return self._shards[hash(user_id) % len(self._shards)]
+
+    def lock(self, user_id: UUID) -> threading.RLock:
+        """
+        Lock guarding the user's cart (re-entrant, shared with other users of the shard)
+
+        Usage:
+            with repo.lock(user_id):
+                repo.add_item(user_id, item)
+                totals = repo.get_totals(user_id)
+        """
+        return self._shard(user_id).lock
+
+    def _expired(self, cart: Cart, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - cart.touched_at > self.ttl_seconds
+
+    def _touch(self, shard: _Shard, user_id: UUID) -> Optional[Cart]:
+        """Return the user's live cart and mark it as recently used (shard lock held)"""
+        cart = shard.carts.get(user_id)
+        if cart is None:
+            return None
+        now = self._clock()
+        if self._expired(cart, now):
+            self._drop(shard, user_id, "ttl")
+            return None
+        cart.touched_at = now
+        shard.carts.move_to_end(user_id)
+        return cart
+
+    def _log(self, user_id: UUID, items: List[CartItem]) -> None:
+        """Append the cart's full content to the journal, if any (shard lock held)"""
+        if self.journal is not None:
+            self.journal.append({
+                "type": "cart",
+                "user_id": user_id,
+                "items": [item.model_dump() for item in items]
+            })
+
+    def _drop(self, shard: _Shard, user_id: UUID, reason: Optional[str] = None) -> None:
+        """Remove a cart from memory, counting it as an eviction if reason is given (shard lock held)"""
+        cart = shard.carts.pop(user_id, None)
+        if cart is None:
+            return
+        self._log(user_id, [])
+        shard.bytes -= cart.bytes
+        self._resident_carts.dec()
+        self._resident_bytes.dec(amount=cart.bytes)
+        if reason is not None:
+            with self._evictions_lock:
+                self.evictions[reason] += 1
+            self._evictions_total.inc(reason)
+
+    def _add_bytes(self, shard: _Shard, delta: int) -> None:
+        if delta:
+            shard.bytes += delta
+            self._resident_bytes.inc(amount=delta)
+
+    def cart_count(self) -> int:
+        """Number of resident carts"""
+        return sum(len(shard.carts) for shard in self._shards)
+
+    def resident_bytes(self) -> int:
+        """Approximate memory held by resident carts"""
+        return sum(shard.bytes for shard in self._shards)
 
     def get_cart(self, user_id: UUID) -> List[CartItem]:
         """
@@ -26,9 +266,29 @@ class LocalCartRepo:
         Returns:
             List of cart items (empty list if cart doesn't exist)
         """
-        return self._storage.get(user_id, [])
+        shard = self._shard(user_id)
+        with shard.lock:
+            cart = self._touch(shard, user_id)
+            return cart.list_items() if cart is not None else []
+
+    def get_totals(self, user_id: UUID) -> Tuple[float, int]:
+        """
+        Retrieve the running totals of a user's cart in O(1)
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Tuple of (total price rounded to 2 decimals, total quantity)
+        """
+        shard = self._shard(user_id)
+        with shard.lock:
+            cart = self._touch(shard, user_id)
+            if cart is None:
+                return 0.0, 0
+            return cart.total_price, cart.item_count
 
-    def add_item(self, user_id: UUID, item: CartItem) -> List[CartItem]:
+    def add_item(self, user_id: UUID, item: CartItem, catalog_version: int = 0) -> List[CartItem]:
         """
         Add an item to user's cart
         If item already exists, increases quantity
@@ -36,29 +296,121 @@ class LocalCartRepo:
         Args:
             user_id: User identifier
             item: Cart item to add
+            catalog_version: Catalog version a newly created cart is priced against
 
         Returns:
             Updated list of cart items
         """
-        if user_id not in self._storage:
-            self._storage[user_id] = []
+        shard = self._shard(user_id)
+        created = False
+        with shard.lock:
+            cart = self._touch(shard, user_id)
+            if cart is None:
+                cart = shard.carts[user_id] = Cart(touched_at=self._clock(), catalog_version=catalog_version)
+                self._resident_carts.inc()
+                self._add_bytes(shard, cart.bytes)
+                created = True
 
-        cart = self._storage[user_id]
+            bytes_before = cart.bytes
+            cart.add(item)
+            self._add_bytes(shard, cart.bytes - bytes_before)
+            items = cart.list_items()
+            self._log(user_id, items)
 
-        # Check if item already exists in cart
-        existing_item = next(
-            (i for i in cart if i.item_id == item.item_id),
-            None
-        )
+        if created and self.max_carts > 0:
+            self._enforce_max_carts()
+        return items
 
-        if existing_item:
-            # Update quantity of existing item
-            existing_item.quantity += item.quantity
-        else:
-            # Add new item to cart
-            cart.append(item)
+    def set_items(self, user_id: UUID, items: List[CartItem], catalog_version: int = 0) -> List[CartItem]:
+        """
+        Replace the whole content of user's cart in one step
 
-        return cart
+        The new cart is built aside and swapped in under the shard lock, so
+        readers see either the old or the new content. An empty list drops
+        the cart.
+
+        Args:
+            user_id: User identifier
+            items: New cart lines in display order
+            catalog_version: Catalog version the lines are priced against
+
+        Returns:
+            Updated list of cart items
+        """
+        shard = self._shard(user_id)
+        created = False
+        with shard.lock:
+            old = self._touch(shard, user_id)
+            if not items:
+                self._drop(shard, user_id)
+                return []
+
+            cart = Cart(touched_at=self._clock(), catalog_version=catalog_version)
+            for item in items:
+                cart.add(item)
+            if old is None:
+                self._resident_carts.inc()
+                created = True
+            else:
+                self._add_bytes(shard, -old.bytes)
+            shard.carts[user_id] = cart
+            self._add_bytes(shard, cart.bytes)
+            items = cart.list_items()
+            self._log(user_id, items)
+
+        if created and self.max_carts > 0:
+            self._enforce_max_carts()
+        return items
+
+    def reprice(self, user_id: UUID, catalog: Mapping[str, Mapping[str, Any]], version: int) -> bool:
+        """
+        Bring a cart up to date with the given catalog version
+
+        Does nothing if the cart does not exist or is already priced
+        against this version, so calling it on every access is cheap.
+
+        Args:
+            user_id: User identifier
+            catalog: Mapping of item_id to {"type", "name", "price"}
+            version: Version of the catalog
+
+        Returns:
+            True if the cart was repriced
+        """
+        shard = self._shard(user_id)
+        with shard.lock:
+            cart = shard.carts.get(user_id)
+            if cart is None or cart.catalog_version == version:
+                return False
+            bytes_before = cart.bytes
+            changed = cart.reprice(catalog, version)
+            self._add_bytes(shard, cart.bytes - bytes_before)
+            if not cart.items:
+                self._drop(shard, user_id)
+            elif changed:
+                self._log(user_id, cart.list_items())
+        if changed:
+            logger.debug(f"Cart of user {user_id} repriced to catalog version {version}: {changed} lines changed")
+        return True
+
+    def _enforce_max_carts(self) -> None:
+        """Evict least recently touched carts until at most max_carts remain"""
+        while self.cart_count() > self.max_carts:
+            # The globally oldest cart is the oldest of the shard heads
+            oldest = None
+            for shard in self._shards:
+                with shard.lock:
+                    head = next(iter(shard.carts.items()), None)
+                if head is not None and (oldest is None or head[1].touched_at < oldest[2]):
+                    oldest = (shard, head[0], head[1].touched_at)
+            if oldest is None:
+                return
+            shard, user_id, touched_at = oldest
+            with shard.lock:
+                cart = shard.carts.get(user_id)
+                # Skip if the cart was touched or dropped since it was picked
+                if cart is not None and cart.touched_at == touched_at:
+                    self._drop(shard, user_id, "lru")
 
     def remove_item(self, user_id: UUID, item_id: str) -> bool:
         """
@@ -71,17 +423,20 @@ class LocalCartRepo:
         Returns:
             True if item was removed, False if item or cart not found
         """
-        if user_id not in self._storage:
-            return False
-
-        cart = self._storage[user_id]
-        initial_length = len(cart)
-
-        # Filter out the item with matching item_id
-        self._storage[user_id] = [item for item in cart if item.item_id != item_id]
-
-        # Return True if an item was actually removed
-        return len(self._storage[user_id]) < initial_length
+        shard = self._shard(user_id)
+        with shard.lock:
+            cart = self._touch(shard, user_id)
+            if cart is None:
+                return False
+            bytes_before = cart.bytes
+            if not cart.remove(item_id):
+                return False
+            self._add_bytes(shard, cart.bytes - bytes_before)
+            if not cart.items:
+                self._drop(shard, user_id)
+            else:
+                self._log(user_id, cart.list_items())
+        return True
 
     def clear_cart(self, user_id: UUID) -> None:
         """
@@ -90,14 +445,91 @@ class LocalCartRepo:
         Args:
             user_id: User identifier
         """
-        if user_id in self._storage:
-            self._storage[user_id] = []
+        shard = self._shard(user_id)
+        with shard.lock:
+            self._drop(shard, user_id)
+
+    def clear_all(self) -> None:
+        """Drop every cart (mainly for testing)"""
+        for shard in self._shards:
+            with shard.lock:
+                for user_id in list(shard.carts):
+                    self._drop(shard, user_id)
+
+    def evict_expired(self) -> int:
+        """
+        Drop carts idle for longer than the TTL
+
+        Each shard is ordered by last touch, so only expired carts at the
+        head of every shard are visited.
+
+        Returns:
+            Number of evicted carts
+        """
+        if self.ttl_seconds <= 0:
+            return 0
+        now = self._clock()
+        evicted = 0
+        for shard in self._shards:
+            with shard.lock:
+                while shard.carts:
+                    user_id, cart = next(iter(shard.carts.items()))
+                    if not self._expired(cart, now):
+                        break
+                    self._drop(shard, user_id, "ttl")
+                    evicted += 1
+        if evicted:
+            logger.info(f"Evicted {evicted} abandoned carts")
+        return evicted
+
+    def stats(self) -> Dict[str, int]:
+        """Return resident cart counts and eviction counters"""
+        return {
+            "carts": self.cart_count(),
+            "bytes": self.resident_bytes(),
+            "max_carts": self.max_carts,
+            "ttl_seconds": self.ttl_seconds,
+            "lock_shards": len(self._shards),
+            "evicted_ttl": self.evictions["ttl"],
+            "evicted_lru": self.evictions["lru"]
+        }
+
+    def apply_record(self, record: Dict[str, Any]) -> None:
+        """
+        Apply a journal record during recovery
+
+        The cart gets catalog version 0, so it is repriced on first access.
+        """
+        if record["type"] != "cart":
+            raise ValueError(f"Unknown record type: {record['type']!r}")
+        self.set_items(UUID(record["user_id"]), [CartItem(**item) for item in record["items"]])
+
+    def snapshot_records(self) -> Iterable[Dict[str, Any]]:
+        """
+        Records rebuilding all resident carts
+
+        Shards are copied one at a time under their lock while the records
+        are consumed, so the result can be read on another thread.
+        """
+        def records() -> Iterator[Dict[str, Any]]:
+            for shard in self._shards:
+                with shard.lock:
+                    carts = [(user_id, cart.list_items()) for user_id, cart in shard.carts.items()]
+                for user_id, items in carts:
+                    yield {"type": "cart", "user_id": user_id, "items": [item.model_dump() for item in items]}
+
+        return records()
 
-    def get_all_carts(self) -> Dict[UUID, List[CartItem]]:
+    def get_all_carts(self) -> Dict[UUID, Cart]:
         """
         Retrieve all carts (mainly for debugging/testing)
 
         Returns:
-            Dictionary of all carts
+            Snapshot dictionary of all carts, least recently touched first
+            within each shard
         """
-        return self._storage
+        all_carts: Dict[UUID, Cart] = {}
+        for shard in self._shards:
+            with shard.lock:
+                all_carts.update(shard.carts)
+        return all_carts
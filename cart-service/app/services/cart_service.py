@@ -1,15 +1,16 @@
 """
 Business logic for Cart Service
 """
-from typing import Dict, List
+from typing import Any, Dict, List, Mapping, Optional
 from uuid import UUID
 from fastapi import HTTPException, status
 
-from app.models.cart import CartItem, CartResponse, AddItemRequest
+from app.models.cart import CartItem, CartResponse, AddItemRequest, BatchCartRequest
 from app.repositories.local_cart_repo import LocalCartRepo
+from app.services.catalog_store import CatalogStore
 
 
-# Catalog of available products and services
+# Default catalog of available products and services (catalog version 1)
 CATALOG = {
     "svc_oil_change": {
         "type": "service",
@@ -32,14 +33,19 @@ CATALOG = {
 class CartService:
     """
     Service layer for cart operations
+
+    Cart lines keep the price they were added with until the catalog
+    changes; every cart operation first reprices the cart if it was priced
+    against an older catalog version.
     """
 
-    def __init__(self, repository: LocalCartRepo):
+    def __init__(self, repository: LocalCartRepo, catalog: Optional[CatalogStore] = None):
         self.repo = repository
+        self.catalog = catalog or CatalogStore(CATALOG)
 
     def get_cart(self, user_id: UUID) -> CartResponse:
         """
-        Retrieve user's cart with calculated total price
+        Retrieve user's cart with its running total price
 
         Args:
             user_id: User identifier
@@ -47,13 +53,17 @@ class CartService:
         Returns:
             CartResponse with items and total price
         """
-        items = self.repo.get_cart(user_id)
-        total_price = self._calculate_total_price(items)
+        snapshot = self.catalog.current
+        with self.repo.lock(user_id):
+            self.repo.reprice(user_id, snapshot.items, snapshot.version)
+            items = self.repo.get_cart(user_id)
+            total_price, item_count = self.repo.get_totals(user_id)
 
         return CartResponse(
             user_id=user_id,
             items=items,
-            total_price=total_price
+            total_price=total_price,
+            item_count=item_count
         )
 
     def add_item(self, user_id: UUID, request: AddItemRequest) -> CartResponse:
@@ -70,15 +80,16 @@ class CartService:
         Raises:
             HTTPException: If item_id not found in catalog
         """
+        snapshot = self.catalog.current
+
         # Validate item exists in catalog
-        if request.item_id not in CATALOG:
+        catalog_item = snapshot.items.get(request.item_id)
+        if catalog_item is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Item '{request.item_id}' not found in catalog"
             )
 
-        catalog_item = CATALOG[request.item_id]
-
         # Validate type matches
         if catalog_item["type"] != request.type:
             raise HTTPException(
@@ -95,14 +106,93 @@ class CartService:
             price=catalog_item["price"]
         )
 
-        # Add to repository
-        updated_items = self.repo.add_item(user_id, cart_item)
-        total_price = self._calculate_total_price(updated_items)
+        # Add to repository; items and totals are read under the same lock
+        with self.repo.lock(user_id):
+            self.repo.reprice(user_id, snapshot.items, snapshot.version)
+            updated_items = self.repo.add_item(user_id, cart_item, catalog_version=snapshot.version)
+            total_price, item_count = self.repo.get_totals(user_id)
 
         return CartResponse(
             user_id=user_id,
             items=updated_items,
-            total_price=total_price
+            total_price=total_price,
+            item_count=item_count
+        )
+
+    def apply_batch(self, user_id: UUID, request: BatchCartRequest) -> CartResponse:
+        """
+        Apply add/remove/set_quantity operations to user's cart atomically
+
+        Operations are applied in order to a working copy of the cart under
+        the user's lock; the result is stored only if every operation is
+        valid, otherwise the cart is left unchanged.
+
+        Args:
+            user_id: User identifier
+            request: Batch of operations
+
+        Returns:
+            Final CartResponse
+
+        Raises:
+            HTTPException: If an item is not in the catalog (404), its type
+                does not match (400) or a removed item is not in the cart (404)
+        """
+        snapshot = self.catalog.current
+
+        with self.repo.lock(user_id):
+            self.repo.reprice(user_id, snapshot.items, snapshot.version)
+            lines = {item.item_id: item for item in self.repo.get_cart(user_id)}
+
+            for index, operation in enumerate(request.operations):
+                if operation.op == "remove":
+                    if lines.pop(operation.item_id, None) is None:
+                        raise HTTPException(
+                            status_code=status.HTTP_404_NOT_FOUND,
+                            detail=f"Operation {index}: item '{operation.item_id}' not found in cart"
+                        )
+                    continue
+
+                catalog_item = snapshot.items.get(operation.item_id)
+                if catalog_item is None:
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail=f"Operation {index}: item '{operation.item_id}' not found in catalog"
+                    )
+                if operation.type is not None and catalog_item["type"] != operation.type:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=(
+                            f"Operation {index}: item type mismatch: expected "
+                            f"'{catalog_item['type']}', got '{operation.type}'"
+                        )
+                    )
+
+                existing = lines.get(operation.item_id)
+                quantity = operation.quantity
+                if operation.op == "add" and existing is not None:
+                    quantity += existing.quantity
+                if quantity == 0:
+                    lines.pop(operation.item_id, None)
+                elif existing is not None:
+                    lines[operation.item_id] = existing.model_copy(update={"quantity": quantity})
+                else:
+                    lines[operation.item_id] = CartItem(
+                        item_id=operation.item_id,
+                        type=catalog_item["type"],
+                        name=catalog_item["name"],
+                        quantity=quantity,
+                        price=catalog_item["price"]
+                    )
+
+            items = self.repo.set_items(user_id, list(lines.values()), catalog_version=snapshot.version)
+            total_price, item_count = self.repo.get_totals(user_id)
+
+        return CartResponse(
+            user_id=user_id,
+            items=items,
+            total_price=total_price,
+            item_count=item_count
         )
 
     def remove_item(self, user_id: UUID, item_id: str) -> None:
@@ -124,25 +214,35 @@ class CartService:
                 detail=f"Item '{item_id}' not found in cart"
             )
 
-    @staticmethod
-    def _calculate_total_price(items: List[CartItem]) -> float:
+    def remove_checked_out(self, user_id: UUID, items: List[CartItem]) -> None:
         """
-        Calculate total price of all items in cart
+        Remove checked-out quantities from user's cart
 
-        Args:
-            items: List of cart items
+        Only the quantities that were ordered are subtracted, so items
+        added while the checkout was running stay in the cart.
 
-        Returns:
-            Total price rounded to 2 decimal places
+        Args:
+            user_id: User identifier
+            items: Cart items as they were checked out
         """
-        total = sum(item.price * item.quantity for item in items)
-        return round(total, 2)
-
-    def get_catalog(self) -> Dict:
+        ordered = {item.item_id: item.quantity for item in items}
+        snapshot = self.catalog.current
+        with self.repo.lock(user_id):
+            self.repo.reprice(user_id, snapshot.items, snapshot.version)
+            remaining = []
+            for item in self.repo.get_cart(user_id):
+                quantity = item.quantity - ordered.get(item.item_id, 0)
+                if quantity == item.quantity:
+                    remaining.append(item)
+                elif quantity > 0:
+                    remaining.append(item.model_copy(update={"quantity": quantity}))
+            self.repo.set_items(user_id, remaining, catalog_version=snapshot.version)
+
+    def get_catalog(self) -> Mapping[str, Dict[str, Any]]:
         """
         Get available catalog items
 
         Returns:
-            Catalog dictionary
+            Catalog dictionary of the current version
         """
-        return CATALOG
+        return self.catalog.current.items
@@ -0,0 +1,48 @@
+"""
+Background eviction of abandoned carts
+"""
+import asyncio
+import logging
+from typing import Optional
+
+from app.repositories.local_cart_repo import LocalCartRepo
+
+logger = logging.getLogger(__name__)
+
+
+class CartSweeper:
+    """
+    Periodically drop carts idle beyond the repository TTL
+
+    Expired carts are also dropped lazily when accessed; the sweeper makes
+    sure carts that are never read again do not stay in memory.
+    """
+
+    def __init__(self, repository: LocalCartRepo, interval: float):
+        self.repo = repository
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start sweeping in the running event loop (no-op if TTL is disabled)"""
+        if self.repo.ttl_seconds <= 0 or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(), name="cart-sweeper")
+        logger.info(f"Cart sweeper started: ttl={self.repo.ttl_seconds}s, interval={self.interval}s")
+
+    async def stop(self) -> None:
+        """Stop the sweeper task"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                # Shard locks are shared with threadpool handlers; keep them off the loop
+                await asyncio.to_thread(self.repo.evict_expired)
+            except Exception as e:
+                logger.error(f"Cart sweep failed: {e}")
@@ -0,0 +1,126 @@
+"""
+Versioned in-memory catalog with atomically swapped snapshots
+"""
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping
+
+from pydantic import ValidationError
+
+from app.models.cart import CatalogUpdateRequest
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """
+    One immutable version of the catalog
+
+    items must not be mutated once the snapshot is published. body is the
+    JSON served by GET /api/cart/catalog, rendered once per version, and
+    etag is a hash of those exact bytes (version included), so two
+    snapshots share a strong ETag only if they serve identical bodies.
+    """
+
+    version: int
+    items: Mapping[str, Dict[str, Any]]
+    body: bytes
+    etag: str
+
+
+def _build_snapshot(version: int, items: Dict[str, Dict[str, Any]]) -> CatalogSnapshot:
+    body = json.dumps(
+        {"version": version, "items": items}, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    ).encode("utf-8")
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    return CatalogSnapshot(version=version, items=items, body=body, etag=etag)
+
+
+class CatalogStore:
+    """
+    Holder of the current catalog snapshot
+
+    Readers take ``current`` once per operation and use that snapshot
+    throughout, so they never see a half-loaded catalog. load() validates
+    the new items, builds the next snapshot off to the side and publishes
+    it with a single reference assignment; versions increase by one per
+    load. Carts remember the version they were priced against and are
+    repriced lazily on their next access (see CartService).
+    """
+
+    def __init__(self, items: Dict[str, Dict[str, Any]]):
+        self._load_lock = threading.Lock()
+        self._snapshot = _build_snapshot(1, self._validate(items))
+
+    @staticmethod
+    def _validate(items: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Check catalog entries and normalize them to plain dicts
+
+        Raises:
+            ValueError: If an entry is malformed
+        """
+        try:
+            request = CatalogUpdateRequest(items=items)
+        except ValidationError as e:
+            raise ValueError(f"Invalid catalog: {e}") from e
+        return {item_id: entry.model_dump() for item_id, entry in request.items.items()}
+
+    @property
+    def current(self) -> CatalogSnapshot:
+        """The snapshot currently in effect"""
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        """Version of the current snapshot"""
+        return self._snapshot.version
+
+    def load(self, items: Dict[str, Any]) -> CatalogSnapshot:
+        """
+        Replace the catalog
+
+        Args:
+            items: Mapping of item_id to {"type", "name", "price"}
+
+        Returns:
+            The published snapshot
+
+        Raises:
+            ValueError: If an entry is malformed (the current catalog is kept)
+        """
+        items = self._validate(items)
+        with self._load_lock:
+            snapshot = _build_snapshot(self._snapshot.version + 1, items)
+            self._snapshot = snapshot
+        logger.info(f"Catalog version {snapshot.version} loaded: {len(items)} items")
+        return snapshot
+
+    def load_file(self, path: str) -> CatalogSnapshot:
+        """
+        Replace the catalog from a JSON file
+
+        The file holds either {"items": {...}} (the admin endpoint body) or
+        the item mapping itself.
+
+        Raises:
+            ValueError: If the file is not valid JSON or an entry is malformed
+            OSError: If the file cannot be read
+        """
+        with open(path, encoding="utf-8") as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid catalog file {path}: {e}") from e
+        if isinstance(data, dict) and isinstance(data.get("items"), dict):
+            data = data["items"]
+        return self.load(data)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the current version, ETag and size"""
+        snapshot = self._snapshot
+        return {"version": snapshot.version, "etag": snapshot.etag, "items": len(snapshot.items)}
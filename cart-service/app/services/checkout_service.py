@@ -0,0 +1,235 @@
+"""
+Checkout of the cart into an order, bonuses and a payment
+"""
+import asyncio
+import logging
+import time
+from decimal import Decimal
+from typing import Any, Dict, Optional, Set
+from uuid import UUID
+
+from fastapi import HTTPException, status
+
+from app.models.cart import CartResponse, CheckoutPayment, CheckoutRequest, CheckoutResponse
+from app.services.cart_service import CartService
+from app.services.downstream_client import DownstreamClient, DownstreamUnavailableError
+
+logger = logging.getLogger(__name__)
+
+CENTS = Decimal("0.01")
+
+
+def _describe(cart: CartResponse) -> str:
+    """Default order description listing the cart lines"""
+    description = ", ".join(f"{item.name} x{item.quantity}" for item in cart.items)
+    return description if len(description) <= 500 else description[:497] + "..."
+
+
+class CheckoutService:
+    """
+    Turn a user's cart into an order in one call
+
+    Steps that depend on each other run in sequence, independent ones
+    concurrently, all over pooled connections:
+
+    1. read the cart and the bonus balance (concurrently), rejecting a short
+       balance before anything is created;
+    2. create the order in order-service;
+    3. apply the promocode to the order;
+    4. spend bonuses, only after the promocode was accepted;
+    5. create the payment, if a payment method was given.
+
+    The cart is cleared only when every step succeeded, and only of the
+    quantities that were checked out. Cart reads and writes run in worker
+    threads, since shard locks are shared with threadpool handlers. Downstream 4xx answers are passed
+    through with their status; unreachable services and 5xx answers become
+    503. A user can run one checkout at a time.
+    """
+
+    def __init__(
+        self,
+        cart_service: CartService,
+        orders: DownstreamClient,
+        bonuses: DownstreamClient,
+        payments: DownstreamClient
+    ):
+        self.cart_service = cart_service
+        self.orders = orders
+        self.bonuses = bonuses
+        self.payments = payments
+        self._in_progress: Set[UUID] = set()
+
+    async def close(self) -> None:
+        """Close the connection pools of all downstream clients"""
+        for client in (self.orders, self.bonuses, self.payments):
+            await client.close()
+
+    async def _call(
+        self,
+        client: DownstreamClient,
+        method: str,
+        path: str,
+        authorization: Optional[str],
+        expected_status: int,
+        json: Any = None
+    ) -> Dict[str, Any]:
+        """
+        Send one downstream request and return its JSON body
+
+        Raises:
+            HTTPException: 503 if the service is unavailable, the downstream
+                status for other unexpected answers
+        """
+        try:
+            response = await client.request(method, path, authorization=authorization, json=json)
+        except DownstreamUnavailableError as e:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)) from e
+
+        if response.status_code != expected_status:
+            detail = None
+            try:
+                body = response.json()
+            except ValueError:
+                body = None
+            if isinstance(body, dict):
+                detail = body.get("detail") or body.get("message")
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"{client.name}: {detail or f'unexpected status {response.status_code}'}"
+            )
+        return response.json()
+
+    async def checkout(self, user_id: UUID, authorization: str, request: CheckoutRequest) -> CheckoutResponse:
+        """
+        Check out the user's cart
+
+        Args:
+            user_id: User identifier
+            authorization: Caller's Authorization header, forwarded downstream
+            request: Checkout parameters
+
+        Returns:
+            CheckoutResponse with the created order, discounts and payment
+
+        Raises:
+            HTTPException: 400 if the cart is empty or bonuses are insufficient,
+                409 if a checkout of this user is already running, downstream
+                errors as described in the class docstring
+        """
+        if user_id in self._in_progress:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Checkout is already in progress"
+            )
+        self._in_progress.add(user_id)
+        started = time.monotonic()
+        try:
+            response = await self._checkout(user_id, authorization, request)
+        finally:
+            self._in_progress.discard(user_id)
+        logger.info(
+            f"Checkout of user {user_id} created order {response.order_id} "
+            f"in {time.monotonic() - started:.3f}s"
+        )
+        return response
+
+    async def _balance(self, authorization: str, request: CheckoutRequest) -> float:
+        """Read the bonus balance, or 0.0 if no bonuses were requested"""
+        if request.bonuses <= 0:
+            return 0.0
+        result = await self._call(self.bonuses, "GET", "/api/bonuses/balance", authorization, status.HTTP_200_OK)
+        return float(result["balance"])
+
+    async def _checkout(self, user_id: UUID, authorization: str, request: CheckoutRequest) -> CheckoutResponse:
+        # Neither needs the order, so a short balance is rejected before it exists
+        cart, balance = await asyncio.gather(
+            asyncio.to_thread(self.cart_service.get_cart, user_id),
+            self._balance(authorization, request),
+            return_exceptions=True
+        )
+        if isinstance(cart, BaseException):
+            raise cart
+        if not cart.items:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cart is empty")
+        if isinstance(balance, BaseException):
+            raise balance
+        if balance < request.bonuses:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Insufficient bonuses. Available: {balance}, requested: {request.bonuses}"
+            )
+
+        order = await self._call(
+            self.orders, "POST", "/api/orders", authorization, status.HTTP_201_CREATED,
+            json={
+                "car_id": str(request.car_id),
+                "desired_time": request.desired_time.isoformat(),
+                "description": request.description or _describe(cart)
+            }
+        )
+        order_id = order["order_id"]
+
+        try:
+            return await self._complete(user_id, authorization, request, cart, order_id, order["status"])
+        except HTTPException as e:
+            logger.warning(f"Checkout of user {user_id} failed after creating order {order_id}: {e.detail}")
+            raise HTTPException(
+                status_code=e.status_code,
+                detail=f"{e.detail} (order {order_id} was created, cart was kept)"
+            ) from e
+
+    async def _complete(
+        self,
+        user_id: UUID,
+        authorization: str,
+        request: CheckoutRequest,
+        cart: CartResponse,
+        order_id: str,
+        order_status: str
+    ) -> CheckoutResponse:
+        """Apply discounts and payment to a created order and clear the cart"""
+        discount = 0.0
+        if request.promocode:
+            result = await self._call(
+                self.bonuses, "POST", "/api/bonuses/promocodes/apply", authorization, status.HTTP_200_OK,
+                json={"order_id": order_id, "promocode": request.promocode}
+            )
+            discount = float(result["discount_amount"])
+
+        total = Decimal(repr(cart.total_price))
+        due = max(total - Decimal(repr(discount)), Decimal(0))
+
+        bonuses_spent = 0
+        if request.bonuses > 0:
+            bonuses_spent = min(request.bonuses, int(due))
+            if bonuses_spent > 0:
+                await self._call(
+                    self.bonuses, "POST", "/api/bonuses/spend", authorization, status.HTTP_200_OK,
+                    json={"order_id": order_id, "amount": bonuses_spent}
+                )
+                due -= bonuses_spent
+
+        payment = None
+        if request.payment_method:
+            created = await self._call(
+                self.payments, "POST", "/api/payments", authorization, status.HTTP_201_CREATED,
+                json={"order_id": order_id, "payment_method": request.payment_method}
+            )
+            payment = CheckoutPayment(
+                payment_id=created["payment_id"],
+                status=created["status"],
+                confirmation_url=created["confirmation_url"]
+            )
+
+        await asyncio.to_thread(self.cart_service.remove_checked_out, user_id, cart.items)
+
+        return CheckoutResponse(
+            order_id=order_id,
+            order_status=order_status,
+            items=cart.items,
+            total_price=cart.total_price,
+            discount_amount=discount,
+            bonuses_spent=bonuses_spent,
+            amount_due=float(due.quantize(CENTS)),
+            payment=payment
+        )
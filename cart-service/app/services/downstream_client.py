@@ -0,0 +1,104 @@
+"""
+Pooled HTTP client for calls from cart-service to other services
+"""
+import logging
+from typing import Any, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class DownstreamUnavailableError(Exception):
+    """Raised when a downstream service cannot be reached or answers 5xx"""
+
+    def __init__(self, service: str, message: str):
+        super().__init__(f"{service} unavailable: {message}")
+        self.service = service
+
+
+class DownstreamClient:
+    """
+    Client for one downstream service
+
+    All requests go through one long-lived httpx.AsyncClient so TCP
+    connections are pooled and kept alive between checkouts. The pool is
+    created on the first request (building the TLS context is not free, so
+    instances that never check out do not pay for it) and released by
+    close() on application shutdown. The caller's Authorization header is
+    forwarded so the downstream service sees the same user.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str,
+        timeout: float,
+        max_connections: int,
+        max_keepalive_connections: int,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self.name = name
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self._transport = transport
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    def _build_http_client(self) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections
+        )
+        return httpx.AsyncClient(
+            base_url=self.base_url, timeout=self.timeout, limits=limits, transport=self._transport
+        )
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, created on first use"""
+        if self._http_client is None:
+            self._http_client = self._build_http_client()
+            logger.info(f"{self.name} HTTP pool opened: max_connections={self.max_connections}")
+        return self._http_client
+
+    async def close(self) -> None:
+        """Close the connection pool (called on application shutdown)"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            logger.info(f"{self.name} HTTP pool closed")
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        authorization: Optional[str] = None,
+        json: Any = None
+    ) -> httpx.Response:
+        """
+        Send one request to the service
+
+        Args:
+            method: HTTP method
+            path: Path relative to the service base URL
+            authorization: Authorization header to forward
+            json: JSON body
+
+        Returns:
+            Response with a status below 500
+
+        Raises:
+            DownstreamUnavailableError: On transport errors, timeouts and 5xx responses
+        """
+        headers = {"Authorization": authorization} if authorization else None
+        try:
+            response = await self.http_client.request(method, path, headers=headers, json=json)
+        except httpx.RequestError as e:
+            logger.error(f"{self.name} request {method} {path} failed: {type(e).__name__}: {e}")
+            raise DownstreamUnavailableError(self.name, f"{type(e).__name__}: {e}") from e
+        if response.status_code >= 500:
+            logger.error(f"{self.name} request {method} {path} failed: status {response.status_code}")
+            raise DownstreamUnavailableError(self.name, f"status {response.status_code}")
+        return response
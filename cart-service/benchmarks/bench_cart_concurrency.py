@@ -0,0 +1,145 @@
+"""
+Concurrency stress benchmark for cart mutations on a thread pool.
+
+Cart endpoints are sync handlers, so FastAPI runs them on worker threads.
+This benchmark drives CartService from T threads the same way and checks
+correctness and throughput for two lock layouts:
+
+- global:  LocalCartRepo(shards=1), one lock for all carts
+- sharded: LocalCartRepo(shards=64), per-user lock shards (the default)
+
+Two workloads run for each layout:
+
+- spread: random users, a mix of add (70%), get (20%) and remove (10%);
+          afterwards every cart's item count and total must match the
+          operations that were applied to it
+- hot:    every thread adds to the same cart; each add response must
+          report a distinct item count (1..N), which only holds if adds
+          are linearizable
+
+Usage (from the cart-service directory):
+    python -m benchmarks.bench_cart_concurrency
+    python -m benchmarks.bench_cart_concurrency --threads 16 --ops 20000 --users 1000
+"""
+
+import argparse
+import logging
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+from app.models.cart import AddItemRequest
+from app.repositories.local_cart_repo import LocalCartRepo
+from app.services.cart_service import CATALOG, CartService
+from detailing_observability import MetricsRegistry
+
+LAYOUTS = {"global": 1, "sharded": 64}
+REQUESTS = [
+    AddItemRequest(item_id=item_id, type=item["type"], quantity=1)
+    for item_id, item in CATALOG.items()
+]
+
+
+def _run_threads(threads: int, worker) -> tuple[float, list]:
+    """Run ``worker(index)`` on ``threads`` threads at once; returns (elapsed seconds, results)"""
+    barrier = threading.Barrier(threads + 1)
+
+    def wrapped(index: int):
+        barrier.wait()
+        return worker(index)
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        futures = [pool.submit(wrapped, i) for i in range(threads)]
+        barrier.wait()
+        start = time.perf_counter()
+        results = [future.result() for future in futures]
+    return time.perf_counter() - start, results
+
+
+def spread(shards: int, threads: int, ops: int, users: int) -> tuple[float, bool]:
+    """Mixed workload over many users; returns (ops/s, state consistent)"""
+    service = CartService(LocalCartRepo(shards=shards, registry=MetricsRegistry()))
+    user_ids = [uuid4() for _ in range(users)]
+    per_thread = ops // threads
+
+    def worker(index: int) -> Counter:
+        rng = random.Random(index)
+        applied: Counter = Counter()
+        for _ in range(per_thread):
+            user_id = rng.choice(user_ids)
+            request = rng.choice(REQUESTS)
+            roll = rng.random()
+            if roll < 0.7:
+                service.add_item(user_id, request)
+                applied[(user_id, request.item_id)] += 1
+            elif roll < 0.9:
+                service.get_cart(user_id)
+            else:
+                # Read the line and remove it under the user's lock so the
+                # removed quantity can be attributed to this thread
+                with service.repo.lock(user_id):
+                    quantity = next(
+                        (item.quantity for item in service.repo.get_cart(user_id) if item.item_id == request.item_id),
+                        0
+                    )
+                    if quantity:
+                        service.remove_item(user_id, request.item_id)
+                applied[(user_id, request.item_id)] -= quantity
+        return applied
+
+    elapsed, results = _run_threads(threads, worker)
+
+    expected: Counter = Counter()
+    for applied in results:
+        expected.update(applied)
+    consistent = True
+    for user_id in user_ids:
+        cart = service.get_cart(user_id)
+        quantities = {item.item_id: item.quantity for item in cart.items}
+        wanted = {item_id: expected[(user_id, item_id)] for item_id in CATALOG if expected[(user_id, item_id)]}
+        total = round(sum(CATALOG[item_id]["price"] * qty for item_id, qty in wanted.items()), 2)
+        if quantities != wanted or cart.item_count != sum(wanted.values()) or cart.total_price != total:
+            consistent = False
+    return per_thread * threads / elapsed, consistent
+
+
+def hot(shards: int, threads: int, ops: int) -> tuple[float, bool]:
+    """All threads add to one cart; returns (ops/s, adds linearizable)"""
+    service = CartService(LocalCartRepo(shards=shards, registry=MetricsRegistry()))
+    user_id = uuid4()
+    per_thread = ops // threads
+
+    def worker(index: int) -> list[int]:
+        return [service.add_item(user_id, REQUESTS[0]).item_count for _ in range(per_thread)]
+
+    elapsed, results = _run_threads(threads, worker)
+    counts = sorted(count for result in results for count in result)
+    return per_thread * threads / elapsed, counts == list(range(1, per_thread * threads + 1))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=40_000)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--switch-interval", type=float, default=1e-5,
+                        help="sys.setswitchinterval value; small values provoke races")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    sys.setswitchinterval(args.switch_interval)
+    print(f"threads={args.threads} ops={args.ops} users={args.users}")
+    print(f"{'layout':>8} {'workload':>9} {'ops/s':>10} {'correct':>8}")
+    for name, shards in LAYOUTS.items():
+        ops_per_second, ok = spread(shards, args.threads, args.ops, args.users)
+        print(f"{name:>8} {'spread':>9} {ops_per_second:>10.0f} {str(ok):>8}")
+        ops_per_second, ok = hot(shards, args.threads, args.ops)
+        print(f"{name:>8} {'hot':>9} {ops_per_second:>10.0f} {str(ok):>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark of GET /api/cart with the default and orjson responses.
+
+Fills one cart with N distinct items and serves the cart router from two
+in-process apps, one with FastAPI's default JSONResponse and one with
+ORJSONResponse (FAST_JSON_RESPONSES=true). Requests go through
+httpx.ASGITransport, so the numbers reflect server-side CPU cost only.
+
+Usage (from the cart-service directory):
+    python -m benchmarks.bench_json_responses
+    python -m benchmarks.bench_json_responses --items 10 100 1000 --requests 2000
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.config import MOCK_USER_ID
+from app.endpoints import cart
+from app.models.cart import CartItem
+from detailing_auth import get_current_user_id
+
+DEFAULT_SIZES = [10, 100, 1000]
+
+
+def _seed(count: int) -> None:
+    """Replace the benchmark user's cart with ``count`` distinct items"""
+    cart.cart_repo.clear_cart(MOCK_USER_ID)
+    for i in range(count):
+        cart.cart_repo.add_item(MOCK_USER_ID, CartItem(
+            item_id=f"prod_{i:05d}",
+            type="product",
+            name=f"Товар {i}",
+            quantity=1 + i % 3,
+            price=100.0 + i
+        ))
+
+
+def _build_app(response_class) -> FastAPI:
+    app = FastAPI(default_response_class=response_class)
+    app.include_router(cart.router)
+    app.dependency_overrides[get_current_user_id] = lambda: MOCK_USER_ID
+    return app
+
+
+async def _requests_per_second(app: FastAPI, requests: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up routing and validation caches
+        for _ in range(20):
+            await client.get("/api/cart")
+        start = time.perf_counter()
+        for _ in range(requests):
+            response = await client.get("/api/cart")
+            response.raise_for_status()
+        return requests / (time.perf_counter() - start)
+
+
+async def main(sizes: list[int], requests: int) -> None:
+    default_app = _build_app(JSONResponse)
+    fast_app = _build_app(ORJSONResponse)
+
+    print(f"requests={requests} per size")
+    print(f"{'items':>8} {'default rps':>12} {'orjson rps':>12} {'speedup':>8}")
+    for size in sizes:
+        _seed(size)
+        default = await _requests_per_second(default_app, requests)
+        fast = await _requests_per_second(fast_app, requests)
+        print(f"{size:>8} {default:>12.0f} {fast:>12.0f} {fast / default:>7.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--requests", type=int, default=1000)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    asyncio.run(main(args.items, args.requests))
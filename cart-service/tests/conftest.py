@@ -2,6 +2,7 @@
 Pytest configuration and shared fixtures for Cart Service tests
 """
 import pytest
+from contextlib import nullcontext
 from uuid import UUID, uuid4
 from typing import Generator
 from unittest.mock import Mock
@@ -111,6 +112,8 @@ def mock_cart_repo() -> Mock:
     """Create a mock cart repository for testing service layer"""
     mock_repo = Mock(spec=LocalCartRepo)
     mock_repo.get_cart.return_value = []
+    mock_repo.get_totals.return_value = (0.0, 0)
+    mock_repo.lock.return_value = nullcontext()
     mock_repo.add_item.return_value = []
     mock_repo.remove_item.return_value = True
     mock_repo.clear_cart.return_value = None
@@ -131,19 +134,19 @@ def test_client() -> Generator[TestClient, None, None]:
     """
     from app.main import app
     from app.endpoints import cart
-    from app.auth import get_current_user_id
+    from detailing_auth import get_current_user_id
 
     # Override JWT auth dependency with mock
     app.dependency_overrides[get_current_user_id] = mock_get_current_user_id
 
     # Clear the singleton repository state before each test
-    cart.cart_repo._storage.clear()
+    cart.cart_repo.clear_all()
 
     with TestClient(app) as client:
         yield client
 
     # Clear the singleton repository state after each test (cleanup)
-    cart.cart_repo._storage.clear()
+    cart.cart_repo.clear_all()
     
     # Clean up dependency overrides
     app.dependency_overrides.clear()
@@ -157,7 +160,7 @@ def test_client_with_mock_service(mock_cart_repo: Mock) -> Generator[TestClient,
     """
     from app.main import app
     from app.endpoints import cart
-    from app.auth import get_current_user_id
+    from detailing_auth import get_current_user_id
 
     # Override JWT auth dependency with mock
     app.dependency_overrides[get_current_user_id] = mock_get_current_user_id
@@ -606,3 +606,248 @@ class TestConcurrentOperations:
                 assert item["quantity"] == 3  # 2 + 1
             elif item["item_id"] == "svc_diagnostics":
                 assert item["quantity"] == 1
+
+
+class TestFastJSONResponses:
+    """Tests for the opt-in orjson response class"""
+
+    def test_orjson_responses_match_default(self, test_client: TestClient):
+        """Test that ORJSONResponse renders the same cart as the default class"""
+        from fastapi import FastAPI
+        from fastapi.responses import ORJSONResponse
+        from app.endpoints import cart
+        from detailing_auth import get_current_user_id
+        from tests.conftest import mock_get_current_user_id
+
+        fast_app = FastAPI(default_response_class=ORJSONResponse)
+        fast_app.include_router(cart.router)
+        fast_app.dependency_overrides[get_current_user_id] = mock_get_current_user_id
+
+        # Arrange
+        test_client.post("/api/cart/items", json={"item_id": "svc_oil_change", "type": "service", "quantity": 2})
+
+        # Act
+        default = test_client.get("/api/cart")
+        fast = TestClient(fast_app).get("/api/cart")
+
+        # Assert
+        assert fast.status_code == 200
+        assert fast.headers["content-type"] == "application/json"
+        assert fast.json() == default.json()
+        assert fast.json()["total_price"] == 5000.0
+
+
+class TestCatalogEndpoint:
+    """Tests for GET/PUT /api/cart/catalog"""
+
+    NEW_CATALOG = {
+        "items": {
+            "svc_oil_change": {"type": "service", "name": "Замена масла", "price": 3000.0},
+            "svc_wash": {"type": "service", "name": "Мойка", "price": 800.0}
+        }
+    }
+
+    @pytest.fixture
+    def admin_token(self, monkeypatch: pytest.MonkeyPatch):
+        """Enable catalog updates and restore the default catalog afterwards"""
+        from app.endpoints import cart
+        from app.services.cart_service import CATALOG
+
+        monkeypatch.setattr(cart, "CATALOG_ADMIN_TOKEN", "secret")
+        yield "secret"
+        cart.catalog_store.load(CATALOG)
+
+    def test_get_catalog_with_etag(self, test_client: TestClient):
+        """Test the catalog is served with its version and an ETag"""
+        from app.services.cart_service import CATALOG
+
+        # Act
+        response = test_client.get("/api/cart/catalog")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["cache-control"] == "no-cache"
+        assert response.json()["items"] == CATALOG
+        assert response.json()["version"] >= 1
+
+    def test_if_none_match_returns_304(self, test_client: TestClient):
+        """Test a matching If-None-Match gets 304 without a body"""
+        # Arrange
+        etag = test_client.get("/api/cart/catalog").headers["etag"]
+
+        # Act
+        exact = test_client.get("/api/cart/catalog", headers={"If-None-Match": etag})
+        weak = test_client.get("/api/cart/catalog", headers={"If-None-Match": f'"other", W/{etag}'})
+        stale = test_client.get("/api/cart/catalog", headers={"If-None-Match": '"other"'})
+
+        # Assert
+        assert exact.status_code == 304
+        assert exact.content == b""
+        assert exact.headers["etag"] == etag
+        assert weak.status_code == 304
+        assert stale.status_code == 200
+
+    def test_update_disabled_without_token(self, test_client: TestClient):
+        """Test catalog updates are rejected when no admin token is configured"""
+        # Act
+        response = test_client.put("/api/cart/catalog", json=self.NEW_CATALOG)
+
+        # Assert
+        assert response.status_code == 403
+
+    def test_update_rejects_wrong_token(self, test_client: TestClient, admin_token: str):
+        """Test catalog updates require the configured token"""
+        # Act
+        response = test_client.put(
+            "/api/cart/catalog", json=self.NEW_CATALOG, headers={"X-Catalog-Token": "wrong"}
+        )
+
+        # Assert
+        assert response.status_code == 403
+
+    def test_update_rejects_invalid_entries(self, test_client: TestClient, admin_token: str):
+        """Test malformed catalog entries are rejected with 422"""
+        # Act
+        response = test_client.put(
+            "/api/cart/catalog",
+            json={"items": {"x": {"type": "gift", "name": "X", "price": 1}}},
+            headers={"X-Catalog-Token": admin_token}
+        )
+
+        # Assert
+        assert response.status_code == 422
+
+    def test_update_publishes_new_version_and_reprices_carts(self, test_client: TestClient, admin_token: str):
+        """Test a catalog update changes the ETag and carts pick up new prices"""
+        # Arrange
+        before = test_client.get("/api/cart/catalog")
+        test_client.post("/api/cart/items", json={"item_id": "svc_oil_change", "type": "service", "quantity": 1})
+        test_client.post("/api/cart/items", json={"item_id": "svc_diagnostics", "type": "service", "quantity": 1})
+
+        # Act
+        update = test_client.put(
+            "/api/cart/catalog", json=self.NEW_CATALOG, headers={"X-Catalog-Token": admin_token}
+        )
+        after = test_client.get("/api/cart/catalog", headers={"If-None-Match": before.headers["etag"]})
+        cart_response = test_client.get("/api/cart")
+
+        # Assert
+        assert update.status_code == 200
+        assert update.json()["version"] == before.json()["version"] + 1
+        assert update.json()["item_count"] == 2
+        assert after.status_code == 200
+        assert after.headers["etag"] == update.json()["etag"]
+        assert cart_response.json()["items"] == [
+            {"item_id": "svc_oil_change", "type": "service", "name": "Замена масла", "quantity": 1, "price": 3000.0}
+        ]
+        assert cart_response.json()["total_price"] == 3000.0
+
+
+class TestBatchItemsEndpoint:
+    """Tests for POST /api/cart/items/batch"""
+
+    def test_batch_returns_final_cart(self, test_client: TestClient):
+        """Test a batch of operations is applied and the final cart returned once"""
+        # Arrange
+        test_client.post("/api/cart/items", json={"item_id": "svc_oil_change", "type": "service", "quantity": 1})
+        payload = {"operations": [
+            {"op": "add", "item_id": "prod_oil_filter", "type": "product", "quantity": 2},
+            {"op": "add", "item_id": "svc_diagnostics", "type": "service", "quantity": 1},
+            {"op": "set_quantity", "item_id": "svc_oil_change", "quantity": 3}
+        ]}
+
+        # Act
+        response = test_client.post("/api/cart/items/batch", json=payload)
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert [(item["item_id"], item["quantity"]) for item in data["items"]] == [
+            ("svc_oil_change", 3), ("prod_oil_filter", 2), ("svc_diagnostics", 1)
+        ]
+        assert data["total_price"] == 11000.0
+        assert data["item_count"] == 6
+        assert test_client.get("/api/cart").json() == data
+
+    def test_batch_is_atomic(self, test_client: TestClient):
+        """Test a failing operation leaves the cart untouched"""
+        # Arrange
+        test_client.post("/api/cart/items", json={"item_id": "svc_oil_change", "type": "service", "quantity": 1})
+        before = test_client.get("/api/cart").json()
+        payload = {"operations": [
+            {"op": "add", "item_id": "prod_oil_filter", "quantity": 2},
+            {"op": "remove", "item_id": "svc_diagnostics"}
+        ]}
+
+        # Act
+        response = test_client.post("/api/cart/items/batch", json=payload)
+
+        # Assert
+        assert response.status_code == 404
+        assert test_client.get("/api/cart").json() == before
+
+    def test_batch_validation_error(self, test_client: TestClient):
+        """Test malformed operations are rejected with 422"""
+        # Act
+        response = test_client.post(
+            "/api/cart/items/batch", json={"operations": [{"op": "add", "item_id": "svc_oil_change"}]}
+        )
+
+        # Assert
+        assert response.status_code == 422
+
+
+class TestCheckoutEndpoint:
+    """Tests for POST /api/cart/checkout"""
+
+    @pytest.fixture
+    def checkout_client(self, test_client: TestClient):
+        """Route the checkout service's downstream calls to a fake order-service"""
+        import httpx
+        from app.endpoints import cart
+        from app.services.checkout_service import CheckoutService
+        from app.services.downstream_client import DownstreamClient
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.headers["authorization"] == "Bearer test-token"
+            return httpx.Response(201, json={"order_id": "550e8400-e29b-41d4-a716-446655440000", "status": "created"})
+
+        downstream = DownstreamClient(
+            name="order-service", base_url="http://order-service", timeout=1.0,
+            max_connections=1, max_keepalive_connections=1, transport=httpx.MockTransport(handler)
+        )
+        test_client.app.dependency_overrides[cart.get_checkout_service] = lambda: CheckoutService(
+            cart.cart_service, orders=downstream, bonuses=downstream, payments=downstream
+        )
+        return test_client
+
+    def test_checkout_creates_order_and_clears_cart(self, checkout_client: TestClient):
+        """Test a successful checkout returns 201 and empties the cart"""
+        # Arrange
+        checkout_client.post("/api/cart/items", json={"item_id": "svc_oil_change", "type": "service", "quantity": 1})
+
+        # Act
+        response = checkout_client.post(
+            "/api/cart/checkout",
+            json={"car_id": "123e4567-e89b-12d3-a456-426614174000", "desired_time": "2025-11-20T10:00:00"},
+            headers={"Authorization": "Bearer test-token"}
+        )
+
+        # Assert
+        assert response.status_code == 201
+        assert response.json()["order_id"] == "550e8400-e29b-41d4-a716-446655440000"
+        assert response.json()["amount_due"] == 2500.0
+        assert checkout_client.get("/api/cart").json()["items"] == []
+
+    def test_checkout_of_empty_cart(self, checkout_client: TestClient):
+        """Test checking out an empty cart returns 400"""
+        # Act
+        response = checkout_client.post(
+            "/api/cart/checkout",
+            json={"car_id": "123e4567-e89b-12d3-a456-426614174000", "desired_time": "2025-11-20T10:00:00"},
+            headers={"Authorization": "Bearer test-token"}
+        )
+
+        # Assert
+        assert response.status_code == 400
@@ -0,0 +1,47 @@
+"""
+Unit tests for the background cart sweeper
+"""
+import asyncio
+
+import pytest
+
+from app.repositories.local_cart_repo import LocalCartRepo
+from app.services.cart_sweeper import CartSweeper
+from detailing_observability import MetricsRegistry
+from tests.conftest import TEST_USER_ID, create_cart_item
+
+
+class TestCartSweeper:
+    """Test suite for CartSweeper"""
+
+    @pytest.mark.asyncio
+    async def test_sweeper_evicts_expired_carts(self):
+        """Test the sweeper drops carts once they pass the TTL"""
+        # Arrange
+        now = [0.0]
+        repo = LocalCartRepo(ttl_seconds=10, clock=lambda: now[0], registry=MetricsRegistry())
+        repo.add_item(TEST_USER_ID, create_cart_item())
+        sweeper = CartSweeper(repo, interval=0.01)
+
+        # Act
+        sweeper.start()
+        now[0] = 11
+        await asyncio.sleep(0.05)
+        await sweeper.stop()
+
+        # Assert
+        assert repo.get_all_carts() == {}
+        assert repo.stats()["evicted_ttl"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sweeper_disabled_without_ttl(self):
+        """Test the sweeper does not start when expiry is disabled"""
+        # Arrange
+        sweeper = CartSweeper(LocalCartRepo(registry=MetricsRegistry()), interval=0.01)
+
+        # Act
+        sweeper.start()
+
+        # Assert
+        assert sweeper._task is None
+        await sweeper.stop()
@@ -0,0 +1,99 @@
+"""
+Unit tests for the versioned catalog store
+"""
+import json
+
+import pytest
+
+from app.services.cart_service import CATALOG
+from app.services.catalog_store import CatalogStore
+
+
+class TestCatalogStore:
+    """Test suite for CatalogStore"""
+
+    def test_initial_snapshot_is_version_one(self):
+        """Test the store starts at version 1 with the given items"""
+        # Act
+        store = CatalogStore(CATALOG)
+
+        # Assert
+        assert store.version == 1
+        assert store.current.items == CATALOG
+        assert json.loads(store.current.body) == {"version": 1, "items": CATALOG}
+
+    def test_load_publishes_next_version(self):
+        """Test load() swaps in a new snapshot and keeps the old one intact"""
+        # Arrange
+        store = CatalogStore(CATALOG)
+        old = store.current
+
+        # Act
+        new = store.load({"svc_wash": {"type": "service", "name": "Мойка", "price": 800.0}})
+
+        # Assert
+        assert store.current is new
+        assert new.version == 2
+        assert list(new.items) == ["svc_wash"]
+        assert old.items == CATALOG
+        assert old.etag != new.etag
+
+    def test_etag_matches_served_body(self):
+        """Test the ETag changes with the version and is stable for identical bodies"""
+        # Arrange
+        store = CatalogStore(CATALOG)
+        first = store.current
+
+        # Act
+        store.load(dict(reversed(list(CATALOG.items()))))
+
+        # Assert
+        assert store.version == 2
+        assert store.current.etag != first.etag
+        assert CatalogStore(dict(reversed(list(CATALOG.items())))).current.etag == first.etag
+
+    @pytest.mark.parametrize("entry", [
+        {"type": "gift", "name": "Сертификат", "price": 100.0},
+        {"type": "product", "name": "", "price": 100.0},
+        {"type": "product", "name": "Фильтр", "price": 0},
+        {"type": "product", "name": "Фильтр"},
+    ])
+    def test_invalid_catalog_is_rejected(self, entry):
+        """Test malformed entries raise ValueError and keep the current catalog"""
+        # Arrange
+        store = CatalogStore(CATALOG)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            store.load({"bad_item": entry})
+        assert store.version == 1
+        assert store.current.items == CATALOG
+
+    def test_load_file_accepts_items_wrapper_and_plain_mapping(self, tmp_path):
+        """Test catalog files may hold {"items": {...}} or the mapping itself"""
+        # Arrange
+        store = CatalogStore(CATALOG)
+        wrapped = tmp_path / "wrapped.json"
+        wrapped.write_text(json.dumps({"items": CATALOG}, ensure_ascii=False), encoding="utf-8")
+        plain = tmp_path / "plain.json"
+        plain.write_text(json.dumps(CATALOG, ensure_ascii=False), encoding="utf-8")
+
+        # Act
+        store.load_file(str(wrapped))
+        store.load_file(str(plain))
+
+        # Assert
+        assert store.version == 3
+        assert store.current.items == CATALOG
+
+    def test_load_file_rejects_invalid_json(self, tmp_path):
+        """Test a broken catalog file raises ValueError"""
+        # Arrange
+        store = CatalogStore(CATALOG)
+        path = tmp_path / "catalog.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            store.load_file(str(path))
+        assert store.version == 1
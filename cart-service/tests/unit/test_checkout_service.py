@@ -0,0 +1,260 @@
+"""
+Unit tests for the checkout pipeline
+"""
+import asyncio
+import json
+from typing import Callable, Dict, List, Tuple
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from app.models.cart import AddItemRequest, CheckoutRequest
+from app.services.cart_service import CartService
+from app.services.checkout_service import CheckoutService
+from app.services.downstream_client import DownstreamClient
+from tests.conftest import TEST_USER_ID
+
+ORDER_ID = "550e8400-e29b-41d4-a716-446655440000"
+TOKEN = "Bearer test-token"
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+class FakeDownstream:
+    """Routes requests of all downstream clients to per-endpoint handlers"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls: List[Tuple[str, str, dict]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.handlers: Dict[Tuple[str, str], Handler] = {
+            ("POST", "/api/orders"): lambda r: httpx.Response(201, json={"order_id": ORDER_ID, "status": "created"}),
+            ("POST", "/api/bonuses/promocodes/apply"): lambda r: httpx.Response(
+                200, json={"status": "applied", "discount_amount": 500.0}
+            ),
+            ("GET", "/api/bonuses/balance"): lambda r: httpx.Response(200, json={"balance": 1000.0}),
+            ("POST", "/api/bonuses/spend"): lambda r: httpx.Response(
+                200, json={"bonuses_spent": json.loads(r.content)["amount"], "new_balance": 0.0}
+            ),
+            ("POST", "/api/payments"): lambda r: httpx.Response(201, json={
+                "payment_id": "pay-1", "status": "pending", "confirmation_url": "https://pay/confirm"
+            }),
+        }
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        assert request.headers["authorization"] == TOKEN
+        self.calls.append((request.method, request.url.path, json.loads(request.content or b"null")))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            return self.handlers[(request.method, request.url.path)](request)
+        finally:
+            self.in_flight -= 1
+
+    def paths(self) -> List[str]:
+        return [path for _, path, _ in self.calls]
+
+
+def _client(name: str, transport: httpx.AsyncBaseTransport) -> DownstreamClient:
+    return DownstreamClient(
+        name=name, base_url=f"http://{name}", timeout=1.0,
+        max_connections=10, max_keepalive_connections=10, transport=transport
+    )
+
+
+@pytest.fixture
+def downstream() -> FakeDownstream:
+    """Fake order, bonus and payment services answering successfully"""
+    return FakeDownstream()
+
+
+@pytest.fixture
+def checkout_service(cart_service: CartService, downstream: FakeDownstream) -> CheckoutService:
+    """Checkout over the fake services with a cart of 4500.0"""
+    transport = httpx.MockTransport(downstream.handle)
+    cart_service.add_item(TEST_USER_ID, AddItemRequest(item_id="svc_oil_change", type="service", quantity=1))
+    cart_service.add_item(TEST_USER_ID, AddItemRequest(item_id="prod_oil_filter", type="product", quantity=2))
+    return CheckoutService(
+        cart_service,
+        orders=_client("order-service", transport),
+        bonuses=_client("bonus-service", transport),
+        payments=_client("payment-service", transport)
+    )
+
+
+def _request(**overrides) -> CheckoutRequest:
+    data = {"car_id": "123e4567-e89b-12d3-a456-426614174000", "desired_time": "2025-11-20T10:00:00"}
+    data.update(overrides)
+    return CheckoutRequest(**data)
+
+
+class TestCheckoutService:
+    """Test suite for CheckoutService"""
+
+    @pytest.mark.asyncio
+    async def test_full_checkout(self, checkout_service: CheckoutService, downstream: FakeDownstream):
+        """Test order, promocode, bonuses and payment are applied and the cart cleared"""
+        # Act
+        response = await checkout_service.checkout(
+            TEST_USER_ID, TOKEN, _request(promocode="SUMMER24", bonuses=300, payment_method="card")
+        )
+
+        # Assert
+        assert str(response.order_id) == ORDER_ID
+        assert response.total_price == 4500.0
+        assert response.discount_amount == 500.0
+        assert response.bonuses_spent == 300
+        assert response.amount_due == 3700.0
+        assert response.payment.payment_id == "pay-1"
+        assert downstream.calls[1][1] == "/api/orders"
+        assert downstream.calls[1][2]["description"] == "Замена масла x1, Масляный фильтр x2"
+        assert downstream.paths()[-2:] == ["/api/bonuses/spend", "/api/payments"]
+        assert checkout_service.cart_service.get_cart(TEST_USER_ID).items == []
+        await checkout_service.close()
+
+    @pytest.mark.asyncio
+    async def test_balance_is_read_before_the_order(
+        self, checkout_service: CheckoutService, downstream: FakeDownstream
+    ):
+        """Test the balance check precedes order creation and the promocode follows it"""
+        # Act
+        await checkout_service.checkout(TEST_USER_ID, TOKEN, _request(promocode="SUMMER24", bonuses=100))
+
+        # Assert
+        assert downstream.paths()[:3] == ["/api/bonuses/balance", "/api/orders", "/api/bonuses/promocodes/apply"]
+
+    @pytest.mark.asyncio
+    async def test_minimal_checkout_only_creates_order(
+        self, checkout_service: CheckoutService, downstream: FakeDownstream
+    ):
+        """Test steps that were not requested are skipped"""
+        # Act
+        response = await checkout_service.checkout(TEST_USER_ID, TOKEN, _request(description="Oil change"))
+
+        # Assert
+        assert downstream.paths() == ["/api/orders"]
+        assert downstream.calls[0][2]["description"] == "Oil change"
+        assert response.amount_due == 4500.0
+        assert response.payment is None
+
+    @pytest.mark.asyncio
+    async def test_bonuses_are_capped_by_amount_due(
+        self, checkout_service: CheckoutService, downstream: FakeDownstream
+    ):
+        """Test no more bonuses are spent than the order costs"""
+        # Arrange
+        downstream.handlers[("GET", "/api/bonuses/balance")] = lambda r: httpx.Response(200, json={"balance": 9000.0})
+
+        # Act
+        response = await checkout_service.checkout(TEST_USER_ID, TOKEN, _request(bonuses=9000))
+
+        # Assert
+        assert response.bonuses_spent == 4500
+        assert response.amount_due == 0.0
+
+    @pytest.mark.asyncio
+    async def test_invalid_promocode_keeps_cart_and_spends_nothing(
+        self, checkout_service: CheckoutService, downstream: FakeDownstream
+    ):
+        """Test a failed check stops the pipeline before any bonuses are spent"""
+        # Arrange
+        downstream.handlers[("POST", "/api/bonuses/promocodes/apply")] = lambda r: httpx.Response(
+            404, json={"detail": "Promocode 'NOPE' is invalid or inactive"}
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await checkout_service.checkout(TEST_USER_ID, TOKEN, _request(promocode="NOPE", bonuses=100))
+        assert exc_info.value.status_code == 404
+        assert "invalid or inactive" in exc_info.value.detail
+        assert ORDER_ID in exc_info.value.detail
+        assert "/api/bonuses/spend" not in downstream.paths()
+        assert len(checkout_service.cart_service.get_cart(TEST_USER_ID).items) == 2
+
+    @pytest.mark.asyncio
+    async def test_insufficient_bonuses(self, checkout_service: CheckoutService, downstream: FakeDownstream):
+        """Test a short balance fails with 400 before the order or promocode is touched"""
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await checkout_service.checkout(TEST_USER_ID, TOKEN, _request(promocode="SUMMER24", bonuses=5000))
+        assert exc_info.value.status_code == 400
+        assert "Insufficient bonuses" in exc_info.value.detail
+        assert downstream.paths() == ["/api/bonuses/balance"]
+        assert len(checkout_service.cart_service.get_cart(TEST_USER_ID).items) == 2
+
+    @pytest.mark.asyncio
+    async def test_unavailable_service_returns_503(
+        self, checkout_service: CheckoutService, downstream: FakeDownstream
+    ):
+        """Test transport errors and 5xx answers become 503 and keep the cart"""
+        # Arrange
+        def refuse(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("connection refused", request=request)
+
+        downstream.handlers[("POST", "/api/orders")] = refuse
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await checkout_service.checkout(TEST_USER_ID, TOKEN, _request())
+        assert exc_info.value.status_code == 503
+        assert "order-service" in exc_info.value.detail
+        assert len(checkout_service.cart_service.get_cart(TEST_USER_ID).items) == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_cart(self, checkout_service: CheckoutService, downstream: FakeDownstream):
+        """Test an empty cart is rejected without downstream calls"""
+        # Arrange
+        checkout_service.cart_service.repo.clear_cart(TEST_USER_ID)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await checkout_service.checkout(TEST_USER_ID, TOKEN, _request())
+        assert exc_info.value.status_code == 400
+        assert downstream.calls == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_checkout_of_same_user_rejected(
+        self, checkout_service: CheckoutService, downstream: FakeDownstream
+    ):
+        """Test a second checkout while one is running gets 409"""
+        # Arrange
+        downstream.delay = 0.05
+
+        # Act
+        results = await asyncio.gather(
+            checkout_service.checkout(TEST_USER_ID, TOKEN, _request()),
+            checkout_service.checkout(TEST_USER_ID, TOKEN, _request()),
+            return_exceptions=True
+        )
+
+        # Assert
+        assert str(results[0].order_id) == ORDER_ID
+        assert isinstance(results[1], HTTPException)
+        assert results[1].status_code == 409
+        assert downstream.paths() == ["/api/orders"]
+
+    @pytest.mark.asyncio
+    async def test_items_added_during_checkout_stay_in_cart(
+        self, checkout_service: CheckoutService, downstream: FakeDownstream
+    ):
+        """Test only the checked-out quantities are removed from the cart"""
+        # Arrange
+        create_order = downstream.handlers[("POST", "/api/orders")]
+
+        def add_during_checkout(request: httpx.Request) -> httpx.Response:
+            checkout_service.cart_service.add_item(
+                TEST_USER_ID, AddItemRequest(item_id="prod_oil_filter", type="product", quantity=1)
+            )
+            return create_order(request)
+
+        downstream.handlers[("POST", "/api/orders")] = add_during_checkout
+
+        # Act
+        await checkout_service.checkout(TEST_USER_ID, TOKEN, _request())
+
+        # Assert
+        remaining = checkout_service.cart_service.get_cart(TEST_USER_ID)
+        assert [(item.item_id, item.quantity) for item in remaining.items] == [("prod_oil_filter", 1)]
@@ -12,7 +12,7 @@ import pytest
 from uuid import UUID
 from pydantic import ValidationError
 
-from app.models.cart import CartItem, CartResponse, AddItemRequest
+from app.models.cart import CartItem, CartResponse, AddItemRequest, BatchCartRequest, CartOperation
 
 
 class TestCartItem:
@@ -460,3 +460,42 @@ class TestAddItemRequest:
 
         # Assert - Pydantic allows empty strings, business logic should handle this
         assert request.type == ""
+
+
+
+class TestBatchCartRequest:
+    """Test suite for CartOperation and BatchCartRequest"""
+
+    def test_operations_parsed(self):
+        """Test all operation kinds are accepted with the quantities they need"""
+        # Arrange & Act
+        request = BatchCartRequest(operations=[
+            {"op": "add", "item_id": "svc_oil_change", "type": "service", "quantity": 1},
+            {"op": "set_quantity", "item_id": "prod_oil_filter", "quantity": 0},
+            {"op": "remove", "item_id": "svc_diagnostics"}
+        ])
+
+        # Assert
+        assert [operation.op for operation in request.operations] == ["add", "set_quantity", "remove"]
+        assert request.operations[2].quantity is None
+
+    @pytest.mark.parametrize("operation", [
+        {"op": "add", "item_id": "svc_oil_change"},
+        {"op": "add", "item_id": "svc_oil_change", "quantity": 0},
+        {"op": "set_quantity", "item_id": "svc_oil_change"},
+        {"op": "set_quantity", "item_id": "svc_oil_change", "quantity": -1},
+        {"op": "replace", "item_id": "svc_oil_change", "quantity": 1},
+    ])
+    def test_invalid_operation(self, operation):
+        """Test operations without a valid quantity or with an unknown op are rejected"""
+        with pytest.raises(ValidationError):
+            CartOperation(**operation)
+
+    def test_batch_size_limits(self):
+        """Test empty and oversized batches are rejected"""
+        operation = {"op": "remove", "item_id": "svc_oil_change"}
+
+        with pytest.raises(ValidationError):
+            BatchCartRequest(operations=[])
+        with pytest.raises(ValidationError):
+            BatchCartRequest(operations=[operation] * 101)
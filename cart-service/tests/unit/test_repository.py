@@ -7,18 +7,35 @@ Tests cover:
 - remove_item() - removing items from cart
 - clear_cart() - clearing all items
 - get_all_carts() - retrieving all carts
+- get_totals() - running total price and item count
+- TTL expiry, LRU bound and resident memory accounting
+- Journaling to a DurableStore and recovery
 - Edge cases: non-existent users, duplicate items, empty carts
 """
 import pytest
 from uuid import UUID
 
 from app.repositories.local_cart_repo import LocalCartRepo
+from detailing_observability import MetricsRegistry
+from detailing_persistence import DurableStore
+from tests.conftest import create_cart_item
 from app.models.cart import CartItem
 
 
 # Test user IDs
 TEST_USER_ID = UUID("12345678-1234-5678-1234-567812345678")
 ANOTHER_USER_ID = UUID("87654321-4321-8765-4321-876543218765")
+THIRD_USER_ID = UUID("11111111-2222-3333-4444-555555555555")
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
 
 
 class TestLocalCartRepoGetCart:
@@ -496,6 +513,366 @@ class TestLocalCartRepoClearCart:
         assert result[0].item_id == "test_item"
 
 
+class TestLocalCartRepoTotals:
+    """Test suite for get_totals() running totals"""
+
+    def test_totals_for_new_user(self, clean_cart_repo: LocalCartRepo):
+        """Test totals are zero for a user without cart"""
+        assert clean_cart_repo.get_totals(TEST_USER_ID) == (0.0, 0)
+
+    def test_totals_follow_add_and_accumulate(self, clean_cart_repo: LocalCartRepo):
+        """Test totals include new items and accumulated quantities"""
+        # Arrange
+        repo = clean_cart_repo
+
+        # Act
+        repo.add_item(TEST_USER_ID, create_cart_item("item1", quantity=1, price=2500.0))
+        repo.add_item(TEST_USER_ID, create_cart_item("item2", quantity=2, price=1000.0))
+        repo.add_item(TEST_USER_ID, create_cart_item("item1", quantity=2, price=2500.0))
+
+        # Assert
+        assert repo.get_totals(TEST_USER_ID) == (9500.0, 5)
+
+    def test_totals_follow_remove(self, clean_cart_repo: LocalCartRepo):
+        """Test removing an item subtracts its whole line"""
+        # Arrange
+        repo = clean_cart_repo
+        repo.add_item(TEST_USER_ID, create_cart_item("item1", quantity=3, price=2500.0))
+        repo.add_item(TEST_USER_ID, create_cart_item("item2", quantity=2, price=1000.0))
+
+        # Act
+        repo.remove_item(TEST_USER_ID, "item1")
+
+        # Assert
+        assert repo.get_totals(TEST_USER_ID) == (2000.0, 2)
+
+    def test_totals_reset_by_clear(self, clean_cart_repo: LocalCartRepo):
+        """Test clearing a cart resets its totals"""
+        # Arrange
+        repo = clean_cart_repo
+        repo.add_item(TEST_USER_ID, create_cart_item("item1", quantity=3, price=10.99))
+
+        # Act
+        repo.clear_cart(TEST_USER_ID)
+
+        # Assert
+        assert repo.get_totals(TEST_USER_ID) == (0.0, 0)
+
+    def test_totals_rounding(self, clean_cart_repo: LocalCartRepo):
+        """Test total price is rounded to 2 decimal places"""
+        clean_cart_repo.add_item(TEST_USER_ID, create_cart_item(quantity=3, price=10.333333))
+
+        assert clean_cart_repo.get_totals(TEST_USER_ID) == (31.0, 3)  # 30.999999 -> 31.0
+
+    def test_totals_decimal_precision(self, clean_cart_repo: LocalCartRepo):
+        """Test totals of decimal prices are exact"""
+        # Arrange
+        repo = clean_cart_repo
+        repo.add_item(TEST_USER_ID, create_cart_item("item1", quantity=1, price=10.99))
+        repo.add_item(TEST_USER_ID, create_cart_item("item2", quantity=2, price=5.49))
+
+        # Assert
+        assert repo.get_totals(TEST_USER_ID) == (21.97, 3)
+
+    def test_totals_do_not_drift(self, clean_cart_repo: LocalCartRepo):
+        """Test many adds and removes of fractional prices leave an exact zero"""
+        # Arrange
+        repo = clean_cart_repo
+
+        # Act
+        for i in range(500):
+            repo.add_item(TEST_USER_ID, create_cart_item(f"item{i}", quantity=1, price=0.1))
+        for i in range(500):
+            repo.remove_item(TEST_USER_ID, f"item{i}")
+
+        # Assert
+        assert repo.get_totals(TEST_USER_ID) == (0.0, 0)
+
+    def test_totals_large_numbers(self, clean_cart_repo: LocalCartRepo):
+        """Test totals with large quantities"""
+        clean_cart_repo.add_item(TEST_USER_ID, create_cart_item(quantity=1000, price=50.99))
+
+        assert clean_cart_repo.get_totals(TEST_USER_ID) == (50990.0, 1000)
+
+
+class TestLocalCartRepoReprice:
+    """Test suite for reprice() against a new catalog version"""
+
+    CATALOG_V2 = {
+        "item1": {"type": "service", "name": "Item 1, second version", "price": 3000.0},
+        "item2": {"type": "service", "name": "Test Item", "price": 100.0}
+    }
+
+    def test_reprice_updates_lines_and_totals(self, clean_cart_repo: LocalCartRepo):
+        """Test changed prices and names are applied and totals follow"""
+        # Arrange
+        repo = clean_cart_repo
+        repo.add_item(TEST_USER_ID, create_cart_item("item1", quantity=2, price=2500.0), catalog_version=1)
+        repo.add_item(TEST_USER_ID, create_cart_item("item2", quantity=1, price=100.0), catalog_version=1)
+        bytes_before = repo.resident_bytes()
+
+        # Act
+        repriced = repo.reprice(TEST_USER_ID, self.CATALOG_V2, 2)
+
+        # Assert
+        assert repriced is True
+        items = {item.item_id: item for item in repo.get_cart(TEST_USER_ID)}
+        assert items["item1"].price == 3000.0
+        assert items["item1"].name == "Item 1, second version"
+        assert items["item1"].quantity == 2
+        assert repo.get_totals(TEST_USER_ID) == (6100.0, 3)
+        assert repo.resident_bytes() > bytes_before
+
+    def test_reprice_removes_discontinued_items(self, clean_cart_repo: LocalCartRepo):
+        """Test lines missing from the new catalog are dropped, and empty carts with them"""
+        # Arrange
+        repo = clean_cart_repo
+        repo.add_item(TEST_USER_ID, create_cart_item("gone", quantity=1, price=50.0), catalog_version=1)
+        repo.add_item(ANOTHER_USER_ID, create_cart_item("gone", quantity=1, price=50.0), catalog_version=1)
+        repo.add_item(ANOTHER_USER_ID, create_cart_item("item2", quantity=1, price=100.0), catalog_version=1)
+
+        # Act
+        repo.reprice(TEST_USER_ID, self.CATALOG_V2, 2)
+        repo.reprice(ANOTHER_USER_ID, self.CATALOG_V2, 2)
+
+        # Assert
+        assert repo.get_all_carts().keys() == {ANOTHER_USER_ID}
+        assert repo.get_totals(ANOTHER_USER_ID) == (100.0, 1)
+
+    def test_reprice_skips_current_version(self, clean_cart_repo: LocalCartRepo):
+        """Test carts already priced against the version are left alone"""
+        # Arrange
+        repo = clean_cart_repo
+        repo.add_item(TEST_USER_ID, create_cart_item("item1", quantity=1, price=2500.0), catalog_version=2)
+
+        # Act & Assert
+        assert repo.reprice(TEST_USER_ID, self.CATALOG_V2, 2) is False
+        assert repo.reprice(ANOTHER_USER_ID, self.CATALOG_V2, 2) is False
+        assert repo.get_totals(TEST_USER_ID) == (2500.0, 1)
+
+    def test_reprice_keeps_items_handed_out_earlier(self, clean_cart_repo: LocalCartRepo):
+        """Test repricing replaces lines instead of mutating them"""
+        # Arrange
+        repo = clean_cart_repo
+        repo.add_item(TEST_USER_ID, create_cart_item("item1", quantity=1, price=2500.0), catalog_version=1)
+        before = repo.get_cart(TEST_USER_ID)
+
+        # Act
+        repo.reprice(TEST_USER_ID, self.CATALOG_V2, 2)
+
+        # Assert
+        assert before[0].price == 2500.0
+
+
+class TestLocalCartRepoSetItems:
+    """Test suite for set_items() whole-cart replacement"""
+
+    def test_set_items_replaces_content_and_totals(self, clean_cart_repo: LocalCartRepo):
+        """Test the cart holds exactly the new lines afterwards"""
+        # Arrange
+        repo = clean_cart_repo
+        repo.add_item(TEST_USER_ID, create_cart_item("item1", quantity=3, price=2500.0))
+
+        # Act
+        items = repo.set_items(TEST_USER_ID, [
+            create_cart_item("item2", quantity=2, price=1000.0),
+            create_cart_item("item3", quantity=1, price=1500.0)
+        ], catalog_version=3)
+
+        # Assert
+        assert [item.item_id for item in items] == ["item2", "item3"]
+        assert repo.get_totals(TEST_USER_ID) == (3500.0, 3)
+        assert repo.get_all_carts()[TEST_USER_ID].catalog_version == 3
+
+    def test_set_items_empty_drops_cart(self, clean_cart_repo: LocalCartRepo):
+        """Test an empty item list removes the cart and its memory"""
+        # Arrange
+        repo = clean_cart_repo
+        repo.add_item(TEST_USER_ID, create_cart_item("item1"))
+
+        # Act
+        items = repo.set_items(TEST_USER_ID, [])
+
+        # Assert
+        assert items == []
+        assert repo.cart_count() == 0
+        assert repo.resident_bytes() == 0
+
+    def test_set_items_keeps_resident_bytes_consistent(self, clean_cart_repo: LocalCartRepo):
+        """Test replacing a cart accounts the same bytes as building it by adds"""
+        # Arrange
+        built = LocalCartRepo(registry=MetricsRegistry())
+        built.add_item(TEST_USER_ID, create_cart_item("item2", quantity=2))
+        repo = clean_cart_repo
+        repo.add_item(TEST_USER_ID, create_cart_item("item1", name="A much longer item name"))
+
+        # Act
+        repo.set_items(TEST_USER_ID, [create_cart_item("item2", quantity=2)])
+
+        # Assert
+        assert repo.cart_count() == 1
+        assert repo.resident_bytes() == built.resident_bytes()
+
+
+class TestLocalCartRepoExpiry:
+    """Test suite for abandoned cart expiry and the LRU bound"""
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def registry(self) -> MetricsRegistry:
+        return MetricsRegistry()
+
+    def test_idle_cart_expires_lazily(self, clock: FakeClock, registry: MetricsRegistry):
+        """Test a cart idle beyond the TTL is gone on next access"""
+        # Arrange
+        repo = LocalCartRepo(ttl_seconds=60, clock=clock, registry=registry)
+        repo.add_item(TEST_USER_ID, create_cart_item())
+
+        # Act
+        clock.now += 61
+
+        # Assert
+        assert repo.get_cart(TEST_USER_ID) == []
+        assert repo.get_totals(TEST_USER_ID) == (0.0, 0)
+        assert TEST_USER_ID not in repo.get_all_carts()
+        assert repo.stats()["evicted_ttl"] == 1
+
+    def test_access_refreshes_ttl(self, clock: FakeClock, registry: MetricsRegistry):
+        """Test reading a cart keeps it alive"""
+        # Arrange
+        repo = LocalCartRepo(ttl_seconds=60, clock=clock, registry=registry)
+        repo.add_item(TEST_USER_ID, create_cart_item())
+
+        # Act
+        clock.now += 50
+        repo.get_cart(TEST_USER_ID)
+        clock.now += 50
+
+        # Assert
+        assert len(repo.get_cart(TEST_USER_ID)) == 1
+
+    def test_evict_expired_only_drops_idle_carts(self, clock: FakeClock, registry: MetricsRegistry):
+        """Test the sweep removes idle carts and keeps recently touched ones"""
+        # Arrange
+        repo = LocalCartRepo(ttl_seconds=60, clock=clock, registry=registry)
+        repo.add_item(TEST_USER_ID, create_cart_item())
+        repo.add_item(ANOTHER_USER_ID, create_cart_item())
+        clock.now += 40
+        repo.add_item(THIRD_USER_ID, create_cart_item())
+        repo.get_cart(TEST_USER_ID)
+        clock.now += 30
+
+        # Act
+        evicted = repo.evict_expired()
+
+        # Assert
+        assert evicted == 1
+        assert set(repo.get_all_carts()) == {THIRD_USER_ID, TEST_USER_ID}
+        assert registry.counter("cart_evictions_total", "", ("reason",)).value("ttl") == 1
+
+    def test_zero_ttl_never_expires(self, clock: FakeClock, registry: MetricsRegistry):
+        """Test ttl_seconds=0 disables expiry"""
+        # Arrange
+        repo = LocalCartRepo(ttl_seconds=0, clock=clock, registry=registry)
+        repo.add_item(TEST_USER_ID, create_cart_item())
+
+        # Act
+        clock.now += 10 ** 9
+
+        # Assert
+        assert repo.evict_expired() == 0
+        assert len(repo.get_cart(TEST_USER_ID)) == 1
+
+    def test_max_carts_evicts_least_recently_used(self, clock: FakeClock, registry: MetricsRegistry):
+        """Test adding a cart beyond max_carts drops the least recently touched cart"""
+        # Arrange
+        repo = LocalCartRepo(max_carts=2, clock=clock, registry=registry)
+        repo.add_item(TEST_USER_ID, create_cart_item())
+        repo.add_item(ANOTHER_USER_ID, create_cart_item())
+        repo.get_cart(TEST_USER_ID)
+
+        # Act
+        repo.add_item(THIRD_USER_ID, create_cart_item())
+
+        # Assert
+        assert set(repo.get_all_carts()) == {TEST_USER_ID, THIRD_USER_ID}
+        assert repo.stats()["evicted_lru"] == 1
+
+    def test_empty_carts_are_not_kept(self, clean_cart_repo: LocalCartRepo):
+        """Test clearing a cart or removing its last item frees it"""
+        # Arrange
+        repo = clean_cart_repo
+        repo.add_item(TEST_USER_ID, create_cart_item("item1"))
+        repo.add_item(ANOTHER_USER_ID, create_cart_item("item1"))
+
+        # Act
+        repo.clear_cart(TEST_USER_ID)
+        repo.remove_item(ANOTHER_USER_ID, "item1")
+
+        # Assert
+        assert repo.get_all_carts() == {}
+        assert repo.stats()["bytes"] == 0
+
+    def test_resident_metrics(self, registry: MetricsRegistry):
+        """Test resident cart and byte gauges follow mutations"""
+        # Arrange
+        repo = LocalCartRepo(registry=registry)
+        carts = registry.gauge("cart_resident_carts", "")
+        resident_bytes = registry.gauge("cart_resident_bytes", "")
+
+        # Act
+        repo.add_item(TEST_USER_ID, create_cart_item("item1"))
+        one_line = resident_bytes.value()
+        repo.add_item(TEST_USER_ID, create_cart_item("item2"))
+        repo.add_item(TEST_USER_ID, create_cart_item("item2", quantity=5))
+        repo.add_item(ANOTHER_USER_ID, create_cart_item("item1"))
+
+        # Assert
+        assert carts.value() == 2
+        assert resident_bytes.value() > one_line > 0
+        assert resident_bytes.value() == repo.stats()["bytes"]
+
+        repo.remove_item(TEST_USER_ID, "item2")
+        repo.clear_cart(ANOTHER_USER_ID)
+        assert carts.value() == 1
+        assert resident_bytes.value() == one_line
+
+
+class TestLocalCartRepoPersistence:
+    """Test suite for journaling and recovery through a DurableStore"""
+
+    def test_journaled_carts_are_recovered(self, tmp_path):
+        """Test a restarted repository gets the carts, without removed ones"""
+        # Arrange
+        repo = LocalCartRepo(registry=MetricsRegistry())
+        store = DurableStore(str(tmp_path), "carts")
+        store.recover(repo.apply_record)
+        repo.journal = store
+        repo.add_item(TEST_USER_ID, create_cart_item(item_id="wash"))
+        repo.add_item(TEST_USER_ID, create_cart_item(item_id="wax", quantity=2))
+        repo.remove_item(TEST_USER_ID, "wash")
+        repo.add_item(ANOTHER_USER_ID, create_cart_item())
+        repo.clear_cart(ANOTHER_USER_ID)
+        store.compact(repo.snapshot_records)
+        repo.add_item(THIRD_USER_ID, create_cart_item())
+        store.close()
+
+        # Act
+        recovered = LocalCartRepo(registry=MetricsRegistry())
+        stats = DurableStore(str(tmp_path), "carts").recover(recovered.apply_record)
+
+        # Assert
+        assert stats.snapshot_records == 1
+        assert stats.wal_records == 1
+        assert recovered.get_all_carts().keys() == {TEST_USER_ID, THIRD_USER_ID}
+        assert recovered.get_cart(THIRD_USER_ID) == repo.get_cart(THIRD_USER_ID)
+        assert [item.item_id for item in recovered.get_cart(TEST_USER_ID)] == ["wax"]
+        assert recovered.get_cart(ANOTHER_USER_ID) == []
+
+
 class TestLocalCartRepoGetAllCarts:
     """Test suite for get_all_carts() method"""
 
@@ -556,8 +933,8 @@ class TestLocalCartRepoGetAllCarts:
         assert len(all_carts[TEST_USER_ID]) == 1
         assert len(all_carts[ANOTHER_USER_ID]) == 1
 
-    def test_get_all_carts_returns_reference(self, clean_cart_repo: LocalCartRepo):
-        """Test that get_all_carts returns reference to internal storage (be aware!)"""
+    def test_get_all_carts_returns_snapshot(self, clean_cart_repo: LocalCartRepo):
+        """Test that get_all_carts returns a snapshot of the sharded storage"""
         # Arrange
         repo = clean_cart_repo
         item = CartItem(
@@ -572,5 +949,6 @@ class TestLocalCartRepoGetAllCarts:
         # Act
         all_carts = repo.get_all_carts()
 
-        # Verify it's the actual internal storage (not a copy)
-        assert all_carts is repo._storage
+        # Storage is sharded, so the result is a copy of the shard contents
+        all_carts.clear()
+        assert len(repo.get_all_carts()) == 1
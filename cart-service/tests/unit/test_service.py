@@ -5,17 +5,18 @@ Tests cover:
 - get_cart() - retrieving cart with calculated total
 - add_item() - adding items with catalog validation
 - remove_item() - removing items with error handling
-- _calculate_total_price() - price calculation logic
 - get_catalog() - catalog retrieval
 - Error scenarios: invalid item_id, type mismatch, item not found
 """
 import pytest
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from uuid import UUID
 from unittest.mock import Mock
 from fastapi import HTTPException
 
 from app.services.cart_service import CartService, CATALOG
-from app.models.cart import CartItem, CartResponse, AddItemRequest
+from app.models.cart import CartItem, CartResponse, AddItemRequest, BatchCartRequest
 from app.repositories.local_cart_repo import LocalCartRepo
 
 
@@ -85,14 +86,17 @@ class TestCartServiceGetCart:
             price=100.0
         )
         mock_cart_repo.get_cart.return_value = [sample_item]
+        mock_cart_repo.get_totals.return_value = (100.0, 1)
 
         # Act
         response = service.get_cart(TEST_USER_ID)
 
         # Assert
         mock_cart_repo.get_cart.assert_called_once_with(TEST_USER_ID)
+        mock_cart_repo.get_totals.assert_called_once_with(TEST_USER_ID)
         assert len(response.items) == 1
         assert response.total_price == 100.0
+        assert response.item_count == 1
 
 
 class TestCartServiceAddItem:
@@ -332,158 +336,6 @@ class TestCartServiceRemoveItem:
         assert exc_info.value.status_code == 404
 
 
-class TestCartServiceCalculateTotalPrice:
-    """Test suite for _calculate_total_price() static method"""
-
-    def test_calculate_total_price_empty_list(self):
-        """Test calculate total price for empty cart"""
-        # Arrange
-        items = []
-
-        # Act
-        total = CartService._calculate_total_price(items)
-
-        # Assert
-        assert total == 0.0
-
-    def test_calculate_total_price_single_item(self):
-        """Test calculate total price for single item"""
-        # Arrange
-        items = [
-            CartItem(
-                item_id="test_item",
-                type="service",
-                name="Test",
-                quantity=1,
-                price=100.0
-            )
-        ]
-
-        # Act
-        total = CartService._calculate_total_price(items)
-
-        # Assert
-        assert total == 100.0
-
-    def test_calculate_total_price_multiple_quantities(self):
-        """Test calculate total price with quantity > 1"""
-        # Arrange
-        items = [
-            CartItem(
-                item_id="test_item",
-                type="product",
-                name="Test",
-                quantity=5,
-                price=200.0
-            )
-        ]
-
-        # Act
-        total = CartService._calculate_total_price(items)
-
-        # Assert
-        assert total == 1000.0  # 5 * 200.0
-
-    def test_calculate_total_price_multiple_items(self):
-        """Test calculate total price for multiple different items"""
-        # Arrange
-        items = [
-            CartItem(
-                item_id="item1",
-                type="service",
-                name="Service 1",
-                quantity=1,
-                price=2500.0
-            ),
-            CartItem(
-                item_id="item2",
-                type="product",
-                name="Product 1",
-                quantity=2,
-                price=1000.0
-            ),
-            CartItem(
-                item_id="item3",
-                type="service",
-                name="Service 2",
-                quantity=1,
-                price=1500.0
-            )
-        ]
-
-        # Act
-        total = CartService._calculate_total_price(items)
-
-        # Assert
-        # Expected: 2500.0 + (1000.0 * 2) + 1500.0 = 6000.0
-        assert total == 6000.0
-
-    def test_calculate_total_price_rounding(self):
-        """Test calculate total price rounds to 2 decimal places"""
-        # Arrange
-        items = [
-            CartItem(
-                item_id="test_item",
-                type="product",
-                name="Test",
-                quantity=3,
-                price=10.333333
-            )
-        ]
-
-        # Act
-        total = CartService._calculate_total_price(items)
-
-        # Assert
-        assert total == 31.0  # 3 * 10.333333 = 30.999999 -> 31.0 (rounded)
-
-    def test_calculate_total_price_large_numbers(self):
-        """Test calculate total price with large quantities and prices"""
-        # Arrange
-        items = [
-            CartItem(
-                item_id="test_item",
-                type="product",
-                name="Test",
-                quantity=1000,
-                price=50.99
-            )
-        ]
-
-        # Act
-        total = CartService._calculate_total_price(items)
-
-        # Assert
-        assert total == 50990.0  # 1000 * 50.99
-
-    def test_calculate_total_price_decimal_precision(self):
-        """Test calculate total price maintains decimal precision"""
-        # Arrange
-        items = [
-            CartItem(
-                item_id="item1",
-                type="product",
-                name="Product 1",
-                quantity=1,
-                price=10.99
-            ),
-            CartItem(
-                item_id="item2",
-                type="product",
-                name="Product 2",
-                quantity=2,
-                price=5.49
-            )
-        ]
-
-        # Act
-        total = CartService._calculate_total_price(items)
-
-        # Assert
-        # Expected: 10.99 + (5.49 * 2) = 10.99 + 10.98 = 21.97
-        assert total == 21.97
-
-
 class TestCartServiceGetCatalog:
     """Test suite for get_catalog() method"""
 
@@ -597,3 +449,159 @@ class TestCartServiceIntegration:
         response = service.get_cart(TEST_USER_ID)
         assert len(response.items) == 1
         assert response.items[0].item_id == "svc_oil_change"
+
+
+class TestCartServiceApplyBatch:
+    """Test suite for apply_batch() method"""
+
+    def test_batch_applies_operations_in_order(self, cart_service_with_data: CartService):
+        """Test add, set_quantity and remove are applied in order in one call"""
+        # Arrange
+        service = cart_service_with_data
+        request = BatchCartRequest(operations=[
+            {"op": "add", "item_id": "prod_oil_filter", "type": "product", "quantity": 1},
+            {"op": "add", "item_id": "prod_oil_filter", "quantity": 2},
+            {"op": "set_quantity", "item_id": "svc_diagnostics", "quantity": 2},
+            {"op": "remove", "item_id": "svc_oil_change"}
+        ])
+
+        # Act
+        response = service.apply_batch(TEST_USER_ID, request)
+
+        # Assert
+        assert [(item.item_id, item.quantity) for item in response.items] == [
+            ("prod_oil_filter", 3), ("svc_diagnostics", 2)
+        ]
+        assert response.total_price == 6000.0
+        assert response.item_count == 5
+        assert service.get_cart(TEST_USER_ID) == response
+
+    def test_set_quantity_zero_removes_item(self, cart_service_with_data: CartService):
+        """Test set_quantity 0 removes the line and an emptied cart is dropped"""
+        # Arrange
+        service = cart_service_with_data
+        request = BatchCartRequest(operations=[{"op": "set_quantity", "item_id": "svc_oil_change", "quantity": 0}])
+
+        # Act
+        response = service.apply_batch(TEST_USER_ID, request)
+
+        # Assert
+        assert response.items == []
+        assert response.total_price == 0.0
+        assert service.repo.get_all_carts() == {}
+
+    @pytest.mark.parametrize("operation, status_code", [
+        ({"op": "add", "item_id": "invalid_item", "quantity": 1}, 404),
+        ({"op": "add", "item_id": "prod_oil_filter", "type": "service", "quantity": 1}, 400),
+        ({"op": "remove", "item_id": "svc_diagnostics"}, 404),
+    ])
+    def test_invalid_operation_leaves_cart_unchanged(
+        self, cart_service_with_data: CartService, operation, status_code
+    ):
+        """Test one failing operation rejects the whole batch"""
+        # Arrange
+        service = cart_service_with_data
+        before = service.get_cart(TEST_USER_ID)
+        request = BatchCartRequest(operations=[
+            {"op": "add", "item_id": "svc_oil_change", "quantity": 5},
+            operation
+        ])
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            service.apply_batch(TEST_USER_ID, request)
+        assert exc_info.value.status_code == status_code
+        assert "Operation 1" in exc_info.value.detail
+        assert service.get_cart(TEST_USER_ID) == before
+
+    def test_remove_of_item_added_in_same_batch(self, cart_service: CartService):
+        """Test later operations see the effect of earlier ones"""
+        # Arrange
+        request = BatchCartRequest(operations=[
+            {"op": "add", "item_id": "svc_diagnostics", "quantity": 1},
+            {"op": "remove", "item_id": "svc_diagnostics"},
+            {"op": "add", "item_id": "svc_oil_change", "quantity": 1}
+        ])
+
+        # Act
+        response = cart_service.apply_batch(TEST_USER_ID, request)
+
+        # Assert
+        assert [item.item_id for item in response.items] == ["svc_oil_change"]
+        assert response.total_price == 2500.0
+
+
+class TestCartServiceCatalogVersions:
+    """Lazy repricing of carts when the catalog changes"""
+
+    def test_get_cart_reprices_after_catalog_load(self, cart_service: CartService):
+        """Test a cart picks up new prices on its next read"""
+        # Arrange
+        service = cart_service
+        service.add_item(TEST_USER_ID, AddItemRequest(item_id="svc_oil_change", type="service", quantity=2))
+        catalog = {**CATALOG, "svc_oil_change": {**CATALOG["svc_oil_change"], "price": 3000.0}}
+
+        # Act
+        service.catalog.load(catalog)
+        response = service.get_cart(TEST_USER_ID)
+
+        # Assert
+        assert response.items[0].price == 3000.0
+        assert response.total_price == 6000.0
+
+    def test_add_item_reprices_existing_lines_first(self, cart_service: CartService):
+        """Test adding to a cart priced against an old version does not mix prices"""
+        # Arrange
+        service = cart_service
+        service.add_item(TEST_USER_ID, AddItemRequest(item_id="svc_oil_change", type="service", quantity=1))
+        service.catalog.load({**CATALOG, "svc_oil_change": {**CATALOG["svc_oil_change"], "price": 3000.0}})
+
+        # Act
+        response = service.add_item(
+            TEST_USER_ID, AddItemRequest(item_id="svc_oil_change", type="service", quantity=1)
+        )
+
+        # Assert
+        assert response.items[0].quantity == 2
+        assert response.total_price == 6000.0
+
+    def test_discontinued_item_cannot_be_added(self, cart_service: CartService):
+        """Test items removed from the catalog are rejected and dropped from carts"""
+        # Arrange
+        service = cart_service
+        service.add_item(TEST_USER_ID, AddItemRequest(item_id="svc_diagnostics", type="service", quantity=1))
+        service.catalog.load({k: v for k, v in CATALOG.items() if k != "svc_diagnostics"})
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            service.add_item(TEST_USER_ID, AddItemRequest(item_id="svc_diagnostics", type="service", quantity=1))
+        assert exc_info.value.status_code == 404
+        assert service.get_cart(TEST_USER_ID).items == []
+
+
+class TestCartServiceConcurrency:
+    """Concurrent mutations from threadpool handlers"""
+
+    def test_concurrent_adds_are_linearizable(self, cart_service: CartService):
+        """Test each concurrent add observes a distinct item count and none is lost"""
+        # Arrange
+        threads = 8
+        adds_per_thread = 50
+        request = AddItemRequest(item_id="svc_oil_change", type="service", quantity=1)
+        barrier = threading.Barrier(threads)
+
+        def worker():
+            barrier.wait()
+            return [cart_service.add_item(TEST_USER_ID, request).item_count for _ in range(adds_per_thread)]
+
+        # Act
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            results = [future.result() for future in [pool.submit(worker) for _ in range(threads)]]
+
+        # Assert
+        counts = sorted(count for result in results for count in result)
+        total = threads * adds_per_thread
+        assert counts == list(range(1, total + 1))
+        response = cart_service.get_cart(TEST_USER_ID)
+        assert response.items[0].quantity == total
+        assert response.total_price == total * 2500.0
@@ -8,6 +8,9 @@ class Settings(BaseSettings):
     """Application settings"""
     service_name: str = "fines-service"
     service_port: int = 8007
+
+    # Serialize responses with orjson instead of json.dumps (opt-in)
+    fast_json_responses: bool = False
     
     class Config:
         env_file = ".env"
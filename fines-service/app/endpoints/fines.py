@@ -7,7 +7,7 @@ from fastapi import APIRouter, HTTPException, Query, Depends
 from app.models.fine import FineResponse, PayFineRequest, PaymentResponse
 from app.services.fine_service import FineService
 from app.repositories.local_fine_repo import fine_repository
-from app.auth import get_current_user_id
+from detailing_auth import get_current_user_id
 
 
 router = APIRouter(prefix="/api/fines", tags=["fines"])
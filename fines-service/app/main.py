@@ -2,6 +2,8 @@
 Main FastAPI application for Fines Service
 """
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
+from detailing_observability import setup_load_shedding, setup_metrics, setup_profiling
 from app.config import settings
 from app.endpoints import fines
 
@@ -10,10 +12,20 @@ from app.endpoints import fines
 app = FastAPI(
     title=settings.service_name,
     description="Microservice for managing traffic fines",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse if settings.fast_json_responses else JSONResponse
 )
 
 
+# Shed load (503) on event-loop lag or too many requests in flight
+setup_load_shedding(app)
+
+# Request metrics and /metrics endpoint
+setup_metrics(app)
+
+# Sampling profiler at /debug/profile (only with PROFILING_ENABLED=true)
+setup_profiling(app)
+
 # Include routers
 app.include_router(fines.router)
 
@@ -0,0 +1,91 @@
+"""
+Benchmark of GET /api/fines/check with the default and orjson responses.
+
+Seeds one license plate with N unpaid fines and serves the fines router from
+two in-process apps, one with FastAPI's default JSONResponse and one with
+ORJSONResponse (FAST_JSON_RESPONSES=true). Requests go through
+httpx.ASGITransport, so the numbers reflect server-side CPU cost only.
+
+Usage (from the fines-service directory):
+    python -m benchmarks.bench_json_responses
+    python -m benchmarks.bench_json_responses --fines 10 100 1000 --requests 2000
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from datetime import date
+from uuid import UUID, uuid4
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.endpoints import fines
+from app.models.fine import Fine
+from app.repositories.local_fine_repo import fine_repository
+from detailing_auth import get_current_user_id
+
+PLATE = "B000BB000"
+DEFAULT_SIZES = [10, 100, 1000]
+
+
+def _seed(count: int) -> None:
+    """Replace the fines of the benchmark plate with ``count`` unpaid fines"""
+    plate_fines = [
+        Fine(
+            fine_id=uuid4(),
+            license_plate=PLATE,
+            amount=500.0 + i,
+            description=f"Превышение скорости, протокол {i}",
+            date=date(2024, 1 + i % 12, 1 + i % 28)
+        )
+        for i in range(count)
+    ]
+    fine_repository._fines[PLATE] = plate_fines
+    for fine in plate_fines:
+        fine_repository._fines_by_id[fine.fine_id] = fine
+
+
+def _build_app(response_class) -> FastAPI:
+    app = FastAPI(default_response_class=response_class)
+    app.include_router(fines.router)
+    app.dependency_overrides[get_current_user_id] = lambda: UUID(int=1)
+    return app
+
+
+async def _requests_per_second(app: FastAPI, requests: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up routing and validation caches
+        for _ in range(20):
+            await client.get("/api/fines/check", params={"license_plate": PLATE})
+        start = time.perf_counter()
+        for _ in range(requests):
+            response = await client.get("/api/fines/check", params={"license_plate": PLATE})
+            response.raise_for_status()
+        return requests / (time.perf_counter() - start)
+
+
+async def main(sizes: list[int], requests: int) -> None:
+    default_app = _build_app(JSONResponse)
+    fast_app = _build_app(ORJSONResponse)
+
+    print(f"requests={requests} per size")
+    print(f"{'fines':>8} {'default rps':>12} {'orjson rps':>12} {'speedup':>8}")
+    for size in sizes:
+        _seed(size)
+        default = await _requests_per_second(default_app, requests)
+        fast = await _requests_per_second(fast_app, requests)
+        print(f"{size:>8} {default:>12.0f} {fast:>12.0f} {fast / default:>7.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fines", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--requests", type=int, default=1000)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    asyncio.run(main(args.fines, args.requests))
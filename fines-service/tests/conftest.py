@@ -80,7 +80,7 @@ def real_fine_service(real_repository):
 @pytest.fixture
 def test_client():
     """Create a test client for integration testing with mocked JWT auth"""
-    from app.auth import get_current_user_id
+    from detailing_auth import get_current_user_id
     
     # Override JWT auth dependency with mock
     app.dependency_overrides[get_current_user_id] = mock_get_current_user_id
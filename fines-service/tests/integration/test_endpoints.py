@@ -471,3 +471,26 @@ class TestAPIDocumentation:
         response = test_client.get("/redoc")
 
         assert response.status_code == 200
+
+
+class TestFastJSONResponses:
+    """Tests for the opt-in orjson response class"""
+
+    def test_orjson_responses_match_default(self, test_client):
+        """Test that ORJSONResponse renders the same payload as the default class"""
+        from fastapi import FastAPI
+        from fastapi.responses import ORJSONResponse
+        from app.endpoints import fines
+        from detailing_auth import get_current_user_id
+        from tests.conftest import mock_get_current_user_id
+
+        fast_app = FastAPI(default_response_class=ORJSONResponse)
+        fast_app.include_router(fines.router)
+        fast_app.dependency_overrides[get_current_user_id] = mock_get_current_user_id
+
+        default = test_client.get("/api/fines/check", params={"license_plate": "А123БВ799"})
+        fast = TestClient(fast_app).get("/api/fines/check", params={"license_plate": "А123БВ799"})
+
+        assert fast.status_code == 200
+        assert fast.headers["content-type"] == "application/json"
+        assert fast.json() == default.json()
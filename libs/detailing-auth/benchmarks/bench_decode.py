@@ -0,0 +1,70 @@
+"""
+Micro-benchmark of per-request authentication cost.
+
+Measures the mean time of one get_current_user_id call for:
+
+- legacy:      jose.jwt.decode with the raw key string (the old app/auth.py)
+- jose:        TokenVerifier with the python-jose backend and a pre-built key
+- pyjwt:       TokenVerifier with the PyJWT backend (if installed)
+- cached:      get_current_user_id with the token already in token_cache
+
+Usage (from the libs/detailing-auth directory):
+    python -m benchmarks.bench_decode
+    python -m benchmarks.bench_decode --iterations 50000
+"""
+
+import argparse
+import logging
+import time
+from uuid import UUID, uuid4
+
+from jose import jwt
+
+from detailing_auth import TokenVerifier, get_current_user_id, settings, token_cache
+from detailing_auth.verifier import pyjwt
+
+
+def _timeit(func, iterations: int) -> float:
+    """Return mean microseconds per call"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main(iterations: int) -> None:
+    token = jwt.encode(
+        {"sub": str(uuid4()), "exp": int(time.time()) + 3600},
+        settings.JWT_SECRET_KEY,
+        algorithm=settings.JWT_ALGORITHM
+    )
+    header = f"Bearer {token}"
+
+    def legacy():
+        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+        return UUID(payload["sub"])
+
+    results = {"legacy": _timeit(legacy, iterations)}
+
+    backends = ["jose"] + (["pyjwt"] if pyjwt is not None else [])
+    for backend in backends:
+        verifier = TokenVerifier(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM, backend=backend)
+        results[backend] = _timeit(lambda: UUID(verifier.decode(token)["sub"]), iterations)
+
+    token_cache.clear()
+    get_current_user_id(header)
+    results["cached"] = _timeit(lambda: get_current_user_id(header), iterations)
+
+    print(f"iterations={iterations}")
+    print(f"{'mode':>8} {'us/request':>11} {'speedup':>8}")
+    for mode, cost in results.items():
+        print(f"{mode:>8} {cost:>11.2f} {results['legacy'] / cost:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    main(args.iterations)
@@ -0,0 +1,22 @@
+"""
+Shared JWT authentication for the car detailing services.
+
+Provides the get_current_user_id FastAPI dependency used by cart, order,
+payment, bonus, fines and support services to authenticate requests with
+tokens issued by user-service.
+"""
+from detailing_auth.cache import TokenCache
+from detailing_auth.config import AuthSettings, settings
+from detailing_auth.dependency import get_current_user_id, token_cache, token_verifier
+from detailing_auth.verifier import InvalidTokenError, TokenVerifier
+
+__all__ = [
+    "AuthSettings",
+    "InvalidTokenError",
+    "TokenCache",
+    "TokenVerifier",
+    "get_current_user_id",
+    "settings",
+    "token_cache",
+    "token_verifier",
+]
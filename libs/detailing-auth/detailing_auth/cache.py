@@ -0,0 +1,108 @@
+"""Bounded cache of verified tokens"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+from uuid import UUID
+
+
+class TokenCache:
+    """
+    LRU cache of verified tokens
+
+    Maps a SHA-256 digest of the token to the resolved user ID until the
+    token's "exp" claim, so clients that resend the same bearer token skip
+    signature verification. Raw tokens are never stored. Tokens without
+    "exp" are not cached.
+
+    With a metrics registry (a detailing_observability MetricsRegistry),
+    lookups, evictions and the cache size are also exported on /metrics:
+    auth_token_cache_lookups_total{result="hit"|"miss"},
+    auth_token_cache_evictions_total and auth_token_cache_size.
+    """
+
+    def __init__(self, max_size: int, clock: Callable[[], float] = time.time, registry: Optional[Any] = None):
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: "OrderedDict[bytes, Tuple[UUID, float]]" = OrderedDict()
+        # Sync dependencies run in the threadpool, so access is locked
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lookups_total = self._evictions_total = self._size = None
+        if registry is not None:
+            self._lookups_total = registry.counter(
+                "auth_token_cache_lookups_total", "Verified-token cache lookups by result", ("result",)
+            )
+            self._evictions_total = registry.counter(
+                "auth_token_cache_evictions_total", "Tokens evicted from the verified-token cache"
+            )
+            self._size = registry.gauge("auth_token_cache_size", "Tokens held in the verified-token cache")
+
+    def _count_lookup(self, result: str) -> None:
+        if self._lookups_total is not None:
+            self._lookups_total.inc(result)
+
+    def _update_size(self) -> None:
+        if self._size is not None:
+            self._size.set(len(self._entries))
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[UUID]:
+        """Return the cached user ID for a still valid token, or None"""
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                user_id, expires_at = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    self._count_lookup("hit")
+                    return user_id
+                del self._entries[key]
+                self._update_size()
+            self.misses += 1
+            self._count_lookup("miss")
+            return None
+
+    def set(self, token: str, user_id: UUID, expires_at: Optional[float]) -> None:
+        """Remember a verified token until its expiry time"""
+        if expires_at is None or self.max_size <= 0 or expires_at <= self._clock():
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (user_id, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+                if self._evictions_total is not None:
+                    self._evictions_total.inc()
+            self._update_size()
+
+    def clear(self) -> None:
+        """Drop all cached tokens and reset counters (exported counters keep counting)"""
+        with self._lock:
+            self._entries.clear()
+            self._update_size()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Return cache counters and hit rate"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
@@ -0,0 +1,35 @@
+"""Authentication settings read from environment variables"""
+import os
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class AuthSettings:
+    """
+    JWT settings shared by all services (must match user-service)
+
+    Environment variables:
+        JWT_SECRET_KEY: HMAC key used by user-service to sign tokens
+        JWT_ALGORITHM: Signing algorithm
+        JWT_LEEWAY_SECONDS: Allowed clock skew for exp/nbf checks
+        TOKEN_CACHE_MAX_SIZE: Verified tokens kept in memory (0 disables)
+    """
+
+    JWT_SECRET_KEY: str = "your-secret-key-change-in-production"
+    JWT_ALGORITHM: str = "HS256"
+    JWT_LEEWAY_SECONDS: float = 0.0
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+
+    @classmethod
+    def from_env(cls) -> "AuthSettings":
+        """Build settings from the environment, falling back to defaults"""
+        defaults = cls()
+        return cls(
+            JWT_SECRET_KEY=os.getenv("JWT_SECRET_KEY", defaults.JWT_SECRET_KEY),
+            JWT_ALGORITHM=os.getenv("JWT_ALGORITHM", defaults.JWT_ALGORITHM),
+            JWT_LEEWAY_SECONDS=float(os.getenv("JWT_LEEWAY_SECONDS", defaults.JWT_LEEWAY_SECONDS)),
+            TOKEN_CACHE_MAX_SIZE=int(os.getenv("TOKEN_CACHE_MAX_SIZE", defaults.TOKEN_CACHE_MAX_SIZE)),
+        )
+
+
+settings = AuthSettings.from_env()
@@ -0,0 +1,87 @@
+"""FastAPI dependency resolving the authenticated user"""
+import logging
+from typing import Optional
+from uuid import UUID
+
+from fastapi import Header, HTTPException, status
+
+from detailing_auth.cache import TokenCache
+from detailing_auth.config import settings
+from detailing_auth.verifier import InvalidTokenError, TokenVerifier
+
+logger = logging.getLogger(__name__)
+
+try:
+    from detailing_observability import REGISTRY as metrics_registry
+except ImportError:  # Cache metrics are exported only next to the observability package
+    metrics_registry = None
+
+token_verifier = TokenVerifier(
+    secret_key=settings.JWT_SECRET_KEY,
+    algorithm=settings.JWT_ALGORITHM,
+    leeway=settings.JWT_LEEWAY_SECONDS
+)
+token_cache = TokenCache(max_size=settings.TOKEN_CACHE_MAX_SIZE, registry=metrics_registry)
+
+
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"}
+    )
+
+
+def get_current_user_id(authorization: Optional[str] = Header(None)) -> UUID:
+    """
+    Extract and validate user_id from JWT token in Authorization header.
+    
+    Tokens that were already verified are resolved from token_cache until
+    they expire.
+    
+    Args:
+        authorization: Authorization header value (Bearer <token>)
+        
+    Returns:
+        UUID: Authenticated user's ID
+        
+    Raises:
+        HTTPException: 401 if token is missing, invalid, or expired
+    """
+    if not authorization:
+        logger.warning("Authorization header missing")
+        raise _unauthorized("Authorization header required")
+    
+    # Extract token from "Bearer <token>" format
+    parts = authorization.split()
+    if len(parts) != 2 or parts[0].lower() != "bearer":
+        logger.warning(f"Invalid authorization header format: {authorization}")
+        raise _unauthorized("Invalid authorization header format. Expected: Bearer <token>")
+    
+    token = parts[1]
+    
+    cached_user_id = token_cache.get(token)
+    if cached_user_id is not None:
+        return cached_user_id
+    
+    try:
+        payload = token_verifier.decode(token)
+    except InvalidTokenError as e:
+        logger.warning(f"JWT validation failed: {e}")
+        raise _unauthorized("Invalid or expired token")
+    
+    # Extract user_id from "sub" field
+    user_id_str = payload.get("sub")
+    if not user_id_str:
+        logger.warning("Token payload missing 'sub' field")
+        raise _unauthorized("Invalid token: missing user ID")
+    
+    try:
+        user_id = UUID(user_id_str)
+    except (TypeError, ValueError) as e:
+        logger.error(f"Failed to parse user_id as UUID: {e}")
+        raise _unauthorized("Invalid token: malformed user ID")
+    
+    token_cache.set(token, user_id, payload.get("exp"))
+    logger.debug(f"User authenticated: {user_id}")
+    return user_id
@@ -0,0 +1,79 @@
+"""JWT signature and claims verification"""
+import logging
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import jwt as pyjwt
+except ImportError:  # PyJWT is an optional speed-up
+    pyjwt = None
+
+from jose import jwk
+from jose import jwt as jose_jwt
+from jose import JWTError
+
+
+class InvalidTokenError(Exception):
+    """Token signature, format or claims are invalid"""
+
+
+class TokenVerifier:
+    """
+    Decode and validate JWTs with a key prepared once
+
+    Uses PyJWT when it is installed (noticeably faster for HS256) and
+    python-jose otherwise. The signing key is converted to the backend's
+    key object once at construction instead of on every decode.
+    """
+
+    def __init__(self, secret_key: str, algorithm: str, leeway: float = 0.0, backend: Optional[str] = None):
+        """
+        Args:
+            secret_key: Key used to verify signatures
+            algorithm: The only accepted "alg" value
+            leeway: Allowed clock skew in seconds for exp/nbf/iat checks
+            backend: "pyjwt" or "jose"; defaults to PyJWT when installed
+        """
+        if backend is None:
+            backend = "pyjwt" if pyjwt is not None else "jose"
+        if backend == "pyjwt" and pyjwt is None:
+            raise ImportError("PyJWT is not installed; install detailing-auth[fast]")
+        if backend not in ("pyjwt", "jose"):
+            raise ValueError(f"Unknown JWT backend: {backend}")
+
+        self.algorithm = algorithm
+        self.leeway = leeway
+        self.backend = backend
+        self._algorithms = [algorithm]
+        if backend == "pyjwt":
+            self._key = secret_key.encode()
+            self._pyjwt = pyjwt.PyJWT()
+        else:
+            self._key = jwk.construct(secret_key, algorithm)
+            self._jose_options = {"leeway": leeway}
+        logger.info(f"JWT verifier initialized: backend={backend}, algorithm={algorithm}, leeway={leeway}s")
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        """
+        Verify a token and return its payload
+
+        Args:
+            token: Encoded JWT
+
+        Returns:
+            Decoded claims
+
+        Raises:
+            InvalidTokenError: If the signature, format, exp or nbf is invalid
+        """
+        if self.backend == "pyjwt":
+            try:
+                return self._pyjwt.decode(token, self._key, algorithms=self._algorithms, leeway=self.leeway)
+            except pyjwt.InvalidTokenError as e:
+                raise InvalidTokenError(str(e)) from e
+
+        try:
+            return jose_jwt.decode(token, self._key, algorithms=self._algorithms, options=self._jose_options)
+        except JWTError as e:
+            raise InvalidTokenError(str(e)) from e
@@ -0,0 +1,43 @@
+"""Shared fixtures for detailing-auth tests"""
+import time
+from typing import Optional
+from uuid import UUID
+
+import pytest
+from jose import jwt
+
+from detailing_auth import settings, token_cache
+
+
+class FakeClock:
+    """Manually advanced wall clock"""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_token(user_id: Optional[UUID], expires_in: Optional[float] = 3600, key: str = None, **claims) -> str:
+    """Build a signed token like user-service does"""
+    payload = dict(claims)
+    if user_id is not None:
+        payload["sub"] = str(user_id)
+    if expires_in is not None:
+        payload["exp"] = int(time.time() + expires_in)
+    return jwt.encode(payload, key or settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Fixture providing a controllable clock"""
+    return FakeClock()
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Start every test with an empty global token cache"""
+    token_cache.clear()
+    yield
+    token_cache.clear()
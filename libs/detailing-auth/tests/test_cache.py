@@ -0,0 +1,98 @@
+"""Unit tests for TokenCache"""
+import time
+from uuid import uuid4
+
+import pytest
+
+from detailing_auth import TokenCache
+
+
+class TestTokenCache:
+    """Tests for TokenCache expiry, size limit and metrics"""
+
+    def test_entry_expires_at_exp(self, clock):
+        """Test that a cached token stops resolving once exp has passed"""
+        cache = TokenCache(max_size=10, clock=clock)
+        user_id = uuid4()
+        cache.set("token", user_id, clock.now + 60)
+
+        assert cache.get("token") == user_id
+        clock.now += 60
+        assert cache.get("token") is None
+        assert cache.stats()["size"] == 0
+
+    def test_already_expired_token_not_stored(self, clock):
+        """Test that a token past its exp is not stored"""
+        cache = TokenCache(max_size=10, clock=clock)
+
+        cache.set("token", uuid4(), clock.now - 1)
+
+        assert cache.stats()["size"] == 0
+
+    def test_token_without_exp_not_stored(self, clock):
+        """Test that tokens without an expiry are never cached"""
+        cache = TokenCache(max_size=10, clock=clock)
+
+        cache.set("token", uuid4(), None)
+
+        assert cache.stats()["size"] == 0
+
+    def test_lru_eviction(self, clock):
+        """Test that the least recently used token is evicted at max_size"""
+        cache = TokenCache(max_size=2, clock=clock)
+        cache.set("a", uuid4(), clock.now + 60)
+        cache.set("b", uuid4(), clock.now + 60)
+        cache.get("a")
+
+        cache.set("c", uuid4(), clock.now + 60)
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.stats()["evictions"] == 1
+
+    def test_zero_size_disables_cache(self, clock):
+        """Test that max_size 0 stores nothing"""
+        cache = TokenCache(max_size=0, clock=clock)
+
+        cache.set("token", uuid4(), clock.now + 60)
+
+        assert cache.get("token") is None
+
+    def test_keys_are_digests(self):
+        """Test that raw tokens are not kept in memory"""
+        cache = TokenCache(max_size=10)
+        cache.set("secret-token", uuid4(), time.time() + 60)
+
+        assert "secret-token" not in cache._entries
+        assert all(isinstance(key, bytes) and len(key) == 32 for key in cache._entries)
+
+    def test_hit_rate(self, clock):
+        """Test hit rate calculation"""
+        cache = TokenCache(max_size=10, clock=clock)
+        cache.set("token", uuid4(), clock.now + 60)
+
+        cache.get("token")
+        cache.get("token")
+        cache.get("other")
+
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+    def test_metrics_exported_to_registry(self, clock):
+        """Test that hits, misses, evictions and size reach the metrics registry"""
+        observability = pytest.importorskip("detailing_observability")
+        registry = observability.MetricsRegistry()
+        cache = TokenCache(max_size=1, clock=clock, registry=registry)
+
+        cache.set("a", uuid4(), clock.now + 60)
+        cache.get("a")
+        cache.get("b")
+        cache.set("b", uuid4(), clock.now + 60)
+
+        text = registry.render()
+        assert 'auth_token_cache_lookups_total{result="hit"} 1' in text
+        assert 'auth_token_cache_lookups_total{result="miss"} 1' in text
+        assert "auth_token_cache_evictions_total 1" in text
+        assert "auth_token_cache_size 1" in text
@@ -0,0 +1,90 @@
+"""Unit tests for the get_current_user_id dependency"""
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from detailing_auth import get_current_user_id, token_cache, token_verifier
+from tests.conftest import make_token
+
+
+class TestGetCurrentUserId:
+    """Tests for header parsing and error mapping"""
+
+    def test_valid_token(self):
+        """Test that a valid bearer token resolves to its user"""
+        user_id = uuid4()
+
+        assert get_current_user_id(f"Bearer {make_token(user_id)}") == user_id
+
+    @pytest.mark.parametrize("header,detail", [
+        (None, "Authorization header required"),
+        ("Token abc", "Invalid authorization header format. Expected: Bearer <token>"),
+        ("Bearer", "Invalid authorization header format. Expected: Bearer <token>"),
+        ("Bearer not-a-jwt", "Invalid or expired token"),
+    ])
+    def test_rejected_headers(self, header, detail):
+        """Test 401 responses for missing or malformed credentials"""
+        with pytest.raises(HTTPException) as exc_info:
+            get_current_user_id(header)
+
+        assert exc_info.value.status_code == 401
+        assert exc_info.value.detail == detail
+        assert exc_info.value.headers == {"WWW-Authenticate": "Bearer"}
+
+    def test_missing_sub(self):
+        """Test that a token without sub is rejected"""
+        with pytest.raises(HTTPException) as exc_info:
+            get_current_user_id(f"Bearer {make_token(None)}")
+
+        assert exc_info.value.detail == "Invalid token: missing user ID"
+
+    def test_malformed_sub(self):
+        """Test that a non-UUID sub is rejected"""
+        token = make_token(None, sub="not-a-uuid")
+
+        with pytest.raises(HTTPException) as exc_info:
+            get_current_user_id(f"Bearer {token}")
+
+        assert exc_info.value.detail == "Invalid token: malformed user ID"
+
+    def test_expired_token(self):
+        """Test that an expired token is rejected"""
+        with pytest.raises(HTTPException) as exc_info:
+            get_current_user_id(f"Bearer {make_token(uuid4(), expires_in=-10)}")
+
+        assert exc_info.value.status_code == 401
+
+
+class TestGetCurrentUserIdCache:
+    """Tests for cached token verification"""
+
+    def test_repeated_token_decoded_once(self):
+        """Test that a resent token is served from the cache"""
+        user_id = uuid4()
+        token = make_token(user_id)
+
+        with patch.object(token_verifier, "decode", wraps=token_verifier.decode) as mock_decode:
+            first = get_current_user_id(f"Bearer {token}")
+            second = get_current_user_id(f"Bearer {token}")
+
+        assert first == second == user_id
+        assert mock_decode.call_count == 1
+        assert token_cache.stats()["hits"] == 1
+
+    def test_invalid_token_not_cached(self):
+        """Test that rejected tokens are verified again every time"""
+        token = make_token(uuid4()) + "tampered"
+
+        for _ in range(2):
+            with pytest.raises(HTTPException):
+                get_current_user_id(f"Bearer {token}")
+
+        assert token_cache.stats()["size"] == 0
+
+    def test_token_without_exp_not_cached(self):
+        """Test that tokens without an expiry are never cached"""
+        get_current_user_id(f"Bearer {make_token(uuid4(), expires_in=None)}")
+
+        assert token_cache.stats()["size"] == 0
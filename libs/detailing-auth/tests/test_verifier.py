@@ -0,0 +1,57 @@
+"""Unit tests for TokenVerifier"""
+from uuid import uuid4
+
+import pytest
+
+from detailing_auth import InvalidTokenError, TokenVerifier, settings
+from detailing_auth.verifier import pyjwt
+from tests.conftest import make_token
+
+BACKENDS = ["jose"] + (["pyjwt"] if pyjwt is not None else [])
+
+
+@pytest.fixture(params=BACKENDS)
+def verifier(request) -> TokenVerifier:
+    """Verifier for every available backend"""
+    return TokenVerifier(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM, backend=request.param)
+
+
+class TestTokenVerifier:
+    """Tests for signature and claim validation"""
+
+    def test_decode_valid_token(self, verifier):
+        """Test that a valid token returns its claims"""
+        user_id = uuid4()
+
+        payload = verifier.decode(make_token(user_id))
+
+        assert payload["sub"] == str(user_id)
+
+    def test_wrong_key_rejected(self, verifier):
+        """Test that a token signed with another key is rejected"""
+        with pytest.raises(InvalidTokenError):
+            verifier.decode(make_token(uuid4(), key="another-key"))
+
+    def test_expired_token_rejected(self, verifier):
+        """Test that an expired token is rejected"""
+        with pytest.raises(InvalidTokenError):
+            verifier.decode(make_token(uuid4(), expires_in=-30))
+
+    def test_garbage_rejected(self, verifier):
+        """Test that a malformed token is rejected"""
+        with pytest.raises(InvalidTokenError):
+            verifier.decode("not-a-jwt")
+
+    def test_leeway_accepts_recently_expired(self):
+        """Test that leeway tolerates clock skew"""
+        for backend in BACKENDS:
+            lenient = TokenVerifier(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM, leeway=60, backend=backend)
+
+            payload = lenient.decode(make_token(uuid4(), expires_in=-30))
+
+            assert "sub" in payload
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend name is rejected"""
+        with pytest.raises(ValueError):
+            TokenVerifier(settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM, backend="nope")
@@ -0,0 +1,40 @@
+"""
+Shared observability helpers for the car detailing services.
+
+setup_metrics(app) adds request metrics (latency histograms, in-flight
+gauges, status code counters) and a Prometheus-compatible /metrics
+endpoint to a FastAPI application. setup_load_shedding(app) samples
+event-loop lag and answers 503 with Retry-After while the worker is
+overloaded. setup_profiling(app) mounts an opt-in sampling profiler
+(/debug/profile and the X-Profile header mode).
+"""
+from detailing_observability.config import ProfilingSettings, SheddingSettings
+from detailing_observability.loop_lag import LoopLagMonitor
+from detailing_observability.metrics import (
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+)
+from detailing_observability.middleware import MetricsMiddleware, setup_metrics
+from detailing_observability.profiling import ProfilingMiddleware, SamplingProfiler, setup_profiling
+from detailing_observability.shedding import LoadSheddingMiddleware, setup_load_shedding
+
+__all__ = [
+    "REGISTRY",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "LoadSheddingMiddleware",
+    "LoopLagMonitor",
+    "MetricsMiddleware",
+    "MetricsRegistry",
+    "ProfilingMiddleware",
+    "ProfilingSettings",
+    "SamplingProfiler",
+    "SheddingSettings",
+    "setup_load_shedding",
+    "setup_metrics",
+    "setup_profiling",
+]
@@ -0,0 +1,75 @@
+"""Load shedding and profiling settings read from environment variables"""
+import os
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SheddingSettings:
+    """
+    Event-loop lag sampling and load shedding thresholds
+
+    Environment variables:
+        LOOP_LAG_SAMPLE_INTERVAL_SECONDS: How often the lag sampler wakes up
+        LOAD_SHED_MAX_LOOP_LAG_SECONDS: Shed requests while the loop lags more (0 disables)
+        LOAD_SHED_MAX_IN_FLIGHT: Shed requests above this many in flight (0 disables)
+        LOAD_SHED_RETRY_AFTER_SECONDS: Retry-After value of 503 responses
+    """
+
+    LOOP_LAG_SAMPLE_INTERVAL_SECONDS: float = 0.1
+    LOAD_SHED_MAX_LOOP_LAG_SECONDS: float = 0.5
+    LOAD_SHED_MAX_IN_FLIGHT: int = 512
+    LOAD_SHED_RETRY_AFTER_SECONDS: int = 1
+
+    @classmethod
+    def from_env(cls) -> "SheddingSettings":
+        """Build settings from the environment, falling back to defaults"""
+        defaults = cls()
+        return cls(
+            LOOP_LAG_SAMPLE_INTERVAL_SECONDS=float(
+                os.getenv("LOOP_LAG_SAMPLE_INTERVAL_SECONDS", defaults.LOOP_LAG_SAMPLE_INTERVAL_SECONDS)
+            ),
+            LOAD_SHED_MAX_LOOP_LAG_SECONDS=float(
+                os.getenv("LOAD_SHED_MAX_LOOP_LAG_SECONDS", defaults.LOAD_SHED_MAX_LOOP_LAG_SECONDS)
+            ),
+            LOAD_SHED_MAX_IN_FLIGHT=int(os.getenv("LOAD_SHED_MAX_IN_FLIGHT", defaults.LOAD_SHED_MAX_IN_FLIGHT)),
+            LOAD_SHED_RETRY_AFTER_SECONDS=int(
+                os.getenv("LOAD_SHED_RETRY_AFTER_SECONDS", defaults.LOAD_SHED_RETRY_AFTER_SECONDS)
+            ),
+        )
+
+
+settings = SheddingSettings.from_env()
+
+
+@dataclass(frozen=True)
+class ProfilingSettings:
+    """
+    Sampling profiler switches (everything is off unless PROFILING_ENABLED)
+
+    Environment variables:
+        PROFILING_ENABLED: Mount /debug/profile and the X-Profile header mode
+        PROFILING_TOKEN: Callers must send it in X-Profile-Token (required to enable profiling)
+        PROFILING_INTERVAL_SECONDS: Delay between stack samples
+        PROFILING_MAX_SECONDS: Longest profile /debug/profile accepts
+    """
+
+    PROFILING_ENABLED: bool = False
+    PROFILING_TOKEN: str = ""
+    PROFILING_INTERVAL_SECONDS: float = 0.005
+    PROFILING_MAX_SECONDS: float = 60.0
+
+    @classmethod
+    def from_env(cls) -> "ProfilingSettings":
+        """Build settings from the environment, falling back to defaults"""
+        defaults = cls()
+        return cls(
+            PROFILING_ENABLED=os.getenv("PROFILING_ENABLED", "false").lower() in ("1", "true", "yes"),
+            PROFILING_TOKEN=os.getenv("PROFILING_TOKEN", defaults.PROFILING_TOKEN),
+            PROFILING_INTERVAL_SECONDS=float(
+                os.getenv("PROFILING_INTERVAL_SECONDS", defaults.PROFILING_INTERVAL_SECONDS)
+            ),
+            PROFILING_MAX_SECONDS=float(os.getenv("PROFILING_MAX_SECONDS", defaults.PROFILING_MAX_SECONDS)),
+        )
+
+
+profiling_settings = ProfilingSettings.from_env()
@@ -0,0 +1,101 @@
+"""Background sampler of event-loop scheduling lag"""
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, Optional
+
+from detailing_observability.metrics import REGISTRY, MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class LoopLagMonitor:
+    """
+    Measure how late the event loop runs a periodic timer
+
+    A background task sleeps for ``interval`` seconds and records how much
+    later than scheduled it woke up. Blocking calls in async handlers
+    (bcrypt, synchronous I/O, long scans) show up directly as lag, because
+    the sampler cannot run until they return.
+
+    lag() also accounts for an overdue wake-up that has not happened yet, so
+    a caller running right after a long blocking call sees the stall
+    immediately instead of one interval later.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.1,
+        registry: MetricsRegistry = REGISTRY,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.interval = interval
+        self._clock = clock
+        self._task: Optional[asyncio.Task] = None
+        self._expected_at: Optional[float] = None
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.samples = 0
+        self.lag_gauge = registry.gauge(
+            "event_loop_lag_seconds",
+            "Delay of the last event-loop lag sample"
+        )
+        self.lag_histogram = registry.histogram(
+            "event_loop_lag_sample_seconds",
+            "Distribution of event-loop lag samples",
+            buckets=LAG_BUCKETS
+        )
+
+    @property
+    def running(self) -> bool:
+        """Whether the sampler task is active"""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start sampling in the running event loop (no-op if already running)"""
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run(), name="loop-lag-monitor")
+        logger.info(f"Event-loop lag monitor started: interval={self.interval}s")
+
+    async def stop(self) -> None:
+        """Stop the sampler task"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        self._expected_at = None
+
+    def record(self, lag: float) -> None:
+        """Store one lag sample and export it"""
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+        self.samples += 1
+        self.lag_gauge.set(lag)
+        self.lag_histogram.observe(lag)
+
+    def lag(self) -> float:
+        """Current lag estimate in seconds (0 when the sampler is not running)"""
+        if self._expected_at is None:
+            return 0.0
+        overdue = self._clock() - self._expected_at
+        return max(self.last_lag, overdue)
+
+    async def _run(self) -> None:
+        while True:
+            self._expected_at = self._clock() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, self._clock() - self._expected_at))
+
+    def stats(self) -> Dict[str, float]:
+        """Return sampler state"""
+        return {
+            "running": self.running,
+            "interval_seconds": self.interval,
+            "last_lag_seconds": self.last_lag,
+            "max_lag_seconds": self.max_lag,
+            "samples": self.samples
+        }
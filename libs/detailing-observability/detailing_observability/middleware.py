@@ -0,0 +1,98 @@
+"""ASGI middleware recording per-route request metrics"""
+import time
+from typing import Iterable, Optional
+
+from fastapi import FastAPI
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from detailing_observability.metrics import CONTENT_TYPE, REGISTRY, MetricsRegistry
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """
+    Record latency, in-flight requests and status codes for HTTP requests
+
+    Written as a plain ASGI middleware (not BaseHTTPMiddleware) so it adds
+    no extra task or response buffering per request. Requests are labelled
+    with the route template ("/api/cars/{car_id}"), not the raw path, to
+    keep label cardinality bounded; requests that match no route share the
+    "<unmatched>" label.
+
+    Metrics:
+        http_requests_total{method, route, status}
+        http_request_duration_seconds{method, route} (histogram)
+        http_requests_in_progress{method}
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        registry: MetricsRegistry = REGISTRY,
+        excluded_paths: Iterable[str] = ("/metrics",)
+    ):
+        self.app = app
+        self.excluded_paths = frozenset(excluded_paths)
+        self.requests_total = registry.counter(
+            "http_requests_total",
+            "Total HTTP requests by method, route and status code",
+            ("method", "route", "status")
+        )
+        self.request_duration = registry.histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency in seconds by method and route",
+            ("method", "route")
+        )
+        self.requests_in_progress = registry.gauge(
+            "http_requests_in_progress",
+            "HTTP requests currently being processed",
+            ("method",)
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        self.requests_in_progress.inc(method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            self.requests_in_progress.dec(method)
+            # The router stores the matched route in the shared scope
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or UNMATCHED_ROUTE
+            self.request_duration.observe(duration, method, route_path)
+            self.requests_total.inc(method, route_path, str(status_code))
+
+
+def setup_metrics(app: FastAPI, registry: Optional[MetricsRegistry] = None, path: str = "/metrics") -> None:
+    """
+    Add MetricsMiddleware and a /metrics endpoint to an application
+
+    Args:
+        app: FastAPI application
+        registry: Registry to record into (defaults to the process registry)
+        path: Path of the exposition endpoint
+    """
+    registry = registry or REGISTRY
+
+    async def metrics(request: Request) -> Response:
+        return Response(registry.render(), media_type=CONTENT_TYPE)
+
+    app.add_middleware(MetricsMiddleware, registry=registry, excluded_paths=(path,))
+    app.add_route(path, metrics, methods=["GET"], include_in_schema=False)
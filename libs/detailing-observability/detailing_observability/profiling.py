@@ -0,0 +1,211 @@
+"""Sampling profiler with collapsed-stack output for /debug/profile"""
+import asyncio
+import hmac
+import logging
+import os
+import sys
+import threading
+from collections import Counter as StackCounter
+from typing import Optional
+
+from fastapi import FastAPI
+from starlette.datastructures import Headers
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from detailing_observability.config import ProfilingSettings, profiling_settings as default_settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "x-profile"
+TOKEN_HEADER = "x-profile-token"
+
+# Leaf frames of threads that are waiting rather than working
+IDLE_FRAMES = frozenset({
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+})
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """
+    Sample the stacks of all Python threads from a background thread
+
+    Every ``interval`` seconds the sampler reads sys._current_frames() and
+    counts each stack (root first, prefixed with the thread name). Threads
+    blocked in known waiting calls (selector, locks, queues) are skipped
+    unless include_idle is set. collapsed() returns the counts in the
+    "frame;frame;frame count" format that flamegraph.pl, speedscope and
+    inferno read directly.
+
+    Nothing runs until start() is called, so the profiler costs nothing
+    while unused.
+    """
+
+    def __init__(self, interval: float = 0.005, include_idle: bool = False):
+        self.interval = interval
+        self.include_idle = include_idle
+        self.samples = 0
+        self._stacks: StackCounter = StackCounter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling in a daemon thread"""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        """Record the current stack of every other thread once"""
+        own_id = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            code = frame.f_code
+            if not self.include_idle and (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            stack.append(names.get(thread_id, f"thread-{thread_id}"))
+            self._stacks[";".join(reversed(stack))] += 1
+        self.samples += 1
+
+    def collapsed(self) -> str:
+        """Return sampled stacks in collapsed format, most frequent first"""
+        lines = [f"{stack} {count}" for stack, count in self._stacks.most_common()]
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _authorized(token: str, provided: Optional[str]) -> bool:
+    # An empty token never authorizes: profiling is not mounted without one.
+    # Bytes are compared because compare_digest rejects non-ASCII str.
+    return bool(token) and provided is not None and hmac.compare_digest(
+        token.encode("utf-8"), provided.encode("utf-8", "surrogateescape")
+    )
+
+
+class ProfilingMiddleware:
+    """
+    Profile single requests that carry an X-Profile header
+
+    The request is executed normally, but its response body is replaced
+    with the collapsed stacks sampled while it ran (text/plain); the
+    original status code is reported in X-Profile-Status. Stacks of
+    requests running concurrently in the same process are included too.
+    Requests without the header pass straight through.
+    """
+
+    def __init__(self, app: ASGIApp, interval: float, token: str = ""):
+        self.app = app
+        self.interval = interval
+        self.token = token
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        if PROFILE_HEADER not in headers or not _authorized(self.token, headers.get(TOKEN_HEADER)):
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def capture(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+        profiler = SamplingProfiler(self.interval)
+        profiler.start()
+        try:
+            await self.app(scope, receive, capture)
+        finally:
+            profiler.stop()
+
+        response = PlainTextResponse(
+            profiler.collapsed(),
+            headers={"X-Profile-Status": str(status_code), "X-Profile-Samples": str(profiler.samples)}
+        )
+        await response(scope, receive, send)
+
+
+def setup_profiling(app: FastAPI, config: Optional[ProfilingSettings] = None, path: str = "/debug/profile") -> bool:
+    """
+    Mount the sampling profiler if PROFILING_ENABLED is set
+
+    GET /debug/profile?seconds=N samples the whole process for N seconds
+    and returns collapsed stacks; requests with an X-Profile header are
+    profiled individually (see ProfilingMiddleware). Both require a
+    matching X-Profile-Token header. When profiling is disabled, or enabled
+    without PROFILING_TOKEN (which would let any caller sample the process),
+    nothing is added to the application.
+
+    Args:
+        app: FastAPI application
+        config: Profiling settings (defaults to values from the environment)
+        path: Path of the profile endpoint
+
+    Returns:
+        True if the profiler was mounted
+    """
+    config = config or default_settings
+    if not config.PROFILING_ENABLED:
+        return False
+    if not config.PROFILING_TOKEN:
+        logger.error("PROFILING_ENABLED is set without PROFILING_TOKEN; profiler not mounted")
+        return False
+
+    running = asyncio.Lock()
+
+    async def profile(request: Request) -> Response:
+        if not _authorized(config.PROFILING_TOKEN, request.headers.get(TOKEN_HEADER)):
+            return JSONResponse({"detail": "Invalid profiling token"}, status_code=403)
+        try:
+            seconds = float(request.query_params.get("seconds", "5"))
+        except ValueError:
+            return JSONResponse({"detail": "seconds must be a number"}, status_code=400)
+        if not 0 < seconds <= config.PROFILING_MAX_SECONDS:
+            return JSONResponse(
+                {"detail": f"seconds must be in (0, {config.PROFILING_MAX_SECONDS:g}]"},
+                status_code=400
+            )
+        if running.locked():
+            return JSONResponse({"detail": "A profile is already being recorded"}, status_code=409)
+
+        async with running:
+            profiler = SamplingProfiler(config.PROFILING_INTERVAL_SECONDS)
+            profiler.start()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                profiler.stop()
+        return PlainTextResponse(profiler.collapsed(), headers={"X-Profile-Samples": str(profiler.samples)})
+
+    app.add_middleware(ProfilingMiddleware, interval=config.PROFILING_INTERVAL_SECONDS, token=config.PROFILING_TOKEN)
+    app.add_route(path, profile, methods=["GET"], include_in_schema=False)
+    return True
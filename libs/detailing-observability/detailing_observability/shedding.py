@@ -0,0 +1,147 @@
+"""ASGI middleware rejecting requests while the worker is overloaded"""
+import json
+from typing import Iterable, Optional
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from detailing_observability.config import SheddingSettings, settings as default_settings
+from detailing_observability.loop_lag import LoopLagMonitor
+from detailing_observability.metrics import REGISTRY, MetricsRegistry
+
+REASON_LOOP_LAG = "loop_lag"
+REASON_IN_FLIGHT = "in_flight"
+
+
+class LoadSheddingMiddleware:
+    """
+    Answer 503 with Retry-After instead of queueing requests into timeouts
+
+    A request is shed when the event loop lags more than ``max_loop_lag``
+    seconds or when ``max_in_flight`` requests are already being processed.
+    A threshold of 0 disables that check. Excluded paths (health checks,
+    /metrics) are never shed and do not count as in flight.
+
+    The middleware also starts and stops the lag monitor on ASGI lifespan
+    startup/shutdown, so it works with both lifespan handlers and
+    on_event hooks. Without a lifespan (e.g. a TestClient used outside a
+    ``with`` block) the monitor does not run and only the in-flight limit
+    applies.
+
+    Metrics:
+        http_requests_shed_total{reason}
+        http_requests_admitted_in_progress
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        monitor: LoopLagMonitor,
+        max_loop_lag: float,
+        max_in_flight: int,
+        retry_after: int = 1,
+        registry: MetricsRegistry = REGISTRY,
+        excluded_paths: Iterable[str] = ("/health", "/metrics")
+    ):
+        self.app = app
+        self.monitor = monitor
+        self.max_loop_lag = max_loop_lag
+        self.max_in_flight = max_in_flight
+        self.retry_after = retry_after
+        self.excluded_paths = frozenset(excluded_paths)
+        self.in_flight = 0
+        self.shed_total = registry.counter(
+            "http_requests_shed_total",
+            "Requests rejected with 503 by the load shedder",
+            ("reason",)
+        )
+        self.admitted_in_progress = registry.gauge(
+            "http_requests_admitted_in_progress",
+            "Requests admitted by the load shedder and still being processed"
+        )
+
+    def shed_reason(self) -> Optional[str]:
+        """Return why the next request should be shed, or None to admit it"""
+        if self.max_in_flight > 0 and self.in_flight >= self.max_in_flight:
+            return REASON_IN_FLIGHT
+        if self.max_loop_lag > 0 and self.monitor.lag() > self.max_loop_lag:
+            return REASON_LOOP_LAG
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self.app(scope, self._lifespan_receive(receive), send)
+            return
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        reason = self.shed_reason()
+        if reason is not None:
+            self.shed_total.inc(reason)
+            await self._reject(send)
+            return
+
+        self.in_flight += 1
+        self.admitted_in_progress.inc()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
+            self.admitted_in_progress.dec()
+
+    def _lifespan_receive(self, receive: Receive) -> Receive:
+        async def wrapped() -> Message:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self.monitor.start()
+            elif message["type"] == "lifespan.shutdown":
+                await self.monitor.stop()
+            return message
+        return wrapped
+
+    async def _reject(self, send: Send) -> None:
+        body = json.dumps({"detail": "Service is overloaded, retry later"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(self.retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+def setup_load_shedding(
+    app: FastAPI,
+    config: Optional[SheddingSettings] = None,
+    registry: Optional[MetricsRegistry] = None
+) -> LoopLagMonitor:
+    """
+    Add an event-loop lag monitor and LoadSheddingMiddleware to an application
+
+    Call it before setup_metrics() so that shed requests are still counted
+    in http_requests_total with status 503.
+
+    Args:
+        app: FastAPI application
+        config: Thresholds (defaults to values from the environment)
+        registry: Registry to export lag and shed metrics into
+
+    Returns:
+        The lag monitor, e.g. for reporting in /health
+    """
+    config = config or default_settings
+    registry = registry or REGISTRY
+    monitor = LoopLagMonitor(interval=config.LOOP_LAG_SAMPLE_INTERVAL_SECONDS, registry=registry)
+    app.add_middleware(
+        LoadSheddingMiddleware,
+        monitor=monitor,
+        max_loop_lag=config.LOAD_SHED_MAX_LOOP_LAG_SECONDS,
+        max_in_flight=config.LOAD_SHED_MAX_IN_FLIGHT,
+        retry_after=config.LOAD_SHED_RETRY_AFTER_SECONDS,
+        registry=registry
+    )
+    return monitor
@@ -0,0 +1,68 @@
+"""Tests for LoopLagMonitor"""
+import asyncio
+import time
+
+from detailing_observability import LoopLagMonitor, MetricsRegistry
+
+
+class TestLoopLagMonitor:
+    """Tests for event-loop lag sampling"""
+
+    def test_idle_loop_has_small_lag(self):
+        """Test that an idle loop produces samples close to zero"""
+        registry = MetricsRegistry()
+        monitor = LoopLagMonitor(interval=0.01, registry=registry)
+
+        async def scenario():
+            monitor.start()
+            await asyncio.sleep(0.1)
+            await monitor.stop()
+
+        asyncio.run(scenario())
+
+        assert monitor.samples > 0
+        assert monitor.max_lag < 0.1
+        assert registry.histogram("event_loop_lag_sample_seconds", "").count() == monitor.samples
+
+    def test_blocking_call_is_measured(self):
+        """Test that blocking the loop shows up as lag"""
+        registry = MetricsRegistry()
+        monitor = LoopLagMonitor(interval=0.01, registry=registry)
+
+        async def scenario():
+            monitor.start()
+            await asyncio.sleep(0.02)
+            time.sleep(0.2)
+            # The overdue wake-up is visible before the sampler runs again
+            observed = monitor.lag()
+            await asyncio.sleep(0.02)
+            await monitor.stop()
+            return observed
+
+        observed = asyncio.run(scenario())
+
+        assert observed >= 0.15
+        assert monitor.max_lag >= 0.15
+        assert registry.gauge("event_loop_lag_seconds", "").value() < monitor.max_lag + 1e-9
+
+    def test_lag_is_zero_when_not_running(self):
+        """Test that a stopped monitor never reports lag"""
+        monitor = LoopLagMonitor(registry=MetricsRegistry())
+
+        assert monitor.lag() == 0.0
+        assert monitor.stats()["running"] is False
+
+    def test_start_is_idempotent(self):
+        """Test that a second start() does not spawn another sampler"""
+        monitor = LoopLagMonitor(interval=0.01, registry=MetricsRegistry())
+
+        async def scenario():
+            monitor.start()
+            task = monitor._task
+            monitor.start()
+            same = monitor._task is task
+            await monitor.stop()
+            return same
+
+        assert asyncio.run(scenario()) is True
+        assert monitor.running is False
@@ -0,0 +1,82 @@
+"""Unit tests for metric types and text exposition"""
+import pytest
+
+from detailing_observability import MetricsRegistry
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    """Fresh registry per test"""
+    return MetricsRegistry()
+
+
+class TestCounterAndGauge:
+    """Tests for counters and gauges"""
+
+    def test_counter_render(self, registry):
+        """Test counter samples, HELP and TYPE lines"""
+        counter = registry.counter("jobs_total", "Processed jobs", ("queue",))
+        counter.inc("fast")
+        counter.inc("fast")
+        counter.inc("slow", amount=3)
+
+        text = registry.render()
+
+        assert "# HELP jobs_total Processed jobs" in text
+        assert "# TYPE jobs_total counter" in text
+        assert 'jobs_total{queue="fast"} 2' in text
+        assert 'jobs_total{queue="slow"} 3' in text
+
+    def test_gauge_inc_dec_set(self, registry):
+        """Test gauge updates"""
+        gauge = registry.gauge("in_flight", "In-flight work")
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+        assert gauge.value() == 1
+        gauge.set(0.25)
+
+        assert "in_flight 0.25" in registry.render()
+
+    def test_label_values_escaped(self, registry):
+        """Test quotes, backslashes and newlines in label values"""
+        counter = registry.counter("odd_total", "Odd labels", ("value",))
+        counter.inc('a"b\\c\nd')
+
+        assert 'odd_total{value="a\\"b\\\\c\\nd"} 1' in registry.render()
+
+    def test_wrong_label_count_rejected(self, registry):
+        """Test that label arity is enforced"""
+        counter = registry.counter("x_total", "X", ("a", "b"))
+
+        with pytest.raises(ValueError):
+            counter.inc("only-one")
+
+    def test_register_same_name_returns_existing(self, registry):
+        """Test that re-registering returns the same metric"""
+        first = registry.counter("x_total", "X")
+
+        assert registry.counter("x_total", "X") is first
+        with pytest.raises(ValueError):
+            registry.gauge("x_total", "X")
+
+
+class TestHistogram:
+    """Tests for histogram buckets"""
+
+    def test_cumulative_buckets(self, registry):
+        """Test that buckets are cumulative and include +Inf, sum and count"""
+        histogram = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+        histogram.observe(0.05, "/a")
+        histogram.observe(0.1, "/a")
+        histogram.observe(0.5, "/a")
+        histogram.observe(5.0, "/a")
+
+        text = registry.render()
+
+        assert 'latency_seconds_bucket{route="/a",le="0.1"} 2' in text
+        assert 'latency_seconds_bucket{route="/a",le="1"} 3' in text
+        assert 'latency_seconds_bucket{route="/a",le="+Inf"} 4' in text
+        assert 'latency_seconds_sum{route="/a"} 5.65' in text
+        assert 'latency_seconds_count{route="/a"} 4' in text
+        assert histogram.count("/a") == 4
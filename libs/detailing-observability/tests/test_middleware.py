@@ -0,0 +1,91 @@
+"""Tests for MetricsMiddleware and the /metrics endpoint"""
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from detailing_observability import MetricsRegistry, setup_metrics
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    """Fresh registry per test"""
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def client(registry) -> TestClient:
+    """Small app instrumented with setup_metrics"""
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        if item_id == 0:
+            raise HTTPException(status_code=404, detail="Not found")
+        return {"item_id": item_id}
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    setup_metrics(app, registry=registry)
+    return TestClient(app, raise_server_exceptions=False)
+
+
+class TestMetricsMiddleware:
+    """Tests for recorded request metrics"""
+
+    def test_requests_labelled_by_route_template(self, client, registry):
+        """Test that different item IDs share one route label"""
+        client.get("/items/1")
+        client.get("/items/2")
+        client.get("/items/0")
+
+        requests_total = registry.counter("http_requests_total", "", ("method", "route", "status"))
+        assert requests_total.value("GET", "/items/{item_id}", "200") == 2
+        assert requests_total.value("GET", "/items/{item_id}", "404") == 1
+
+        duration = registry.histogram("http_request_duration_seconds", "", ("method", "route"))
+        assert duration.count("GET", "/items/{item_id}") == 3
+
+    def test_unmatched_route(self, client, registry):
+        """Test that unknown paths do not create per-path labels"""
+        client.get("/nope/123")
+
+        requests_total = registry.counter("http_requests_total", "", ("method", "route", "status"))
+        assert requests_total.value("GET", "<unmatched>", "404") == 1
+
+    def test_unhandled_exception_counted_as_500(self, client, registry):
+        """Test that a crashing handler is recorded with status 500"""
+        client.get("/boom")
+
+        requests_total = registry.counter("http_requests_total", "", ("method", "route", "status"))
+        assert requests_total.value("GET", "/boom", "500") == 1
+
+    def test_in_progress_returns_to_zero(self, client, registry):
+        """Test that the in-flight gauge is decremented after each request"""
+        client.get("/items/1")
+
+        in_progress = registry.gauge("http_requests_in_progress", "", ("method",))
+        assert in_progress.value("GET") == 0
+
+
+class TestMetricsEndpoint:
+    """Tests for the exposition endpoint"""
+
+    def test_metrics_endpoint_text_format(self, client):
+        """Test that /metrics returns the text exposition format"""
+        client.get("/items/1")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert '# TYPE http_request_duration_seconds histogram' in response.text
+        assert 'http_requests_total{method="GET",route="/items/{item_id}",status="200"} 1' in response.text
+
+    def test_metrics_endpoint_not_recorded(self, client, registry):
+        """Test that scrapes themselves are not counted"""
+        client.get("/metrics")
+        client.get("/metrics")
+
+        assert "/metrics" not in registry.render()
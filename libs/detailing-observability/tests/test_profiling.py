@@ -0,0 +1,155 @@
+"""Tests for the sampling profiler and its endpoints"""
+import threading
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from detailing_observability import ProfilingSettings, SamplingProfiler, setup_profiling
+
+ENABLED = ProfilingSettings(
+    PROFILING_ENABLED=True, PROFILING_TOKEN="secret", PROFILING_INTERVAL_SECONDS=0.001, PROFILING_MAX_SECONDS=2
+)
+TOKEN = {"X-Profile-Token": "secret"}
+
+
+def busy_loop(seconds: float) -> None:
+    """Burn CPU so the sampler has something to see"""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _app(config: ProfilingSettings) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/work")
+    def work():
+        busy_loop(0.05)
+        return {"ok": True}
+
+    setup_profiling(app, config=config)
+    return app
+
+
+class TestSamplingProfiler:
+    """Tests for stack sampling"""
+
+    def test_collapsed_stacks_contain_busy_function(self):
+        """Test that a CPU-bound thread shows up root-first in collapsed output"""
+        worker = threading.Thread(target=busy_loop, args=(0.2,), name="busy-worker")
+        profiler = SamplingProfiler(interval=0.001)
+
+        worker.start()
+        profiler.start()
+        time.sleep(0.1)
+        profiler.stop()
+        worker.join()
+
+        lines = profiler.collapsed().splitlines()
+        assert profiler.samples > 0
+        busy = [line for line in lines if line.startswith("busy-worker;")]
+        assert busy
+        stack, count = busy[0].rsplit(" ", 1)
+        assert stack.split(";")[-1].startswith("busy_loop (test_profiling.py:")
+        assert int(count) > 0
+
+    def test_idle_threads_are_skipped(self):
+        """Test that threads blocked on an event are not reported by default"""
+        release = threading.Event()
+        waiter = threading.Thread(target=release.wait, name="idle-waiter")
+        waiter.start()
+        try:
+            profiler = SamplingProfiler()
+            profiler.sample()
+            with_idle = SamplingProfiler(include_idle=True)
+            with_idle.sample()
+        finally:
+            release.set()
+            waiter.join()
+
+        assert "idle-waiter" not in profiler.collapsed()
+        assert "idle-waiter;" in with_idle.collapsed()
+
+    def test_empty_profile(self):
+        """Test that a profiler without samples returns an empty string"""
+        assert SamplingProfiler().collapsed() == ""
+
+
+class TestSetupProfiling:
+    """Tests for /debug/profile and the X-Profile header mode"""
+
+    def test_disabled_by_default(self):
+        """Test that nothing is mounted unless profiling is enabled"""
+        app = _app(ProfilingSettings())
+        client = TestClient(app)
+
+        assert client.get("/debug/profile").status_code == 404
+        response = client.get("/work", headers={"X-Profile": "1"})
+        assert response.json() == {"ok": True}
+        assert "x-profile-status" not in response.headers
+
+    def test_profile_endpoint_returns_collapsed_stacks(self):
+        """Test that /debug/profile samples the process for the given time"""
+        app = _app(ENABLED)
+        worker = threading.Thread(target=busy_loop, args=(0.3,), name="busy-worker")
+
+        worker.start()
+        response = TestClient(app).get("/debug/profile", params={"seconds": 0.1}, headers=TOKEN)
+        worker.join()
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert int(response.headers["x-profile-samples"]) > 0
+        assert "busy_loop (test_profiling.py:" in response.text
+
+    def test_profile_endpoint_validates_seconds(self):
+        """Test that seconds must be a positive number within the limit"""
+        client = TestClient(_app(ENABLED))
+
+        assert client.get("/debug/profile", params={"seconds": "abc"}, headers=TOKEN).status_code == 400
+        assert client.get("/debug/profile", params={"seconds": 0}, headers=TOKEN).status_code == 400
+        assert client.get("/debug/profile", params={"seconds": 3}, headers=TOKEN).status_code == 400
+
+    def test_profile_header_replaces_response(self):
+        """Test that X-Profile returns the request's stacks and original status"""
+        client = TestClient(_app(ENABLED))
+
+        response = client.get("/work", headers={"X-Profile": "1", **TOKEN})
+
+        assert response.status_code == 200
+        assert response.headers["x-profile-status"] == "200"
+        assert "busy_loop (test_profiling.py:" in response.text
+
+    def test_not_mounted_without_token(self):
+        """Test that enabling profiling without a token leaves both modes closed"""
+        app = FastAPI()
+
+        assert setup_profiling(app, config=ProfilingSettings(PROFILING_ENABLED=True)) is False
+        client = TestClient(_app(ProfilingSettings(PROFILING_ENABLED=True)))
+        assert client.get("/debug/profile", params={"seconds": 0.01}).status_code == 404
+        response = client.get("/work", headers={"X-Profile": "1"})
+        assert response.json() == {"ok": True}
+
+    def test_token_required(self):
+        """Test that the token gates both profiling modes"""
+        config = ProfilingSettings(PROFILING_ENABLED=True, PROFILING_TOKEN="secret", PROFILING_MAX_SECONDS=1)
+        client = TestClient(_app(config))
+
+        assert client.get("/debug/profile", params={"seconds": 0.01}).status_code == 403
+        assert client.get(
+            "/debug/profile", params={"seconds": 0.01}, headers={"X-Profile-Token": "secret"}
+        ).status_code == 200
+
+        response = client.get("/work", headers={"X-Profile": "1", "X-Profile-Token": "wrong"})
+        assert response.json() == {"ok": True}
+
+    def test_non_ascii_token_is_rejected(self):
+        """Test that a non-ASCII X-Profile-Token gets 403 rather than an error"""
+        client = TestClient(_app(ENABLED))
+
+        response = client.get(
+            "/debug/profile", params={"seconds": 0.01}, headers={"X-Profile-Token": "sécret".encode("latin-1")}
+        )
+
+        assert response.status_code == 403
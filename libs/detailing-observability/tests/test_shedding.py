@@ -0,0 +1,179 @@
+"""Tests for LoadSheddingMiddleware"""
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from detailing_observability import (
+    LoadSheddingMiddleware,
+    LoopLagMonitor,
+    MetricsRegistry,
+    SheddingSettings,
+    setup_load_shedding,
+    setup_metrics,
+)
+
+
+class StubMonitor(LoopLagMonitor):
+    """Monitor reporting a fixed lag"""
+
+    def __init__(self, registry: MetricsRegistry, lag: float = 0.0):
+        super().__init__(registry=registry)
+        self.fixed_lag = lag
+
+    def lag(self) -> float:
+        return self.fixed_lag
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    """Fresh registry per test"""
+    return MetricsRegistry()
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/work")
+    async def work():
+        return {"ok": True}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    return app
+
+
+class TestLoadSheddingMiddleware:
+    """Tests for shedding decisions"""
+
+    def test_admits_requests_below_thresholds(self, registry):
+        """Test that a healthy worker serves requests normally"""
+        app = _app()
+        app.add_middleware(
+            LoadSheddingMiddleware, monitor=StubMonitor(registry), max_loop_lag=0.5,
+            max_in_flight=10, registry=registry
+        )
+
+        response = TestClient(app).get("/work")
+
+        assert response.status_code == 200
+
+    def test_sheds_on_loop_lag(self, registry):
+        """Test that high loop lag returns 503 with Retry-After"""
+        app = _app()
+        app.add_middleware(
+            LoadSheddingMiddleware, monitor=StubMonitor(registry, lag=2.0), max_loop_lag=0.5,
+            max_in_flight=10, retry_after=3, registry=registry
+        )
+
+        response = TestClient(app).get("/work")
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "3"
+        assert response.json() == {"detail": "Service is overloaded, retry later"}
+        assert registry.counter("http_requests_shed_total", "", ("reason",)).value("loop_lag") == 1
+
+    def test_zero_threshold_disables_lag_check(self, registry):
+        """Test that max_loop_lag=0 never sheds on lag"""
+        app = _app()
+        app.add_middleware(
+            LoadSheddingMiddleware, monitor=StubMonitor(registry, lag=2.0), max_loop_lag=0,
+            max_in_flight=0, registry=registry
+        )
+
+        assert TestClient(app).get("/work").status_code == 200
+
+    def test_health_is_never_shed(self, registry):
+        """Test that excluded paths bypass the shedder"""
+        app = _app()
+        app.add_middleware(
+            LoadSheddingMiddleware, monitor=StubMonitor(registry, lag=2.0), max_loop_lag=0.5,
+            max_in_flight=10, registry=registry
+        )
+
+        assert TestClient(app).get("/health").status_code == 200
+
+    def test_sheds_above_in_flight_limit(self, registry):
+        """Test that requests beyond max_in_flight are rejected while others run"""
+        release = asyncio.Event()
+        app = FastAPI()
+
+        @app.get("/slow")
+        async def slow():
+            await release.wait()
+            return {"ok": True}
+
+        middleware = LoadSheddingMiddleware(
+            app, monitor=StubMonitor(registry), max_loop_lag=0, max_in_flight=2, registry=registry
+        )
+
+        async def call() -> int:
+            status = None
+
+            async def receive():
+                return {"type": "http.request", "body": b"", "more_body": False}
+
+            async def send(message):
+                nonlocal status
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+
+            scope = {
+                "type": "http", "method": "GET", "path": "/slow", "raw_path": b"/slow",
+                "query_string": b"", "headers": [], "root_path": "",
+            }
+            await middleware(scope, receive, send)
+            return status
+
+        async def scenario():
+            first = [asyncio.create_task(call()) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            rejected = await call()
+            release.set()
+            return rejected, await asyncio.gather(*first)
+
+        rejected, admitted = asyncio.run(scenario())
+
+        assert rejected == 503
+        assert admitted == [200, 200]
+        assert middleware.in_flight == 0
+        assert registry.counter("http_requests_shed_total", "", ("reason",)).value("in_flight") == 1
+
+
+class TestSetupLoadShedding:
+    """Tests for setup_load_shedding"""
+
+    def test_monitor_follows_lifespan(self, registry):
+        """Test that the lag monitor runs between startup and shutdown"""
+        app = _app()
+        config = SheddingSettings(LOOP_LAG_SAMPLE_INTERVAL_SECONDS=0.01)
+        monitor = setup_load_shedding(app, config=config, registry=registry)
+
+        with TestClient(app) as client:
+            assert client.get("/work").status_code == 200
+            assert monitor.running
+
+        assert not monitor.running
+
+    def test_shed_requests_counted_by_metrics(self, registry):
+        """Test that shed requests appear in http_requests_total as 503"""
+        app = _app()
+        config = SheddingSettings(LOAD_SHED_MAX_IN_FLIGHT=1)
+        setup_load_shedding(app, config=config, registry=registry)
+        setup_metrics(app, registry=registry)
+        app.middleware_stack = app.build_middleware_stack()
+
+        # Force the in-flight check to trip
+        middleware = app.middleware_stack
+        while not isinstance(middleware, LoadSheddingMiddleware):
+            middleware = middleware.app
+        middleware.in_flight = 1
+
+        response = TestClient(app).get("/work")
+
+        assert response.status_code == 503
+        requests_total = registry.counter("http_requests_total", "", ("method", "route", "status"))
+        assert requests_total.value("GET", "<unmatched>", "503") == 1
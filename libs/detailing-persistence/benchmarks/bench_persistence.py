@@ -0,0 +1,148 @@
+"""
+Benchmark of write throughput and recovery time of DurableStore.
+
+Records look like the cart-service ones (one cart line per user, about
+200 bytes). Phases:
+
+- append:   one thread appends N records without waiting (background
+            group commit), then flushes; the mode of writes made outside
+            HTTP requests and of WAL_SYNC_COMMIT=false
+- commit:   T threads append and wait for durability one record at a time,
+            like requests under WAL_SYNC_COMMIT=true; shows how many
+            records share one fsync
+- recover:  replay N records from the log only
+- compact:  write a snapshot of N records
+- recover:  replay the same state from the snapshot only
+
+Usage (from the libs/detailing-persistence directory):
+    python -m benchmarks.bench_persistence
+    python -m benchmarks.bench_persistence --records 1000000 --commit-records 20000 --threads 1 16 64
+    python -m benchmarks.bench_persistence --dir /var/lib/bench --no-fsync
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Dict, Iterable, Optional
+from uuid import UUID
+
+from detailing_persistence import DurableStore
+
+
+class CartRepository:
+    """Carts keyed by user, one full-state record per change"""
+
+    def __init__(self):
+        self.carts: Dict[str, list] = {}
+        self.journal: Optional[DurableStore] = None
+
+    def put(self, user_id: str, items: list) -> int:
+        self.carts[user_id] = items
+        return self.journal.append({"type": "cart", "user_id": user_id, "items": items})
+
+    def apply_record(self, record: dict) -> None:
+        self.carts[record["user_id"]] = record["items"]
+
+    def snapshot_records(self) -> Iterable[dict]:
+        carts = list(self.carts.items())
+        return ({"type": "cart", "user_id": user_id, "items": items} for user_id, items in carts)
+
+
+def _items(n: int) -> list:
+    return [{"item_id": "svc_oil_change", "type": "service", "name": "Замена масла", "quantity": 1 + n % 3,
+             "price": 2500.0}]
+
+
+def _open(directory: str, fsync: bool) -> tuple:
+    store = DurableStore(directory, "carts", fsync=fsync)
+    repository = CartRepository()
+    stats = store.recover(repository.apply_record)
+    repository.journal = store
+    return store, repository, stats
+
+
+def _report(phase: str, records: int, seconds: float, extra: str = "") -> None:
+    print(f"{phase:<22} {records:>9} records {seconds:>8.2f}s {records / seconds:>11,.0f} rec/s  {extra}")
+
+
+def bench_append(directory: str, records: int, fsync: bool) -> None:
+    store, repository, _ = _open(directory, fsync)
+    start = time.perf_counter()
+    for n in range(records):
+        repository.put(str(UUID(int=n)), _items(n))
+    store.flush()
+    elapsed = time.perf_counter() - start
+    wal = store.wal.stats()
+    _report("append + flush", records, elapsed,
+            f"{store.wal_bytes / elapsed / 2**20:.1f} MiB/s, {wal['records_per_batch']} records/fsync")
+    store.close()
+
+
+def bench_commit(directory: str, records: int, threads: int, fsync: bool) -> None:
+    store, repository, _ = _open(directory, fsync)
+    batches_before = store.wal.batches
+    per_thread = records // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(t: int):
+        barrier.wait()
+        for n in range(per_thread):
+            store.wal.wait(repository.put(f"commit-{t}-{n}", _items(n)))
+
+    workers = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+    committed = per_thread * threads
+    fsyncs = store.wal.batches - batches_before
+    _report(f"commit, {threads} threads", committed, elapsed,
+            f"{committed / fsyncs:.1f} records/fsync, {elapsed / per_thread * 1000:.2f} ms/commit")
+    store.close()
+
+
+def bench_recovery(directory: str, fsync: bool) -> None:
+    store, repository, stats = _open(directory, fsync)
+    _report("recover from log", stats.wal_records, stats.seconds, f"{len(repository.carts)} carts")
+
+    snapshot = store.compact(repository.snapshot_records)
+    _report("compact (snapshot)", snapshot.records, snapshot.seconds, f"{snapshot.bytes / 2**20:.0f} MiB")
+    store.close()
+
+    store, repository, stats = _open(directory, fsync)
+    _report("recover from snapshot", stats.snapshot_records, stats.seconds, f"{len(repository.carts)} carts")
+    store.close()
+
+
+def main(directory: str, records: int, commit_records: int, threads: list, fsync: bool) -> None:
+    print(f"directory={directory} fsync={fsync}")
+    bench_append(directory, records, fsync)
+    for count in threads:
+        bench_commit(directory, commit_records, count, fsync)
+    bench_recovery(directory, fsync)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--commit-records", type=int, default=20_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--dir", help="Directory on the disk to measure (default: a temporary directory)")
+    parser.add_argument("--no-fsync", action="store_true", help="Skip fsync (WAL_FSYNC=false)")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    directory = args.dir or tempfile.mkdtemp(prefix="bench-persistence-")
+    os.makedirs(directory, exist_ok=True)
+    try:
+        main(directory, args.records, args.commit_records, args.threads, not args.no_fsync)
+    finally:
+        if not args.dir:
+            shutil.rmtree(directory, ignore_errors=True)
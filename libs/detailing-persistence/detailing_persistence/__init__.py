@@ -0,0 +1,30 @@
+"""
+Durable storage for the in-memory repositories of the car detailing services.
+
+setup_persistence(app, name, repository) recovers a repository from a
+snapshot plus write-ahead log on startup, logs every change with group
+commit (one fsync per batch of concurrent writes), holds responses until
+their changes are durable and writes compact snapshots in the background.
+It is enabled by PERSISTENCE_DIR and uses only the local disk.
+"""
+from detailing_persistence.config import PersistenceSettings
+from detailing_persistence.middleware import Persistence, PersistenceMiddleware, setup_persistence
+from detailing_persistence.scheduler import SnapshotScheduler
+from detailing_persistence.store import DurableStore, Journaled, RecoveryStats, SnapshotStats
+from detailing_persistence.wal import PersistenceError, WriteAheadLog, encode_record, read_records
+
+__all__ = [
+    "DurableStore",
+    "Journaled",
+    "Persistence",
+    "PersistenceError",
+    "PersistenceMiddleware",
+    "PersistenceSettings",
+    "RecoveryStats",
+    "SnapshotScheduler",
+    "SnapshotStats",
+    "WriteAheadLog",
+    "encode_record",
+    "read_records",
+    "setup_persistence",
+]
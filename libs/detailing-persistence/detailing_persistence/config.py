@@ -0,0 +1,52 @@
+"""Persistence settings read from environment variables"""
+import os
+from dataclasses import dataclass
+
+
+def _flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.lower() in ("1", "true", "yes")
+
+
+@dataclass(frozen=True)
+class PersistenceSettings:
+    """
+    Write-ahead log and snapshot settings (everything is off unless PERSISTENCE_DIR is set)
+
+    Environment variables:
+        PERSISTENCE_DIR: Directory for the log and snapshots of the service (empty disables)
+        WAL_FSYNC: fsync every written batch (disable only on throwaway disks)
+        WAL_SYNC_COMMIT: Hold HTTP responses until the request's records are on disk
+        SNAPSHOT_INTERVAL_SECONDS: Write a snapshot at least this often while there are changes (0 disables)
+        SNAPSHOT_WAL_BYTES: Write a snapshot once the log grows beyond this size (0 disables)
+    """
+
+    PERSISTENCE_DIR: str = ""
+    WAL_FSYNC: bool = True
+    WAL_SYNC_COMMIT: bool = True
+    SNAPSHOT_INTERVAL_SECONDS: float = 300.0
+    SNAPSHOT_WAL_BYTES: int = 64 * 1024 * 1024
+
+    @property
+    def enabled(self) -> bool:
+        """Whether persistence is switched on"""
+        return bool(self.PERSISTENCE_DIR)
+
+    @classmethod
+    def from_env(cls) -> "PersistenceSettings":
+        """Build settings from the environment, falling back to defaults"""
+        defaults = cls()
+        return cls(
+            PERSISTENCE_DIR=os.getenv("PERSISTENCE_DIR", defaults.PERSISTENCE_DIR),
+            WAL_FSYNC=_flag("WAL_FSYNC", defaults.WAL_FSYNC),
+            WAL_SYNC_COMMIT=_flag("WAL_SYNC_COMMIT", defaults.WAL_SYNC_COMMIT),
+            SNAPSHOT_INTERVAL_SECONDS=float(
+                os.getenv("SNAPSHOT_INTERVAL_SECONDS", defaults.SNAPSHOT_INTERVAL_SECONDS)
+            ),
+            SNAPSHOT_WAL_BYTES=int(os.getenv("SNAPSHOT_WAL_BYTES", defaults.SNAPSHOT_WAL_BYTES)),
+        )
+
+
+settings = PersistenceSettings.from_env()
@@ -0,0 +1,180 @@
+"""Wiring of a persisted repository into a FastAPI application"""
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from detailing_persistence.config import PersistenceSettings, settings as default_settings
+from detailing_persistence.scheduler import SnapshotScheduler
+from detailing_persistence.store import DurableStore, Journaled, RecoveryStats, RequestWrites, request_writes
+
+logger = logging.getLogger(__name__)
+
+
+class Persistence:
+    """
+    A repository together with its store and snapshot scheduler
+
+    start() replays the store into the repository, attaches the store as
+    the repository's journal and starts the scheduler. stop() detaches the
+    journal, writes a final snapshot (so the next start only reads the
+    snapshot) and closes the log.
+    """
+
+    def __init__(self, repository: Journaled, store: DurableStore, scheduler: SnapshotScheduler):
+        self.repository = repository
+        self.store = store
+        self.scheduler = scheduler
+        self.recovery: Optional[RecoveryStats] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the repository is currently journaled to the store"""
+        return self.store.is_open and self.repository.journal is self.store
+
+    async def start(self) -> RecoveryStats:
+        """Recover the repository and start journaling (no-op if already running)"""
+        if self.running:
+            return self.recovery
+        self.recovery = await asyncio.to_thread(self.store.recover, self.repository.apply_record)
+        self.repository.journal = self.store
+        self.scheduler.start()
+        return self.recovery
+
+    async def stop(self) -> None:
+        """Stop journaling, write a final snapshot and close the store"""
+        if not self.store.is_open:
+            return
+        await self.scheduler.stop()
+        self.repository.journal = None
+        if self.store.wal_bytes > 0:
+            try:
+                await asyncio.to_thread(self.store.compact, self.repository.snapshot_records)
+            except Exception as e:
+                # Every change is still in the log and is replayed on the next start
+                logger.error(f"Final snapshot of {self.store.name} failed: {type(e).__name__}: {e}")
+        await asyncio.to_thread(self.store.close)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return store and scheduler statistics"""
+        return {
+            **self.store.stats(),
+            "snapshots": self.scheduler.snapshots,
+            "snapshot_failures": self.scheduler.failures,
+        }
+
+
+class PersistenceMiddleware:
+    """
+    Run a Persistence with the application and acknowledge only durable writes
+
+    On ASGI lifespan startup the repository is recovered before the
+    application's own startup handlers run; on shutdown the store is
+    closed after them, so changes made by shutdown handlers (e.g. draining
+    background workers) are still logged. This works with both lifespan
+    handlers and on_event hooks.
+
+    With ``sync_commit`` the start of every HTTP response is held until
+    the records the request appended are on disk. Concurrent requests
+    share fsyncs through the log's group commit, and requests that did not
+    change anything are not delayed at all.
+    """
+
+    def __init__(self, app: ASGIApp, persistence: Persistence, sync_commit: bool = True):
+        self.app = app
+        self.persistence = persistence
+        self.sync_commit = sync_commit
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(scope, receive, send)
+            return
+        if scope["type"] != "http" or not self.sync_commit or not self.persistence.running:
+            await self.app(scope, receive, send)
+            return
+
+        store = self.persistence.store
+        writes = RequestWrites(store)
+        token = request_writes.set(writes)
+
+        async def send_durable(message: Message) -> None:
+            if message["type"] == "http.response.start" and writes.seq:
+                await store.wal.wait_async(writes.seq)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_durable)
+        finally:
+            request_writes.reset(token)
+
+    async def _lifespan(self, scope: Scope, receive: Receive, send: Send) -> None:
+        first = await receive()
+        if first["type"] == "lifespan.startup":
+            try:
+                await self.persistence.start()
+            except Exception as e:
+                # Refuse to serve a repository that could not be recovered
+                logger.error(f"Recovery of {self.persistence.store.name} failed: {type(e).__name__}: {e}")
+                await send({"type": "lifespan.startup.failed", "message": f"{type(e).__name__}: {e}"})
+                raise
+
+        replayed = False
+
+        async def wrapped_receive() -> Message:
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return first
+            return await receive()
+
+        await self.app(scope, wrapped_receive, self._lifespan_send(send))
+
+    def _lifespan_send(self, send: Send) -> Send:
+        async def wrapped(message: Message) -> None:
+            if message["type"] in ("lifespan.shutdown.complete", "lifespan.shutdown.failed"):
+                await self.persistence.stop()
+            await send(message)
+        return wrapped
+
+
+def setup_persistence(
+    app: FastAPI,
+    name: str,
+    repository: Journaled,
+    config: Optional[PersistenceSettings] = None
+) -> Optional[Persistence]:
+    """
+    Persist an in-memory repository if PERSISTENCE_DIR is set
+
+    The repository is recovered from ``<PERSISTENCE_DIR>/<name>.snapshot``
+    and the log segments after it on startup, every change is appended to
+    the log, snapshots are written in the background and once more on
+    shutdown. When persistence is disabled nothing is added to the
+    application.
+
+    Args:
+        app: FastAPI application
+        name: File name prefix of the store
+        repository: Repository implementing apply_record/snapshot_records and a journal attribute
+        config: Persistence settings (defaults to values from the environment)
+
+    Returns:
+        The Persistence, e.g. for reporting in /health, or None when disabled
+    """
+    config = config or default_settings
+    if not config.enabled:
+        return None
+
+    store = DurableStore(config.PERSISTENCE_DIR, name, fsync=config.WAL_FSYNC)
+    scheduler = SnapshotScheduler(
+        store,
+        repository.snapshot_records,
+        interval=config.SNAPSHOT_INTERVAL_SECONDS,
+        max_wal_bytes=config.SNAPSHOT_WAL_BYTES
+    )
+    persistence = Persistence(repository, store, scheduler)
+    app.add_middleware(PersistenceMiddleware, persistence=persistence, sync_commit=config.WAL_SYNC_COMMIT)
+    logger.info(f"Persistence of {name} enabled in {config.PERSISTENCE_DIR}")
+    return persistence
@@ -0,0 +1,103 @@
+"""Background task writing periodic snapshots"""
+import asyncio
+import logging
+import time
+from typing import Callable, Iterable, Optional
+
+from detailing_persistence.store import DurableStore, Record
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotScheduler:
+    """
+    Compact the log of a store in the background
+
+    Every ``check_interval`` seconds the task checks whether the log has
+    grown beyond ``max_wal_bytes`` or ``interval`` seconds passed since the
+    last snapshot while there were changes; if so it runs
+    DurableStore.compact() on a worker thread, so the event loop keeps
+    serving requests while the snapshot is written. A threshold of 0
+    disables that trigger. A failed snapshot is logged and retried on the
+    next check; the log keeps every change in the meantime.
+    """
+
+    def __init__(
+        self,
+        store: DurableStore,
+        snapshot_records: Callable[[], Iterable[Record]],
+        interval: float = 300.0,
+        max_wal_bytes: int = 64 * 1024 * 1024,
+        check_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.store = store
+        self.snapshot_records = snapshot_records
+        self.interval = interval
+        self.max_wal_bytes = max_wal_bytes
+        self.check_interval = check_interval
+        self._clock = clock
+        self._task: Optional[asyncio.Task] = None
+        self._in_progress: Optional[asyncio.Future] = None
+        self._last_snapshot_at = clock()
+        self.snapshots = 0
+        self.failures = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the scheduler task is active"""
+        return self._task is not None and not self._task.done()
+
+    def due(self) -> bool:
+        """Whether a snapshot should be written now"""
+        wal_bytes = self.store.wal_bytes
+        if wal_bytes == 0:
+            return False
+        if self.max_wal_bytes > 0 and wal_bytes >= self.max_wal_bytes:
+            return True
+        return self.interval > 0 and self._clock() - self._last_snapshot_at >= self.interval
+
+    async def snapshot(self) -> None:
+        """Write a snapshot now (on a worker thread)"""
+        await asyncio.to_thread(self.store.compact, self.snapshot_records)
+        self._last_snapshot_at = self._clock()
+        self.snapshots += 1
+
+    def start(self) -> None:
+        """Start checking in the running event loop (no-op if already running)"""
+        if self.running:
+            return
+        self._last_snapshot_at = self._clock()
+        self._task = asyncio.create_task(self._run(), name=f"snapshot-scheduler-{self.store.name}")
+        logger.info(
+            f"Snapshot scheduler for {self.store.name} started: interval={self.interval}s, "
+            f"max_wal_bytes={self.max_wal_bytes}"
+        )
+
+    async def stop(self) -> None:
+        """Stop the scheduler task (a snapshot in progress is finished first)"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        if self._in_progress is not None:
+            await asyncio.gather(self._in_progress, return_exceptions=True)
+            self._in_progress = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            if not self.due():
+                continue
+            # Shielded so that cancelling the loop does not abandon a half-written
+            # snapshot; stop() waits for it instead
+            self._in_progress = asyncio.ensure_future(self.snapshot())
+            try:
+                await asyncio.shield(self._in_progress)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures += 1
+                logger.error(f"Snapshot of {self.store.name} failed: {type(e).__name__}: {e}")
+            self._in_progress = None
@@ -0,0 +1,365 @@
+"""Snapshot plus write-ahead log of one in-memory repository"""
+import logging
+import os
+import re
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol, Tuple
+
+from detailing_persistence.wal import (
+    PersistenceError,
+    WriteAheadLog,
+    decode_line,
+    encode_record,
+    fsync_directory,
+    read_records,
+)
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_BUFFER_BYTES = 1024 * 1024
+
+Record = Dict[str, Any]
+
+
+class Journaled(Protocol):
+    """
+    Repository that can be persisted by a DurableStore
+
+    The repository appends one record to ``journal`` after every mutation
+    (while ``journal`` is not None). Records must be idempotent: replaying
+    a record whose effect is already in the state must not change it,
+    because the last log segment overlaps the snapshot written after it.
+    Upserts of the full state of one key and appends carrying their
+    position satisfy this.
+    """
+
+    journal: Optional["DurableStore"]
+
+    def apply_record(self, record: Record) -> None:
+        """Apply one record during recovery"""
+
+    def snapshot_records(self) -> Iterable[Record]:
+        """
+        Records that rebuild the current state
+
+        Called on a worker thread while the repository stays in use, so it
+        must take its own consistent copies of shared containers.
+        """
+
+
+class RequestWrites:
+    """Sequence number of the last record a request appended to a store"""
+
+    __slots__ = ("store", "seq")
+
+    def __init__(self, store: "DurableStore"):
+        self.store = store
+        self.seq = 0
+
+
+# Set by PersistenceMiddleware for the duration of a request; it is copied
+# into threadpool workers, so sync handlers report their writes as well.
+request_writes: ContextVar[Optional[RequestWrites]] = ContextVar("request_writes", default=None)
+
+
+@dataclass(frozen=True)
+class RecoveryStats:
+    """What recover() replayed"""
+
+    snapshot_records: int
+    wal_records: int
+    wal_segments: int
+    seconds: float
+
+
+@dataclass(frozen=True)
+class SnapshotStats:
+    """One written snapshot"""
+
+    segment: int
+    records: int
+    bytes: int
+    seconds: float
+
+
+class DurableStore:
+    """
+    Compact snapshot plus segmented write-ahead log of one repository
+
+    Files in ``directory``:
+
+    - ``<name>.snapshot``: a header line with the first log segment not
+      covered by the snapshot, the records and a footer with their count;
+    - ``<name>-<segment>.wal``: log segments, replayed in order on top of
+      the snapshot.
+
+    Every line is ``<crc32> <json>``. A snapshot is written to a temporary
+    file, fsynced and renamed over the old one, so a crash leaves either the
+    old or the new snapshot; log segments it covers are deleted afterwards.
+    compact() first rotates the log and then reads the repository state,
+    so the state always includes everything in the covered segments.
+
+    Lifecycle: recover() replays the files and opens a new log segment,
+    append() logs changes, compact() writes snapshots, close() flushes.
+    """
+
+    def __init__(self, directory: str, name: str, fsync: bool = True):
+        self.directory = directory
+        self.name = name
+        self.fsync = fsync
+        self.snapshot_path = os.path.join(directory, f"{name}.snapshot")
+        self._segment_re = re.compile(rf"^{re.escape(name)}-(\d{{8}})\.wal$")
+        self._wal: Optional[WriteAheadLog] = None
+        self._compact_lock = threading.Lock()
+        self.segment = 0
+        self._covered_bytes = 0
+        self._snapshot_seq = 0
+        self.last_recovery: Optional[RecoveryStats] = None
+        self.last_snapshot: Optional[SnapshotStats] = None
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"{self.name}-{segment:08d}.wal")
+
+    def _segments(self) -> List[int]:
+        segments = []
+        for filename in os.listdir(self.directory):
+            match = self._segment_re.match(filename)
+            if match:
+                segments.append(int(match.group(1)))
+        return sorted(segments)
+
+    @property
+    def is_open(self) -> bool:
+        """Whether recover() has run and close() has not"""
+        return self._wal is not None
+
+    @property
+    def wal(self) -> WriteAheadLog:
+        """The log of the current segment"""
+        if self._wal is None:
+            raise PersistenceError(f"Store {self.name} is not open")
+        return self._wal
+
+    @property
+    def wal_bytes(self) -> int:
+        """Size of all log segments not yet covered by a snapshot"""
+        return self._covered_bytes + (self._wal.bytes if self._wal is not None else 0)
+
+    @property
+    def records_since_snapshot(self) -> int:
+        """Records appended since the state was last captured by a snapshot (or recovered)"""
+        return self._wal.appended_seq - self._snapshot_seq if self._wal is not None else 0
+
+    def recover(self, apply: Callable[[Record], None]) -> RecoveryStats:
+        """
+        Replay the snapshot and the log segments after it, then open a new segment
+
+        Args:
+            apply: Called with every record in order (the repository's apply_record)
+
+        Raises:
+            PersistenceError: If the snapshot is damaged or a record cannot be applied
+        """
+        if self._wal is not None:
+            raise PersistenceError(f"Store {self.name} is already open")
+        os.makedirs(self.directory, exist_ok=True)
+        started = time.perf_counter()
+
+        first_segment, snapshot_records = 1, 0
+        if os.path.exists(self.snapshot_path):
+            first_segment, snapshot_records = self._load_snapshot(apply)
+
+        segments = self._segments()
+        for segment in segments:
+            if segment < first_segment:
+                # Left behind by a crash between the snapshot rename and the cleanup
+                os.remove(self._segment_path(segment))
+        segments = [segment for segment in segments if segment >= first_segment]
+
+        wal_records = 0
+        for segment in segments:
+            path = self._segment_path(segment)
+            if os.path.getsize(path) == 0:
+                # Opened by a run that wrote nothing; keeps idle restarts from piling up files
+                os.remove(path)
+                continue
+            for record in read_records(path):
+                self._apply(apply, record, path)
+                wal_records += 1
+            self._covered_bytes += os.path.getsize(path)
+
+        self.segment = max(segments[-1] if segments else 0, first_segment - 1) + 1
+        self._wal = WriteAheadLog(self._segment_path(self.segment), fsync=self.fsync)
+        fsync_directory(self.directory)
+
+        stats = RecoveryStats(
+            snapshot_records=snapshot_records,
+            wal_records=wal_records,
+            wal_segments=len(segments),
+            seconds=time.perf_counter() - started
+        )
+        self.last_recovery = stats
+        logger.info(
+            f"Store {self.name} recovered {snapshot_records} snapshot records and {wal_records} "
+            f"log records from {len(segments)} segments in {stats.seconds:.3f}s"
+        )
+        return stats
+
+    @staticmethod
+    def _apply(apply: Callable[[Record], None], record: Record, path: str) -> None:
+        try:
+            apply(record)
+        except Exception as e:
+            raise PersistenceError(f"Cannot apply record from {path}: {type(e).__name__}: {e}") from e
+
+    def _load_snapshot(self, apply: Callable[[Record], None]) -> Tuple[int, int]:
+        """Apply the snapshot; returns (first segment to replay, record count)"""
+        path = self.snapshot_path
+        with open(path, "rb") as f:
+            try:
+                header = decode_line(f.readline())
+            except ValueError as e:
+                raise PersistenceError(f"Snapshot {path} has a damaged header: {e}") from e
+            if header.get("format") != SNAPSHOT_FORMAT:
+                raise PersistenceError(f"Snapshot {path} has unsupported format {header.get('format')}")
+
+            count = 0
+            previous = None
+            for line in f:
+                try:
+                    record = decode_line(line)
+                except ValueError as e:
+                    raise PersistenceError(f"Snapshot {path} is damaged after {count} records: {e}") from e
+                # The last line is the footer, so apply each record once the next one is read
+                if previous is not None:
+                    self._apply(apply, previous, path)
+                    count += 1
+                previous = record
+            footer = previous
+
+        if footer is None or footer.get("records") != count:
+            raise PersistenceError(f"Snapshot {path} is incomplete: {count} records without a matching footer")
+        return header["segment"], count
+
+    def append(self, record: Record) -> int:
+        """
+        Log one change; returns its sequence number without waiting for the disk
+
+        Raises:
+            PersistenceError: If the store is not open or the log has failed
+            TypeError: If the record is not JSON serializable
+        """
+        seq = self.wal.append(encode_record(record))
+        writes = request_writes.get()
+        if writes is not None and writes.store is self:
+            writes.seq = seq
+        return seq
+
+    def flush(self) -> None:
+        """Block until every appended record is durable"""
+        self.wal.flush()
+
+    def rotate(self) -> int:
+        """
+        Continue the log in a new segment
+
+        Returns:
+            Number of the new segment; all earlier segments are complete and durable
+        """
+        wal = self.wal
+        covered = wal.bytes
+        segment = self.segment + 1
+        wal.rotate(self._segment_path(segment))
+        fsync_directory(self.directory)
+        self._covered_bytes += covered
+        self.segment = segment
+        return segment
+
+    def write_snapshot(self, records: Iterable[Record], segment: int) -> SnapshotStats:
+        """
+        Atomically replace the snapshot and delete the log segments it covers
+
+        Args:
+            records: Full state of the repository, taken after the log was rotated
+            segment: First segment that is not covered (the result of rotate())
+        """
+        started = time.perf_counter()
+        tmp_path = f"{self.snapshot_path}.tmp"
+        count = 0
+        try:
+            with open(tmp_path, "wb", buffering=SNAPSHOT_BUFFER_BYTES) as f:
+                f.write(encode_record({"format": SNAPSHOT_FORMAT, "segment": segment, "created_at": time.time()}))
+                for record in records:
+                    f.write(encode_record(record))
+                    count += 1
+                f.write(encode_record({"records": count}))
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+                size = f.tell()
+            os.replace(tmp_path, self.snapshot_path)
+            fsync_directory(self.directory)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        removed_bytes = 0
+        for old in self._segments():
+            if old < segment:
+                path = self._segment_path(old)
+                removed_bytes += os.path.getsize(path)
+                os.remove(path)
+        self._covered_bytes = max(0, self._covered_bytes - removed_bytes)
+
+        stats = SnapshotStats(segment=segment, records=count, bytes=size, seconds=time.perf_counter() - started)
+        self.last_snapshot = stats
+        logger.info(
+            f"Store {self.name} wrote a snapshot of {count} records ({size} bytes) in {stats.seconds:.3f}s"
+        )
+        return stats
+
+    def compact(self, snapshot_records: Callable[[], Iterable[Record]]) -> SnapshotStats:
+        """
+        Rotate the log, snapshot the repository and drop the covered segments
+
+        Blocking; run it on a worker thread. Concurrent calls are serialized.
+
+        Args:
+            snapshot_records: The repository's snapshot_records
+        """
+        with self._compact_lock:
+            seq = self.wal.appended_seq
+            segment = self.rotate()
+            stats = self.write_snapshot(snapshot_records(), segment)
+            self._snapshot_seq = seq
+            return stats
+
+    def close(self) -> None:
+        """Flush and close the log"""
+        if self._wal is None:
+            return
+        self._wal.close()
+        self._wal = None
+        self._covered_bytes = 0
+        self._snapshot_seq = 0
+        logger.info(f"Store {self.name} closed")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return log, snapshot and recovery statistics"""
+        snapshot = self.last_snapshot
+        recovery = self.last_recovery
+        return {
+            "directory": self.directory,
+            "open": self.is_open,
+            "segment": self.segment,
+            "wal_bytes": self.wal_bytes,
+            "records_since_snapshot": self.records_since_snapshot,
+            "wal": self._wal.stats() if self._wal is not None else None,
+            "last_snapshot": asdict(snapshot) if snapshot else None,
+            "last_recovery": asdict(recovery) if recovery else None,
+        }
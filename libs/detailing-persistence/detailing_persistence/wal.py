@@ -0,0 +1,315 @@
+"""Append-only write-ahead log with group commit"""
+import asyncio
+import json
+import logging
+import os
+import threading
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+class PersistenceError(Exception):
+    """Raised when the log or a snapshot cannot be written or read"""
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_record(record: Dict[str, Any]) -> bytes:
+    """
+    Frame one record as a log line: ``<crc32 hex> <json>\\n``
+
+    UUIDs, datetimes and Decimals are written as strings; the repository
+    that applies the record converts them back. Uses orjson when it is
+    installed (several times faster for both encoding and decoding).
+    """
+    if orjson is not None:
+        payload = orjson.dumps(record, default=_default)
+    else:
+        payload = json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+    return b"%08x %s\n" % (zlib.crc32(payload), payload)
+
+
+def decode_line(line: bytes) -> Dict[str, Any]:
+    """
+    Parse one framed log line
+
+    Raises:
+        ValueError: If the line is torn, its checksum does not match or the payload is not JSON
+    """
+    if len(line) < 11 or line[-1:] != b"\n" or line[8:9] != b" ":
+        raise ValueError("incomplete record")
+    payload = line[9:-1]
+    if int(line[:8], 16) != zlib.crc32(payload):
+        raise ValueError("checksum mismatch")
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def read_records(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the records of a log file in order
+
+    Reading stops at the first torn or corrupt line: a crash in the middle
+    of a write leaves a partial last line, and nothing after it was ever
+    acknowledged as durable.
+    """
+    offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                record = decode_line(line)
+            except ValueError as e:
+                logger.warning(f"{path}: stopped reading at byte {offset}: {e}")
+                return
+            yield record
+            offset += len(line)
+
+
+def fsync_directory(path: str) -> None:
+    """Make file creations, renames and deletions in a directory durable"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class WriteAheadLog:
+    """
+    Append-only log file written by a background thread with group commit
+
+    append() only queues the encoded record and returns its sequence
+    number, so callers on the event loop or on request threads never wait
+    for the disk. The writer thread takes everything queued so far, writes
+    it with one write() and makes it durable with one fsync(); records
+    queued while that fsync runs form the next batch. Under load many
+    records share a single fsync, at low load each record is flushed
+    immediately.
+
+    Callers that must not acknowledge a change before it is on disk wait
+    for its sequence number with wait() (threads) or wait_async() (event
+    loop). A failed write is fatal: it is reported to all waiters and to
+    every later append().
+    """
+
+    def __init__(self, path: str, fsync: bool = True):
+        self.path = path
+        self.fsync = fsync
+        self._file = open(path, "ab")
+        self.bytes = self._file.tell()
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._pending: List[bytes] = []
+        self._appended_seq = 0
+        self._durable_seq = 0
+        self._waiters: List[Tuple[int, asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._error: Optional[BaseException] = None
+        self._closing = False
+        self.batches = 0
+        self.records_written = 0
+        self._thread = threading.Thread(
+            target=self._run, name=f"wal-writer-{os.path.basename(path)}", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def appended_seq(self) -> int:
+        """Sequence number of the last appended record"""
+        return self._appended_seq
+
+    @property
+    def durable_seq(self) -> int:
+        """Sequence number of the last record known to be on disk"""
+        return self._durable_seq
+
+    def _check(self) -> None:
+        if self._error is not None:
+            raise PersistenceError(f"Write-ahead log {self.path} failed: {self._error}") from self._error
+        if self._closing:
+            raise PersistenceError(f"Write-ahead log {self.path} is closed")
+
+    def append(self, line: bytes) -> int:
+        """
+        Queue one framed record (see encode_record)
+
+        Returns:
+            Sequence number of the record
+
+        Raises:
+            PersistenceError: If the log is closed or a previous write failed
+        """
+        with self._cond:
+            if self._error is not None or self._closing:
+                self._check()
+            pending = self._pending
+            pending.append(line)
+            self._appended_seq += 1
+            # The writer only sleeps on an empty queue
+            if len(pending) == 1:
+                self._cond.notify()
+            return self._appended_seq
+
+    def wait(self, seq: int) -> None:
+        """
+        Block until the record with this sequence number is durable
+
+        Raises:
+            PersistenceError: If writing failed before the record was durable
+        """
+        with self._cond:
+            while self._durable_seq < seq and self._error is None:
+                self._cond.wait()
+            if self._durable_seq < seq:
+                raise PersistenceError(f"Write-ahead log {self.path} failed: {self._error}") from self._error
+
+    async def wait_async(self, seq: int) -> None:
+        """Wait in the running event loop until the record is durable (see wait())"""
+        with self._cond:
+            if self._durable_seq >= seq:
+                return
+            if self._error is not None:
+                raise PersistenceError(f"Write-ahead log {self.path} failed: {self._error}") from self._error
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._waiters.append((seq, loop, future))
+        await future
+
+    def flush(self) -> None:
+        """Block until everything appended so far is durable"""
+        self.wait(self._appended_seq)
+
+    def _take_batch(self) -> Tuple[List[bytes], int]:
+        with self._cond:
+            batch, self._pending = self._pending, []
+            return batch, self._appended_seq
+
+    def _write(self, batch: List[bytes]) -> None:
+        data = b"".join(batch)
+        self._file.write(data)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self.bytes += len(data)
+        self.batches += 1
+        self.records_written += len(batch)
+
+    def _mark_durable(self, seq: int) -> None:
+        with self._cond:
+            # The writer thread and rotate() may finish their batches out of order
+            seq = self._durable_seq = max(self._durable_seq, seq)
+            self._cond.notify_all()
+            ready = [waiter for waiter in self._waiters if waiter[0] <= seq]
+            self._waiters = [waiter for waiter in self._waiters if waiter[0] > seq]
+        for _, loop, future in ready:
+            _notify(loop, future, None)
+
+    def _fail(self, error: BaseException) -> None:
+        logger.error(f"Write-ahead log {self.path} failed: {type(error).__name__}: {error}", exc_info=error)
+        with self._cond:
+            self._error = error
+            self._cond.notify_all()
+            waiters, self._waiters = self._waiters, []
+        failure = PersistenceError(f"Write-ahead log {self.path} failed: {error}")
+        for _, loop, future in waiters:
+            _notify(loop, future, failure)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closing:
+                    self._cond.wait()
+                if not self._pending or self._error is not None:
+                    return
+            with self._io_lock:
+                batch, seq = self._take_batch()
+                if not batch:
+                    continue
+                try:
+                    self._write(batch)
+                except Exception as e:
+                    # Any error ends the writer thread; waiters must not hang on it
+                    self._fail(e)
+                    return
+            self._mark_durable(seq)
+
+    def rotate(self, path: str) -> None:
+        """
+        Make everything appended so far durable in the current file and continue in a new one
+
+        Records appended before the call end up in the old file, records
+        appended after it in the new one; appenders are never blocked.
+        """
+        with self._cond:
+            self._check()
+        with self._io_lock:
+            batch, seq = self._take_batch()
+            try:
+                if batch:
+                    self._write(batch)
+                self._file.close()
+                self._file = open(path, "ab")
+            except OSError as e:
+                self._fail(e)
+                raise PersistenceError(f"Cannot rotate write-ahead log to {path}: {e}") from e
+            self.path = path
+            self.bytes = self._file.tell()
+        self._mark_durable(seq)
+
+    def close(self) -> None:
+        """Write out pending records, stop the writer thread and close the file"""
+        with self._cond:
+            if self._closing:
+                return
+            self._closing = True
+            self._cond.notify_all()
+        self._thread.join()
+        with self._io_lock:
+            self._file.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return sequence numbers and batching counters"""
+        return {
+            "path": self.path,
+            "bytes": self.bytes,
+            "appended_seq": self._appended_seq,
+            "durable_seq": self._durable_seq,
+            "batches": self.batches,
+            "records_per_batch": round(self.records_written / self.batches, 2) if self.batches else 0.0,
+        }
+
+
+def _notify(loop: asyncio.AbstractEventLoop, future: asyncio.Future, error: Optional[BaseException]) -> None:
+    """Complete a wait_async() future from the writer thread"""
+    try:
+        loop.call_soon_threadsafe(_resolve, future, error)
+    except RuntimeError:
+        # The waiting loop has been closed; nobody is listening any more
+        pass
+
+
+def _resolve(future: asyncio.Future, error: Optional[BaseException]) -> None:
+    if future.done():
+        return
+    if error is None:
+        future.set_result(None)
+    else:
+        future.set_exception(error)
@@ -0,0 +1,48 @@
+"""Shared fixtures for detailing-persistence tests"""
+from typing import Dict, Iterable, Optional
+
+import pytest
+
+from detailing_persistence import DurableStore
+
+
+class KeyValueRepository:
+    """Minimal journaled repository: upserts and deletes of string keys"""
+
+    def __init__(self):
+        self.items: Dict[str, int] = {}
+        self.journal: Optional[DurableStore] = None
+
+    def put(self, key: str, value: int) -> None:
+        self.items[key] = value
+        if self.journal is not None:
+            self.journal.append({"type": "put", "key": key, "value": value})
+
+    def delete(self, key: str) -> None:
+        self.items.pop(key, None)
+        if self.journal is not None:
+            self.journal.append({"type": "delete", "key": key})
+
+    def apply_record(self, record: dict) -> None:
+        if record["type"] == "put":
+            self.items[record["key"]] = record["value"]
+        else:
+            self.items.pop(record["key"], None)
+
+    def snapshot_records(self) -> Iterable[dict]:
+        items = list(self.items.items())
+        return ({"type": "put", "key": key, "value": value} for key, value in items)
+
+
+@pytest.fixture
+def repository() -> KeyValueRepository:
+    """Empty repository"""
+    return KeyValueRepository()
+
+
+@pytest.fixture
+def store(tmp_path) -> DurableStore:
+    """Store in a temporary directory, closed after the test"""
+    store = DurableStore(str(tmp_path), "items")
+    yield store
+    store.close()
@@ -0,0 +1,125 @@
+"""Tests for setup_persistence, PersistenceMiddleware and SnapshotScheduler"""
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from detailing_persistence import PersistenceError, PersistenceSettings, SnapshotScheduler, setup_persistence
+
+from tests.conftest import KeyValueRepository
+
+
+def _app(repository: KeyValueRepository, directory: str):
+    app = FastAPI()
+    events = []
+
+    @app.on_event("startup")
+    async def startup():
+        events.append(("startup", dict(repository.items)))
+
+    @app.on_event("shutdown")
+    async def shutdown():
+        # Changes made while shutting down are still persisted
+        repository.put("drained", 1)
+
+    @app.put("/items/{key}")
+    def put_item(key: str, value: int):
+        repository.put(key, value)
+        return {key: value}
+
+    @app.get("/items")
+    async def items():
+        return repository.items
+
+    persistence = setup_persistence(app, "items", repository, config=PersistenceSettings(PERSISTENCE_DIR=directory))
+    return app, persistence, events
+
+
+class TestSetupPersistence:
+    """Tests for the application wiring"""
+
+    def test_disabled_without_directory(self, repository):
+        """Test that nothing is added when PERSISTENCE_DIR is empty"""
+        app = FastAPI()
+
+        assert setup_persistence(app, "items", repository, config=PersistenceSettings()) is None
+        assert app.user_middleware == []
+
+    def test_state_survives_restart(self, tmp_path, repository):
+        """Test that changes are recovered before startup handlers of the next run"""
+        app, persistence, _ = _app(repository, str(tmp_path))
+        with TestClient(app) as client:
+            assert client.put("/items/a", params={"value": 1}).status_code == 200
+            client.put("/items/b", params={"value": 2})
+        assert persistence.store.last_snapshot is not None
+
+        restarted = KeyValueRepository()
+        app, persistence, events = _app(restarted, str(tmp_path))
+        with TestClient(app) as client:
+            assert client.get("/items").json() == {"a": 1, "b": 2, "drained": 1}
+
+        assert events == [("startup", {"a": 1, "b": 2, "drained": 1})]
+        assert persistence.recovery.snapshot_records == 3
+
+    def test_response_waits_for_durable_write(self, tmp_path, repository):
+        """Test that a sync handler's write is on disk before its response is sent"""
+        app, persistence, _ = _app(repository, str(tmp_path))
+        with TestClient(app) as client:
+            client.put("/items/a", params={"value": 1})
+            client.get("/items")
+
+            wal = persistence.store.wal
+            assert wal.durable_seq == wal.appended_seq == 1
+
+    def test_unrecoverable_store_fails_startup(self, tmp_path, repository):
+        """Test that the application refuses to start on a damaged snapshot"""
+        (tmp_path / "items.snapshot").write_bytes(b"garbage\n")
+        app, _, _ = _app(repository, str(tmp_path))
+
+        with pytest.raises(PersistenceError, match="damaged header"):
+            with TestClient(app):
+                pass
+
+
+class TestSnapshotScheduler:
+    """Tests for background compaction"""
+
+    def test_snapshot_when_log_exceeds_threshold(self, tmp_path, store, repository):
+        """Test that a large log is compacted in the background"""
+        store.recover(repository.apply_record)
+        repository.journal = store
+        scheduler = SnapshotScheduler(
+            store, repository.snapshot_records, interval=0, max_wal_bytes=1000, check_interval=0.01
+        )
+
+        async def scenario():
+            scheduler.start()
+            for n in range(100):
+                repository.put(f"key-{n}", n)
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if scheduler.snapshots:
+                    break
+            await scheduler.stop()
+
+        asyncio.run(scenario())
+
+        assert scheduler.snapshots >= 1
+        assert store.wal_bytes < 1000
+        assert store.last_snapshot.records == 100
+
+    def test_no_snapshot_without_changes(self, store, repository):
+        """Test that an idle store is not snapshotted"""
+        store.recover(repository.apply_record)
+        clock = [0.0]
+        scheduler = SnapshotScheduler(
+            store, repository.snapshot_records, interval=10, max_wal_bytes=0, clock=lambda: clock[0]
+        )
+        clock[0] = 100.0
+
+        assert not scheduler.due()
+        repository.journal = store
+        repository.put("a", 1)
+        store.flush()
+        assert scheduler.due()
@@ -0,0 +1,136 @@
+"""Tests for DurableStore recovery and compaction"""
+import os
+
+import pytest
+
+from detailing_persistence import DurableStore, PersistenceError, encode_record
+
+from tests.conftest import KeyValueRepository
+
+
+def _reopen(tmp_path) -> tuple:
+    """Recover a fresh repository from the files in tmp_path"""
+    store = DurableStore(str(tmp_path), "items")
+    repository = KeyValueRepository()
+    stats = store.recover(repository.apply_record)
+    repository.journal = store
+    return store, repository, stats
+
+
+class TestDurableStore:
+    """Tests for the snapshot plus log layout"""
+
+    def test_recovers_changes_from_log(self, tmp_path, store, repository):
+        """Test that logged changes are replayed after a restart"""
+        store.recover(repository.apply_record)
+        repository.journal = store
+        repository.put("a", 1)
+        repository.put("b", 2)
+        repository.put("a", 3)
+        repository.delete("b")
+        store.close()
+
+        reopened, recovered, stats = _reopen(tmp_path)
+
+        assert recovered.items == {"a": 3}
+        assert stats.wal_records == 4
+        assert stats.snapshot_records == 0
+        reopened.close()
+
+    def test_compaction_replaces_covered_segments(self, tmp_path, store, repository):
+        """Test that a snapshot supersedes the log written before it"""
+        store.recover(repository.apply_record)
+        repository.journal = store
+        for n in range(10):
+            repository.put(f"k{n}", n)
+
+        snapshot = store.compact(repository.snapshot_records)
+        repository.put("after", 42)
+        store.close()
+
+        assert snapshot.records == 10
+        assert sorted(f for f in os.listdir(tmp_path) if f.endswith(".wal")) == ["items-00000002.wal"]
+        reopened, recovered, stats = _reopen(tmp_path)
+        assert recovered.items == {**{f"k{n}": n for n in range(10)}, "after": 42}
+        assert stats.snapshot_records == 10
+        assert stats.wal_records == 1
+        reopened.close()
+
+    def test_replaying_records_overlapping_the_snapshot_is_harmless(self, tmp_path, store, repository):
+        """Test that changes logged while a snapshot is taken are applied once in effect"""
+        store.recover(repository.apply_record)
+        repository.journal = store
+        repository.put("a", 1)
+
+        def records_with_concurrent_write():
+            # A change lands after the rotation but before the state is read
+            repository.put("a", 2)
+            return repository.snapshot_records()
+
+        store.compact(records_with_concurrent_write)
+        store.close()
+
+        reopened, recovered, stats = _reopen(tmp_path)
+        assert recovered.items == {"a": 2}
+        assert stats.wal_records == 1
+        reopened.close()
+
+    def test_torn_log_tail_is_ignored(self, tmp_path, store, repository):
+        """Test that a record cut off by a crash is dropped and the rest recovered"""
+        store.recover(repository.apply_record)
+        repository.journal = store
+        repository.put("a", 1)
+        store.close()
+        with open(tmp_path / "items-00000001.wal", "ab") as f:
+            f.write(encode_record({"type": "put", "key": "b", "value": 2})[:-4])
+
+        reopened, recovered, _ = _reopen(tmp_path)
+
+        assert recovered.items == {"a": 1}
+        reopened.close()
+
+    def test_damaged_snapshot_fails_recovery(self, tmp_path, store, repository):
+        """Test that a truncated snapshot is reported instead of loading partial state"""
+        store.recover(repository.apply_record)
+        repository.journal = store
+        repository.put("a", 1)
+        repository.put("b", 2)
+        store.compact(repository.snapshot_records)
+        store.close()
+        snapshot = tmp_path / "items.snapshot"
+        snapshot.write_bytes(snapshot.read_bytes().rsplit(b"\n", 2)[0] + b"\n")
+
+        with pytest.raises(PersistenceError, match="incomplete"):
+            DurableStore(str(tmp_path), "items").recover(KeyValueRepository().apply_record)
+
+    def test_segments_left_by_interrupted_compaction_are_removed(self, tmp_path, store, repository):
+        """Test that segments already covered by the snapshot are deleted on recovery"""
+        store.recover(repository.apply_record)
+        repository.journal = store
+        repository.put("a", 1)
+        segment = store.rotate()
+        store.write_snapshot(repository.snapshot_records(), segment)
+        store.close()
+        # Simulate a crash between the snapshot rename and the segment cleanup
+        (tmp_path / "items-00000001.wal").write_bytes(encode_record({"type": "put", "key": "a", "value": 0}))
+
+        reopened, recovered, _ = _reopen(tmp_path)
+
+        assert recovered.items == {"a": 1}
+        assert not (tmp_path / "items-00000001.wal").exists()
+        reopened.close()
+
+    def test_idle_restarts_do_not_pile_up_segments(self, tmp_path, store, repository):
+        """Test that empty segments of runs without changes are removed on recovery"""
+        store.recover(repository.apply_record)
+        store.close()
+        for _ in range(3):
+            reopened, _, _ = _reopen(tmp_path)
+            reopened.close()
+
+        assert len([f for f in os.listdir(tmp_path) if f.endswith(".wal")]) == 1
+
+    def test_append_requires_open_store(self, store):
+        """Test that appending before recover() fails loudly"""
+        with pytest.raises(PersistenceError, match="not open"):
+            store.append({"type": "put", "key": "a", "value": 1})
@@ -0,0 +1,137 @@
+"""Tests for WriteAheadLog and the record framing"""
+import asyncio
+import threading
+from uuid import UUID
+from datetime import datetime
+
+import pytest
+
+from detailing_persistence import PersistenceError, WriteAheadLog, encode_record, read_records
+from detailing_persistence.wal import decode_line
+
+
+class TestRecordFraming:
+    """Tests for encode_record/decode_line/read_records"""
+
+    def test_round_trip_converts_uuid_and_datetime_to_strings(self):
+        """Test that records survive encoding with special types as strings"""
+        line = encode_record({"id": UUID(int=1), "at": datetime(2025, 1, 2, 3, 4, 5), "name": "Мойка"})
+
+        assert decode_line(line) == {
+            "id": "00000000-0000-0000-0000-000000000001",
+            "at": "2025-01-02T03:04:05",
+            "name": "Мойка",
+        }
+
+    def test_corrupt_line_is_rejected(self):
+        """Test that a flipped byte fails the checksum"""
+        line = bytearray(encode_record({"value": 1}))
+        line[-3] = ord("2")
+
+        with pytest.raises(ValueError, match="checksum"):
+            decode_line(bytes(line))
+
+    def test_reading_stops_at_torn_tail(self, tmp_path):
+        """Test that a partially written last record is ignored"""
+        path = tmp_path / "log.wal"
+        path.write_bytes(
+            encode_record({"n": 1}) + encode_record({"n": 2}) + encode_record({"n": 3})[:-5]
+        )
+
+        assert list(read_records(str(path))) == [{"n": 1}, {"n": 2}]
+
+
+class TestWriteAheadLog:
+    """Tests for group commit"""
+
+    def test_appended_records_are_durable_after_flush(self, tmp_path):
+        """Test that flush() waits for every appended record"""
+        wal = WriteAheadLog(str(tmp_path / "log.wal"))
+        for n in range(100):
+            wal.append(encode_record({"n": n}))
+
+        wal.flush()
+
+        assert wal.durable_seq == 100
+        assert [r["n"] for r in read_records(wal.path)] == list(range(100))
+        wal.close()
+
+    def test_concurrent_committers_share_fsyncs(self, tmp_path):
+        """Test that records committed from many threads are batched"""
+        wal = WriteAheadLog(str(tmp_path / "log.wal"))
+        threads, per_thread = 16, 50
+
+        def commit(t: int):
+            for n in range(per_thread):
+                wal.wait(wal.append(encode_record({"t": t, "n": n})))
+
+        workers = [threading.Thread(target=commit, args=(t,)) for t in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert wal.durable_seq == threads * per_thread
+        assert wal.batches < threads * per_thread
+        assert len(list(read_records(wal.path))) == threads * per_thread
+        wal.close()
+
+    def test_wait_async_resolves_after_write(self, tmp_path):
+        """Test that event-loop waiters are woken by the writer thread"""
+        wal = WriteAheadLog(str(tmp_path / "log.wal"))
+
+        async def scenario():
+            seqs = [wal.append(encode_record({"n": n})) for n in range(10)]
+            await asyncio.wait_for(wal.wait_async(seqs[-1]), timeout=5)
+
+        asyncio.run(scenario())
+
+        assert wal.durable_seq == 10
+        wal.close()
+
+    def test_rotate_splits_records_between_files(self, tmp_path):
+        """Test that rotate() finishes the old file and continues in the new one"""
+        wal = WriteAheadLog(str(tmp_path / "1.wal"))
+        wal.append(encode_record({"n": 1}))
+        wal.rotate(str(tmp_path / "2.wal"))
+        wal.append(encode_record({"n": 2}))
+        wal.close()
+
+        assert list(read_records(str(tmp_path / "1.wal"))) == [{"n": 1}]
+        assert list(read_records(str(tmp_path / "2.wal"))) == [{"n": 2}]
+
+    def test_write_failure_is_reported(self, tmp_path):
+        """Test that a failed write fails waiters and later appends"""
+        wal = WriteAheadLog(str(tmp_path / "log.wal"))
+        wal.flush()
+        wal._file.close()
+
+        seq = wal.append(encode_record({"n": 1}))
+
+        with pytest.raises(PersistenceError):
+            wal.wait(seq)
+        with pytest.raises(PersistenceError):
+            wal.append(encode_record({"n": 2}))
+        wal.close()
+
+    def test_unexpected_write_error_fails_async_waiters(self, tmp_path, monkeypatch):
+        """Test that an error other than OSError still wakes every waiter"""
+        wal = WriteAheadLog(str(tmp_path / "log.wal"))
+        wal.flush()
+
+        def broken_write(batch):
+            raise TypeError("unexpected")
+
+        monkeypatch.setattr(wal, "_write", broken_write)
+
+        async def scenario():
+            seq = wal.append(encode_record({"n": 1}))
+            await asyncio.wait_for(wal.wait_async(seq), timeout=5)
+
+        with pytest.raises(PersistenceError):
+            asyncio.run(scenario())
+        with pytest.raises(PersistenceError):
+            wal.wait(wal.appended_seq)
+        with pytest.raises(PersistenceError):
+            wal.append(encode_record({"n": 2}))
+        wal.close()
@@ -10,9 +10,33 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8003
 
+    # Serialize responses with orjson instead of json.dumps (opt-in)
+    FAST_JSON_RESPONSES: bool = False
+
     # External service URLs
     CAR_SERVICE_URL: str = "http://car-service:8002"
 
+    # car-service HTTP client (shared connection pool)
+    CAR_SERVICE_TIMEOUT: float = 10.0
+    CAR_SERVICE_MAX_CONNECTIONS: int = 100
+    CAR_SERVICE_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    CAR_SERVICE_KEEPALIVE_EXPIRY: float = 30.0
+    CAR_SERVICE_HTTP2: bool = False
+
+    # car-service resilience: total time budget per call, retries with
+    # jittered exponential backoff, and circuit breaker thresholds
+    CAR_SERVICE_DEADLINE: float = 3.0
+    CAR_SERVICE_MAX_RETRIES: int = 2
+    CAR_SERVICE_RETRY_BACKOFF: float = 0.05
+    CAR_SERVICE_RETRY_BACKOFF_MAX: float = 0.5
+    CAR_SERVICE_BREAKER_FAILURE_THRESHOLD: int = 5
+    CAR_SERVICE_BREAKER_RECOVERY_TIMEOUT: float = 10.0
+
+    # Car existence cache (TTL in seconds, 0 disables caching of that result)
+    CAR_CACHE_MAX_SIZE: int = 10000
+    CAR_CACHE_POSITIVE_TTL: float = 300.0
+    CAR_CACHE_NEGATIVE_TTL: float = 30.0
+
     class Config:
         env_file = ".env"
         case_sensitive = True
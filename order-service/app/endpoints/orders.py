@@ -14,7 +14,7 @@ from app.models.order import (
     ErrorResponse
 )
 from app.services.order_service import order_service
-from app.auth import get_current_user_id
+from detailing_auth import get_current_user_id
 
 logger = logging.getLogger(__name__)
 
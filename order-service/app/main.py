@@ -3,11 +3,15 @@ import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from detailing_observability import setup_load_shedding, setup_metrics, setup_profiling
+from detailing_persistence import setup_persistence
 
 from app.config import settings
 from app.endpoints import orders
+from app.repositories.local_order_repo import order_repository
+from app.services.car_client import car_client
 
 # Configure logging
 logging.basicConfig(
@@ -23,9 +27,11 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     logger.info(f"Car Service URL: {settings.CAR_SERVICE_URL}")
+    await car_client.start()
     yield
     # Shutdown
     logger.info(f"Shutting down {settings.APP_NAME}")
+    await car_client.close()
 
 
 # Create FastAPI application
@@ -33,7 +39,8 @@ app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="Order management service for car service appointments",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if settings.FAST_JSON_RESPONSES else JSONResponse
 )
 
 # Configure CORS
@@ -45,6 +52,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Shed load (503) on event-loop lag or too many requests in flight
+setup_load_shedding(app)
+
+# Request metrics and /metrics endpoint
+setup_metrics(app)
+
+# Sampling profiler at /debug/profile (only with PROFILING_ENABLED=true)
+setup_profiling(app)
+
+# Snapshot + write-ahead log of orders and reviews (only with PERSISTENCE_DIR set)
+setup_persistence(app, "orders", order_repository)
+
 # Include routers
 app.include_router(orders.router)
 
@@ -57,11 +76,14 @@ app.include_router(orders.router)
     description="Returns the health status of the service"
 )
 async def health_check():
-    """Health check endpoint"""
+    """Health check endpoint with car-service client counters"""
     return {
         "status": "healthy",
         "service": settings.APP_NAME,
-        "version": settings.APP_VERSION
+        "version": settings.APP_VERSION,
+        "car_cache": car_client.cache.stats(),
+        "car_lookups": car_client.single_flight.stats(),
+        "car_circuit_breaker": car_client.breaker.stats()
     }
 
 
@@ -1,18 +1,35 @@
 """In-memory repository for orders and reviews"""
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional
 from uuid import UUID, uuid4
 
+from detailing_persistence import DurableStore
+
 from app.models.order import Order, Review
 
 
+def _order_record(order: Order) -> Dict[str, Any]:
+    return {"type": "order", "order": dict(vars(order))}
+
+
+def _review_record(review: Review) -> Dict[str, Any]:
+    return {"type": "review", "review": dict(vars(review))}
+
+
 class LocalOrderRepository:
-    """In-memory storage for orders and reviews"""
+    """
+    In-memory storage for orders and reviews
+
+    When journal is set, every created or changed order and every review
+    is appended to it as a full upsert, so records can be replayed in any
+    overlap with a snapshot.
+    """
 
     def __init__(self):
         self._orders: Dict[UUID, Order] = {}
         self._reviews: Dict[UUID, Review] = {}
         self._order_reviews: Dict[UUID, UUID] = {}  # order_id -> review_id mapping
+        self.journal: Optional[DurableStore] = None
 
     async def create_order(
         self,
@@ -31,6 +48,8 @@ class LocalOrderRepository:
             created_at=datetime.now()
         )
         self._orders[order_id] = order
+        if self.journal is not None:
+            self.journal.append(_order_record(order))
         return order
 
     async def get_order_by_id(self, order_id: UUID) -> Optional[Order]:
@@ -42,6 +61,8 @@ class LocalOrderRepository:
         order = self._orders.get(order_id)
         if order:
             order.status = new_status
+            if self.journal is not None:
+                self.journal.append(_order_record(order))
         return order
 
     async def create_review(
@@ -62,6 +83,8 @@ class LocalOrderRepository:
         )
         self._reviews[review_id] = review
         self._order_reviews[order_id] = review_id
+        if self.journal is not None:
+            self.journal.append(_review_record(review))
         return review
 
     async def has_review(self, order_id: UUID) -> bool:
@@ -75,6 +98,47 @@ class LocalOrderRepository:
             return self._reviews.get(review_id)
         return None
 
+    def apply_record(self, record: Dict[str, Any]) -> None:
+        """Apply a journal record during recovery"""
+        if record["type"] == "order":
+            data = record["order"]
+            order = Order(
+                order_id=UUID(data["order_id"]),
+                car_id=UUID(data["car_id"]),
+                status=data["status"],
+                appointment_time=datetime.fromisoformat(data["appointment_time"]),
+                description=data["description"],
+                created_at=datetime.fromisoformat(data["created_at"])
+            )
+            self._orders[order.order_id] = order
+        elif record["type"] == "review":
+            data = record["review"]
+            review = Review(
+                review_id=UUID(data["review_id"]),
+                order_id=UUID(data["order_id"]),
+                status=data["status"],
+                rating=data["rating"],
+                comment=data["comment"],
+                created_at=datetime.fromisoformat(data["created_at"])
+            )
+            self._reviews[review.review_id] = review
+            self._order_reviews[review.order_id] = review.review_id
+        else:
+            raise ValueError(f"Unknown record type: {record['type']!r}")
+
+    def snapshot_records(self) -> Iterable[Dict[str, Any]]:
+        """Records rebuilding all orders and reviews (built lazily from copies of the dicts)"""
+        orders = list(self._orders.values())
+        reviews = list(self._reviews.values())
+
+        def records() -> Iterator[Dict[str, Any]]:
+            for order in orders:
+                yield _order_record(order)
+            for review in reviews:
+                yield _review_record(review)
+
+        return records()
+
 
 # Singleton instance
 order_repository = LocalOrderRepository()
@@ -0,0 +1,105 @@
+"""Bounded TTL cache for car existence checks"""
+import logging
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CarExistenceCache:
+    """
+    LRU cache of car existence results with separate TTLs
+
+    Positive results ("car exists") and negative results ("car not found")
+    expire independently, so a car registered shortly after a failed lookup
+    becomes visible after negative_ttl seconds. A TTL of 0 disables caching
+    of that kind of result. When max_size entries are stored the least
+    recently used entry is evicted. hits counts both kinds of cached
+    result; negative_hits counts the "car not found" ones among them.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        positive_ttl: float,
+        negative_ttl: float,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_size = max_size
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[bool, float]]" = OrderedDict()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, car_id: str) -> Optional[bool]:
+        """
+        Look up a cached existence result
+
+        Args:
+            car_id: UUID of the car
+
+        Returns:
+            True/False if a fresh result is cached, None on miss
+        """
+        entry = self._entries.get(car_id)
+        if entry is not None:
+            exists, expires_at = entry
+            if expires_at > self._clock():
+                self._entries.move_to_end(car_id)
+                self.hits += 1
+                if not exists:
+                    self.negative_hits += 1
+                return exists
+            del self._entries[car_id]
+
+        self.misses += 1
+        return None
+
+    def set(self, car_id: str, exists: bool) -> None:
+        """
+        Store an existence result
+
+        Args:
+            car_id: UUID of the car
+            exists: Whether car-service reported the car as existing
+        """
+        ttl = self.positive_ttl if exists else self.negative_ttl
+        if ttl <= 0 or self.max_size <= 0:
+            return
+
+        self._entries[car_id] = (exists, self._clock() + ttl)
+        self._entries.move_to_end(car_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, car_id: str) -> None:
+        """Drop the cached result for one car"""
+        if self._entries.pop(car_id, None) is not None:
+            logger.info(f"Car existence cache invalidated for car {car_id}")
+
+    def clear(self) -> None:
+        """Drop all cached results and reset counters"""
+        self._entries.clear()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Return cache counters and hit rate"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
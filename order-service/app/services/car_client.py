@@ -1,79 +1,245 @@
 """HTTP client for car-service communication"""
+import asyncio
 import httpx
 import logging
+import random
+import time
 from typing import Optional
 
 from app.config import settings
+from app.services.car_cache import CarExistenceCache
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
 
+class CarServiceUnavailableError(Exception):
+    """Raised when car-service cannot give a definitive answer in time"""
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class CarServiceClient:
-    """Client for interacting with car-service"""
+    """
+    Client for interacting with car-service
+
+    All requests go through one long-lived httpx.AsyncClient so TCP
+    connections to car-service are pooled and kept alive between orders.
+    The pool is opened by start() from the application lifespan and
+    released by close(); if a request is made before start() the pool is
+    created lazily.
+
+    Definitive answers from car-service (200 and 404) are remembered in a
+    CarExistenceCache; errors and unexpected statuses are never cached.
+    Concurrent lookups of the same car share one in-flight request.
+
+    Each call has a total time budget (deadline). Transport errors and 5xx
+    responses are retried with jittered exponential backoff while the
+    budget lasts, and feed a circuit breaker; while the breaker is open
+    calls fail immediately with CarServiceUnavailableError.
+    """
 
     def __init__(self):
         self.base_url = settings.CAR_SERVICE_URL
-        self.timeout = 10.0
+        self.timeout = settings.CAR_SERVICE_TIMEOUT
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self.cache = CarExistenceCache(
+            max_size=settings.CAR_CACHE_MAX_SIZE,
+            positive_ttl=settings.CAR_CACHE_POSITIVE_TTL,
+            negative_ttl=settings.CAR_CACHE_NEGATIVE_TTL
+        )
+        self.single_flight = SingleFlight()
+        self.deadline = settings.CAR_SERVICE_DEADLINE
+        self.max_retries = settings.CAR_SERVICE_MAX_RETRIES
+        self.retry_backoff = settings.CAR_SERVICE_RETRY_BACKOFF
+        self.retry_backoff_max = settings.CAR_SERVICE_RETRY_BACKOFF_MAX
+        self.breaker = CircuitBreaker(
+            name="car-service",
+            failure_threshold=settings.CAR_SERVICE_BREAKER_FAILURE_THRESHOLD,
+            recovery_timeout=settings.CAR_SERVICE_BREAKER_RECOVERY_TIMEOUT
+        )
+
+    def _build_http_client(self) -> httpx.AsyncClient:
+        """Create the pooled HTTP client from settings"""
+        http2 = settings.CAR_SERVICE_HTTP2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("CAR_SERVICE_HTTP2 is enabled but 'h2' is not installed, using HTTP/1.1")
+                http2 = False
+
+        limits = httpx.Limits(
+            max_connections=settings.CAR_SERVICE_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.CAR_SERVICE_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.CAR_SERVICE_KEEPALIVE_EXPIRY
+        )
+        return httpx.AsyncClient(timeout=self.timeout, limits=limits, http2=http2)
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, created on first use"""
+        if self._http_client is None:
+            self._http_client = self._build_http_client()
+        return self._http_client
+
+    async def start(self) -> None:
+        """Open the connection pool (called on application startup)"""
+        if self._http_client is None:
+            self._http_client = self._build_http_client()
+            logger.info(
+                f"car-service HTTP pool opened: max_connections={settings.CAR_SERVICE_MAX_CONNECTIONS}, "
+                f"max_keepalive={settings.CAR_SERVICE_MAX_KEEPALIVE_CONNECTIONS}"
+            )
+
+    async def close(self) -> None:
+        """Close the connection pool (called on application shutdown)"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            logger.info("car-service HTTP pool closed")
+
+    def invalidate_car(self, car_id: str) -> None:
+        """
+        Forget the cached existence result for a car
 
-    async def verify_car_exists(self, car_id: str) -> bool:
+        Call this when a car is known to have been created or removed so
+        the next check goes to car-service.
+        """
+        self.cache.invalidate(car_id)
+
+    async def _get_car(self, car_id: str, timeout: Optional[float] = None) -> httpx.Response:
+        """
+        GET the car from car-service, coalescing concurrent calls per car
+
+        Coalesced callers share the deadline of the call that started the
+        request.
+
+        Args:
+            car_id: UUID of the car
+            timeout: Total time budget in seconds (defaults to self.deadline)
+
+        Returns:
+            Response with a status below 500
+
+        Raises:
+            CarServiceUnavailableError: If the breaker is open, the budget is
+                exhausted or every attempt failed
+        """
+        deadline = time.monotonic() + (timeout if timeout is not None else self.deadline)
+        return await self.single_flight.do(car_id, lambda: self._get_car_with_retries(car_id, deadline))
+
+    async def _get_car_with_retries(self, car_id: str, deadline: float) -> httpx.Response:
+        """Send GET attempts until success, budget exhaustion or retry limit"""
+        url = f"{self.base_url}/api/cars/{car_id}"
+        attempt = 0
+
+        while True:
+            if not self.breaker.allow_request():
+                raise CarServiceUnavailableError(
+                    "car-service circuit breaker is open",
+                    retry_after=self.breaker.retry_after()
+                )
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise CarServiceUnavailableError(f"Deadline exceeded while fetching car {car_id}")
+
+            try:
+                response = await self.http_client.get(url, timeout=min(self.timeout, remaining))
+            except httpx.RequestError as e:
+                self.breaker.record_failure()
+                failure = f"{type(e).__name__}: {e}"
+            else:
+                if response.status_code < 500:
+                    self.breaker.record_success()
+                    return response
+                self.breaker.record_failure()
+                failure = f"status {response.status_code}"
+
+            logger.warning(f"car-service attempt {attempt + 1} for car {car_id} failed: {failure}")
+            if attempt >= self.max_retries:
+                raise CarServiceUnavailableError(f"car-service failed after {attempt + 1} attempts: {failure}")
+
+            # Full jitter: sleep a random time up to the exponential backoff cap
+            delay = random.uniform(0, min(self.retry_backoff_max, self.retry_backoff * 2 ** attempt))
+            if time.monotonic() + delay >= deadline:
+                raise CarServiceUnavailableError(f"Deadline exceeded while fetching car {car_id}")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def verify_car_exists(self, car_id: str, timeout: Optional[float] = None) -> bool:
         """
         Verify that a car exists in car-service
 
         Args:
             car_id: UUID of the car to verify
+            timeout: Total time budget in seconds (defaults to CAR_SERVICE_DEADLINE)
 
         Returns:
-            True if car exists (200 response), False otherwise
+            True if car exists (200 response), False if car-service answered
+            404 or another 4xx status
+
+        Raises:
+            CarServiceUnavailableError: If car-service is unreachable, slow,
+                returns 5xx, or the circuit breaker is open
         """
-        url = f"{self.base_url}/api/cars/{car_id}"
+        cached = self.cache.get(car_id)
+        if cached is not None:
+            logger.debug(f"Car existence cache hit for car {car_id}: {cached}")
+            return cached
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                logger.info(f"Verifying car existence: {url}")
-                response = await client.get(url)
-
-                if response.status_code == 200:
-                    logger.info(f"Car {car_id} exists")
-                    return True
-                elif response.status_code == 404:
-                    logger.warning(f"Car {car_id} not found")
-                    return False
-                else:
-                    logger.error(f"Unexpected status code {response.status_code} from car-service")
-                    return False
-
-        except httpx.TimeoutException:
-            logger.error(f"Timeout while connecting to car-service: {url}")
-            return False
-        except httpx.RequestError as e:
-            logger.error(f"Error connecting to car-service: {e}")
-            return False
+            logger.info(f"Verifying car existence: car_id={car_id}")
+            response = await self._get_car(car_id, timeout)
+        except CarServiceUnavailableError as e:
+            logger.error(f"car-service unavailable while verifying car {car_id}: {e}")
+            raise
         except Exception as e:
             logger.error(f"Unexpected error while verifying car: {e}")
+            raise CarServiceUnavailableError(f"Unexpected error while verifying car: {e}") from e
+
+        if response.status_code == 200:
+            logger.info(f"Car {car_id} exists")
+            self.cache.set(car_id, True)
+            return True
+        elif response.status_code == 404:
+            logger.warning(f"Car {car_id} not found")
+            self.cache.set(car_id, False)
+            return False
+        else:
+            logger.error(f"Unexpected status code {response.status_code} from car-service")
             return False
 
-    async def get_car_details(self, car_id: str) -> Optional[dict]:
+    async def get_car_details(self, car_id: str, timeout: Optional[float] = None) -> Optional[dict]:
         """
         Get detailed information about a car
 
         Args:
             car_id: UUID of the car
+            timeout: Total time budget in seconds (defaults to CAR_SERVICE_DEADLINE)
 
         Returns:
-            Car details as dict if found, None otherwise
+            Car details as dict if found, None otherwise (including when
+            car-service is unavailable)
         """
-        url = f"{self.base_url}/api/cars/{car_id}"
-
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                logger.info(f"Fetching car details: {url}")
-                response = await client.get(url)
-
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    logger.warning(f"Failed to fetch car details: {response.status_code}")
-                    return None
+            logger.info(f"Fetching car details: car_id={car_id}")
+            response = await self._get_car(car_id, timeout)
+
+            if response.status_code == 200:
+                self.cache.set(car_id, True)
+                return response.json()
+            elif response.status_code == 404:
+                self.cache.set(car_id, False)
+                logger.warning(f"Failed to fetch car details: {response.status_code}")
+                return None
+            else:
+                logger.warning(f"Failed to fetch car details: {response.status_code}")
+                return None
 
         except Exception as e:
             logger.error(f"Error fetching car details: {e}")
@@ -0,0 +1,100 @@
+"""Circuit breaker for calls to downstream services"""
+import logging
+import time
+from typing import Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker with half-open probing
+
+    closed:    requests pass; failure_threshold consecutive failures open it.
+    open:      requests are rejected until recovery_timeout has passed.
+    half_open: one probe request is let through. Success closes the
+               breaker, failure opens it again. If the probe never reports
+               back, another probe is allowed after recovery_timeout.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        recovery_timeout: float,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._changed_at = clock()
+        self.rejected = 0
+        self.opened = 0
+
+    @property
+    def state(self) -> str:
+        """Current breaker state"""
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until the breaker lets a probe through (0 when closed)"""
+        if self._state == self.CLOSED:
+            return 0.0
+        return max(0.0, self._changed_at + self.recovery_timeout - self._clock())
+
+    def allow_request(self) -> bool:
+        """
+        Decide whether a request may be sent now
+
+        Returns:
+            True if the request may proceed, False if it must fail fast
+        """
+        if self._state == self.CLOSED:
+            return True
+
+        if self.retry_after() > 0:
+            self.rejected += 1
+            return False
+
+        # Recovery timeout elapsed: let exactly one probe through
+        self._set_state(self.HALF_OPEN)
+        return True
+
+    def record_success(self) -> None:
+        """Report a successful call"""
+        self._consecutive_failures = 0
+        if self._state != self.CLOSED:
+            self._set_state(self.CLOSED)
+
+    def record_failure(self) -> None:
+        """Report a failed call"""
+        self._consecutive_failures += 1
+        if self._state == self.HALF_OPEN or (
+            self._state == self.CLOSED and self._consecutive_failures >= self.failure_threshold
+        ):
+            self.opened += 1
+            self._set_state(self.OPEN)
+
+    def _set_state(self, state: str) -> None:
+        if state != self._state:
+            log = logger.warning if state == self.OPEN else logger.info
+            log(f"Circuit breaker '{self.name}': {self._state} -> {state}")
+        self._state = state
+        self._changed_at = self._clock()
+
+    def stats(self) -> Dict[str, object]:
+        """Return breaker state and counters"""
+        return {
+            "state": self._state,
+            "consecutive_failures": self._consecutive_failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+            "retry_after": round(self.retry_after(), 3)
+        }
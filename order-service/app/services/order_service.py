@@ -1,5 +1,6 @@
 """Business logic for order management"""
 import logging
+import math
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
@@ -15,7 +16,7 @@ from app.models.order import (
     Review
 )
 from app.repositories.local_order_repo import order_repository
-from app.services.car_client import car_client
+from app.services.car_client import car_client, CarServiceUnavailableError
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +50,16 @@ class OrderService:
             HTTPException: 404 if car not found, 503 if car-service unavailable
         """
         # Verify car exists in car-service
-        car_exists = await self.car_client.verify_car_exists(str(request.car_id))
+        try:
+            car_exists = await self.car_client.verify_car_exists(str(request.car_id))
+        except CarServiceUnavailableError as e:
+            logger.error(f"Cannot verify car {request.car_id}: {e}")
+            headers = {"Retry-After": str(math.ceil(e.retry_after))} if e.retry_after > 0 else None
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Car service unavailable",
+                headers=headers
+            )
 
         if not car_exists:
             logger.warning(f"Attempted to create order for non-existent car: {request.car_id}")
@@ -0,0 +1,60 @@
+"""Request coalescing for concurrent identical calls"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into one in-flight call
+
+    The first caller for a key starts the call as a separate task; callers
+    arriving while it runs await the same task and receive its result or
+    exception. The task is shielded, so a cancelled caller does not cancel
+    the shared call for the others. Once the call finishes the key is
+    released and the next caller starts a fresh call.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn() for key, or join the call already in flight for key
+
+        Args:
+            key: Identity of the call (e.g. car ID)
+            fn: Zero-argument coroutine function performing the call
+
+        Returns:
+            Result of the shared call
+        """
+        self.calls += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._release(key, done))
+        else:
+            self.coalesced += 1
+            logger.debug(f"Coalesced call for key {key}")
+        return await asyncio.shield(task)
+
+    def _release(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a finished call and mark its exception as retrieved"""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Return call counters"""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight)
+        }
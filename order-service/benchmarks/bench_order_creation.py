@@ -0,0 +1,114 @@
+"""
+Benchmark of order-creation throughput against a local stub car-service.
+
+Starts a minimal car-service stub (GET /api/cars/{car_id} -> 200) with
+uvicorn on localhost and runs OrderService.create_order with a fixed
+concurrency in two modes:
+
+- per-call: a new httpx.AsyncClient per request (the previous behaviour)
+- pooled:   the shared CarServiceClient connection pool
+
+Usage (from the order-service directory):
+    python -m benchmarks.bench_order_creation
+    python -m benchmarks.bench_order_creation --orders 5000 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import logging
+import socket
+import time
+from datetime import datetime
+from uuid import uuid4
+
+import httpx
+import uvicorn
+
+from app.config import settings
+from app.models.order import CreateOrderRequest
+from app.repositories.local_order_repo import LocalOrderRepository
+from app.services.car_client import CarServiceClient
+from app.services.order_service import OrderService
+
+
+async def stub_car_service(scope, receive, send):
+    """ASGI stub that reports every car as existing"""
+    if scope["type"] != "http":
+        return
+    body = b'{"car_id": "stub"}'
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class PerCallCarServiceClient(CarServiceClient):
+    """Car client that opens a new connection for every request"""
+
+    async def verify_car_exists(self, car_id: str) -> bool:
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            response = await client.get(f"{self.base_url}/api/cars/{car_id}")
+            return response.status_code == 200
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _run_orders(car_client: CarServiceClient, orders: int, concurrency: int) -> float:
+    """Create ``orders`` orders and return throughput in orders per second"""
+    service = OrderService()
+    service.repository = LocalOrderRepository()
+    service.car_client = car_client
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def create_one():
+        request = CreateOrderRequest(car_id=uuid4(), desired_time=datetime(2030, 1, 1), description="Benchmark")
+        async with semaphore:
+            await service.create_order(request)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(create_one() for _ in range(orders)))
+    return orders / (time.perf_counter() - start)
+
+
+async def main(orders: int, concurrency: int) -> None:
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(stub_car_service, host="127.0.0.1", port=port, log_level="error"))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    settings.CAR_SERVICE_URL = f"http://127.0.0.1:{port}"
+    try:
+        per_call = await _run_orders(PerCallCarServiceClient(), orders, concurrency)
+
+        pooled_client = CarServiceClient()
+        await pooled_client.start()
+        try:
+            pooled = await _run_orders(pooled_client, orders, concurrency)
+        finally:
+            await pooled_client.close()
+    finally:
+        server.should_exit = True
+        await server_task
+
+    print(f"orders={orders} concurrency={concurrency}")
+    print(f"{'mode':>10} {'orders/s':>10}")
+    print(f"{'per-call':>10} {per_call:>10.0f}")
+    print(f"{'pooled':>10} {pooled:>10.0f}")
+    print(f"speedup: {pooled / per_call:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--orders", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    asyncio.run(main(args.orders, args.concurrency))
@@ -49,7 +49,7 @@ def valid_auth_headers(mock_jwt_token):
 # Component Test 1: Create order with car verification flow
 @pytest.mark.asyncio
 @patch("app.services.order_service.order_service.car_client.verify_car_exists")
-@patch("app.auth.jwt.decode")
+@patch("detailing_auth.dependency.token_verifier.decode")
 async def test_create_order_with_car_verification_flow(
     mock_jwt_decode,
     mock_verify_car,
@@ -113,7 +113,7 @@ async def test_create_order_with_car_verification_flow(
 # Component Test 2: Order status transition flow
 @pytest.mark.asyncio
 @patch("app.services.order_service.order_service.car_client.verify_car_exists")
-@patch("app.auth.jwt.decode")
+@patch("detailing_auth.dependency.token_verifier.decode")
 async def test_order_status_transition_flow(
     mock_jwt_decode,
     mock_verify_car,
@@ -181,7 +181,7 @@ async def test_order_status_transition_flow(
 # Component Test 3: Invalid status transition validation
 @pytest.mark.asyncio
 @patch("app.services.order_service.order_service.car_client.verify_car_exists")
-@patch("app.auth.jwt.decode")
+@patch("detailing_auth.dependency.token_verifier.decode")
 async def test_invalid_status_transition_validation(
     mock_jwt_decode,
     mock_verify_car,
@@ -251,7 +251,7 @@ async def test_invalid_status_transition_validation(
 # Component Test 4: Add review to order flow
 @pytest.mark.asyncio
 @patch("app.services.order_service.order_service.car_client.verify_car_exists")
-@patch("app.auth.jwt.decode")
+@patch("detailing_auth.dependency.token_verifier.decode")
 async def test_add_review_to_order_flow(
     mock_jwt_decode,
     mock_verify_car,
@@ -329,7 +329,7 @@ async def test_add_review_to_order_flow(
 # Component Test 5: Car service failure handling
 @pytest.mark.asyncio
 @patch("app.services.order_service.order_service.car_client.verify_car_exists")
-@patch("app.auth.jwt.decode")
+@patch("detailing_auth.dependency.token_verifier.decode")
 async def test_car_service_failure_handling(
     mock_jwt_decode,
     mock_verify_car,
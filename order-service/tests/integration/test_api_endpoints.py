@@ -22,7 +22,7 @@ def mock_get_current_user_id():
 def test_client():
     """Fixture providing FastAPI TestClient with mocked auth"""
     # Override the auth dependency
-    from app.auth import get_current_user_id
+    from detailing_auth import get_current_user_id
     from app.endpoints import orders
     
     app.dependency_overrides[get_current_user_id] = mock_get_current_user_id
@@ -57,6 +57,10 @@ class TestHealthEndpoint:
         assert data["status"] == "healthy"
         assert data["service"] == "Order Service"
         assert "version" in data
+        assert {"hits", "negative_hits", "misses", "hit_rate"} <= data["car_cache"].keys()
+        assert {"calls", "coalesced", "in_flight"} <= data["car_lookups"].keys()
+        assert data["car_circuit_breaker"]["state"] == "closed"
+        assert {"opened", "rejected", "retry_after"} <= data["car_circuit_breaker"].keys()
 
     def test_root_endpoint(self, test_client):
         """Test GET / returns service info"""
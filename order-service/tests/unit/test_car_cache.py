@@ -0,0 +1,134 @@
+"""Unit tests for CarExistenceCache"""
+import pytest
+
+from app.services.car_cache import CarExistenceCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Fixture providing a controllable clock"""
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    """Fixture providing a small cache with distinct TTLs"""
+    return CarExistenceCache(max_size=3, positive_ttl=60.0, negative_ttl=5.0, clock=clock)
+
+
+class TestCarExistenceCacheTTL:
+    """Tests for expiry of cached results"""
+
+    def test_miss_on_empty_cache(self, cache):
+        """Test that an unknown car is a miss"""
+        assert cache.get("car-1") is None
+        assert cache.misses == 1
+        assert cache.hits == 0
+
+    def test_positive_and_negative_results_returned(self, cache):
+        """Test that both True and False are served from cache"""
+        cache.set("found", True)
+        cache.set("missing", False)
+
+        assert cache.get("found") is True
+        assert cache.get("missing") is False
+        assert cache.hits == 2
+
+    def test_negative_result_expires_before_positive(self, cache, clock):
+        """Test that negative and positive TTLs are independent"""
+        cache.set("found", True)
+        cache.set("missing", False)
+
+        clock.now += 10.0
+
+        assert cache.get("missing") is None
+        assert cache.get("found") is True
+
+        clock.now += 60.0
+
+        assert cache.get("found") is None
+
+    def test_zero_ttl_disables_caching(self, clock):
+        """Test that a TTL of 0 skips storing that kind of result"""
+        cache = CarExistenceCache(max_size=10, positive_ttl=60.0, negative_ttl=0, clock=clock)
+
+        cache.set("missing", False)
+
+        assert cache.get("missing") is None
+        assert cache.stats()["size"] == 0
+
+
+class TestCarExistenceCacheBounds:
+    """Tests for LRU eviction and invalidation"""
+
+    def test_least_recently_used_entry_evicted(self, cache):
+        """Test that the cache never grows beyond max_size"""
+        cache.set("a", True)
+        cache.set("b", True)
+        cache.set("c", True)
+        cache.get("a")  # "b" becomes least recently used
+
+        cache.set("d", True)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is True
+        assert cache.stats()["size"] == 3
+        assert cache.evictions == 1
+
+    def test_invalidate_removes_entry(self, cache):
+        """Test that invalidate drops a single car"""
+        cache.set("a", True)
+        cache.set("b", False)
+
+        cache.invalidate("a")
+        cache.invalidate("unknown")
+
+        assert cache.get("a") is None
+        assert cache.get("b") is False
+
+    def test_clear_resets_entries_and_counters(self, cache):
+        """Test that clear empties the cache and counters"""
+        cache.set("a", True)
+        cache.get("a")
+
+        cache.clear()
+
+        assert cache.stats() == {
+            "size": 0,
+            "max_size": 3,
+            "hits": 0,
+            "negative_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "hit_rate": 0.0
+        }
+
+    def test_hit_rate(self, cache):
+        """Test that hit_rate reflects hits over lookups"""
+        cache.set("a", True)
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+        cache.get("c")
+
+        assert cache.stats()["hit_rate"] == 0.5
+
+    def test_negative_hits_are_counted_separately(self, cache):
+        """Test that cached "not found" results are reported as negative hits"""
+        cache.set("a", True)
+        cache.set("b", False)
+        cache.get("a")
+        cache.get("b")
+
+        assert cache.stats()["hits"] == 2
+        assert cache.stats()["negative_hits"] == 1
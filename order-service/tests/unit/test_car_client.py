@@ -1,9 +1,11 @@
 """Unit tests for CarServiceClient"""
+import asyncio
+
 import pytest
-from unittest.mock import AsyncMock, patch, Mock
+from unittest.mock import AsyncMock, patch, Mock, ANY
 import httpx
 
-from app.services.car_client import CarServiceClient
+from app.services.car_client import CarServiceClient, CarServiceUnavailableError
 
 
 class TestCarServiceClientVerifyCarExists:
@@ -19,13 +21,13 @@ class TestCarServiceClientVerifyCarExists:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             result = await client.verify_car_exists(str(test_car_id))
 
             assert result is True
             mock_client.get.assert_called_once_with(
-                f"{client.base_url}/api/cars/{test_car_id}"
+                f"{client.base_url}/api/cars/{test_car_id}", timeout=ANY
             )
 
     @pytest.mark.asyncio
@@ -38,7 +40,7 @@ class TestCarServiceClientVerifyCarExists:
             mock_response = Mock()
             mock_response.status_code = 404
             mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             result = await client.verify_car_exists(str(test_car_id))
 
@@ -46,7 +48,7 @@ class TestCarServiceClientVerifyCarExists:
 
     @pytest.mark.asyncio
     async def test_verify_car_exists_server_error(self, test_car_id):
-        """Test car verification when car-service returns 500"""
+        """Test car verification when car-service keeps returning 500"""
         client = CarServiceClient()
 
         with patch('httpx.AsyncClient') as mock_client_class:
@@ -54,29 +56,27 @@ class TestCarServiceClientVerifyCarExists:
             mock_response = Mock()
             mock_response.status_code = 500
             mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-
-            result = await client.verify_car_exists(str(test_car_id))
+            mock_client_class.return_value = mock_client
 
-            assert result is False
+            with pytest.raises(CarServiceUnavailableError):
+                await client.verify_car_exists(str(test_car_id))
 
     @pytest.mark.asyncio
     async def test_verify_car_exists_timeout(self, test_car_id):
-        """Test car verification handles timeout gracefully"""
+        """Test that a timeout is reported as car-service unavailable"""
         client = CarServiceClient()
 
         with patch('httpx.AsyncClient') as mock_client_class:
             mock_client = AsyncMock()
             mock_client.get = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
-            result = await client.verify_car_exists(str(test_car_id))
-
-            assert result is False
+            with pytest.raises(CarServiceUnavailableError):
+                await client.verify_car_exists(str(test_car_id))
 
     @pytest.mark.asyncio
     async def test_verify_car_exists_connection_error(self, test_car_id):
-        """Test car verification handles connection errors"""
+        """Test that connection errors are reported as car-service unavailable"""
         client = CarServiceClient()
 
         with patch('httpx.AsyncClient') as mock_client_class:
@@ -84,15 +84,14 @@ class TestCarServiceClientVerifyCarExists:
             mock_client.get = AsyncMock(
                 side_effect=httpx.ConnectError("Connection refused")
             )
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-
-            result = await client.verify_car_exists(str(test_car_id))
+            mock_client_class.return_value = mock_client
 
-            assert result is False
+            with pytest.raises(CarServiceUnavailableError):
+                await client.verify_car_exists(str(test_car_id))
 
     @pytest.mark.asyncio
     async def test_verify_car_exists_generic_request_error(self, test_car_id):
-        """Test car verification handles generic request errors"""
+        """Test that generic request errors are reported as car-service unavailable"""
         client = CarServiceClient()
 
         with patch('httpx.AsyncClient') as mock_client_class:
@@ -100,15 +99,14 @@ class TestCarServiceClientVerifyCarExists:
             mock_client.get = AsyncMock(
                 side_effect=httpx.RequestError("Network error")
             )
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-
-            result = await client.verify_car_exists(str(test_car_id))
+            mock_client_class.return_value = mock_client
 
-            assert result is False
+            with pytest.raises(CarServiceUnavailableError):
+                await client.verify_car_exists(str(test_car_id))
 
     @pytest.mark.asyncio
     async def test_verify_car_exists_unexpected_exception(self, test_car_id):
-        """Test car verification handles unexpected exceptions"""
+        """Test that unexpected exceptions are reported as car-service unavailable"""
         client = CarServiceClient()
 
         with patch('httpx.AsyncClient') as mock_client_class:
@@ -116,11 +114,10 @@ class TestCarServiceClientVerifyCarExists:
             mock_client.get = AsyncMock(
                 side_effect=Exception("Unexpected error")
             )
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-
-            result = await client.verify_car_exists(str(test_car_id))
+            mock_client_class.return_value = mock_client
 
-            assert result is False
+            with pytest.raises(CarServiceUnavailableError):
+                await client.verify_car_exists(str(test_car_id))
 
     @pytest.mark.asyncio
     async def test_verify_car_exists_uses_correct_url(self, test_car_id):
@@ -133,12 +130,12 @@ class TestCarServiceClientVerifyCarExists:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             await client.verify_car_exists(str(test_car_id))
 
             expected_url = f"http://test-car-service:8002/api/cars/{test_car_id}"
-            mock_client.get.assert_called_once_with(expected_url)
+            mock_client.get.assert_called_once_with(expected_url, timeout=ANY)
 
     @pytest.mark.asyncio
     async def test_verify_car_exists_uses_correct_timeout(self, test_car_id):
@@ -150,12 +147,13 @@ class TestCarServiceClientVerifyCarExists:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             await client.verify_car_exists(str(test_car_id))
 
             # Verify timeout was passed to AsyncClient
-            mock_client_class.assert_called_once_with(timeout=client.timeout)
+            mock_client_class.assert_called_once()
+            assert mock_client_class.call_args.kwargs["timeout"] == client.timeout
 
 
 class TestCarServiceClientGetCarDetails:
@@ -178,13 +176,13 @@ class TestCarServiceClientGetCarDetails:
             mock_response.status_code = 200
             mock_response.json.return_value = expected_data
             mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             result = await client.get_car_details(str(test_car_id))
 
             assert result == expected_data
             mock_client.get.assert_called_once_with(
-                f"{client.base_url}/api/cars/{test_car_id}"
+                f"{client.base_url}/api/cars/{test_car_id}", timeout=ANY
             )
 
     @pytest.mark.asyncio
@@ -197,7 +195,7 @@ class TestCarServiceClientGetCarDetails:
             mock_response = Mock()
             mock_response.status_code = 404
             mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             result = await client.get_car_details(str(test_car_id))
 
@@ -213,7 +211,7 @@ class TestCarServiceClientGetCarDetails:
             mock_response = Mock()
             mock_response.status_code = 500
             mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             result = await client.get_car_details(str(test_car_id))
 
@@ -229,7 +227,7 @@ class TestCarServiceClientGetCarDetails:
             mock_client.get = AsyncMock(
                 side_effect=Exception("Network error")
             )
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             result = await client.get_car_details(str(test_car_id))
 
@@ -253,3 +251,306 @@ class TestCarServiceClientConfiguration:
         client = CarServiceClient()
 
         assert client.base_url == settings.CAR_SERVICE_URL
+
+
+class TestCarServiceClientConnectionPool:
+    """Tests for the shared pooled HTTP client"""
+
+    @pytest.mark.asyncio
+    async def test_http_client_reused_across_calls(self, test_car_id):
+        """Test that consecutive calls share one AsyncClient"""
+        client = CarServiceClient()
+
+        with patch('httpx.AsyncClient') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {"car_id": str(test_car_id)}
+            mock_client.get = AsyncMock(return_value=mock_response)
+            mock_client_class.return_value = mock_client
+
+            await client.verify_car_exists(str(test_car_id))
+            await client.verify_car_exists("other-car")
+            await client.get_car_details(str(test_car_id))
+
+            mock_client_class.assert_called_once()
+            assert mock_client.get.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_client_uses_pool_limits_from_settings(self):
+        """Test that pool limits and HTTP/2 flag come from settings"""
+        from app.config import settings
+
+        client = CarServiceClient()
+
+        with patch('httpx.AsyncClient') as mock_client_class:
+            await client.start()
+
+            kwargs = mock_client_class.call_args.kwargs
+            assert kwargs["limits"].max_connections == settings.CAR_SERVICE_MAX_CONNECTIONS
+            assert kwargs["limits"].max_keepalive_connections == settings.CAR_SERVICE_MAX_KEEPALIVE_CONNECTIONS
+            assert kwargs["limits"].keepalive_expiry == settings.CAR_SERVICE_KEEPALIVE_EXPIRY
+            assert kwargs["http2"] is settings.CAR_SERVICE_HTTP2
+
+    @pytest.mark.asyncio
+    async def test_http2_falls_back_without_h2(self, monkeypatch):
+        """Test that HTTP/2 is disabled when the h2 package is missing"""
+        import sys
+        from app.config import settings
+
+        monkeypatch.setattr(settings, "CAR_SERVICE_HTTP2", True)
+        monkeypatch.setitem(sys.modules, "h2", None)
+        client = CarServiceClient()
+
+        with patch('httpx.AsyncClient') as mock_client_class:
+            await client.start()
+
+            assert mock_client_class.call_args.kwargs["http2"] is False
+
+    @pytest.mark.asyncio
+    async def test_start_and_close_lifecycle(self):
+        """Test that close() releases the pool and start() is idempotent"""
+        client = CarServiceClient()
+
+        with patch('httpx.AsyncClient') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            await client.start()
+            await client.start()
+            await client.close()
+            await client.close()
+
+            mock_client_class.assert_called_once()
+            mock_client.aclose.assert_awaited_once()
+            assert client._http_client is None
+
+    @pytest.mark.asyncio
+    async def test_real_client_has_keepalive_pool(self):
+        """Test that the real pooled client is built with configured limits"""
+        client = CarServiceClient()
+
+        await client.start()
+        try:
+            assert isinstance(client.http_client, httpx.AsyncClient)
+            assert client.http_client.timeout.read == client.timeout
+        finally:
+            await client.close()
+
+
+class TestCarServiceClientCache:
+    """Tests for caching of car existence results"""
+
+    @staticmethod
+    def _client_returning(status_code: int):
+        client = CarServiceClient()
+        mock_http = AsyncMock()
+        mock_response = Mock()
+        mock_response.status_code = status_code
+        mock_response.json.return_value = {}
+        mock_http.get = AsyncMock(return_value=mock_response)
+        client._http_client = mock_http
+        return client, mock_http
+
+    @pytest.mark.asyncio
+    async def test_positive_result_is_cached(self, test_car_id):
+        """Test that a found car is not re-checked within the TTL"""
+        client, mock_http = self._client_returning(200)
+
+        assert await client.verify_car_exists(str(test_car_id)) is True
+        assert await client.verify_car_exists(str(test_car_id)) is True
+
+        assert mock_http.get.await_count == 1
+        assert client.cache.hits == 1
+        assert client.cache.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_negative_result_is_cached(self, test_car_id):
+        """Test that a 404 is cached as a negative result"""
+        client, mock_http = self._client_returning(404)
+
+        assert await client.verify_car_exists(str(test_car_id)) is False
+        assert await client.verify_car_exists(str(test_car_id)) is False
+
+        assert mock_http.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, test_car_id):
+        """Test that server errors always go back to car-service"""
+        client, mock_http = self._client_returning(500)
+        client.max_retries = 0
+
+        for _ in range(2):
+            with pytest.raises(CarServiceUnavailableError):
+                await client.verify_car_exists(str(test_car_id))
+
+        assert mock_http.get.await_count == 2
+        assert client.cache.stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_get_car_details_populates_cache(self, test_car_id):
+        """Test that fetching details records existence"""
+        client, mock_http = self._client_returning(200)
+
+        await client.get_car_details(str(test_car_id))
+
+        assert await client.verify_car_exists(str(test_car_id)) is True
+        assert mock_http.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_car_forces_refetch(self, test_car_id):
+        """Test that invalidate_car drops the cached result"""
+        client, mock_http = self._client_returning(404)
+        await client.verify_car_exists(str(test_car_id))
+
+        client.invalidate_car(str(test_car_id))
+        mock_http.get.return_value.status_code = 200
+
+        assert await client.verify_car_exists(str(test_car_id)) is True
+        assert mock_http.get.await_count == 2
+
+
+class TestCarServiceClientCoalescing:
+    """Tests for request coalescing of concurrent lookups"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_request(self, test_car_id):
+        """Test that concurrent verify/details calls for one car make one request"""
+        client = CarServiceClient()
+        release = asyncio.Event()
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"car_id": str(test_car_id)}
+
+        async def slow_get(url, **kwargs):
+            await release.wait()
+            return mock_response
+
+        mock_http = AsyncMock()
+        mock_http.get = AsyncMock(side_effect=slow_get)
+        client._http_client = mock_http
+
+        callers = [
+            asyncio.create_task(client.verify_car_exists(str(test_car_id)))
+            for _ in range(10)
+        ]
+        callers.append(asyncio.create_task(client.get_car_details(str(test_car_id))))
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*callers)
+
+        assert results[:10] == [True] * 10
+        assert results[10] == {"car_id": str(test_car_id)}
+        assert mock_http.get.await_count == 1
+        assert client.single_flight.coalesced == 10
+
+    @pytest.mark.asyncio
+    async def test_coalesced_failure_raises_for_all(self, test_car_id):
+        """Test that a shared timeout is reported to every caller"""
+        client = CarServiceClient()
+        client.max_retries = 0
+        mock_http = AsyncMock()
+        mock_http.get = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
+        client._http_client = mock_http
+
+        results = await asyncio.gather(
+            *(client.verify_car_exists(str(test_car_id)) for _ in range(3)),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(result, CarServiceUnavailableError) for result in results)
+        assert mock_http.get.await_count == 1
+
+
+class TestCarServiceClientResilience:
+    """Tests for retries, deadlines and the circuit breaker"""
+
+    @staticmethod
+    def _client_with_responses(*outcomes):
+        """Build a client whose HTTP GETs return/raise the given outcomes in order"""
+        client = CarServiceClient()
+        client.retry_backoff = 0.001
+        client.retry_backoff_max = 0.001
+        side_effect = []
+        for outcome in outcomes:
+            if isinstance(outcome, int):
+                response = Mock()
+                response.status_code = outcome
+                side_effect.append(response)
+            else:
+                side_effect.append(outcome)
+        mock_http = AsyncMock()
+        mock_http.get = AsyncMock(side_effect=side_effect)
+        client._http_client = mock_http
+        return client, mock_http
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_retried(self, test_car_id):
+        """Test that a 503 followed by 200 succeeds within the retry budget"""
+        client, mock_http = self._client_with_responses(503, httpx.ConnectError("refused"), 200)
+
+        assert await client.verify_car_exists(str(test_car_id)) is True
+        assert mock_http.get.await_count == 3
+        assert client.breaker.state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_retries_are_bounded(self, test_car_id):
+        """Test that at most max_retries + 1 attempts are made"""
+        client, mock_http = self._client_with_responses(*[500] * 10)
+
+        with pytest.raises(CarServiceUnavailableError):
+            await client.verify_car_exists(str(test_car_id))
+
+        assert mock_http.get.await_count == client.max_retries + 1
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self, test_car_id):
+        """Test that a 4xx answer is returned without retrying"""
+        client, mock_http = self._client_with_responses(400, 200)
+
+        assert await client.verify_car_exists(str(test_car_id)) is False
+        assert mock_http.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_attempt_timeout_limited_by_deadline(self, test_car_id):
+        """Test that each attempt's timeout never exceeds the remaining budget"""
+        client, mock_http = self._client_with_responses(200)
+
+        await client.verify_car_exists(str(test_car_id), timeout=0.5)
+
+        assert mock_http.get.call_args.kwargs["timeout"] <= 0.5
+
+    @pytest.mark.asyncio
+    async def test_exhausted_deadline_fails_without_request(self, test_car_id):
+        """Test that a zero budget fails fast"""
+        client, mock_http = self._client_with_responses(200)
+
+        with pytest.raises(CarServiceUnavailableError, match="Deadline"):
+            await client.verify_car_exists(str(test_car_id), timeout=0)
+
+        mock_http.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_fails_fast(self, test_car_id):
+        """Test that once the breaker opens no further requests are sent"""
+        client, mock_http = self._client_with_responses(*[500] * 20)
+        client.max_retries = 0
+
+        for _ in range(client.breaker.failure_threshold):
+            with pytest.raises(CarServiceUnavailableError):
+                await client.verify_car_exists(str(test_car_id))
+        sent = mock_http.get.await_count
+
+        with pytest.raises(CarServiceUnavailableError) as exc_info:
+            await client.verify_car_exists(str(test_car_id))
+
+        assert client.breaker.state == "open"
+        assert mock_http.get.await_count == sent
+        assert exc_info.value.retry_after > 0
+
+    @pytest.mark.asyncio
+    async def test_get_car_details_returns_none_when_unavailable(self, test_car_id):
+        """Test that get_car_details keeps returning None on failures"""
+        client, mock_http = self._client_with_responses(*[500] * 5)
+
+        assert await client.get_car_details(str(test_car_id)) is None
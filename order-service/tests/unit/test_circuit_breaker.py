@@ -0,0 +1,129 @@
+"""Unit tests for CircuitBreaker"""
+import pytest
+
+from app.services.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Fixture providing a controllable clock"""
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    """Fixture providing a breaker that opens after 3 failures"""
+    return CircuitBreaker("test", failure_threshold=3, recovery_timeout=10.0, clock=clock)
+
+
+def _trip(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.allow_request()
+        breaker.record_failure()
+
+
+class TestCircuitBreakerClosed:
+    """Tests for the closed state"""
+
+    def test_starts_closed(self, breaker):
+        """Test that a new breaker lets requests through"""
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request() is True
+        assert breaker.retry_after() == 0.0
+
+    def test_opens_after_consecutive_failures(self, breaker):
+        """Test that failure_threshold consecutive failures open the breaker"""
+        _trip(breaker)
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.opened == 1
+
+    def test_success_resets_failure_count(self, breaker):
+        """Test that failures must be consecutive"""
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+
+class TestCircuitBreakerOpenAndHalfOpen:
+    """Tests for fail-fast and half-open probing"""
+
+    def test_open_rejects_requests(self, breaker, clock):
+        """Test that requests fail fast while open"""
+        _trip(breaker)
+        clock.now += 5.0
+
+        assert breaker.allow_request() is False
+        assert breaker.rejected == 1
+        assert breaker.retry_after() == pytest.approx(5.0)
+
+    def test_stats_report_state_and_counters(self, breaker, clock):
+        """Test that stats() exposes what /health reports for the breaker"""
+        _trip(breaker)
+        clock.now += 4.0
+        breaker.allow_request()
+
+        assert breaker.stats() == {
+            "state": CircuitBreaker.OPEN,
+            "consecutive_failures": 3,
+            "opened": 1,
+            "rejected": 1,
+            "retry_after": 6.0
+        }
+
+    def test_single_probe_after_recovery_timeout(self, breaker, clock):
+        """Test that only one probe is allowed in half-open state"""
+        _trip(breaker)
+        clock.now += 10.0
+
+        assert breaker.allow_request() is True
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request() is False
+
+    def test_successful_probe_closes(self, breaker, clock):
+        """Test that a successful probe closes the breaker"""
+        _trip(breaker)
+        clock.now += 10.0
+        breaker.allow_request()
+
+        breaker.record_success()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request() is True
+
+    def test_failed_probe_reopens(self, breaker, clock):
+        """Test that a failed probe reopens the breaker for another timeout"""
+        _trip(breaker)
+        clock.now += 10.0
+        breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.allow_request() is False
+        assert breaker.opened == 2
+
+    def test_lost_probe_allows_new_probe(self, breaker, clock):
+        """Test that a probe that never reports back does not wedge the breaker"""
+        _trip(breaker)
+        clock.now += 10.0
+        breaker.allow_request()
+
+        clock.now += 10.0
+
+        assert breaker.allow_request() is True
+        assert breaker.state == CircuitBreaker.HALF_OPEN
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock
 from fastapi import HTTPException
 
 from app.services.order_service import OrderService
+from app.services.car_client import CarServiceUnavailableError
 from app.models.order import CreateOrderRequest, ReviewRequest
 
 
@@ -82,9 +83,9 @@ class TestOrderServiceCreateOrder:
         mock_car_client,
         sample_order_data
     ):
-        """Test order creation fails gracefully when car-service is unavailable"""
-        # Setup mocks - car_client returns False on error
-        mock_car_client.verify_car_exists.return_value = False
+        """Test order creation fails with 503 when car-service is unavailable"""
+        # Setup mocks - car_client raises when car-service cannot answer
+        mock_car_client.verify_car_exists.side_effect = CarServiceUnavailableError("timeout")
 
         # Create service with mocked dependencies
         service = OrderService()
@@ -98,9 +99,33 @@ class TestOrderServiceCreateOrder:
         with pytest.raises(HTTPException) as exc_info:
             await service.create_order(request)
 
-        assert exc_info.value.status_code == 404
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.detail == "Car service unavailable"
+        assert exc_info.value.headers is None
         mock_repository.create_order.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_create_order_circuit_open_sets_retry_after(
+        self,
+        mock_repository,
+        mock_car_client,
+        sample_order_data
+    ):
+        """Test that an open circuit breaker yields 503 with Retry-After"""
+        mock_car_client.verify_car_exists.side_effect = CarServiceUnavailableError(
+            "car-service circuit breaker is open", retry_after=4.2
+        )
+
+        service = OrderService()
+        service.repository = mock_repository
+        service.car_client = mock_car_client
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.create_order(CreateOrderRequest(**sample_order_data))
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers == {"Retry-After": "5"}
+
 
 class TestOrderServiceUpdateOrderStatus:
     """Tests for update_order_status method"""
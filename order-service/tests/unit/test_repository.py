@@ -3,6 +3,8 @@ import pytest
 from datetime import datetime
 from uuid import UUID
 
+from detailing_persistence import DurableStore
+
 from app.repositories.local_order_repo import LocalOrderRepository
 from app.models.order import Order, Review
 
@@ -319,3 +321,35 @@ class TestLocalOrderRepositoryDataPersistence:
 
         assert retrieved_review.review_id == review.review_id
         assert retrieved_review.order_id == order.order_id
+
+
+class TestLocalOrderRepositoryJournal:
+    """Tests for journaling orders and reviews to a DurableStore"""
+
+    @pytest.mark.asyncio
+    async def test_orders_statuses_and_reviews_are_recovered(
+        self, fresh_repository, test_car_id, test_datetime, tmp_path
+    ):
+        """Test that a restarted repository sees the latest status and the review"""
+        store = DurableStore(str(tmp_path), "orders")
+        store.recover(fresh_repository.apply_record)
+        fresh_repository.journal = store
+        order = await fresh_repository.create_order(
+            car_id=test_car_id, appointment_time=test_datetime, description="Oil change"
+        )
+        await fresh_repository.update_order_status(order.order_id, "completed")
+        await fresh_repository.create_review(order_id=order.order_id, rating=5, comment="Great!")
+        store.close()
+
+        recovered = LocalOrderRepository()
+        reopened = DurableStore(str(tmp_path), "orders")
+        stats = reopened.recover(recovered.apply_record)
+        reopened.close()
+
+        restored = await recovered.get_order_by_id(order.order_id)
+        assert stats.wal_records == 3
+        assert vars(restored) == vars(order)
+        assert restored.status == "completed"
+        review = await recovered.get_review_by_order_id(order.order_id)
+        assert review.rating == 5
+        assert isinstance(review.created_at, datetime)
@@ -0,0 +1,104 @@
+"""Unit tests for SingleFlight request coalescing"""
+import asyncio
+
+import pytest
+
+from app.services.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight.do"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """Test that concurrent callers with the same key run fn once"""
+        group = SingleFlight()
+        release = asyncio.Event()
+        executions = 0
+
+        async def fetch():
+            nonlocal executions
+            executions += 1
+            await release.wait()
+            return "car"
+
+        callers = [asyncio.create_task(group.do("car-1", fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*callers)
+
+        assert results == ["car"] * 5
+        assert executions == 1
+        assert group.stats() == {"calls": 5, "coalesced": 4, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_different_keys_are_not_coalesced(self):
+        """Test that calls for different keys run independently"""
+        group = SingleFlight()
+
+        async def fetch(value):
+            await asyncio.sleep(0)
+            return value
+
+        results = await asyncio.gather(
+            group.do("a", lambda: fetch("a")),
+            group.do("b", lambda: fetch("b"))
+        )
+
+        assert results == ["a", "b"]
+        assert group.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_coalesced(self):
+        """Test that a finished call is not reused by later callers"""
+        group = SingleFlight()
+        executions = 0
+
+        async def fetch():
+            nonlocal executions
+            executions += 1
+            return executions
+
+        assert await group.do("car-1", fetch) == 1
+        assert await group.do("car-1", fetch) == 2
+        assert group.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates_to_all_callers(self):
+        """Test that every waiting caller receives the shared exception"""
+        group = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            raise ConnectionError("car-service down")
+
+        callers = [asyncio.create_task(group.do("car-1", fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*callers, return_exceptions=True)
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert group.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        """Test that cancelling the first caller leaves followers unaffected"""
+        group = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "car"
+
+        leader = asyncio.create_task(group.do("car-1", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(group.do("car-1", fetch))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        release.set()
+
+        assert await follower == "car"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
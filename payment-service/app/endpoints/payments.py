@@ -11,7 +11,8 @@ from app.models import (
     PaymentStatusResponse,
 )
 from app.services import payment_service
-from app.auth import get_current_user_id
+from app.services.payment_processor import PaymentQueueFullError
+from detailing_auth import get_current_user_id
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +41,8 @@ async def create_payment(
         Данные созданного платежа
 
     Raises:
-        HTTPException: 404 если заказ не найден, 409 если заказ уже оплачен
+        HTTPException: 404 если заказ не найден, 409 если заказ уже оплачен,
+            429 если очередь обработки платежей заполнена
     """
     try:
         # Используем user_id из JWT токена и amount из запроса (или дефолт)
@@ -60,6 +62,14 @@ async def create_payment(
             confirmation_url=payment["confirmation_url"]
         )
 
+    except PaymentQueueFullError as e:
+        logger.warning(f"Payment rejected, processing queue is full: {request.order_id}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
+
     except ValueError as e:
         error_msg = str(e)
 
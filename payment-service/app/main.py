@@ -4,10 +4,14 @@ import logging
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+from detailing_observability import setup_load_shedding, setup_metrics, setup_profiling
+from detailing_persistence import setup_persistence
 
 from app.config import settings
 from app.endpoints import router as payments_router
-from app.services import rabbitmq_publisher
+from app.repositories.local_payment_repo import payment_repository
+from app.services import payment_service, rabbitmq_publisher
 
 # Настройка логирования
 logging.basicConfig(
@@ -23,7 +27,8 @@ app = FastAPI(
     description="Микросервис обработки платежей с RabbitMQ Publisher",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse if settings.fast_json_responses else JSONResponse
 )
 
 # CORS middleware
@@ -35,6 +40,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Сброс нагрузки (503) при задержке event loop или избытке запросов в обработке
+setup_load_shedding(app)
+
+# Метрики запросов и эндпоинт /metrics
+setup_metrics(app)
+
+# Профилировщик /debug/profile (только при PROFILING_ENABLED=true)
+setup_profiling(app)
+
+# Снимок + журнал упреждающей записи платежей (только при заданном PERSISTENCE_DIR)
+setup_persistence(app, "payments", payment_repository)
+
 # Подключение роутеров
 app.include_router(payments_router)
 
@@ -50,7 +67,8 @@ async def health_check():
     return {
         "status": "healthy",
         "service": settings.service_name,
-        "rabbitmq_connected": rabbitmq_publisher.connection is not None
+        "rabbitmq_connected": rabbitmq_publisher.connection is not None,
+        "payment_processing": payment_service.processor.stats()
     }
 
 
@@ -71,6 +89,8 @@ async def startup_event():
         # В продакшене здесь можно решить, завершать ли приложение
         # raise
 
+    await payment_service.start_processing()
+
     logger.info(f"{settings.service_name} started successfully on port {settings.port}")
 
 
@@ -79,10 +99,13 @@ async def shutdown_event():
     """
     Выполняется при остановке приложения.
 
-    Закрывает соединение с RabbitMQ.
+    Дожидается обработки принятых платежей (пока RabbitMQ еще доступен
+    для публикации событий) и закрывает соединение с RabbitMQ.
     """
     logger.info(f"Shutting down {settings.service_name}...")
 
+    await payment_service.stop_processing(timeout=settings.payment_shutdown_timeout)
+
     try:
         await rabbitmq_publisher.close()
         logger.info("RabbitMQ connection closed")
@@ -1,15 +1,31 @@
 """Repository для работы с платежами (in-memory storage)."""
 
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from detailing_persistence import DurableStore
 
 
 class PaymentRepository:
-    """Репозиторий для управления платежами в памяти."""
+    """
+    Репозиторий для управления платежами в памяти.
+
+    Помимо списка платежей поддерживает индексы по payment_id и order_id
+    и множество оплаченных заказов, поэтому поиск платежа, смена статуса
+    и проверка оплаты заказа выполняются за O(1) и не зависят от объема
+    истории платежей.
+
+    Если задан ``journal``, после создания платежа и каждой смены статуса
+    в него дописывается полное состояние платежа.
+    """
 
     def __init__(self):
         """Инициализация хранилища."""
-        self.payments_storage: List[Dict] = []
+        self._payments_by_id: Dict[str, Dict] = {}
+        self._payments_by_order: Dict[str, List[Dict]] = {}
+        self._paid_orders: Set[str] = set()
+        self.payments_storage = []
+        self.journal: Optional[DurableStore] = None
 
         # Заглушка для данных заказов (для проверки существования)
         self.orders_mock: Dict[str, Dict] = {
@@ -23,6 +39,35 @@ class PaymentRepository:
             }
         }
 
+    @property
+    def payments_storage(self) -> List[Dict]:
+        """Все платежи в порядке создания."""
+        return self._payments_storage
+
+    @payments_storage.setter
+    def payments_storage(self, payments: List[Dict]) -> None:
+        """Заменить хранилище целиком и перестроить индексы."""
+        self._payments_storage = payments
+        self._payments_by_id.clear()
+        self._payments_by_order.clear()
+        self._paid_orders.clear()
+        for payment in payments:
+            self._index_payment(payment)
+
+    def _index_payment(self, payment: Dict) -> None:
+        """Добавить платеж в индексы."""
+        # При повторяющемся payment_id действует первый платеж
+        self._payments_by_id.setdefault(payment.get("payment_id"), payment)
+        order_id = payment.get("order_id")
+        self._payments_by_order.setdefault(order_id, []).append(payment)
+        if payment.get("status") == "succeeded":
+            self._paid_orders.add(order_id)
+
+    def _log_payment(self, payment: Dict) -> None:
+        """Дописать состояние платежа в журнал, если он задан."""
+        if self.journal is not None:
+            self.journal.append({"type": "payment", "payment": dict(payment)})
+
     def create_payment(self, payment_data: Dict) -> Dict:
         """
         Создать новый платеж.
@@ -33,7 +78,9 @@ class PaymentRepository:
         Returns:
             Созданный платеж
         """
-        self.payments_storage.append(payment_data)
+        self._payments_storage.append(payment_data)
+        self._index_payment(payment_data)
+        self._log_payment(payment_data)
         return payment_data
 
     def get_payment_by_id(self, payment_id: str) -> Optional[Dict]:
@@ -46,10 +93,7 @@ class PaymentRepository:
         Returns:
             Данные платежа или None
         """
-        for payment in self.payments_storage:
-            if payment["payment_id"] == payment_id:
-                return payment
-        return None
+        return self._payments_by_id.get(payment_id)
 
     def update_payment_status(
         self,
@@ -68,13 +112,24 @@ class PaymentRepository:
         Returns:
             True если успешно, False если платеж не найден
         """
-        for payment in self.payments_storage:
-            if payment["payment_id"] == payment_id:
-                payment["status"] = new_status
-                if paid_at:
-                    payment["paid_at"] = paid_at
-                return True
-        return False
+        payment = self._payments_by_id.get(payment_id)
+        if payment is None:
+            return False
+
+        old_status = payment.get("status")
+        payment["status"] = new_status
+        if paid_at:
+            payment["paid_at"] = paid_at
+
+        order_id = payment.get("order_id")
+        if new_status == "succeeded":
+            self._paid_orders.add(order_id)
+        elif old_status == "succeeded":
+            # Заказ остается оплаченным, только если есть другой успешный платеж
+            if not any(p.get("status") == "succeeded" for p in self._payments_by_order.get(order_id, [])):
+                self._paid_orders.discard(order_id)
+        self._log_payment(payment)
+        return True
 
     def check_order_paid(self, order_id: str) -> bool:
         """
@@ -86,10 +141,19 @@ class PaymentRepository:
         Returns:
             True если заказ уже оплачен
         """
-        for payment in self.payments_storage:
-            if payment["order_id"] == order_id and payment["status"] == "succeeded":
-                return True
-        return False
+        return order_id in self._paid_orders
+
+    def get_payments_by_order(self, order_id: str) -> List[Dict]:
+        """
+        Получить все платежи заказа.
+
+        Args:
+            order_id: Идентификатор заказа
+
+        Returns:
+            Список платежей заказа в порядке создания
+        """
+        return list(self._payments_by_order.get(order_id, []))
 
     def get_order_data(self, order_id: str) -> Optional[Dict]:
         """
@@ -103,6 +167,38 @@ class PaymentRepository:
         """
         return self.orders_mock.get(order_id)
 
+    def apply_record(self, record: Dict[str, Any]) -> None:
+        """
+        Применить запись журнала при восстановлении.
+
+        Args:
+            record: Запись журнала с полным состоянием платежа
+
+        Raises:
+            ValueError: Неизвестный тип записи
+        """
+        if record["type"] != "payment":
+            raise ValueError(f"Unknown record type: {record['type']!r}")
+        payment = dict(record["payment"])
+        for field in ("created_at", "paid_at"):
+            if payment.get(field):
+                payment[field] = datetime.fromisoformat(payment[field])
+
+        if payment["payment_id"] in self._payments_by_id:
+            self.update_payment_status(payment["payment_id"], payment["status"], payment.get("paid_at"))
+        else:
+            self.create_payment(payment)
+
+    def snapshot_records(self) -> Iterable[Dict[str, Any]]:
+        """
+        Записи, из которых восстанавливаются все платежи.
+
+        Returns:
+            Записи журнала в порядке создания платежей
+        """
+        payments = [dict(payment) for payment in self._payments_storage]
+        return ({"type": "payment", "payment": payment} for payment in payments)
+
 
 # Singleton instance
 payment_repository = PaymentRepository()
@@ -0,0 +1,166 @@
+"""Ограниченный пул воркеров для фоновой обработки платежей."""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PaymentQueueFullError(Exception):
+    """Очередь обработки платежей заполнена."""
+
+
+class PaymentProcessor:
+    """
+    Очередь фиксированного размера и фиксированное число воркеров.
+
+    Задачи передаются в handler как именованные аргументы. Если очередь
+    заполнена, submit() сразу отклоняет задачу (backpressure), вместо того
+    чтобы порождать неограниченное число asyncio-задач. Воркеры запускаются
+    start() (или лениво при первом submit() в текущем event loop), а
+    shutdown() дожидается обработки уже принятых платежей.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[..., Awaitable[Any]],
+        workers: int,
+        max_queue_size: int
+    ):
+        """
+        Инициализация пула.
+
+        Args:
+            handler: Корутина обработки одного платежа
+            workers: Количество параллельных воркеров
+            max_queue_size: Максимальное число платежей, ожидающих обработки
+        """
+        self.handler = handler
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._accepting = True
+        self.in_flight = 0
+        self.processed = 0
+        self.failed = 0
+        self.rejected = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Запущены ли воркеры в текущем event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return self._loop is loop and bool(self._worker_tasks)
+
+    def start(self) -> None:
+        """Запустить воркеры в текущем event loop (повторный вызов ничего не делает)."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._accepting = True
+        self.in_flight = 0
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(), name=f"payment-worker-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(f"Payment processor started: workers={self.workers}, queue_size={self.max_queue_size}")
+
+    def check_capacity(self) -> None:
+        """
+        Убедиться, что следующая задача будет принята.
+
+        Raises:
+            PaymentQueueFullError: Если очередь заполнена или пул останавливается
+        """
+        if not self.running:
+            return
+        if not self._accepting:
+            self.rejected += 1
+            raise PaymentQueueFullError("Payment processor is shutting down")
+        if self._queue.full():
+            self.rejected += 1
+            raise PaymentQueueFullError("Payment processing queue is full")
+
+    def submit(self, **job: Any) -> None:
+        """
+        Поставить платеж в очередь обработки.
+
+        Args:
+            **job: Аргументы для handler
+
+        Raises:
+            PaymentQueueFullError: Если очередь заполнена или пул останавливается
+        """
+        self.check_capacity()
+        self.start()
+        self._queue.put_nowait((time.monotonic(), job))
+
+    async def _worker(self) -> None:
+        """Обрабатывать задачи из очереди до отмены."""
+        while True:
+            enqueued_at, job = await self._queue.get()
+            self.in_flight += 1
+            try:
+                await self.handler(**job)
+                self.processed += 1
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Payment processing job failed: {e}")
+            finally:
+                self.in_flight -= 1
+                latency = time.monotonic() - enqueued_at
+                self._latency_total += latency
+                self._latency_max = max(self._latency_max, latency)
+                self._queue.task_done()
+
+    async def shutdown(self, timeout: float) -> None:
+        """
+        Перестать принимать платежи и дождаться обработки очереди.
+
+        Args:
+            timeout: Максимальное время ожидания в секундах; по истечении
+                оставшиеся задачи отменяются
+        """
+        self._accepting = False
+        if not self.running:
+            return
+
+        pending = self._queue.qsize() + self.in_flight
+        logger.info(f"Draining payment processor: {pending} payments pending")
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.error(
+                f"Payment processor drain timed out after {timeout}s, "
+                f"{self._queue.qsize() + self.in_flight} payments left unprocessed"
+            )
+
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        logger.info("Payment processor stopped")
+
+    def stats(self) -> Dict[str, Any]:
+        """Метрики очереди и времени обработки."""
+        completed = self.processed + self.failed
+        return {
+            "workers": self.workers,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "queue_capacity": self.max_queue_size,
+            "in_flight": self.in_flight,
+            "processed": self.processed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "avg_latency_seconds": self._latency_total / completed if completed else 0.0,
+            "max_latency_seconds": self._latency_max
+        }
@@ -6,7 +6,9 @@ import uuid
 from datetime import datetime
 from typing import Dict, Optional
 
+from app.config import settings
 from app.repositories import payment_repository
+from app.services.payment_processor import PaymentProcessor
 from app.services.rabbitmq_publisher import rabbitmq_publisher
 
 logger = logging.getLogger(__name__)
@@ -18,6 +20,24 @@ class PaymentService:
     def __init__(self):
         """Инициализация сервиса."""
         self.repository = payment_repository
+        self.processor = PaymentProcessor(
+            handler=self._process_payment_async,
+            workers=settings.payment_workers,
+            max_queue_size=settings.payment_queue_size
+        )
+
+    async def start_processing(self) -> None:
+        """Запустить воркеры обработки платежей."""
+        self.processor.start()
+
+    async def stop_processing(self, timeout: float) -> None:
+        """
+        Дождаться обработки принятых платежей и остановить воркеры.
+
+        Args:
+            timeout: Максимальное время ожидания в секундах
+        """
+        await self.processor.shutdown(timeout)
 
     async def initiate_payment(self, order_id: str, payment_method: str, user_id: str, amount: float = 5000.0) -> Dict:
         """
@@ -34,11 +54,15 @@ class PaymentService:
 
         Raises:
             ValueError: Если заказ уже оплачен
+            PaymentQueueFullError: Если очередь обработки заполнена
         """
         # Проверяем, не оплачен ли уже заказ
         if self.repository.check_order_paid(order_id):
             raise ValueError(f"Order {order_id} already paid")
 
+        # Не создаем платеж, который некому будет обработать
+        self.processor.check_capacity()
+
         # Генерируем уникальный ID платежа
         payment_id = f"pay_{uuid.uuid4().hex[:8]}"
 
@@ -61,14 +85,12 @@ class PaymentService:
 
         logger.info(f"Payment {payment_id} created for order {order_id} with status 'pending'")
 
-        # Запускаем фоновую задачу для обработки платежа
-        asyncio.create_task(
-            self._process_payment_async(
-                payment_id=payment_id,
-                order_id=order_id,
-                user_id=user_id,
-                amount=amount
-            )
+        # Ставим платеж в очередь фоновой обработки
+        self.processor.submit(
+            payment_id=payment_id,
+            order_id=order_id,
+            user_id=user_id,
+            amount=amount
         )
 
         return created_payment
@@ -83,7 +105,8 @@ class PaymentService:
         """
         Фоновая задача для обработки платежа.
 
-        Симулирует обработку платежа (5 секунд), затем:
+        Симулирует обработку платежа (settings.payment_processing_delay,
+        по умолчанию 5 секунд), затем:
         1. Обновляет статус платежа на "succeeded"
         2. Публикует событие в RabbitMQ
 
@@ -97,7 +120,7 @@ class PaymentService:
             logger.info(f"Starting async payment processing for payment_id={payment_id}")
 
             # Симуляция обработки платежа (проверка карты, связь с банком и т.д.)
-            await asyncio.sleep(5)
+            await asyncio.sleep(settings.payment_processing_delay)
 
             # Обновляем статус платежа на "succeeded"
             paid_at = datetime.utcnow()
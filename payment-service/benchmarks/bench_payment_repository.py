@@ -0,0 +1,73 @@
+"""
+Бенчмарк PaymentRepository: стоимость операций при большой истории платежей.
+
+Заполняет репозиторий N платежами (каждый второй заказ оплачен) и измеряет
+среднее время get_payment_by_id, check_order_paid, update_payment_status и
+create_payment. Благодаря индексам время не должно расти с N.
+
+Запуск (из каталога payment-service):
+    python -m benchmarks.bench_payment_repository
+    python -m benchmarks.bench_payment_repository --sizes 1000 100000
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime
+
+from app.repositories.local_payment_repo import PaymentRepository
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+SAMPLE_OPS = 10_000
+
+
+def _payment(index: int) -> dict:
+    """Сформировать платеж с заданным номером."""
+    return {
+        "payment_id": f"pay_{index:010d}",
+        "order_id": f"ord_{index:010d}",
+        "status": "succeeded" if index % 2 else "pending",
+        "amount": 5000.0,
+        "currency": "RUB",
+        "created_at": datetime.utcnow(),
+        "paid_at": None,
+    }
+
+
+def _mean_us(operation, args) -> float:
+    """Среднее время вызова operation(*arg) в микросекундах."""
+    start = time.perf_counter()
+    for arg in args:
+        operation(*arg)
+    return (time.perf_counter() - start) / len(args) * 1e6
+
+
+def run(size: int) -> dict:
+    """Заполнить репозиторий и замерить операции."""
+    repo = PaymentRepository()
+    for i in range(size):
+        repo.create_payment(_payment(i))
+
+    probes = [random.randrange(size) for _ in range(SAMPLE_OPS)]
+    return {
+        "get_by_id": _mean_us(repo.get_payment_by_id, [(f"pay_{i:010d}",) for i in probes]),
+        "order_paid": _mean_us(repo.check_order_paid, [(f"ord_{i:010d}",) for i in probes]),
+        "update": _mean_us(repo.update_payment_status, [(f"pay_{i:010d}", "succeeded") for i in probes]),
+        "create": _mean_us(repo.create_payment, [(_payment(size + i),) for i in range(SAMPLE_OPS)]),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PaymentRepository benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    args = parser.parse_args()
+
+    columns = ["get_by_id", "order_paid", "update", "create"]
+    print(f"{'payments':>10} " + " ".join(f"{c + ', us':>14}" for c in columns))
+    for size in args.sizes:
+        result = run(size)
+        print(f"{size:>10} " + " ".join(f"{result[c]:>14.2f}" for c in columns))
+
+
+if __name__ == "__main__":
+    main()
@@ -32,6 +32,11 @@ def event_loop() -> Generator:
     """
     loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
+    # Stop payment workers left running by tests before closing the loop
+    pending = asyncio.all_tasks(loop)
+    for task in pending:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
     loop.close()
 
 
@@ -139,7 +144,7 @@ def test_client() -> Generator[TestClient, None, None]:
     Returns:
         TestClient for making HTTP requests to the API
     """
-    from app.auth import get_current_user_id
+    from detailing_auth import get_current_user_id
     
     # Override JWT auth dependency with mock
     app.dependency_overrides[get_current_user_id] = mock_get_current_user_id
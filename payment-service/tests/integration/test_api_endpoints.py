@@ -229,6 +229,42 @@ class TestCreatePaymentEndpoint:
             assert "confirmation_url" in data
 
 
+class TestCreatePaymentBackpressure:
+    """Integration tests for payment rejection under load."""
+
+    def test_create_payment_queue_full_returns_429(self, test_client: TestClient):
+        """Test that a full processing queue yields 429 with Retry-After."""
+        # Arrange
+        from app.services import payment_service
+        from app.services.payment_processor import PaymentQueueFullError
+
+        with patch.object(
+            payment_service.processor,
+            "check_capacity",
+            side_effect=PaymentQueueFullError("Payment processing queue is full")
+        ):
+            # Act
+            response = test_client.post("/api/payments", json={
+                "order_id": "ord_test123",
+                "payment_method": "card"
+            })
+
+        # Assert
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response.headers["Retry-After"] == "1"
+
+    def test_health_reports_processing_metrics(self, test_client: TestClient):
+        """Test that health exposes queue depth and latency metrics."""
+        # Act
+        data = test_client.get("/health").json()
+
+        # Assert
+        metrics = data["payment_processing"]
+        assert "queue_depth" in metrics
+        assert "in_flight" in metrics
+        assert "avg_latency_seconds" in metrics
+
+
 class TestGetPaymentStatusEndpoint:
     """Integration tests for GET /api/payments/{payment_id} endpoint."""
 
@@ -0,0 +1,195 @@
+"""Unit tests for PaymentProcessor worker pool."""
+
+import asyncio
+
+import pytest
+
+from app.services.payment_processor import PaymentProcessor, PaymentQueueFullError
+
+
+class BlockingHandler:
+    """Handler that records calls and blocks until released."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, **job):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await self.release.wait()
+            self.calls.append(job)
+        finally:
+            self.active -= 1
+
+
+async def _drain_ready_tasks():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestPaymentProcessorProcessing:
+    """Tests for job execution and concurrency limits."""
+
+    @pytest.mark.asyncio
+    async def test_submitted_job_is_processed(self):
+        """Test that a submitted job reaches the handler with its arguments."""
+        # Arrange
+        handler = BlockingHandler()
+        handler.release.set()
+        processor = PaymentProcessor(handler, workers=2, max_queue_size=10)
+
+        # Act
+        processor.submit(payment_id="pay_1", amount=100.0)
+        await processor.shutdown(timeout=1.0)
+
+        # Assert
+        assert handler.calls == [{"payment_id": "pay_1", "amount": 100.0}]
+        assert processor.stats()["processed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_by_workers(self):
+        """Test that no more than `workers` jobs run at the same time."""
+        # Arrange
+        handler = BlockingHandler()
+        processor = PaymentProcessor(handler, workers=3, max_queue_size=100)
+
+        # Act
+        for i in range(20):
+            processor.submit(payment_id=f"pay_{i}")
+        await _drain_ready_tasks()
+
+        # Assert
+        assert handler.active == 3
+        assert processor.stats()["queue_depth"] == 17
+        assert processor.stats()["in_flight"] == 3
+
+        handler.release.set()
+        await processor.shutdown(timeout=1.0)
+        assert handler.max_active == 3
+        assert len(handler.calls) == 20
+
+    @pytest.mark.asyncio
+    async def test_handler_failure_does_not_kill_worker(self):
+        """Test that a failing job is counted and the worker keeps going."""
+        # Arrange
+        results = []
+
+        async def handler(payment_id):
+            if payment_id == "bad":
+                raise RuntimeError("boom")
+            results.append(payment_id)
+
+        processor = PaymentProcessor(handler, workers=1, max_queue_size=10)
+
+        # Act
+        processor.submit(payment_id="bad")
+        processor.submit(payment_id="good")
+        await processor.shutdown(timeout=1.0)
+
+        # Assert
+        assert results == ["good"]
+        assert processor.stats()["failed"] == 1
+        assert processor.stats()["processed"] == 1
+
+
+class TestPaymentProcessorBackpressure:
+    """Tests for queue limits and shutdown behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects(self):
+        """Test that submissions beyond queue capacity are rejected."""
+        # Arrange
+        handler = BlockingHandler()
+        processor = PaymentProcessor(handler, workers=1, max_queue_size=2)
+        processor.submit(payment_id="pay_0")
+        await _drain_ready_tasks()  # worker takes pay_0, queue is empty
+        processor.submit(payment_id="pay_1")
+        processor.submit(payment_id="pay_2")
+
+        # Act & Assert
+        with pytest.raises(PaymentQueueFullError):
+            processor.submit(payment_id="pay_3")
+        with pytest.raises(PaymentQueueFullError):
+            processor.check_capacity()
+        assert processor.stats()["rejected"] == 2
+
+        handler.release.set()
+        await processor.shutdown(timeout=1.0)
+        assert len(handler.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_shutdown_drains_queue(self):
+        """Test that shutdown waits for queued payments to finish."""
+        # Arrange
+        processed = []
+
+        async def handler(payment_id):
+            await asyncio.sleep(0.01)
+            processed.append(payment_id)
+
+        processor = PaymentProcessor(handler, workers=2, max_queue_size=100)
+        for i in range(10):
+            processor.submit(payment_id=f"pay_{i}")
+
+        # Act
+        await processor.shutdown(timeout=5.0)
+
+        # Assert
+        assert len(processed) == 10
+        assert processor.running is False
+
+    @pytest.mark.asyncio
+    async def test_shutdown_timeout_cancels_remaining(self):
+        """Test that shutdown gives up after the timeout."""
+        # Arrange
+        handler = BlockingHandler()
+        processor = PaymentProcessor(handler, workers=1, max_queue_size=10)
+        processor.submit(payment_id="stuck")
+        await _drain_ready_tasks()
+
+        # Act
+        await processor.shutdown(timeout=0.05)
+
+        # Assert
+        assert handler.calls == []
+        assert processor.running is False
+
+    @pytest.mark.asyncio
+    async def test_rejects_while_draining(self):
+        """Test that new payments are rejected once shutdown has begun."""
+        # Arrange
+        handler = BlockingHandler()
+        processor = PaymentProcessor(handler, workers=1, max_queue_size=10)
+        processor.submit(payment_id="pay_0")
+        shutdown = asyncio.create_task(processor.shutdown(timeout=1.0))
+        await _drain_ready_tasks()
+
+        # Act & Assert
+        with pytest.raises(PaymentQueueFullError):
+            processor.submit(payment_id="late")
+
+        handler.release.set()
+        await shutdown
+        assert handler.calls == [{"payment_id": "pay_0"}]
+
+    @pytest.mark.asyncio
+    async def test_latency_metrics(self):
+        """Test that processing latency is recorded."""
+        # Arrange
+        async def handler(payment_id):
+            await asyncio.sleep(0.02)
+
+        processor = PaymentProcessor(handler, workers=1, max_queue_size=10)
+
+        # Act
+        processor.submit(payment_id="pay_0")
+        await processor.shutdown(timeout=1.0)
+
+        # Assert
+        stats = processor.stats()
+        assert stats["avg_latency_seconds"] >= 0.02
+        assert stats["max_latency_seconds"] >= stats["avg_latency_seconds"]
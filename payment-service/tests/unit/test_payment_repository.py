@@ -3,6 +3,7 @@
 from datetime import datetime
 
 import pytest
+from detailing_persistence import DurableStore
 
 from app.repositories.local_payment_repo import PaymentRepository
 
@@ -335,3 +336,110 @@ class TestPaymentRepositoryEdgeCases:
         assert updated_payment["status"] == "succeeded"
         # paid_at should remain None if not provided
         assert updated_payment.get("paid_at") is None
+
+
+class TestPaymentRepositoryIndexes:
+    """Tests for payment_id/order_id indexes and the paid orders set."""
+
+    def test_update_to_succeeded_marks_order_paid(self, payment_repository: PaymentRepository):
+        """Test that a status update to succeeded is reflected by check_order_paid."""
+        # Arrange
+        payment_repository.create_payment(
+            {"payment_id": "pay_idx1", "order_id": "ord_idx", "status": "pending"}
+        )
+
+        # Act
+        payment_repository.update_payment_status("pay_idx1", "succeeded")
+
+        # Assert
+        assert payment_repository.check_order_paid("ord_idx") is True
+
+    def test_succeeded_then_failed_unmarks_order(self, payment_repository: PaymentRepository):
+        """Test that an order stops being paid when its only success is revoked."""
+        # Arrange
+        payment_repository.create_payment(
+            {"payment_id": "pay_idx2", "order_id": "ord_revoked", "status": "pending"}
+        )
+        payment_repository.update_payment_status("pay_idx2", "succeeded")
+
+        # Act
+        payment_repository.update_payment_status("pay_idx2", "failed")
+
+        # Assert
+        assert payment_repository.check_order_paid("ord_revoked") is False
+
+    def test_order_stays_paid_with_another_success(self, payment_repository: PaymentRepository):
+        """Test that revoking one success keeps the order paid if another exists."""
+        # Arrange
+        payment_repository.create_payment(
+            {"payment_id": "pay_a", "order_id": "ord_two", "status": "succeeded"}
+        )
+        payment_repository.create_payment(
+            {"payment_id": "pay_b", "order_id": "ord_two", "status": "succeeded"}
+        )
+
+        # Act
+        payment_repository.update_payment_status("pay_a", "failed")
+
+        # Assert
+        assert payment_repository.check_order_paid("ord_two") is True
+
+    def test_get_payments_by_order(self, payment_repository: PaymentRepository):
+        """Test that payments are grouped by order in creation order."""
+        # Arrange
+        first = payment_repository.create_payment({"payment_id": "pay_1", "order_id": "ord_x"})
+        payment_repository.create_payment({"payment_id": "pay_2", "order_id": "ord_y"})
+        third = payment_repository.create_payment({"payment_id": "pay_3", "order_id": "ord_x"})
+
+        # Act & Assert
+        assert payment_repository.get_payments_by_order("ord_x") == [first, third]
+        assert payment_repository.get_payments_by_order("ord_unknown") == []
+
+    def test_replacing_storage_rebuilds_indexes(self, payment_repository: PaymentRepository):
+        """Test that assigning payments_storage resets and rebuilds all indexes."""
+        # Arrange
+        payment_repository.create_payment(
+            {"payment_id": "pay_old", "order_id": "ord_old", "status": "succeeded"}
+        )
+        kept = {"payment_id": "pay_kept", "order_id": "ord_kept", "status": "succeeded"}
+
+        # Act
+        payment_repository.payments_storage = [kept]
+
+        # Assert
+        assert payment_repository.get_payment_by_id("pay_old") is None
+        assert payment_repository.check_order_paid("ord_old") is False
+        assert payment_repository.get_payment_by_id("pay_kept") is kept
+        assert payment_repository.check_order_paid("ord_kept") is True
+
+
+class TestPaymentRepositoryJournal:
+    """Tests for journaling and recovery through a DurableStore."""
+
+    def test_journaled_payments_are_recovered(self, payment_repository: PaymentRepository, tmp_path):
+        """Test that payments, statuses and indexes survive a restart."""
+        # Arrange
+        store = DurableStore(str(tmp_path), "payments")
+        store.recover(payment_repository.apply_record)
+        payment_repository.journal = store
+        created_at = datetime(2025, 3, 1, 12, 0)
+        paid_at = datetime(2025, 3, 1, 12, 5)
+        payment_repository.create_payment(
+            {"payment_id": "pay_1", "order_id": "ord_1", "status": "pending", "created_at": created_at,
+             "paid_at": None}
+        )
+        store.compact(payment_repository.snapshot_records)
+        payment_repository.update_payment_status("pay_1", "succeeded", paid_at)
+        store.close()
+
+        # Act
+        recovered = PaymentRepository()
+        DurableStore(str(tmp_path), "payments").recover(recovered.apply_record)
+
+        # Assert
+        assert recovered.get_payment_by_id("pay_1") == {
+            "payment_id": "pay_1", "order_id": "ord_1", "status": "succeeded", "created_at": created_at,
+            "paid_at": paid_at
+        }
+        assert recovered.check_order_paid("ord_1") is True
+        assert len(recovered.payments_storage) == 1
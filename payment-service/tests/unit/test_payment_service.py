@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from app.repositories.local_payment_repo import PaymentRepository
+from app.services.payment_processor import PaymentQueueFullError
 from app.services.payment_service import PaymentService
 
 
@@ -139,15 +140,20 @@ class TestPaymentServiceInitiatePayment:
         user_id = "test-user-id"
         amount = 5000.0
 
-        with patch("app.services.payment_service.asyncio.create_task") as mock_create_task:
+        with patch.object(payment_service.processor, "submit") as mock_submit:
             with patch("app.services.payment_service.rabbitmq_publisher") as mock_publisher:
                 mock_publisher.publish_payment_success = AsyncMock()
 
                 # Act
-                await payment_service.initiate_payment(order_id, "card", user_id, amount)
+                payment = await payment_service.initiate_payment(order_id, "card", user_id, amount)
 
                 # Assert
-                mock_create_task.assert_called_once()
+                mock_submit.assert_called_once_with(
+                    payment_id=payment["payment_id"],
+                    order_id=order_id,
+                    user_id=user_id,
+                    amount=amount
+                )
 
     @pytest.mark.asyncio
     async def test_initiate_payment_with_different_payment_method(
@@ -169,6 +175,45 @@ class TestPaymentServiceInitiatePayment:
             assert result["payment_method"] == "sbp"
 
 
+class TestPaymentServiceBackpressure:
+    """Tests for rejecting payments when the processing queue is full."""
+
+    @pytest.mark.asyncio
+    async def test_initiate_payment_rejected_when_queue_full(
+        self, payment_service: PaymentService, payment_repository: PaymentRepository
+    ):
+        """Test that a full queue rejects the payment before it is stored."""
+        # Arrange
+        with patch.object(
+            payment_service.processor,
+            "check_capacity",
+            side_effect=PaymentQueueFullError("Payment processing queue is full")
+        ):
+            # Act & Assert
+            with pytest.raises(PaymentQueueFullError):
+                await payment_service.initiate_payment("ord_test123", "card", "user", 100.0)
+
+        assert payment_repository.payments_storage == []
+
+    @pytest.mark.asyncio
+    async def test_stop_processing_drains_pending_payments(
+        self, payment_service: PaymentService, payment_repository: PaymentRepository
+    ):
+        """Test that stopping the service finishes accepted payments."""
+        # Arrange
+        with patch("app.services.payment_service.rabbitmq_publisher") as mock_publisher:
+            mock_publisher.publish_payment_success = AsyncMock()
+            with patch("app.services.payment_service.asyncio.sleep", new_callable=AsyncMock):
+                payment = await payment_service.initiate_payment("ord_test123", "card", "user", 100.0)
+
+                # Act
+                await payment_service.stop_processing(timeout=1.0)
+
+        # Assert
+        assert payment_repository.get_payment_by_id(payment["payment_id"])["status"] == "succeeded"
+        mock_publisher.publish_payment_success.assert_called_once()
+
+
 class TestPaymentServiceProcessPaymentAsync:
     """Tests for background payment processing."""
 
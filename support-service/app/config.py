@@ -8,6 +8,9 @@ class Settings(BaseSettings):
     service_name: str = "support-service"
     port: int = 8008
 
+    # Serialize responses with orjson instead of json.dumps (opt-in)
+    fast_json_responses: bool = False
+
     # Mock user ID for testing (in production would come from auth token)
     mock_user_id: str = "c3f4e1a1-5b8a-4b0e-8d9b-9d4a6f1e2c3d"
 
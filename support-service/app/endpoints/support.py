@@ -11,7 +11,7 @@ from app.models.ticket import (
 )
 from app.services.support_service import support_service
 from app.config import settings
-from app.auth import get_current_user_id
+from detailing_auth import get_current_user_id
 
 
 router = APIRouter(prefix="/api/support", tags=["support"])
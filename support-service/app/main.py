@@ -1,9 +1,12 @@
 """FastAPI application entry point."""
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+from detailing_observability import setup_load_shedding, setup_metrics, setup_profiling
+from detailing_persistence import setup_persistence
 
 from app.config import settings
 from app.endpoints import support_router
+from app.repositories import ticket_repository
 
 
 # Create FastAPI application
@@ -11,9 +14,22 @@ app = FastAPI(
     title=settings.service_name,
     description="Support ticket management microservice",
     version="1.0.0",
+    default_response_class=ORJSONResponse if settings.fast_json_responses else JSONResponse,
 )
 
 
+# Shed load (503) on event-loop lag or too many requests in flight
+setup_load_shedding(app)
+
+# Request metrics and /metrics endpoint
+setup_metrics(app)
+
+# Sampling profiler at /debug/profile (only with PROFILING_ENABLED=true)
+setup_profiling(app)
+
+# Snapshot + write-ahead log of tickets and messages (only with PERSISTENCE_DIR set)
+setup_persistence(app, "tickets", ticket_repository)
+
 # Register routers
 app.include_router(support_router)
 
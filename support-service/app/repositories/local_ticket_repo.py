@@ -1,8 +1,10 @@
 """In-memory repository for ticket storage."""
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 from uuid import UUID, uuid4
 
+from detailing_persistence import DurableStore
+
 from app.models.ticket import Ticket, Message
 
 
@@ -13,12 +15,22 @@ class LocalTicketRepository:
     Storage structure:
     - tickets: Dict[UUID, Ticket] - key is ticket_id
     - messages: Dict[UUID, List[Message]] - key is ticket_id
+
+    When ``journal`` is set, new tickets and messages are appended to it.
+    Message records carry their position in the ticket, so replaying a
+    record twice does not duplicate the message.
     """
 
     def __init__(self):
         """Initialize in-memory storage."""
         self.tickets: Dict[UUID, Ticket] = {}
         self.messages: Dict[UUID, List[Message]] = {}
+        self.journal: Optional[DurableStore] = None
+
+    def _log_message(self, message: Message, index: int) -> None:
+        """Append a message record to the journal, if any."""
+        if self.journal is not None:
+            self.journal.append({"type": "message", "index": index, "message": message.model_dump()})
 
     def create_ticket(
         self,
@@ -64,6 +76,10 @@ class LocalTicketRepository:
         )
         self.messages[ticket_id] = [initial_message]
 
+        if self.journal is not None:
+            self.journal.append({"type": "ticket", "ticket": ticket.model_dump()})
+        self._log_message(initial_message, 0)
+
         return ticket
 
     def get_ticket_by_id(self, ticket_id: UUID) -> Optional[Ticket]:
@@ -119,6 +135,7 @@ class LocalTicketRepository:
             self.messages[ticket_id] = []
 
         self.messages[ticket_id].append(message)
+        self._log_message(message, len(self.messages[ticket_id]) - 1)
 
         return message
 
@@ -134,6 +151,46 @@ class LocalTicketRepository:
         """
         return self.messages.get(ticket_id, [])
 
+    def apply_record(self, record: Dict[str, Any]) -> None:
+        """
+        Apply a journal record during recovery.
+
+        Args:
+            record: Ticket or message record
+
+        Raises:
+            ValueError: If the record type is unknown
+        """
+        if record["type"] == "ticket":
+            ticket = Ticket(**record["ticket"])
+            self.tickets.setdefault(ticket.ticket_id, ticket)
+        elif record["type"] == "message":
+            message = Message(**record["message"])
+            messages = self.messages.setdefault(message.ticket_id, [])
+            if record["index"] >= len(messages):
+                messages.append(message)
+        else:
+            raise ValueError(f"Unknown record type: {record['type']!r}")
+
+    def snapshot_records(self) -> Iterable[Dict[str, Any]]:
+        """
+        Build the records that recreate all tickets and messages.
+
+        Returns:
+            Ticket records followed by message records, read lazily
+        """
+        tickets = list(self.tickets.values())
+        messages = [(ticket_id, list(items)) for ticket_id, items in self.messages.items()]
+
+        def records() -> Iterator[Dict[str, Any]]:
+            for ticket in tickets:
+                yield {"type": "ticket", "ticket": ticket.model_dump()}
+            for _, items in messages:
+                for index, message in enumerate(items):
+                    yield {"type": "message", "index": index, "message": message.model_dump()}
+
+        return records()
+
 
 # Singleton instance
 ticket_repository = LocalTicketRepository()
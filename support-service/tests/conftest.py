@@ -86,7 +86,7 @@ def reset_singleton_repository():
 @pytest.fixture
 def client():
     """Provide a TestClient for FastAPI application testing with mocked JWT auth."""
-    from app.auth import get_current_user_id
+    from detailing_auth import get_current_user_id
     
     # Override JWT auth dependency with mock
     app.dependency_overrides[get_current_user_id] = mock_get_current_user_id
@@ -4,6 +4,8 @@ from datetime import datetime
 from uuid import UUID, uuid4
 from unittest.mock import patch, MagicMock
 
+from detailing_persistence import DurableStore
+
 from app.repositories.local_ticket_repo import LocalTicketRepository
 from app.models.ticket import Ticket, Message
 
@@ -425,3 +427,21 @@ class TestLocalTicketRepository:
         assert ticket2.user_id == user2
         assert ticket1.ticket_id != ticket2.ticket_id
         assert len(repository.tickets) == 2
+
+    def test_journaled_tickets_and_messages_are_recovered(self, repository, sample_user_id, sample_order_id, tmp_path):
+        """Test that tickets and messages survive a restart without duplicates."""
+        store = DurableStore(str(tmp_path), "tickets")
+        store.recover(repository.apply_record)
+        repository.journal = store
+        ticket = repository.create_ticket(sample_user_id, "Subject", "First", order_id=sample_order_id)
+        repository.add_message(ticket.ticket_id, "support", "Second")
+        store.compact(repository.snapshot_records)
+        repository.add_message(ticket.ticket_id, str(sample_user_id), "Third")
+        store.close()
+
+        recovered = LocalTicketRepository()
+        DurableStore(str(tmp_path), "tickets").recover(recovered.apply_record)
+
+        assert recovered.get_ticket_by_id(ticket.ticket_id) == ticket
+        assert recovered.get_messages_by_ticket(ticket.ticket_id) == repository.get_messages_by_ticket(ticket.ticket_id)
+        assert len(recovered.get_messages_by_ticket(ticket.ticket_id)) == 3
@@ -16,11 +16,18 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_SECONDS: int = 3600
 
+    # Password hashing pool (bcrypt runs off the event loop)
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
     # Application configuration
     APP_NAME: str = "User Service"
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = False
 
+    # Serialize responses with orjson instead of json.dumps (opt-in)
+    FAST_JSON_RESPONSES: bool = False
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -30,7 +30,8 @@ router = APIRouter(prefix="/api/users", tags=["users"])
     responses={
         201: {"description": "User successfully registered"},
         409: {"description": "Email or phone number already registered"},
-        422: {"description": "Validation error (e.g., password too short)"}
+        422: {"description": "Validation error (e.g., password too short)"},
+        503: {"description": "Password hashing pool is saturated"}
     }
 )
 async def register(
@@ -64,7 +65,8 @@ async def register(
     responses={
         200: {"description": "Successfully authenticated"},
         401: {"description": "Incorrect email or password"},
-        422: {"description": "Validation error (missing email or password)"}
+        422: {"description": "Validation error (missing email or password)"},
+        503: {"description": "Password hashing pool is saturated"}
     }
 )
 async def login(
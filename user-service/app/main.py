@@ -5,11 +5,14 @@ Main FastAPI application entry point.
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from detailing_observability import setup_load_shedding, setup_metrics, setup_profiling
 
 from app.config import settings
 from app.endpoints import users
 from app.database import engine, Base
+from app.services.password_hasher import password_hasher
 
 # Configure logging
 logging.basicConfig(
@@ -38,6 +41,8 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down User Service...")
     await engine.dispose()
     logger.info("Database connections closed")
+    password_hasher.shutdown()
+    logger.info("Password hashing pool stopped")
 
 
 # Create FastAPI application
@@ -46,6 +51,7 @@ app = FastAPI(
     description="Microservice for user registration and authentication in the car detailing system",
     version=settings.APP_VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse if settings.FAST_JSON_RESPONSES else JSONResponse,
 )
 
 # Configure CORS
@@ -57,6 +63,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Shed load (503) on event-loop lag or too many requests in flight
+setup_load_shedding(app)
+
+# Request metrics and /metrics endpoint
+setup_metrics(app)
+
+# Sampling profiler at /debug/profile (only with PROFILING_ENABLED=true)
+setup_profiling(app)
+
 # Include routers
 app.include_router(users.router)
 
@@ -72,7 +87,8 @@ async def health_check():
     return {
         "status": "healthy",
         "service": settings.APP_NAME,
-        "version": settings.APP_VERSION
+        "version": settings.APP_VERSION,
+        "password_hasher": password_hasher.stats()
     }
 
 
@@ -4,7 +4,7 @@ Database repository for User operations.
 
 import logging
 from typing import Optional
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
@@ -27,6 +27,11 @@ class UserRepository:
         """
         Create a new user in the database.
 
+        Runs a single INSERT ... RETURNING statement and relies on the unique
+        constraints on email and phone_number instead of checking them with
+        separate SELECTs. Use duplicate_field() to find out which constraint
+        a raised IntegrityError refers to.
+
         Args:
             session: Async SQLAlchemy database session
             email: User email address
@@ -40,18 +45,21 @@ class UserRepository:
         Raises:
             IntegrityError: If email or phone_number already exists
         """
-        user = User(
-            email=email,
-            password_hash=password_hash,
-            full_name=full_name,
-            phone_number=phone_number,
+        stmt = (
+            insert(User)
+            .values(
+                email=email,
+                password_hash=password_hash,
+                full_name=full_name,
+                phone_number=phone_number,
+            )
+            .returning(User)
         )
 
-        session.add(user)
-
         try:
+            result = await session.execute(stmt)
+            user = result.scalar_one()
             await session.commit()
-            await session.refresh(user)
             logger.info(f"User created successfully: {user.id}")
             return user
         except IntegrityError as e:
@@ -59,6 +67,34 @@ class UserRepository:
             logger.error(f"IntegrityError creating user: {e}")
             raise
 
+    @staticmethod
+    def duplicate_field(error: IntegrityError) -> Optional[str]:
+        """
+        Determine which unique field caused an IntegrityError.
+
+        Uses the constraint name reported by PostgreSQL (asyncpg or psycopg)
+        and falls back to the error message, which is how SQLite reports it
+        ("UNIQUE constraint failed: users.email").
+
+        Args:
+            error: IntegrityError raised by create_user
+
+        Returns:
+            "email" or "phone_number", or None if the field is unknown
+        """
+        orig = error.orig
+        constraint = (
+            getattr(orig, "constraint_name", None)
+            or getattr(getattr(orig, "__cause__", None), "constraint_name", None)
+            or getattr(getattr(orig, "diag", None), "constraint_name", None)
+        )
+        text = constraint or str(orig)
+
+        for field in ("phone_number", "email"):
+            if field in text:
+                return field
+        return None
+
     @staticmethod
     async def get_user_by_email(session: AsyncSession, email: str) -> Optional[User]:
         """
@@ -0,0 +1,108 @@
+"""
+Bounded worker pool for password hashing.
+
+bcrypt is deliberately slow (hundreds of milliseconds per call). Running it
+directly inside a coroutine blocks the event loop for that long, so every
+other request on the worker waits behind a single login. PasswordHasher
+runs the CPU-bound calls on a dedicated thread pool (bcrypt releases the
+GIL) and limits how many calls may be queued at once.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusyError(Exception):
+    """Raised when too many hashing calls are already pending."""
+
+
+class PasswordHasher:
+    """Run password hashing functions on a size-limited thread pool."""
+
+    def __init__(self, workers: int, max_pending: int):
+        """
+        Initialize the hasher.
+
+        Args:
+            workers: Number of hashing threads
+            max_pending: Maximum number of running plus queued calls
+        """
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool, created on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="password-hasher"
+            )
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run func(*args) on the hashing pool.
+
+        Args:
+            func: Blocking hashing or verification function
+            *args: Positional arguments for func
+
+        Returns:
+            Result of func
+
+        Raises:
+            PasswordHasherBusyError: If max_pending calls are already pending
+        """
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            logger.warning(f"Password hasher saturated: {self.pending} calls pending")
+            raise PasswordHasherBusyError("Too many password hashing requests pending")
+
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+        finally:
+            self.pending -= 1
+            self.completed += 1
+
+    def shutdown(self) -> None:
+        """Stop the thread pool and wait for running calls."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get pool counters.
+
+        Returns:
+            Dictionary with pool size, pending, completed and rejected calls
+        """
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "completed": self.completed,
+            "rejected": self.rejected
+        }
+
+
+# Global hasher instance
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING
+)
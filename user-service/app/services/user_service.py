@@ -13,6 +13,7 @@ from fastapi import HTTPException, status
 
 from app.config import settings
 from app.repositories.db_user_repo import UserRepository
+from app.services.password_hasher import password_hasher, PasswordHasherBusyError
 from app.models.user import RegisterRequest, RegisterResponse, LoginResponse
 from app.schemas.user import User
 
@@ -71,6 +72,27 @@ def _create_access_token(data: Dict[str, Any], expires_delta: timedelta) -> str:
     return encoded_jwt
 
 
+# 409 details for each unique field of the users table
+_DUPLICATE_DETAILS = {
+    "email": "Email already registered",
+    "phone_number": "Phone number already registered",
+}
+
+
+def _service_busy() -> HTTPException:
+    """
+    Build the error returned when the password hashing pool is saturated.
+
+    Returns:
+        HTTPException with status 503 and Retry-After header
+    """
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Service is busy, please retry later",
+        headers={"Retry-After": "1"}
+    )
+
+
 class UserService:
     """Service for user-related business logic."""
 
@@ -92,29 +114,18 @@ class UserService:
         Raises:
             HTTPException: 409 if email or phone already exists
             HTTPException: 422 if validation fails
+            HTTPException: 503 if the password hashing pool is saturated
         """
         logger.info(f"Attempting to register user with email: {user_data.email}")
 
-        # Check if email already exists
-        if await UserRepository.check_email_exists(db, user_data.email):
-            logger.warning(f"Registration failed: Email already exists - {user_data.email}")
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Email already registered"
-            )
-
-        # Check if phone number already exists
-        if await UserRepository.check_phone_exists(db, user_data.phone_number):
-            logger.warning(f"Registration failed: Phone already exists - {user_data.phone_number}")
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Phone number already registered"
-            )
-
-        # Hash the password
-        password_hash = _hash_password(user_data.password)
+        # Hash the password on the hashing pool
+        try:
+            password_hash = await password_hasher.run(_hash_password, user_data.password)
+        except PasswordHasherBusyError:
+            raise _service_busy()
 
-        # Create user in database
+        # Create user in database; email and phone uniqueness is enforced
+        # by the INSERT itself, so no separate existence checks are needed
         try:
             user = await UserRepository.create_user(
                 session=db,
@@ -125,10 +136,11 @@ class UserService:
             )
             logger.info(f"User registered successfully: {user.id}")
         except IntegrityError as e:
-            logger.error(f"IntegrityError during registration: {e}")
+            field = UserRepository.duplicate_field(e)
+            logger.warning(f"Registration failed: duplicate {field or 'email or phone'} - {user_data.email}")
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
-                detail="Email or phone number already registered"
+                detail=_DUPLICATE_DETAILS.get(field, "Email or phone number already registered")
             )
 
         # Return response
@@ -159,6 +171,7 @@ class UserService:
         Raises:
             HTTPException: 401 if authentication fails
             HTTPException: 422 if email or password is missing
+            HTTPException: 503 if the password hashing pool is saturated
         """
         logger.info(f"Authentication attempt for email: {email}")
 
@@ -174,7 +187,16 @@ class UserService:
         user = await UserRepository.get_user_by_email(db, email)
 
         # Check if user exists and password is correct
-        if not user or not _verify_password(password, user.password_hash):
+        password_valid = False
+        if user:
+            try:
+                password_valid = await password_hasher.run(
+                    _verify_password, password, user.password_hash
+                )
+            except PasswordHasherBusyError:
+                raise _service_busy()
+
+        if not password_valid:
             logger.warning(f"Authentication failed for email: {email}")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
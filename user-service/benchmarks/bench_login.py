@@ -0,0 +1,126 @@
+"""
+Load benchmark for login latency with and without the hashing pool.
+
+Sends concurrent POST /api/users/login requests to the app in-process
+(httpx ASGITransport) while a second client polls GET /health. The user
+lookup is stubbed with a real bcrypt hash so each login does one full
+bcrypt verification. Two modes are compared:
+
+- inline: bcrypt runs directly in the coroutine (the previous behaviour)
+- pool:   bcrypt runs on the PasswordHasher thread pool
+
+For each mode the benchmark prints login p50/p99 and /health p50/p99,
+which shows how much a login stalls unrelated requests.
+
+Usage (from the user-service directory):
+    python -m benchmarks.bench_login
+    python -m benchmarks.bench_login --logins 64 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+import httpx
+
+from app.database import get_db
+from app.main import app
+from app.repositories.db_user_repo import UserRepository
+from app.services.password_hasher import password_hasher
+from app.services.user_service import _hash_password
+
+PASSWORD = "benchmark-password"
+HEALTH_INTERVAL = 0.01
+
+
+def _percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index] * 1000
+
+
+async def _inline_run(func, *args):
+    """PasswordHasher.run replacement that blocks the loop like before"""
+    return func(*args)
+
+
+async def run(logins: int, concurrency: int, inline: bool) -> tuple[list, list, float]:
+    """Return (login latencies, health latencies, elapsed) in seconds"""
+    transport = httpx.ASGITransport(app=app)
+    semaphore = asyncio.Semaphore(concurrency)
+    login_latencies, health_latencies = [], []
+    done = asyncio.Event()
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def login():
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.post("/api/users/login", json={"email": "bench@example.com", "password": PASSWORD})
+                login_latencies.append(time.perf_counter() - start)
+                assert response.status_code == 200, response.text
+
+        async def health(scheduled: float):
+            await client.get("/health")
+            health_latencies.append(time.perf_counter() - scheduled)
+
+        async def poll_health():
+            # Open-loop schedule: latency counts from when the request was due,
+            # so time spent waiting for a blocked event loop is included
+            probes = []
+            start = time.perf_counter()
+            tick = 0
+            while not done.is_set():
+                tick += 1
+                scheduled = start + tick * HEALTH_INTERVAL
+                await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+                probes.append(asyncio.create_task(health(scheduled)))
+            await asyncio.gather(*probes)
+
+        poller = asyncio.create_task(poll_health())
+        started = time.perf_counter()
+        if inline:
+            with patch.object(password_hasher, "run", _inline_run):
+                await asyncio.gather(*(login() for _ in range(logins)))
+        else:
+            await asyncio.gather(*(login() for _ in range(logins)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await poller
+
+    return login_latencies, health_latencies, elapsed
+
+
+async def main(logins: int, concurrency: int) -> None:
+    user = SimpleNamespace(id=uuid4(), email="bench@example.com", password_hash=_hash_password(PASSWORD))
+
+    async def fake_get_user_by_email(session, email):
+        return user
+
+    async def fake_get_db():
+        yield None
+
+    app.dependency_overrides[get_db] = fake_get_db
+    print(f"logins={logins} concurrency={concurrency} hash_workers={password_hasher.workers}")
+    print(f"{'mode':>7} {'logins/s':>9} {'login p50':>10} {'login p99':>10} {'health p50':>11} {'health p99':>11}  (ms)")
+    with patch.object(UserRepository, "get_user_by_email", fake_get_user_by_email):
+        for mode in ("inline", "pool"):
+            login_lat, health_lat, elapsed = await run(logins, concurrency, inline=(mode == "inline"))
+            print(
+                f"{mode:>7} {logins / elapsed:>9.1f} {_percentile(login_lat, 50):>10.0f} {_percentile(login_lat, 99):>10.0f} "
+                f"{_percentile(health_lat, 50):>11.1f} {_percentile(health_lat, 99):>11.1f}"
+            )
+    password_hasher.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    asyncio.run(main(args.logins, args.concurrency))
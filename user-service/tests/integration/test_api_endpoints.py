@@ -13,6 +13,7 @@ Uses TestClient with real database operations (SQLite in-memory).
 import pytest
 from httpx import AsyncClient
 from fastapi import status
+from sqlalchemy import event
 
 from app.repositories.db_user_repo import UserRepository
 
@@ -48,6 +49,33 @@ class TestRegisterEndpoint:
         assert user is not None
         assert user.email == user_data["email"]
 
+    @pytest.mark.asyncio
+    async def test_register_single_statement(self, test_client, async_db_engine):
+        """Test registration runs one INSERT ... RETURNING and no SELECTs."""
+        # Arrange
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.strip().split()[0].upper())
+
+        event.listen(async_db_engine.sync_engine, "before_cursor_execute", record)
+        user_data = {
+            "email": "single@example.com",
+            "password": "password123",
+            "full_name": "Single Statement",
+            "phone_number": "+79990000001"
+        }
+
+        # Act
+        try:
+            response = await test_client.post("/api/users/register", json=user_data)
+        finally:
+            event.remove(async_db_engine.sync_engine, "before_cursor_execute", record)
+
+        # Assert
+        assert response.status_code == status.HTTP_201_CREATED
+        assert statements == ["INSERT"]
+
     @pytest.mark.asyncio
     async def test_register_duplicate_email(self, test_client, async_db_session):
         """Test registration with duplicate email returns 409."""
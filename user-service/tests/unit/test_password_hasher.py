@@ -0,0 +1,90 @@
+"""
+Unit tests for the password hashing pool.
+
+Tests that hashing runs off the event loop and that the pool rejects
+calls once too many are pending.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.password_hasher import PasswordHasher, PasswordHasherBusyError
+
+
+class TestPasswordHasher:
+    """Test PasswordHasher.run and its limits."""
+
+    @pytest.mark.asyncio
+    async def test_run_returns_result_from_worker_thread(self):
+        """Test that the function runs on a pool thread and its result is returned."""
+        # Arrange
+        hasher = PasswordHasher(workers=2, max_pending=10)
+
+        # Act
+        result = await hasher.run(lambda value: (value, threading.current_thread().name), "secret")
+
+        # Assert
+        assert result[0] == "secret"
+        assert result[1].startswith("password-hasher")
+        assert hasher.stats()["completed"] == 1
+        hasher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_does_not_block_event_loop(self):
+        """Test that a slow hash leaves the event loop free for other coroutines."""
+        # Arrange
+        hasher = PasswordHasher(workers=1, max_pending=10)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+
+        # Act
+        await hasher.run(time.sleep, 0.2)
+        ticker_task.cancel()
+
+        # Assert
+        assert ticks >= 10
+        hasher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_rejects_when_too_many_pending(self):
+        """Test that calls beyond max_pending are rejected immediately."""
+        # Arrange
+        hasher = PasswordHasher(workers=1, max_pending=2)
+        release = threading.Event()
+        running = [asyncio.create_task(hasher.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        # Act & Assert
+        with pytest.raises(PasswordHasherBusyError):
+            await hasher.run(release.wait)
+
+        release.set()
+        await asyncio.gather(*running)
+        assert hasher.stats()["rejected"] == 1
+        assert hasher.stats()["pending"] == 0
+        hasher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_propagates_exceptions(self):
+        """Test that exceptions from the hashing function reach the caller."""
+        # Arrange
+        hasher = PasswordHasher(workers=1, max_pending=2)
+
+        def fail():
+            raise ValueError("bad hash")
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await hasher.run(fail)
+        assert hasher.stats()["pending"] == 0
+        hasher.shutdown()
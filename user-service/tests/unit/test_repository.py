@@ -7,6 +7,7 @@ All tests are isolated from actual database connections.
 
 import pytest
 from unittest.mock import AsyncMock, Mock
+from sqlalchemy import Insert
 from sqlalchemy.exc import IntegrityError
 from uuid import uuid4
 
@@ -21,7 +22,7 @@ class TestUserRepositoryCreateUser:
     async def test_create_user_success(self, mock_db_session, sample_user):
         """Test successful user creation."""
         # Arrange
-        mock_db_session.refresh.side_effect = lambda user: setattr(user, 'id', sample_user.id)
+        mock_db_session.execute.return_value = Mock(scalar_one=Mock(return_value=sample_user))
 
         # Act
         user = await UserRepository.create_user(
@@ -33,19 +34,40 @@ class TestUserRepositoryCreateUser:
         )
 
         # Assert
-        assert isinstance(user, User)
-        assert user.email == "test@example.com"
-        assert user.password_hash == "hashed_password"
-        assert user.full_name == "Test User"
-        assert user.phone_number == "+79991234567"
-        mock_db_session.add.assert_called_once()
+        assert user is sample_user
         mock_db_session.commit.assert_called_once()
-        mock_db_session.refresh.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_create_user_single_insert_returning(self, mock_db_session, sample_user):
+        """Test that create_user issues one INSERT ... RETURNING and no refresh."""
+        # Arrange
+        mock_db_session.execute.return_value = Mock(scalar_one=Mock(return_value=sample_user))
+
+        # Act
+        await UserRepository.create_user(
+            session=mock_db_session,
+            email="test@example.com",
+            password_hash="hashed_password",
+            full_name="Test User",
+            phone_number="+79991234567"
+        )
+
+        # Assert
+        mock_db_session.execute.assert_called_once()
+        stmt = mock_db_session.execute.call_args[0][0]
+        assert isinstance(stmt, Insert)
+        assert stmt._returning
+        assert stmt.compile().params["email"] == "test@example.com"
+        mock_db_session.add.assert_not_called()
+        mock_db_session.refresh.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_create_user_calls_commit(self, mock_db_session):
         """Test that create_user commits the transaction."""
-        # Arrange & Act
+        # Arrange
+        mock_db_session.execute.return_value = Mock(scalar_one=Mock(return_value=Mock()))
+
+        # Act
         await UserRepository.create_user(
             session=mock_db_session,
             email="test@example.com",
@@ -61,7 +83,7 @@ class TestUserRepositoryCreateUser:
     async def test_create_user_duplicate_email_raises_integrity_error(self, mock_db_session):
         """Test that duplicate email raises IntegrityError."""
         # Arrange
-        mock_db_session.commit.side_effect = IntegrityError(
+        mock_db_session.execute.side_effect = IntegrityError(
             "duplicate key value violates unique constraint",
             params={},
             orig=Exception()
@@ -84,7 +106,7 @@ class TestUserRepositoryCreateUser:
     async def test_create_user_duplicate_phone_raises_integrity_error(self, mock_db_session):
         """Test that duplicate phone number raises IntegrityError."""
         # Arrange
-        mock_db_session.commit.side_effect = IntegrityError(
+        mock_db_session.execute.side_effect = IntegrityError(
             "duplicate key value violates unique constraint",
             params={},
             orig=Exception()
@@ -106,7 +128,7 @@ class TestUserRepositoryCreateUser:
     async def test_create_user_rolls_back_on_error(self, mock_db_session):
         """Test that transaction is rolled back on error."""
         # Arrange
-        mock_db_session.commit.side_effect = IntegrityError(
+        mock_db_session.execute.side_effect = IntegrityError(
             "database error",
             params={},
             orig=Exception()
@@ -125,6 +147,50 @@ class TestUserRepositoryCreateUser:
         mock_db_session.rollback.assert_called_once()
 
 
+class TestUserRepositoryDuplicateField:
+    """Test UserRepository.duplicate_field method."""
+
+    def test_duplicate_field_postgres_email_constraint(self):
+        """Test mapping of the PostgreSQL email constraint name."""
+        # Arrange
+        orig = Exception("duplicate key value violates unique constraint")
+        orig.constraint_name = "users_email_key"
+        error = IntegrityError("INSERT", params={}, orig=orig)
+
+        # Act & Assert
+        assert UserRepository.duplicate_field(error) == "email"
+
+    def test_duplicate_field_asyncpg_phone_constraint(self):
+        """Test constraint name taken from the asyncpg exception behind the adapter."""
+        # Arrange
+        cause = Exception("duplicate key value violates unique constraint")
+        cause.constraint_name = "users_phone_number_key"
+        orig = Exception("adapter error")
+        orig.__cause__ = cause
+        error = IntegrityError("INSERT", params={}, orig=orig)
+
+        # Act & Assert
+        assert UserRepository.duplicate_field(error) == "phone_number"
+
+    def test_duplicate_field_sqlite_message(self):
+        """Test mapping of the SQLite error message."""
+        # Arrange
+        error = IntegrityError(
+            "INSERT", params={}, orig=Exception("UNIQUE constraint failed: users.phone_number")
+        )
+
+        # Act & Assert
+        assert UserRepository.duplicate_field(error) == "phone_number"
+
+    def test_duplicate_field_unknown(self):
+        """Test that an unrelated constraint maps to None."""
+        # Arrange
+        error = IntegrityError("INSERT", params={}, orig=Exception("NOT NULL constraint failed"))
+
+        # Act & Assert
+        assert UserRepository.duplicate_field(error) is None
+
+
 class TestUserRepositoryGetUserByEmail:
     """Test UserRepository.get_user_by_email method."""
 
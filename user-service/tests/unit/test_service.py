@@ -15,6 +15,7 @@ from sqlalchemy.exc import IntegrityError
 from app.services.user_service import UserService
 from app.models.user import RegisterRequest, LoginRequest
 from app.repositories.db_user_repo import UserRepository
+from app.services.password_hasher import PasswordHasherBusyError
 
 
 class TestUserServiceRegisterUser:
@@ -68,8 +69,12 @@ class TestUserServiceRegisterUser:
         """Test that duplicate email raises HTTP 409 Conflict."""
         # Arrange
         request = RegisterRequest(**sample_user_data)
+        orig = Exception("duplicate key value violates unique constraint")
+        orig.constraint_name = "users_email_key"
 
-        with patch.object(UserRepository, 'check_email_exists', return_value=True):
+        with patch.object(UserRepository, 'create_user', side_effect=IntegrityError(
+                 "duplicate key", params={}, orig=orig
+             )):
 
             # Act & Assert
             with pytest.raises(HTTPException) as exc_info:
@@ -83,9 +88,12 @@ class TestUserServiceRegisterUser:
         """Test that duplicate phone number raises HTTP 409 Conflict."""
         # Arrange
         request = RegisterRequest(**sample_user_data)
+        orig = Exception("duplicate key value violates unique constraint")
+        orig.constraint_name = "users_phone_number_key"
 
-        with patch.object(UserRepository, 'check_email_exists', return_value=False), \
-             patch.object(UserRepository, 'check_phone_exists', return_value=True):
+        with patch.object(UserRepository, 'create_user', side_effect=IntegrityError(
+                 "duplicate key", params={}, orig=orig
+             )):
 
             # Act & Assert
             with pytest.raises(HTTPException) as exc_info:
@@ -96,13 +104,11 @@ class TestUserServiceRegisterUser:
 
     @pytest.mark.asyncio
     async def test_register_user_integrity_error_raises_409(self, mock_db_session, sample_user_data):
-        """Test that IntegrityError from database raises HTTP 409."""
+        """Test that an IntegrityError with unknown constraint raises HTTP 409."""
         # Arrange
         request = RegisterRequest(**sample_user_data)
 
-        with patch.object(UserRepository, 'check_email_exists', return_value=False), \
-             patch.object(UserRepository, 'check_phone_exists', return_value=False), \
-             patch.object(UserRepository, 'create_user', side_effect=IntegrityError(
+        with patch.object(UserRepository, 'create_user', side_effect=IntegrityError(
                  "duplicate key", params={}, orig=Exception()
              )):
 
@@ -114,21 +120,22 @@ class TestUserServiceRegisterUser:
             assert "Email or phone number already registered" in exc_info.value.detail
 
     @pytest.mark.asyncio
-    async def test_register_user_checks_email_before_phone(self, mock_db_session, sample_user_data):
-        """Test that email uniqueness is checked before phone."""
+    async def test_register_user_skips_existence_checks(self, mock_db_session, sample_user_data, sample_user):
+        """Test that registration relies on the INSERT instead of separate SELECTs."""
         # Arrange
         request = RegisterRequest(**sample_user_data)
 
-        with patch.object(UserRepository, 'check_email_exists', return_value=True) as mock_email, \
-             patch.object(UserRepository, 'check_phone_exists', return_value=False) as mock_phone:
+        with patch.object(UserRepository, 'check_email_exists') as mock_email, \
+             patch.object(UserRepository, 'check_phone_exists') as mock_phone, \
+             patch.object(UserRepository, 'create_user', return_value=sample_user) as mock_create:
 
-            # Act & Assert
-            with pytest.raises(HTTPException):
-                await UserService.register_user(mock_db_session, request)
+            # Act
+            await UserService.register_user(mock_db_session, request)
 
-            # Verify email check was called but phone check was not
-            mock_email.assert_called_once()
+            # Assert
+            mock_email.assert_not_called()
             mock_phone.assert_not_called()
+            mock_create.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_register_user_with_minimum_valid_password(self, mock_db_session, sample_user):
@@ -342,3 +349,41 @@ class TestUserServiceAuthenticateUser:
             # Assert
             assert decoded["sub"] == str(sample_user.id)
             assert decoded["email"] == sample_user.email
+
+
+class TestUserServicePasswordHasherSaturation:
+    """Test behaviour when the password hashing pool is saturated."""
+
+    @pytest.mark.asyncio
+    async def test_register_user_hasher_busy_raises_503(self, mock_db_session, sample_user_data):
+        """Test that registration returns 503 when hashing cannot be queued."""
+        # Arrange
+        request = RegisterRequest(**sample_user_data)
+
+        with patch.object(UserRepository, 'check_email_exists', return_value=False), \
+             patch.object(UserRepository, 'check_phone_exists', return_value=False), \
+             patch.object(UserRepository, 'create_user') as mock_create, \
+             patch('app.services.user_service.password_hasher.run',
+                   side_effect=PasswordHasherBusyError("busy")):
+
+            # Act & Assert
+            with pytest.raises(HTTPException) as exc_info:
+                await UserService.register_user(mock_db_session, request)
+
+            assert exc_info.value.status_code == 503
+            assert exc_info.value.headers["Retry-After"] == "1"
+            mock_create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_authenticate_user_hasher_busy_raises_503(self, mock_db_session, sample_user):
+        """Test that login returns 503 when verification cannot be queued."""
+        # Arrange
+        with patch.object(UserRepository, 'get_user_by_email', return_value=sample_user), \
+             patch('app.services.user_service.password_hasher.run',
+                   side_effect=PasswordHasherBusyError("busy")):
+
+            # Act & Assert
+            with pytest.raises(HTTPException) as exc_info:
+                await UserService.authenticate_user(mock_db_session, "test@example.com", "password123")
+
+            assert exc_info.value.status_code == 503